@@ -60,14 +60,11 @@ async def generate_audio(req: AudioGenRequest):
         audio_url = f"/output/{req.project_id}/assets/audio/{filename}"
         
         # Update DB
-        conn = db.get_db()
-        cur = conn.cursor()
-        if req.type == "sfx":
-            cur.execute("UPDATE image_prompts SET sfx_url = ? WHERE project_id = ? AND scene_number = ?", (audio_url, req.project_id, req.scene_number))
-        else:
-            cur.execute("UPDATE image_prompts SET bgm_url = ? WHERE project_id = ? AND scene_number = ?", (audio_url, req.project_id, req.scene_number))
-        conn.commit()
-        conn.close()
+        column = "sfx_url" if req.type == "sfx" else "bgm_url"
+        db.run_write(lambda conn: conn.execute(
+            f"UPDATE image_prompts SET {column} = ? WHERE project_id = ? AND scene_number = ?",
+            (audio_url, req.project_id, req.scene_number),
+        ))
         
         return {"status": "success", "audio_url": audio_url}
 
@@ -135,22 +132,19 @@ async def analyze_audio_prompts(req: AudioAnalyzeRequest):
             raise HTTPException(500, "Failed to parse AI response")
             
         # 3. Save to DB
-        conn = db.get_db()
-        cur = conn.cursor()
-        
-        for item in analysis:
-            s_num = item.get('scene_number')
-            sfx = item.get('sfx_prompt')
-            bgm = item.get('bgm_prompt')
-            
-            cur.execute("""
-                UPDATE image_prompts 
-                SET sfx_prompt = ?, bgm_prompt = ?
-                WHERE project_id = ? AND scene_number = ?
-            """, (sfx, bgm, req.project_id, s_num))
-            
-        conn.commit()
-        conn.close()
+        def _write(conn):
+            for item in analysis:
+                s_num = item.get('scene_number')
+                sfx = item.get('sfx_prompt')
+                bgm = item.get('bgm_prompt')
+
+                conn.execute("""
+                    UPDATE image_prompts 
+                    SET sfx_prompt = ?, bgm_prompt = ?
+                    WHERE project_id = ? AND scene_number = ?
+                """, (sfx, bgm, req.project_id, s_num))
+
+        db.run_write(_write)
 
         return {"status": "success", "count": len(analysis)}
 
@@ -167,17 +161,14 @@ class AudioPromptUpdate(BaseModel):
 @router.post("/update-prompt")
 async def update_audio_prompt(req: AudioPromptUpdate):
     try:
-        conn = db.get_db()
-        cur = conn.cursor()
-        
-        if req.sfx_prompt is not None:
-            cur.execute("UPDATE image_prompts SET sfx_prompt = ? WHERE project_id = ? AND scene_number = ?", (req.sfx_prompt, req.project_id, req.scene_number))
-        
-        if req.bgm_prompt is not None:
-            cur.execute("UPDATE image_prompts SET bgm_prompt = ? WHERE project_id = ? AND scene_number = ?", (req.bgm_prompt, req.project_id, req.scene_number))
-            
-        conn.commit()
-        conn.close()
+        def _write(conn):
+            if req.sfx_prompt is not None:
+                conn.execute("UPDATE image_prompts SET sfx_prompt = ? WHERE project_id = ? AND scene_number = ?", (req.sfx_prompt, req.project_id, req.scene_number))
+
+            if req.bgm_prompt is not None:
+                conn.execute("UPDATE image_prompts SET bgm_prompt = ? WHERE project_id = ? AND scene_number = ?", (req.bgm_prompt, req.project_id, req.scene_number))
+
+        db.run_write(_write)
         return {"status": "success"}
     except Exception as e:
         raise HTTPException(500, str(e))
@@ -16,3 +16,17 @@ async def health_check():
             "typecast": bool(config.TYPECAST_API_KEY)
         }
     }
+
+
+@router.get("/api/health/db")
+async def db_health():
+    """로컬 SQLite writer 큐 지표 (group commit, lock 재시도, commit latency)"""
+    import database as db
+    return {"status": "ok", "writer": db.get_db_write_stats()}
+
+
+@router.get("/api/health/web-admin")
+async def web_admin_health():
+    """Supabase/웹 관리자 HTTP 지표 (엔드포인트별 요청 수, 오류, 재시도, 지연, 전송 바이트)"""
+    from services.web_admin_client import web_admin_client
+    return {"status": "ok", "requests": web_admin_client.request_metrics()}
@@ -15,6 +15,7 @@ import asyncio
 import time
 
 import database as db
+from services.async_db import async_db
 from config import config
 from app.models.media import PromptsGenerateRequest
 from app.models.project import ImagePromptsSave
@@ -153,7 +154,7 @@ async def generate_image_prompts_api(req: PromptsGenerateRequest):
         character_ref_image_url = None
         if req.project_id:
             # Get latest script info
-            p_data = db.get_script(req.project_id)
+            p_data = await async_db.get_script(req.project_id)
             if p_data:
                 duration = p_data.get('estimated_duration', 60)
 
@@ -165,7 +166,7 @@ async def generate_image_prompts_api(req: PromptsGenerateRequest):
         style_key = req.style or "realistic"
         character_ref_image_url = req.character_reference or ""
         
-        db_presets = db.get_style_presets()
+        db_presets = await async_db.get_style_presets()
         style_data = db_presets.get(style_key.lower())
         style_prompt = style_data.get('prompt_value', style_key) if style_data else STYLE_PROMPTS.get(style_key.lower(), style_key)
         
@@ -205,7 +206,7 @@ async def generate_image_prompts_api(req: PromptsGenerateRequest):
         # 4. [CRITICAL] DB에 실시간 저장
         if req.project_id:
             try:
-                db.save_image_prompts(req.project_id, prompts_list)
+                await async_db.save_image_prompts(req.project_id, prompts_list)
                 print(f"[Main] Auto-saved {len(prompts_list)} image prompts for project {req.project_id}")
             except Exception as e:
                 print(f"[DB] Auto-save image prompts failed: {e}")
@@ -227,7 +228,7 @@ async def generate_random_cooking_video(project_id: int):
     """랜덤 요리 선정 및 단계별 Veo 영상 자동 생성 (Shorts 전용)"""
     try:
         # 1. 대본 기반 길이 추정
-        script_data = db.get_script(project_id)
+        script_data = await async_db.get_script(project_id)
         if not script_data or not script_data.get('full_script'):
             duration = 30 # Default 30s
         else:
@@ -295,10 +296,10 @@ async def generate_random_cooking_video(project_id: int):
             })
         
         # 4. DB 저장 (기존 프롬프트 대체)
-        db.save_image_prompts(project_id, scenes)
+        await async_db.save_image_prompts(project_id, scenes)
         
         # 5. 프로젝트 설정 업데이트 (요리 이름 등 기록)
-        db.update_project_setting(project_id, 'cooking_dish', dish_name)
+        await async_db.update_project_setting(project_id, 'cooking_dish', dish_name)
         
         return {
             "status": "ok",
@@ -332,13 +333,13 @@ async def generate_thumbnail_background(req: ThumbnailBackgroundRequest):
         # 1. Art Style (from Project Settings)
         art_style_desc = ""
         if req.project_id:
-            settings = db.get_project_settings(req.project_id)
+            settings = await async_db.get_project_settings(req.project_id)
             if settings:
                 # Use image_style_prompt if available (this is the refined AI prompt)
                 art_style_desc = settings.get('image_style_prompt') 
                 if not art_style_desc and settings.get('image_style'):
                     # Fallback to fetching preset by key
-                    presets = db.get_style_presets()
+                    presets = await async_db.get_style_presets()
                     style_key = settings.get('image_style')
                     preset = presets.get(style_key)
                     if preset:
@@ -348,7 +349,7 @@ async def generate_thumbnail_background(req: ThumbnailBackgroundRequest):
         layout_desc = ""
         if req.thumbnail_style:
             # 1. DB에서 스타일 설명 가져오기 (이제 레이아웃 중심)
-            presets = db.get_thumbnail_style_presets() # Returns Dict[str, Dict]
+            presets = await async_db.get_thumbnail_style_presets() # Returns Dict[str, Dict]
             target_preset = presets.get(req.thumbnail_style)
             if target_preset:
                 layout_desc = target_preset.get('prompt', '') # get_thumbnail_style_presets uses 'prompt' key
@@ -780,7 +781,7 @@ async def generate_character_prompts(req: CharacterPromptRequest):
 
 
         # [NEW] 비주얼 스타일 결정 (프롬프트 반영)
-        db_presets = db.get_style_presets()
+        db_presets = await async_db.get_style_presets()
         style_prefix = "photorealistic"
         
         if req.style:
@@ -791,7 +792,7 @@ async def generate_character_prompts(req: CharacterPromptRequest):
                 style_prefix = STYLE_PROMPTS.get(req.style.lower(), req.style)
         elif req.project_id:
             # 프로젝트 설정에서 스타일 조회
-            settings = db.get_project_settings(req.project_id)
+            settings = await async_db.get_project_settings(req.project_id)
             if settings and settings.get('image_style'):
                 image_style_key = settings['image_style'].lower()
                 style_data = db_presets.get(image_style_key)
@@ -807,7 +808,7 @@ async def generate_character_prompts(req: CharacterPromptRequest):
         # [NEW] DB 저장
         if req.project_id:
             try:
-                db.save_project_characters(req.project_id, characters)
+                await async_db.save_project_characters(req.project_id, characters)
                 print(f"[Main] Saved {len(characters)} characters to DB for project {req.project_id}")
             except Exception as db_err:
                 print(f"[Main] Failed to save characters: {db_err}")
@@ -824,7 +825,7 @@ async def generate_character_prompts(req: CharacterPromptRequest):
 async def save_characters(project_id: int, characters: List[Dict] = Body(...)):
     """캐릭터 목록 저장 (삭제 포함)"""
     try:
-        db.save_project_characters(project_id, characters)
+        await async_db.save_project_characters(project_id, characters)
         return {"status": "ok", "count": len(characters)}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -834,7 +835,7 @@ async def save_characters(project_id: int, characters: List[Dict] = Body(...)):
 async def get_characters(project_id: int):
     """캐릭터 목록 조회"""
     try:
-        characters = db.get_project_characters(project_id)
+        characters = await async_db.get_project_characters(project_id)
         return {"status": "ok", "characters": characters}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -850,7 +851,7 @@ async def generate_character_image(
     """캐릭터 이미지를 생성하고 저장 (Character Reference용)"""
     try:
         # [NEW] DB 스타일 프리셋 조회
-        db_presets = db.get_style_presets()
+        db_presets = await async_db.get_style_presets()
         style_data = db_presets.get(style.lower())
         if isinstance(style_data, dict):
             detailed_style = style_data.get("prompt_value", STYLE_PROMPTS.get(style.lower(), style))
@@ -888,7 +889,7 @@ async def generate_character_image(
         # [NEW] DB 업데이트
         if name:
             try:
-                db.update_character_image(project_id, name, web_url)
+                await async_db.update_character_image(project_id, name, web_url)
                 print(f"[DB] Updated character image for {name}")
             except Exception as dbe:
                 print(f"[DB] Failed to update character image: {dbe}")
@@ -907,7 +908,7 @@ async def generate_motion_from_image(
 ):
     """생성된 이미지를 Gemini Vision으로 분석해 motion_desc 생성"""
     try:
-        scene_prompts = db.get_image_prompts(project_id)
+        scene_prompts = await async_db.get_image_prompts(project_id)
         if not scene_prompts:
             return {"status": "error", "error": "프롬프트가 없습니다."}
 
@@ -951,13 +952,10 @@ async def generate_motion_from_image(
                     scene_text=scene_text
                 )
                 # DB 저장
-                conn = db.get_db()
-                conn.execute(
+                await async_db.execute_write(
                     "UPDATE image_prompts SET motion_desc = ? WHERE project_id = ? AND scene_number = ?",
                     (motion, project_id, scene_num)
                 )
-                conn.commit()
-                conn.close()
 
                 results.append({"scene_number": scene_num, "motion_desc": motion})
                 print(f"  ✅ Scene {scene_num}: {motion}")
@@ -1000,13 +998,10 @@ async def generate_flow_prompt_api(
             project_id=project_id,
         )
         # DB 저장
-        conn = db.get_db()
-        conn.execute(
+        await async_db.execute_write(
             "UPDATE image_prompts SET flow_prompt = ? WHERE project_id = ? AND scene_number = ?",
             (result, project_id, scene_number)
         )
-        conn.commit()
-        conn.close()
         return {"status": "ok", "flow_prompt": result}
     except Exception as e:
         import traceback; traceback.print_exc()
@@ -1021,7 +1016,7 @@ async def generate_dual_prompts_api(
     """특정 씬의 Dual Frame(Start/End) 프롬프트만 AI로 조립/생성"""
     try:
         # 1. 캐릭터 DNA 정보 로드
-        characters = db.get_project_characters(project_id)
+        characters = await async_db.get_project_characters(project_id)
         
         # 2. Gemini 서비스의 단일 씬 조립 로직 호출
         # (기존 generate_image_prompts_from_script의 조립 부분과 유사하게 처리)
@@ -1045,7 +1040,7 @@ async def bulk_generate_motion(
 ):
     """씬 목록의 motion_desc(영상 모션 프롬프트)를 Gemini AI로 일괄 자동 생성"""
     try:
-        scene_prompts = db.get_image_prompts(project_id)
+        scene_prompts = await async_db.get_image_prompts(project_id)
         if not scene_prompts:
             return {"status": "error", "error": "프롬프트가 없습니다. 먼저 이미지 프롬프트를 생성해주세요."}
 
@@ -1078,13 +1073,10 @@ async def bulk_generate_motion(
                     prompt_en=prompt_en
                 )
                 # DB 저장
-                conn = db.get_db()
-                conn.execute(
+                await async_db.execute_write(
                     "UPDATE image_prompts SET motion_desc = ? WHERE project_id = ? AND scene_number = ?",
                     (motion, project_id, scene_num)
                 )
-                conn.commit()
-                conn.close()
 
                 results.append({"scene_number": scene_num, "motion_desc": motion})
                 print(f"  ✅ Scene {scene_num}: {motion}")
@@ -1107,7 +1099,7 @@ async def bulk_generate_motion(
 
 @router.post("/api/image/generate-music-cover")
 async def generate_music_cover(req: MusicCoverGenerateRequest):
-    project = db.get_project(req.project_id)
+    project = await async_db.get_project(req.project_id)
     if not project:
         raise HTTPException(404, "Project not found")
 
@@ -1125,9 +1117,9 @@ async def generate_music_cover(req: MusicCoverGenerateRequest):
 
     image_url = result.get("image_url")
     if req.image_type == "background":
-        db.update_project_setting(req.project_id, "background_video_url", image_url)
+        await async_db.update_project_setting(req.project_id, "background_video_url", image_url)
     else:
-        db.update_project_setting(req.project_id, "template_image_url", image_url)
+        await async_db.update_project_setting(req.project_id, "template_image_url", image_url)
 
     return {"status": "ok", "image_url": image_url, "image_type": req.image_type}
 
@@ -1181,7 +1173,7 @@ async def generate_image(
         images_bytes = None
 
         # DB에서 스타일 prefix 가져오기
-        _style_settings = db.get_style_presets().get(style.lower(), {}) if style else {}
+        _style_settings = (await async_db.get_style_presets()).get(style.lower(), {}) if style else {}
         _style_prefix = (_style_settings.get('prompt_value') or STYLE_PROMPTS.get(style.lower(), '')).strip()
 
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1253,7 +1245,7 @@ async def generate_image(
         
         # DB 업데이트 (이미지 URL 저장)
         print(f"💿 [Image Generation] Updating DB for Project {project_id}, Scene {scene_number} with URL {image_url}")
-        db.update_image_prompt_url(project_id, scene_number, image_url)
+        await async_db.update_image_prompt_url(project_id, scene_number, image_url)
         
         return {
             "status": "ok",
@@ -1287,9 +1279,10 @@ async def upload_scene_media(
         is_image = ext in ALLOWED_IMAGE_EXT
         
         if not replace_existing and (is_video or is_image):
+            scene_rows = await async_db.get_image_prompts(project_id)
             target_scene = next(
                 (
-                    scene for scene in db.get_image_prompts(project_id)
+                    scene for scene in scene_rows
                     if int(scene.get("scene_number") or 0) == int(scene_number)
                 ),
                 None,
@@ -1311,7 +1304,7 @@ async def upload_scene_media(
 
         # [NEW] Enforce video-only for required intro video zone scenes
         if is_image:
-            readiness_check = sync_project_asset_readiness(project_id, persist=False)
+            readiness_check = await async_db.run(sync_project_asset_readiness, project_id, persist=False)
             required_zone = readiness_check.get("required_video_zone_scenes") or []
             if scene_number in required_zone:
                 return JSONResponse(
@@ -1340,10 +1333,10 @@ async def upload_scene_media(
             
         # DB 업데이트
         if is_video:
-            db.update_image_prompt_video_url(project_id, scene_number, web_url)
+            await async_db.update_image_prompt_video_url(project_id, scene_number, web_url)
         else:
-            db.update_image_prompt_url(project_id, scene_number, web_url)
-        readiness = sync_project_asset_readiness(project_id)
+            await async_db.update_image_prompt_url(project_id, scene_number, web_url)
+        readiness = await async_db.run(sync_project_asset_readiness, project_id)
             
         return {
             "status": "ok",
@@ -1381,7 +1374,7 @@ async def bulk_match_scene_media(
     try:
         from app.utils import get_project_output_dir, ALLOWED_IMAGE_EXT, ALLOWED_VIDEO_EXT
         from services.video_matcher import video_matcher
-        scenes = db.get_image_prompts(project_id)
+        scenes = await async_db.get_image_prompts(project_id)
         if not scenes:
             return JSONResponse(
                 status_code=400,
@@ -1503,7 +1496,7 @@ async def bulk_match_scene_media(
         # [NEW] Enforce video-only for required intro video zone scenes:
         # Image matches assigned to required-zone scenes are moved to
         # needs_review with a warning instead of being auto-committed.
-        readiness_check = sync_project_asset_readiness(project_id, persist=False)
+        readiness_check = await async_db.run(sync_project_asset_readiness, project_id, persist=False)
         required_zone = set(readiness_check.get("required_video_zone_scenes") or [])
         if required_zone:
             filtered_matched = []
@@ -1526,9 +1519,9 @@ async def bulk_match_scene_media(
         for item in plan["matched"]:
             matched_scene = int(item["scene_number"])
             if item["is_video"]:
-                db.update_image_prompt_video_url(project_id, matched_scene, item["url"])
+                await async_db.update_image_prompt_video_url(project_id, matched_scene, item["url"])
             else:
-                db.update_image_prompt_url(project_id, matched_scene, item["url"])
+                await async_db.update_image_prompt_url(project_id, matched_scene, item["url"])
 
             updates.append({
                 "original_name": item["original_name"],
@@ -1541,8 +1534,8 @@ async def bulk_match_scene_media(
             matched_count += 1
 
         # 원본 이미지 프롬프트 상태 최신화 반환을 위해 씬 목록 가져오기
-        latest_scenes = db.get_image_prompts(project_id)
-        readiness = sync_project_asset_readiness(project_id)
+        latest_scenes = await async_db.get_image_prompts(project_id)
+        readiness = await async_db.run(sync_project_asset_readiness, project_id)
 
         return {
             "status": "ok",
@@ -1586,9 +1579,10 @@ async def assign_scene_media(
                 content={"status": "error", "error": "URL does not point to a stored project file."},
             )
 
+        scene_rows = await async_db.get_image_prompts(project_id)
         target_scene = next(
             (
-                scene for scene in db.get_image_prompts(project_id)
+                scene for scene in scene_rows
                 if int(scene.get("scene_number") or 0) == int(scene_number)
             ),
             None,
@@ -1607,10 +1601,10 @@ async def assign_scene_media(
             )
 
         if is_video:
-            db.update_image_prompt_video_url(project_id, int(scene_number), url)
+            await async_db.update_image_prompt_video_url(project_id, int(scene_number), url)
         else:
-            db.update_image_prompt_url(project_id, int(scene_number), url)
-        readiness = sync_project_asset_readiness(project_id)
+            await async_db.update_image_prompt_url(project_id, int(scene_number), url)
+        readiness = await async_db.run(sync_project_asset_readiness, project_id)
 
         return {
             "status": "ok",
@@ -1685,7 +1679,7 @@ async def list_output_assets(project_id: int):
 
 @router.get("/api/projects/{project_id}/asset-readiness")
 async def get_project_asset_readiness(project_id: int):
-    readiness = sync_project_asset_readiness(project_id)
+    readiness = await async_db.run(sync_project_asset_readiness, project_id)
     if readiness.get("reason") == "project_not_found":
         raise HTTPException(status_code=404, detail="Project not found")
     return {"status": "ok", "asset_readiness": readiness}
@@ -1704,7 +1698,7 @@ async def replace_asset_from_library(
     try:
         # [NEW] Enforce video-only for required intro video zone scenes
         if not is_video:
-            readiness_check = sync_project_asset_readiness(project_id, persist=False)
+            readiness_check = await async_db.run(sync_project_asset_readiness, project_id, persist=False)
             required_zone = readiness_check.get("required_video_zone_scenes") or []
             if scene_number in required_zone:
                 return JSONResponse(
@@ -1717,10 +1711,10 @@ async def replace_asset_from_library(
                 )
 
         if is_video:
-            db.update_image_prompt_video_url(project_id, scene_number, asset_url)
+            await async_db.update_image_prompt_video_url(project_id, scene_number, asset_url)
         else:
-            db.update_image_prompt_url(project_id, scene_number, asset_url)
-        readiness = sync_project_asset_readiness(project_id)
+            await async_db.update_image_prompt_url(project_id, scene_number, asset_url)
+        readiness = await async_db.run(sync_project_asset_readiness, project_id)
         return {"status": "ok", "asset_readiness": readiness}
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -1762,7 +1756,7 @@ async def generate_grid_image(
             grid_prompt += f"- Panel {i+1} (Position: {['Top-Left', 'Top-Right', 'Bottom-Left', 'Bottom-Right'][i]}): {scene_text}\\n"
         
         # 스타일 추가
-        db_presets = db.get_style_presets()
+        db_presets = await async_db.get_style_presets()
         style_data = db_presets.get(style.lower(), {})
         style_prefix = style_data.get('prompt_value', STYLE_PROMPTS.get(style.lower(), ''))
         
@@ -1811,7 +1805,7 @@ class BulkPromptUpdate(BaseModel):
 @router.post("/api/projects/{project_id}/image-prompts/auto")
 async def auto_generate_images(project_id: int):
     """대본 기반 이미지 프롬프트 생성 및 일괄 이미지 생성 (Longform & Shorts)"""
-    script_data = db.get_script(project_id)
+    script_data = await async_db.get_script(project_id)
     script = ""
     duration = 60
 
@@ -1819,7 +1813,7 @@ async def auto_generate_images(project_id: int):
         script = script_data["full_script"]
         duration = script_data.get("estimated_duration", 60)
     else:
-        shorts_data = db.get_shorts(project_id)
+        shorts_data = await async_db.get_shorts(project_id)
         if shorts_data and shorts_data.get("shorts_data"):
             try:
                 scenes = shorts_data.get("shorts_data", {}).get("scenes", [])
@@ -1866,7 +1860,7 @@ async def auto_generate_images(project_id: int):
     tasks = [process_scene(p) for p in prompts]
     await asyncio.gather(*tasks)
 
-    db.save_image_prompts(project_id, prompts)
+    await async_db.save_image_prompts(project_id, prompts)
     image_grid_prompts = _persist_image_grid_prompts(project_id, prompts)
     return {
         "status": "ok",
@@ -1878,24 +1872,24 @@ async def auto_generate_images(project_id: int):
 @router.post("/api/projects/{project_id}/image-prompts")
 async def save_image_prompts(project_id: int, req: ImagePromptsSave):
     """이미지 프롬프트 저장"""
-    db.save_image_prompts(project_id, req.prompts)
+    await async_db.save_image_prompts(project_id, req.prompts)
     image_grid_prompts = _persist_image_grid_prompts(project_id, req.prompts)
     return {
         "status": "ok",
         "image_grid_prompts": image_grid_prompts,
-        "asset_readiness": sync_project_asset_readiness(project_id),
+        "asset_readiness": await async_db.run(sync_project_asset_readiness, project_id),
     }
 
 
 @router.get("/api/projects/{project_id}/image-prompts")
 async def get_image_prompts(project_id: int):
     """이미지 프롬프트 조회"""
-    prompts = db.get_image_prompts(project_id)
+    prompts = await async_db.get_image_prompts(project_id)
     return {
         "status": "ok",
         "prompts": prompts,
         "image_grid_prompts": _load_image_grid_prompts(project_id, prompts),
-        "asset_readiness": sync_project_asset_readiness(project_id),
+        "asset_readiness": await async_db.run(sync_project_asset_readiness, project_id),
     }
 
 
@@ -1906,7 +1900,7 @@ async def bulk_update_prompts(project_id: int, req: BulkPromptUpdate):
         lines = [line.strip() for line in req.texts.split('\n') if line.strip()]
         if not lines:
             raise HTTPException(400, "입력된 프롬프트가 없습니다.")
-        existing = db.get_image_prompts(project_id)
+        existing = await async_db.get_image_prompts(project_id)
         new_prompts = []
         for i, line in enumerate(lines):
             scene_number = i + 1
@@ -1923,7 +1917,7 @@ async def bulk_update_prompts(project_id: int, req: BulkPromptUpdate):
                 "motion_desc": base.get("motion_desc", "")
             }
             new_prompts.append(prompt_item)
-        db.save_image_prompts(project_id, new_prompts)
+        await async_db.save_image_prompts(project_id, new_prompts)
         return {"status": "success", "count": len(new_prompts)}
     except Exception as e:
         print(f"Bulk Update Error: {e}")
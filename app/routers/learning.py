@@ -37,7 +37,13 @@ async def get_admin_learning_stats(limit: int = Query(100, ge=1, le=500)):
         sync_learning_data(limit)
     except Exception as exc:
         print(f"[Learning] Admin stats remote sync skipped: {exc}")
-    return {"status": "ok", "stats": db.get_learning_admin_stats(limit)}
+    stats = db.get_learning_admin_stats(limit)
+    try:
+        from services.learning_sync_service import sync_status
+        stats["remote_sync"] = sync_status()
+    except Exception as exc:
+        stats["remote_sync"] = {"error": str(exc)}
+    return {"status": "ok", "stats": stats}
 
 
 @router.post("/{project_id}/learning/events")
@@ -12,7 +12,7 @@ import database as db
 from config import config
 from services.music_generation_service import music_generation_service
 from services.music_plan_service import music_plan_service
-from services.remote_drive_render_service import remote_drive_render_service
+from services.remote_drive_render_service import packaging_progress_callback, remote_drive_render_service
 from services.remote_render_service import package_music_project_assets
 from services.web_admin_client import web_admin_client
 
@@ -535,6 +535,7 @@ async def render_music_playlist(
                 project_id,
                 selected_track_files,
                 playlist_title=playlist_title,
+                progress_callback=packaging_progress_callback(project_id),
             )
             result = remote_drive_render_service.enqueue_packaged_project(
                 project_id,
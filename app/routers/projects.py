@@ -3,6 +3,7 @@ from typing import List, Optional
 import re
 import asyncio
 import database as db
+from services.async_db import async_db
 from app.models.project import ProjectCreate, ProjectUpdate, ProjectSettingUpdate, ProjectSettingsSave
 from pydantic import BaseModel
 from config import config
@@ -60,14 +61,14 @@ async def bulk_delete_projects(req: BulkDeleteRequest):
         count = 0
         for pid in req.ids:
             try:
-                project = db.get_project(pid)
+                project = await async_db.get_project(pid)
                 if project:
                     try:
                         from services.project_sync_service import sync_project_deleted
-                        sync_project_deleted(project)
+                        await async_db.run(sync_project_deleted, project)
                     except Exception as sync_e:
                         print(f"[ProjectSync] Bulk delete remote warning for {pid}: {sync_e}")
-                db.delete_project(pid)
+                await async_db.delete_project(pid)
                 count += 1
             except Exception: pass
         return {"status": "success", "deleted_count": count}
@@ -81,9 +82,9 @@ async def bulk_copy_move(req: BulkCopyMoveRequest):
         for pid in req.ids:
             try:
                 if req.action == 'copy':
-                    db.copy_project(pid, req.target_mode)
+                    await async_db.copy_project(pid, req.target_mode)
                 else:
-                    db.move_project(pid, req.target_mode)
+                    await async_db.move_project(pid, req.target_mode)
                 count += 1
             except Exception as inner_e:
                 print(f"Error in bulk {req.action}: {inner_e}")
@@ -151,42 +152,42 @@ async def _ensure_translations_bg_locked(projects: list):
             if p.get("name") and not p.get("name_vi"):
                 translated_name = await translate_text_to_target(p["name"], vi_lang_code)
                 if translated_name:
-                    db.update_project(pid, name_vi=translated_name)
+                    await async_db.update_project(pid, name_vi=translated_name)
                     p["name_vi"] = translated_name
 
             # 1-2. Project Name (English)
             if p.get("name") and not p.get("name_en"):
                 translated_name_en = await translate_text_to_target(p["name"], "en")
                 if translated_name_en:
-                    db.update_project(pid, name_en=translated_name_en)
+                    await async_db.update_project(pid, name_en=translated_name_en)
                     p["name_en"] = translated_name_en
 
             # 1-3. Project Name (Thai UI)
             if p.get("name") and (not p.get("name_th") or not has_thai_text(p.get("name_th"))):
                 translated_name_th = await translate_text_to_target(p["name"], "th")
                 if translated_name_th:
-                    db.update_project(pid, name_th=translated_name_th)
+                    await async_db.update_project(pid, name_th=translated_name_th)
                     p["name_th"] = translated_name_th
 
             # 2. Topic (Vietnamese)
             if p.get("topic") and not p.get("topic_vi"):
                 translated_topic = await translate_text_to_target(p["topic"], vi_lang_code)
                 if translated_topic:
-                    db.update_project(pid, topic_vi=translated_topic)
+                    await async_db.update_project(pid, topic_vi=translated_topic)
                     p["topic_vi"] = translated_topic
 
             # 2-2. Topic (English)
             if p.get("topic") and not p.get("topic_en"):
                 translated_topic_en = await translate_text_to_target(p["topic"], "en")
                 if translated_topic_en:
-                    db.update_project(pid, topic_en=translated_topic_en)
+                    await async_db.update_project(pid, topic_en=translated_topic_en)
                     p["topic_en"] = translated_topic_en
 
             # 2-3. Topic (Thai UI)
             if p.get("topic") and (not p.get("topic_th") or not has_thai_text(p.get("topic_th"))):
                 translated_topic_th = await translate_text_to_target(p["topic"], "th")
                 if translated_topic_th:
-                    db.update_project(pid, topic_th=translated_topic_th)
+                    await async_db.update_project(pid, topic_th=translated_topic_th)
                     p["topic_th"] = translated_topic_th
 
             # 3. Video Title (Vietnamese)
@@ -198,42 +199,42 @@ async def _ensure_translations_bg_locked(projects: list):
             if title_key and p.get(title_key) and not p.get(title_vi_key):
                 translated_title = await translate_text_to_target(p[title_key], vi_lang_code)
                 if translated_title:
-                    db.update_project_setting(pid, "title_vi", translated_title)
+                    await async_db.update_project_setting(pid, "title_vi", translated_title)
                     p[title_vi_key] = translated_title
 
             # 3-2. Video Title (English)
             if title_key and p.get(title_key) and not p.get(title_en_key):
                 translated_title_en = await translate_text_to_target(p[title_key], "en")
                 if translated_title_en:
-                    db.update_project_setting(pid, "title_en", translated_title_en)
+                    await async_db.update_project_setting(pid, "title_en", translated_title_en)
                     p[title_en_key] = translated_title_en
 
             # 3-3. Video Title (Thai UI)
             if title_key and p.get(title_key) and (not p.get(title_th_key) or not has_thai_text(p.get(title_th_key))):
                 translated_title_th = await translate_text_to_target(p[title_key], "th")
                 if translated_title_th:
-                    db.update_project_setting(pid, "title_th", translated_title_th)
+                    await async_db.update_project_setting(pid, "title_th", translated_title_th)
                     p[title_th_key] = translated_title_th
 
             # 4. Image Prompts Scene Script Context
             try:
-                prompts = db.get_image_prompts(pid)
+                prompts = await async_db.get_image_prompts(pid)
                 for pm in prompts:
                     pm_id = pm.get("id")
                     if pm_id and pm.get("scene_text") and not pm.get("scene_text_vi"):
                         translated_scene_text = await translate_text_to_target(pm["scene_text"], vi_lang_code)
                         if translated_scene_text:
-                            db.update_image_prompt_scene_text_vi(pm_id, translated_scene_text)
+                            await async_db.update_image_prompt_scene_text_vi(pm_id, translated_scene_text)
                     
                     if pm_id and pm.get("scene_text") and not pm.get("scene_text_en"):
                         translated_scene_text_en = await translate_text_to_target(pm["scene_text"], "en")
                         if translated_scene_text_en:
-                            db.update_image_prompt_scene_text_en(pm_id, translated_scene_text_en)
+                            await async_db.update_image_prompt_scene_text_en(pm_id, translated_scene_text_en)
 
                     if pm_id and pm.get("scene_text") and (not pm.get("scene_text_th") or not has_thai_text(pm.get("scene_text_th"))):
                         translated_scene_text_th = await translate_text_to_target(pm["scene_text"], "th")
                         if translated_scene_text_th:
-                            db.update_image_prompt_scene_text_th(pm_id, translated_scene_text_th)
+                            await async_db.update_image_prompt_scene_text_th(pm_id, translated_scene_text_th)
 
             except Exception as e_prompts:
                 print(f"[BG Translation Error - Prompts] {e_prompts}")
@@ -265,9 +266,9 @@ async def get_current_project(background_tasks: BackgroundTasks):
     """가장 최근에 작업한 프로젝트 정보 반환 (연결 폴백용)"""
     from services.auth_service import auth_service
     email = auth_service.get_user_email()
-    current_mode = normalize_app_mode(db.get_global_setting("app_mode", DEFAULT_APP_MODE))
+    current_mode = normalize_app_mode(await async_db.get_global_setting("app_mode", DEFAULT_APP_MODE))
     recent = [
-        project for project in db.get_projects_with_status(employee_email=email)
+        project for project in await async_db.get_projects_with_status(employee_email=email)
         if (project.get("app_mode") or DEFAULT_APP_MODE) == current_mode
     ][:1]
     if recent:
@@ -286,7 +287,7 @@ class FeedbackRequest(BaseModel):
 async def submit_project_feedback(project_id: int, request: FeedbackRequest):
     try:
         import database as db
-        db.save_project_feedback(project_id, request.category, request.rating, request.comments)
+        await async_db.save_project_feedback(project_id, request.category, request.rating, request.comments)
         return {"status": "success"}
     except Exception as e:
         raise HTTPException(500, str(e))
@@ -323,11 +324,11 @@ async def get_projects(background_tasks: BackgroundTasks):
         email = auth_service.get_user_email()
 
         # [NEW] Supabase에서 로컬에 없는 프로젝트 복원
-        sync_result = ensure_local_projects_from_remote(email)
+        sync_result = await async_db.run(ensure_local_projects_from_remote, email)
         if sync_result.get("restored", 0) > 0:
             print(f"[ProjectSync] Restored {sync_result['restored']} projects from Supabase")
 
-        projects = db.get_projects_with_status(employee_email=email)
+        projects = await async_db.get_projects_with_status(employee_email=email)
 
         # Run translations sequentially in the background
         background_tasks.add_task(ensure_translations_bg, projects)
@@ -370,7 +371,7 @@ async def create_project(request: Request, background_tasks: BackgroundTasks):
         from services.auth_service import auth_service
         email = auth_service.get_user_email()
 
-        project_id = db.create_project(
+        project_id = await async_db.create_project(
             name=name,
             topic=topic,
             app_mode=app_mode,
@@ -384,10 +385,10 @@ async def create_project(request: Request, background_tasks: BackgroundTasks):
 
 @router.get("/projects/{project_id}")
 async def get_project(project_id: int, background_tasks: BackgroundTasks):
-    project = db.get_project(project_id)
+    project = await async_db.get_project(project_id)
     if not project:
         raise HTTPException(404, "Project not found")
-    settings = db.get_project_settings(project_id) or {}
+    settings = await async_db.get_project_settings(project_id) or {}
     project["app_mode"] = settings.get("app_mode") or DEFAULT_APP_MODE
     project["video_title"] = settings.get("title")
     project["duration_seconds"] = settings.get("duration_seconds")
@@ -396,7 +397,7 @@ async def get_project(project_id: int, background_tasks: BackgroundTasks):
 
 @router.get("/projects/{project_id}/script-structure")
 async def get_script_structure(project_id: int):
-    structure = db.get_script_structure(project_id)
+    structure = await async_db.get_script_structure(project_id)
     if not structure:
         raise HTTPException(404, "No script structure found")
     return structure
@@ -404,8 +405,8 @@ async def get_script_structure(project_id: int):
 @router.post("/projects/{project_id}/script-structure")
 async def save_script_structure(project_id: int, data: dict, background_tasks: BackgroundTasks):
     try:
-        db.save_script_structure(project_id, data)
-        db.mark_project_dirty(project_id)
+        await async_db.save_script_structure(project_id, data)
+        await async_db.mark_project_dirty(project_id)
         _queue_project_sync(background_tasks, project_id)
         return {"status": "ok"}
     except Exception as e:
@@ -426,7 +427,7 @@ async def update_project(project_id: int, data: ProjectUpdate, background_tasks:
         if data.target_language is not None:
             update_data["target_language"] = data.target_language
             
-        db.update_project(project_id, **update_data)
+        await async_db.update_project(project_id, **update_data)
         _queue_project_sync(background_tasks, project_id)
         return {"status": "success"}
     except Exception as e:
@@ -435,14 +436,14 @@ async def update_project(project_id: int, data: ProjectUpdate, background_tasks:
 @router.delete("/projects/{project_id}")
 async def delete_project(project_id: int):
     try:
-        project = db.get_project(project_id)
+        project = await async_db.get_project(project_id)
         if project:
             try:
                 from services.project_sync_service import sync_project_deleted
-                sync_project_deleted(project)
+                await async_db.run(sync_project_deleted, project)
             except Exception as sync_e:
                 print(f"[ProjectSync] Delete remote warning for {project_id}: {sync_e}")
-        db.delete_project(project_id)
+        await async_db.delete_project(project_id)
         return {"status": "success"}
     except Exception as e:
         raise HTTPException(500, str(e))
@@ -454,7 +455,7 @@ async def save_project_settings(project_id: int, settings: ProjectSettingsSave,
         if "title" in settings_dict:
             settings_dict["title_vi"] = None
         settings_dict = _strip_locked_styles(project_id, settings_dict)
-        db.save_project_settings(project_id, settings_dict)
+        await async_db.save_project_settings(project_id, settings_dict)
         _queue_project_sync(background_tasks, project_id)
         return {"status": "success"}
     except Exception as e:
@@ -465,9 +466,9 @@ async def update_project_setting(project_id: int, data: ProjectSettingUpdate, ba
     try:
         if data.key in _STYLE_LOCK_KEYS and _is_style_locked(project_id):
             return {"status": "locked", "message": "AI가 배정한 스타일은 변경할 수 없습니다.", "key": data.key}
-        db.update_project_setting(project_id, data.key, data.value)
+        await async_db.update_project_setting(project_id, data.key, data.value)
         if data.key == "title":
-            db.update_project_setting(project_id, "title_vi", None)
+            await async_db.update_project_setting(project_id, "title_vi", None)
         _queue_project_sync(background_tasks, project_id)
         return {"status": "success"}
     except Exception as e:
@@ -476,7 +477,7 @@ async def update_project_setting(project_id: int, data: ProjectSettingUpdate, ba
 # [NEW] GET Method for settings
 @router.get("/project-settings/{project_id}")
 async def get_project_settings_api(project_id: int):
-    settings = db.get_project_settings(project_id)
+    settings = await async_db.get_project_settings(project_id)
     if not settings:
         raise HTTPException(404, "Settings not found")
     return settings
@@ -492,19 +493,15 @@ async def update_motion_desc(project_id: int, data: MotionDescUpdate, background
     """씬별 모션 프롬프트 업데이트"""
     try:
         # 1. Update project_settings (for fast lookup)
-        db.update_project_setting(project_id, f"scene_{data.scene_number}_motion_desc", data.motion_desc)
+        await async_db.update_project_setting(project_id, f"scene_{data.scene_number}_motion_desc", data.motion_desc)
         
         # 2. Update image_prompts table (for persistence)
         # We need a db function for this specific update or use generic execute
-        conn = db.get_db()
-        cur = conn.cursor()
-        cur.execute(
-            "UPDATE image_prompts SET motion_desc = ? WHERE project_id = ? AND scene_number = ?", 
+        await async_db.execute_write(
+            "UPDATE image_prompts SET motion_desc = ? WHERE project_id = ? AND scene_number = ?",
             (data.motion_desc, project_id, data.scene_number)
         )
-        conn.commit()
-        conn.close()
-        db.mark_project_dirty(project_id)
+        await async_db.mark_project_dirty(project_id)
         _queue_project_sync(background_tasks, project_id)
 
         return {"status": "success"}
@@ -529,11 +526,11 @@ async def generate_single_video(project_id: int, req: SingleVideoGenRequest):
         from datetime import datetime
         
         # 1. Get Project Settings & Style
-        p_settings = db.get_project_settings(project_id) or {}
+        p_settings = await async_db.get_project_settings(project_id) or {}
         image_style = p_settings.get('image_style', 'realistic')
         
         # DB에서 스타일 prefix 가져오기
-        db_presets = db.get_style_presets()
+        db_presets = await async_db.get_style_presets()
         style_settings = db_presets.get(image_style.lower(), {})
         style_prefix = (style_settings.get('prompt_value') or STYLE_PROMPTS.get(image_style.lower(), '')).strip()
 
@@ -568,7 +565,7 @@ async def generate_single_video(project_id: int, req: SingleVideoGenRequest):
             style_prefix = style_prefix.strip(', ')
 
         # 2. Get Image Path
-        prompts = db.get_image_prompts(project_id)
+        prompts = await async_db.get_image_prompts(project_id)
         target_p = next((p for p in prompts if p['scene_number'] == req.scene_number), None)
         if not target_p: raise HTTPException(404, "Scene not found")
         
@@ -620,13 +617,10 @@ async def generate_single_video(project_id: int, req: SingleVideoGenRequest):
                 )
                 # DB에도 저장 (다음에 재사용)
                 if effective_motion_desc:
-                    conn = db.get_db()
-                    conn.execute(
+                    await async_db.execute_write(
                         "UPDATE image_prompts SET motion_desc=? WHERE project_id=? AND scene_number=?",
                         (effective_motion_desc, project_id, req.scene_number)
                     )
-                    conn.commit()
-                    conn.close()
             except Exception as me:
                 print(f"⚠️ motion_desc 자동 생성 실패: {me}")
 
@@ -678,9 +672,9 @@ async def generate_single_video(project_id: int, req: SingleVideoGenRequest):
         elif actual_engine == "image":
             # [2D Motion] Simple Pan/Zoom
             # Check Global Webtoon Settings
-            w_auto = db.get_global_setting("webtoon_auto_split", True, value_type="bool")
-            w_pan = db.get_global_setting("webtoon_smart_pan", True, value_type="bool")
-            w_zoom = db.get_global_setting("webtoon_convert_zoom", True, value_type="bool")
+            w_auto = await async_db.get_global_setting("webtoon_auto_split", True, value_type="bool")
+            w_pan = await async_db.get_global_setting("webtoon_smart_pan", True, value_type="bool")
+            w_zoom = await async_db.get_global_setting("webtoon_convert_zoom", True, value_type="bool")
 
             # pan 씬 자동 전환 시 motion_desc에서 판 방향 추출, 아니면 req.motion_desc 사용
             if pan_redirected:
@@ -711,7 +705,7 @@ async def generate_single_video(project_id: int, req: SingleVideoGenRequest):
                 
         # 3. Save Result
         if video_url:
-            db.update_image_prompt_video_url(project_id, req.scene_number, video_url)
+            await async_db.update_image_prompt_video_url(project_id, req.scene_number, video_url)
             result = {"status": "success", "video_url": video_url, "engine_used": actual_engine}
             if pan_redirected:
                 result["warning"] = f"pan 씬 감지: Wan → image 엔진으로 자동 전환됨 (세로 잘림 방지)"
@@ -741,13 +735,13 @@ async def generate_tts_scenes(project_id: int, req: SceneTTSRequest):
         import os, uuid
 
         # 1. 씬 목록 로드 (scene_text 포함)
-        image_prompts = db.get_image_prompts(project_id)
+        image_prompts = await async_db.get_image_prompts(project_id)
         if not image_prompts:
             raise HTTPException(400, "이미지 프롬프트(씬 목록)가 없습니다. 먼저 이미지 프롬프트를 생성하세요.")
 
         # 2. 보이스 설정 결정 (요청 → DB 설정 → 프로젝트 언어 기본값 순)
-        p_settings = db.get_project_settings(project_id) or {}
-        project = db.get_project(project_id) or {}
+        p_settings = await async_db.get_project_settings(project_id) or {}
+        project = await async_db.get_project(project_id) or {}
         target_language = p_settings.get("target_language") or project.get("language") or "ko"
         provider = req.voice_provider or p_settings.get("voice_provider") or ("elevenlabs" if str(target_language).startswith("ko") else "gemini")
         voice_id = req.voice_id or p_settings.get("voice_id") or p_settings.get("voice_name")
@@ -796,7 +790,7 @@ async def generate_tts_scenes(project_id: int, req: SceneTTSRequest):
                             })
                         cumulative_time += duration
                         audio_url = f"/output/{os.path.basename(audio_path)}"
-                        db.update_project_setting(project_id, f"scene_{scene_num}_audio_path", audio_path)
+                        await async_db.update_project_setting(project_id, f"scene_{scene_num}_audio_path", audio_path)
                         results.append({"scene_number": scene_num, "status": "ok", "audio_url": audio_url, "duration": duration})
                     else:
                         results.append({"scene_number": scene_num, "status": "error", "reason": "elevenlabs_failed"})
@@ -817,7 +811,7 @@ async def generate_tts_scenes(project_id: int, req: SceneTTSRequest):
                         except Exception: dur = 3.0
                         cumulative_time += dur
                         audio_url = f"/output/{os.path.basename(s_out)}"
-                        db.update_project_setting(project_id, f"scene_{scene_num}_audio_path", s_out)
+                        await async_db.update_project_setting(project_id, f"scene_{scene_num}_audio_path", s_out)
                         results.append({"scene_number": scene_num, "status": "ok", "audio_url": audio_url, "duration": dur})
                     else:
                         results.append({"scene_number": scene_num, "status": "error", "reason": "tts_failed"})
@@ -828,7 +822,7 @@ async def generate_tts_scenes(project_id: int, req: SceneTTSRequest):
         # 워드 정렬 데이터 저장 (자막 싱크용)
         if all_alignments:
             import json as _json
-            db.update_project_setting(project_id, "tts_word_alignment", _json.dumps(all_alignments, ensure_ascii=False))
+            await async_db.update_project_setting(project_id, "tts_word_alignment", _json.dumps(all_alignments, ensure_ascii=False))
 
         ok_count = sum(1 for r in results if r["status"] == "ok")
         return {
@@ -7,7 +7,7 @@ import shutil
 import uuid
 import time
 import httpx
-from fastapi.responses import RedirectResponse, HTMLResponse, Response, JSONResponse
+from fastapi.responses import RedirectResponse, HTMLResponse, Response, JSONResponse, StreamingResponse
 from config import config
 from app.modes import DEFAULT_APP_MODE, normalize_app_mode
 import csv
@@ -479,47 +479,38 @@ async def get_settlement_summary(
     }
 
 
-@router.get("/settlement-export")
-async def export_settlement_csv(
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    email: Optional[str] = None,
-    project_pay: int = 0,
-    ai_pay: int = 0,
-    approved_only: Optional[str] = "true",
-):
-    _require_advanced_settings_access()
-    import csv
-    import io
-    import time as _time
+class _CsvLineBuffer:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 버퍼 (스트리밍용)"""
 
-    stats = db.get_worker_settlement_stats(
-        start_date=start_date,
-        end_date=end_date,
-        email=(email or "").strip() or None,
-        approved_only=_parse_bool_query(approved_only, True),
-    )
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "worker",
-        "approved_projects",
-        "total_projects",
-        "success_ai_tasks",
-        "total_ai_tasks",
-        "tts_tasks",
-        "media_tasks",
-        "project_pay",
-        "ai_pay",
-        "total_payout",
-    ])
+    def write(self, value):
+        return value
+
+
+_SETTLEMENT_CSV_HEADER = [
+    "worker",
+    "approved_projects",
+    "total_projects",
+    "success_ai_tasks",
+    "total_ai_tasks",
+    "tts_tasks",
+    "media_tasks",
+    "project_pay",
+    "ai_pay",
+    "total_payout",
+]
+
+
+def _iter_settlement_csv(stats, project_pay: int = 0, ai_pay: int = 0):
+    """정산 통계를 CSV 한 줄씩 생성 (엑셀 호환 BOM 포함)"""
+    writer = csv.writer(_CsvLineBuffer())
+    yield "\ufeff" + writer.writerow(_SETTLEMENT_CSV_HEADER)
     for row in stats:
         approved_projects = int(row.get("completed_projects") or 0)
         success_ai_tasks = int(row.get("success_ai_tasks") or 0)
         total_project_payout = int(row.get("total_project_payout") or 0)
         project_earnings = total_project_payout if total_project_payout > 0 else (approved_projects * int(project_pay or 0))
         ai_earnings = success_ai_tasks * int(ai_pay or 0)
-        writer.writerow([
+        yield writer.writerow([
             row.get("worker") or "unknown",
             approved_projects,
             int(row.get("total_projects") or 0),
@@ -532,9 +523,29 @@ async def export_settlement_csv(
             project_earnings + ai_earnings,
         ])
 
-    filename = f"air_settlement_{_time.strftime('%Y%m%d_%H%M%S')}.csv"
-    return Response(
-        content="\ufeff" + output.getvalue(),
+
+@router.get("/settlement-export")
+async def export_settlement_csv(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    email: Optional[str] = None,
+    project_pay: int = 0,
+    ai_pay: int = 0,
+    approved_only: Optional[str] = "true",
+):
+    _require_advanced_settings_access()
+    from services.async_db import async_db
+
+    # 집계는 ai_log_rollups에서 읽으므로 작업자 수만큼의 행만 내려온다
+    stats = await async_db.get_worker_settlement_stats(
+        start_date=start_date,
+        end_date=end_date,
+        email=(email or "").strip() or None,
+        approved_only=_parse_bool_query(approved_only, True),
+    )
+    filename = f"air_settlement_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+    return StreamingResponse(
+        _iter_settlement_csv(stats, project_pay, ai_pay),
         media_type="text/csv; charset=utf-8",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -769,11 +780,7 @@ async def analyze_style_image(
 async def delete_style_preset(style_key: str):
     _require_advanced_settings_access()
     """스타일 프리셋 삭제 (커스텀)"""
-    conn = db.get_db()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM style_presets WHERE style_key = ?", (style_key,))
-    conn.commit()
-    conn.close()
+    db.delete_style_preset(style_key)
     return {"status": "ok"}
 
 
@@ -922,11 +929,9 @@ async def delete_thumbnail_style_preset(style_key: str):
     _require_advanced_settings_access()
     """썸네일 스타일 프리셋 삭제"""
     try:
-        conn = db.get_db()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM thumbnail_style_presets WHERE style_key = ?", (style_key,))
-        conn.commit()
-        conn.close()
+        db.run_write(lambda conn: conn.execute(
+            "DELETE FROM thumbnail_style_presets WHERE style_key = ?", (style_key,)
+        ))
         return {"status": "ok"}
     except Exception as e:
         raise HTTPException(500, str(e))
@@ -1349,104 +1354,6 @@ async def get_settlement_summary(
         return {"status": "error", "message": str(e)}
 
 
-@router.get("/settlement-export")
-async def export_settlement(
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    email: Optional[str] = None,
-    project_pay: int = 10000,
-    ai_pay: int = 500
-):
-    """Export settlement data as CSV (admin only)"""
-    try:
-        from services.auth_service import auth_service
-        from services.web_admin_client import web_admin_client
-        import csv
-        import io
-
-        user_email = auth_service.get_user_email()
-        if not user_email:
-            return {"status": "error", "message": "Not authenticated"}
-
-        # Check if user is admin
-        if web_admin_client.has_supabase():
-            is_admin = web_admin_client.is_admin_user(user_email)
-        else:
-            is_admin = db.is_user_admin(user_email)
-
-        if not is_admin:
-            raise HTTPException(status_code=403, detail="Admin access required")
-
-        # Get settlement data
-        if web_admin_client.has_supabase():
-            stats = web_admin_client.get_settlement_summary(start_date, end_date, email)
-        else:
-            stats = db.get_settlement_summary(start_date, end_date, email)
-
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow([
-            'Worker Email',
-            'Total Projects',
-            'Completed Projects',
-            'Total AI Tasks',
-            'Success AI Tasks',
-            'TTS Tasks',
-            'Media Tasks',
-            'Project Payout (KRW)',
-            'AI Image Payout (KRW)',
-            'Total Payout (KRW)'
-        ])
-
-        # Data rows
-        for stat in stats:
-            worker_email = stat.get('worker', '')
-            completed_projects = stat.get('completed_projects', 0)
-            success_ai_tasks = stat.get('success_ai_tasks', 0)
-
-            project_earnings = completed_projects * project_pay
-            ai_earnings = success_ai_tasks * ai_pay
-            total_payout = project_earnings + ai_earnings
-
-            writer.writerow([
-                worker_email,
-                stat.get('total_projects', 0),
-                completed_projects,
-                stat.get('total_ai_tasks', 0),
-                success_ai_tasks,
-                stat.get('tts_tasks', 0),
-                stat.get('media_tasks', 0),
-                project_earnings,
-                ai_earnings,
-                total_payout
-            ])
-
-        csv_content = output.getvalue()
-
-        # Return as downloadable file
-        from fastapi.responses import StreamingResponse
-        from datetime import datetime
-
-        filename = f"settlement_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-
-        return StreamingResponse(
-            iter([csv_content]),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-
-    except HTTPException as he:
-        return {"status": "error", "detail": he.detail}
-    except Exception as e:
-        print(f"Error exporting settlement: {e}")
-        import traceback
-        traceback.print_exc()
-        return {"status": "error", "message": str(e)}
-
-
 # Alias endpoint for frontend compatibility
 @router.get("/work-history")
 async def get_work_history():
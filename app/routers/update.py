@@ -26,7 +26,8 @@ async def check_status():
     return {
         "is_downloading": updater_service.is_downloading,
         "progress": updater_service.download_progress,
-        "error": updater_service.download_error
+        "error": updater_service.download_error,
+        "kind": updater_service.download_kind,
     }
 
 @router.post("/apply")
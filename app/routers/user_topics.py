@@ -336,7 +336,8 @@ def _call_bridge(action: str, params: dict | None = None) -> dict:
         raise HTTPException(status_code=401, detail="Authentication required")
 
     try:
-        r = requests.post(
+        r = web_admin_client.request(
+            "POST",
             f"{web_admin_client.dashboard_url}/api/desktop-topics-bridge",
             json={"email": email, "session_token": session_token, "action": action, "params": params or {}},
             headers=web_admin_client.dashboard_headers(content_type=True),
@@ -384,7 +385,8 @@ def _supabase_get_direct(table: str, params: dict, timeout: int = 15) -> list:
     supabase_url, headers = _supabase_direct_config()
     if not supabase_url:
         raise BridgeError("local Supabase fallback is not configured")
-    r = requests.get(
+    r = web_admin_client.request(
+        "GET",
         f"{supabase_url}/rest/v1/{table}",
         headers=headers,
         params=params,
@@ -402,7 +404,8 @@ def _supabase_patch_direct(table: str, params: dict, payload: dict, timeout: int
     if not supabase_url:
         raise BridgeError("local Supabase fallback is not configured")
     patch_headers = {**headers, "Prefer": "return=representation"}
-    r = requests.patch(
+    r = web_admin_client.request(
+        "PATCH",
         f"{supabase_url}/rest/v1/{table}",
         headers=patch_headers,
         params=params,
@@ -468,6 +471,23 @@ def _call_local_supabase_action(action: str, params: dict | None = None) -> dict
         rows = _supabase_patch_direct("topics_queue", {"id": f"eq.{topic_id}"}, fields)
         return {"status": "ok", "rows": rows}
 
+    if action == "save_translations_batch":
+        lang = str(params.get("lang") or "").strip()
+        if lang not in {"en", "vi", "th"}:
+            return {"status": "error", "detail": "invalid_lang"}
+        saved, failed = 0, []
+        for item in params.get("items") or []:
+            topic_id = str((item or {}).get("topic_id") or "").strip()
+            fields = (item or {}).get("fields") or {}
+            if not topic_id or not isinstance(fields, dict):
+                continue
+            try:
+                _supabase_patch_direct("topics_queue", {"id": f"eq.{topic_id}"}, fields)
+                saved += 1
+            except BridgeError:
+                failed.append(topic_id)
+        return {"status": "ok", "saved": saved, "failed": failed}
+
     if action == "get_rebalancing_settings":
         try:
             rows = _supabase_get_direct(
@@ -863,6 +883,9 @@ def _fetch_stored_translations(topic_ids: list[str], lang_code: str) -> dict:
         return {}
 
 
+_TRANSLATION_BATCH_SIZE = 200
+
+
 async def _save_translations_to_db(translations: dict, lang_code: str) -> None:
     """Persist newly AI-translated topic fields back to Supabase topics_queue
     via the bridge. Fire-and-forget: errors are logged but not propagated to
@@ -871,23 +894,42 @@ async def _save_translations_to_db(translations: dict, lang_code: str) -> None:
         return
 
     lang = lang_code
-
-    async def _patch_one(topic_id: str, data: dict) -> None:
+    items = []
+    for topic_id, data in translations.items():
         topic_val = str(data.get(f"topic_{lang}") or "").strip()
         if not topic_val:
-            return
-        fields = {
-            f"topic_{lang}": topic_val,
-            f"category_name_{lang}": str(data.get(f"category_name_{lang}") or "").strip(),
-        }
+            continue
+        items.append({
+            "topic_id": topic_id,
+            "fields": {
+                f"topic_{lang}": topic_val,
+                f"category_name_{lang}": str(data.get(f"category_name_{lang}") or "").strip(),
+            },
+        })
+
+    async def _patch_one(item: dict) -> None:
         try:
             await asyncio.to_thread(
-                _call_bridge_or_local, "save_translations", {"topic_id": topic_id, "lang": lang, "fields": fields}
+                _call_bridge_or_local, "save_translations", {**item, "lang": lang}
             )
         except Exception as e:
-            print(f"[User Topics] Failed to save translation for topic {topic_id} ({lang}): {e}")
+            print(f"[User Topics] Failed to save translation for topic {item['topic_id']} ({lang}): {e}")
 
-    await asyncio.gather(*(_patch_one(tid, data) for tid, data in translations.items()))
+    # One bridge round-trip per 200 topics instead of one per topic.
+    for start in range(0, len(items), _TRANSLATION_BATCH_SIZE):
+        chunk = items[start:start + _TRANSLATION_BATCH_SIZE]
+        try:
+            result = await asyncio.to_thread(
+                _call_bridge_or_local, "save_translations_batch", {"lang": lang, "items": chunk}
+            )
+        except Exception as e:
+            print(f"[User Topics] Failed to save {len(chunk)} translations ({lang}): {e}")
+            continue
+        if str((result or {}).get("detail") or "").startswith("unknown_action"):
+            # Older auth-web deployment without the batch action.
+            await asyncio.gather(*(_patch_one(item) for item in chunk))
+        elif (result or {}).get("failed"):
+            print(f"[User Topics] Failed to save translations for topics {result['failed']} ({lang})")
 
 def _normalize_topic_payload(topic: dict, policy: dict) -> dict:
     category = topic.get("categories") or {}
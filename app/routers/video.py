@@ -14,6 +14,7 @@ import re
 
 from config import config
 import database as db
+from services.async_db import async_db
 from services.video_service import video_service
 from services.storage_service import storage_service
 from app.modes import is_shorts_mode
@@ -225,7 +226,7 @@ class SubtitlePresetSave(BaseModel):
 async def get_subtitle_presets():
     """저장된 자막 프리셋 목록 조회"""
     try:
-        presets = db.get_subtitle_style_presets()
+        presets = await async_db.get_subtitle_style_presets()
         return {"status": "ok", "presets": presets}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -237,7 +238,7 @@ async def save_subtitle_preset(req: SubtitlePresetSave):
         if not req.name:
             return {"status": "error", "error": "프리셋 이름을 입력하세요."}
         
-        db.save_subtitle_style_preset(req.name, json.dumps(req.settings, ensure_ascii=False))
+        await async_db.save_subtitle_style_preset(req.name, json.dumps(req.settings, ensure_ascii=False))
         return {"status": "ok"}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -246,7 +247,7 @@ async def save_subtitle_preset(req: SubtitlePresetSave):
 async def delete_subtitle_preset(name: str):
     """자막 프리셋 삭제"""
     try:
-        db.delete_subtitle_style_preset(name)
+        await async_db.delete_subtitle_style_preset(name)
         return {"status": "ok"}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -256,11 +257,11 @@ async def get_subtitles(project_id: int):
     """자막 데이터 조회"""
     try:
         # 1. Project & TTS Check
-        tts_data = db.get_tts(project_id)
+        tts_data = await async_db.get_tts(project_id)
         if not tts_data or not tts_data.get('audio_path'):
             return {"status": "error", "error": "TTS 오디오가 없습니다. 먼저 TTS를 생성해주세요."}
             
-        settings = db.get_project_settings(project_id)
+        settings = await async_db.get_project_settings(project_id)
         
         # 2. Audio URL
         audio_path = tts_data['audio_path']
@@ -294,7 +295,7 @@ async def get_subtitles(project_id: int):
                 pass
         
         # 4. Images for preview
-        image_prompts = db.get_image_prompts(project_id)
+        image_prompts = await async_db.get_image_prompts(project_id)
         source_images = []
         for p in image_prompts:
             if p.get('video_url'):
@@ -428,20 +429,20 @@ async def generate_subtitles_api(req: dict = Body(...)):
         
     try:
         # Load necessary data
-        tts_data = db.get_tts(project_id)
+        tts_data = await async_db.get_tts(project_id)
         if not tts_data or not tts_data.get('audio_path'):
             return {"status": "error", "error": "TTS 오디오가 없습니다."}
             
-        project = db.get_project(project_id)
-        project_settings = db.get_project_settings(project_id) or {}
+        project = await async_db.get_project(project_id)
+        project_settings = await async_db.get_project_settings(project_id) or {}
         subtitle_max_chars = _subtitle_max_chars(
             req.get("subtitle_max_chars") or project_settings.get("subtitle_max_chars"),
             25
         )
-        db.update_project_setting(project_id, 'subtitle_max_chars', subtitle_max_chars)
+        await async_db.update_project_setting(project_id, 'subtitle_max_chars', subtitle_max_chars)
         
         # Script text for alignment (optional)
-        script_data = db.get_script(project_id)
+        script_data = await async_db.get_script(project_id)
         full_script = script_data['full_script'] if script_data else ""
         
         # Service Call
@@ -496,20 +497,20 @@ async def generate_subtitles_api(req: dict = Body(...)):
             json.dump(subtitles, f, ensure_ascii=False, indent=2)
             
         # Update DB
-        db.update_project_setting(project_id, 'subtitle_path', save_path)
+        await async_db.update_project_setting(project_id, 'subtitle_path', save_path)
         # [FIX] Keep an untouched snapshot so the "초기화" reset button can restore
         # subtitles even after manual edits (e.g. deleting rows) overwrite subtitle_path.
-        db.update_project_setting(project_id, 'subtitle_path_original', save_path)
+        await async_db.update_project_setting(project_id, 'subtitle_path_original', save_path)
         # Fresh generation invalidates any previous manual timeline edits.
-        db.update_project_setting(project_id, 'image_timings_path', None)
-        db.update_project_setting(project_id, 'timeline_images_path', None)
-        db.update_project_setting(project_id, 'image_effects_path', None)
+        await async_db.update_project_setting(project_id, 'image_timings_path', None)
+        await async_db.update_project_setting(project_id, 'timeline_images_path', None)
+        await async_db.update_project_setting(project_id, 'image_effects_path', None)
 
         # Calculate Image Timings for Frontend Preview
         image_timings = []
         image_urls = []
         try:
-             images_data = db.get_image_prompts(project_id)
+             images_data = await async_db.get_image_prompts(project_id)
              if images_data:
                  image_urls = []
                  for img in images_data:
@@ -560,7 +561,7 @@ async def save_subtitles_api(req: dict = Body(...)):
             json.dump(subtitles, f, ensure_ascii=False, indent=2)
             
         # Update DB
-        db.update_project_setting(project_id, 'subtitle_path', save_path)
+        await async_db.update_project_setting(project_id, 'subtitle_path', save_path)
         
         # Save Image Timings if provided
         image_timings = req.get("image_timings")
@@ -569,7 +570,7 @@ async def save_subtitles_api(req: dict = Body(...)):
              timings_path = os.path.join(config.OUTPUT_DIR, timings_filename)
              with open(timings_path, "w", encoding="utf-8") as f:
                  json.dump(image_timings, f, indent=2)
-             db.update_project_setting(project_id, 'image_timings_path', timings_path)
+             await async_db.update_project_setting(project_id, 'image_timings_path', timings_path)
 
         # Save Timeline Images (Custom Order/Reuse)
         # [FIX] images=None → 전송 안 됨, images=[] → 삭제 후 빈 목록 (둘 다 처리)
@@ -579,7 +580,7 @@ async def save_subtitles_api(req: dict = Body(...)):
              tl_path = os.path.join(config.OUTPUT_DIR, tl_filename)
              with open(tl_path, "w", encoding="utf-8") as f:
                  json.dump(timeline_images, f, indent=2)
-             db.update_project_setting(project_id, 'timeline_images_path', tl_path)
+             await async_db.update_project_setting(project_id, 'timeline_images_path', tl_path)
 
         # Save Image Effects
         image_effects = req.get("image_effects")
@@ -588,7 +589,7 @@ async def save_subtitles_api(req: dict = Body(...)):
              ef_path = os.path.join(config.OUTPUT_DIR, ef_filename)
              with open(ef_path, "w", encoding="utf-8") as f:
                  json.dump(image_effects, f, indent=2)
-             db.update_project_setting(project_id, 'image_effects_path', ef_path)
+             await async_db.update_project_setting(project_id, 'image_effects_path', ef_path)
 
         sfx_cues = req.get("sfx_cues")
         if sfx_cues is not None:
@@ -612,7 +613,7 @@ async def auto_sync_images_api(req: dict = Body(...)):
 
     try:
         # 1. Load Data
-        settings = db.get_project_settings(project_id)
+        settings = await async_db.get_project_settings(project_id)
         
         # Subtitles
         subtitle_path = settings.get('subtitle_path')
@@ -624,7 +625,7 @@ async def auto_sync_images_api(req: dict = Body(...)):
              return {"status": "error", "error": "자막이 없습니다. 먼저 자막을 생성하세요."}
 
         # Images (Source)
-        prompts_data = db.get_image_prompts(project_id)
+        prompts_data = await async_db.get_image_prompts(project_id)
         valid_images = [p for p in prompts_data if p.get('image_url')]
         
         if not valid_images:
@@ -706,13 +707,13 @@ async def auto_sync_images_api(req: dict = Body(...)):
         tl_path = os.path.join(config.OUTPUT_DIR, tl_filename)
         with open(tl_path, "w", encoding="utf-8") as f:
             json.dump(new_timeline_images, f, indent=2)
-        db.update_project_setting(project_id, 'timeline_images_path', tl_path)
+        await async_db.update_project_setting(project_id, 'timeline_images_path', tl_path)
         
         timings_filename = f"image_timings_{project_id}_auto_{int(time.time())}.json"
         timings_path = os.path.join(config.OUTPUT_DIR, timings_filename)
         with open(timings_path, "w", encoding="utf-8") as f:
              json.dump(new_image_timings, f, indent=2)
-        db.update_project_setting(project_id, 'image_timings_path', timings_path)
+        await async_db.update_project_setting(project_id, 'image_timings_path', timings_path)
 
         return {
             "status": "ok", 
@@ -741,9 +742,9 @@ async def regenerate_subtitles_api(project_id: int, req: dict = Body(default=Non
 async def reset_subtitle_timeline(project_id: int):
     """타임라인 이미지/타이밍/효과 설정을 초기화"""
     try:
-        db.update_project_setting(project_id, 'timeline_images_path', None)
-        db.update_project_setting(project_id, 'image_timings_path', None)
-        db.update_project_setting(project_id, 'image_effects_path', None)
+        await async_db.update_project_setting(project_id, 'timeline_images_path', None)
+        await async_db.update_project_setting(project_id, 'image_timings_path', None)
+        await async_db.update_project_setting(project_id, 'image_effects_path', None)
         
         return {"status": "ok", "message": "타임라인이 초기화되었습니다."}
     except Exception as e:
@@ -755,7 +756,7 @@ async def reset_subtitle_timeline(project_id: int):
 async def get_project_subtitles(project_id: int, force_refresh: bool = False, ui_lang: str = "vi", force_translate: bool = False):
     """프로젝트 자막 및 이미지 싱크 데이터 조회"""
     try:
-        settings = db.get_project_settings(project_id) or {}
+        settings = await async_db.get_project_settings(project_id) or {}
         subtitle_path = settings.get('subtitle_path')
         image_timings_path = settings.get('image_timings_path')
         timeline_images_path = settings.get('timeline_images_path')
@@ -780,7 +781,7 @@ async def get_project_subtitles(project_id: int, force_refresh: bool = False, ui
         audio_url = None
         audio_duration = 0.0
         try:
-            tts_data = db.get_tts(project_id)
+            tts_data = await async_db.get_tts(project_id)
             if tts_data and tts_data.get('audio_path'):
                 audio_path = tts_data['audio_path']
                 if os.path.exists(audio_path):
@@ -885,7 +886,7 @@ Subtitles to translate:
                  timeline_images = json.load(f)
         
         # Source images from DB - [FIX] Use scene-aware list to prevent jumbling/compression
-        prompts = db.get_image_prompts(project_id)
+        prompts = await async_db.get_image_prompts(project_id)
         source_images = []
         for p in prompts:
             # If both image and video are missing, we still need a placeholder to keep timing sync
@@ -995,7 +996,7 @@ Subtitles to translate:
 async def get_subtitle_defaults_api():
     """최근 사용된(또는 기본) 자막 설정 반환 (오토파일럿 UI 표시용)"""
     try:
-        defaults = db.get_subtitle_defaults()
+        defaults = await async_db.get_subtitle_defaults()
         return {"status": "ok", "settings": defaults}
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -1013,7 +1014,7 @@ async def delete_subtitle_segment(
         end = request.get('end')
 
         # 1. 자막 로드
-        settings = db.get_project_settings(project_id)
+        settings = await async_db.get_project_settings(project_id)
         subtitle_path = settings.get('subtitle_path')
         if not subtitle_path or not os.path.exists(subtitle_path):
              return {"status": "error", "error": "자막 파일이 없습니다"}
@@ -1026,7 +1027,7 @@ async def delete_subtitle_segment(
             return {"status": "error", "error": "잘못된 자막 인덱스"}
 
         # 2. 오디오 자르기 (서비스 호출)
-        audio_data = db.get_tts(project_id)
+        audio_data = await async_db.get_tts(project_id)
         if audio_data and audio_data.get('audio_path'):
             from services.audio_service import audio_service
             audio_service.cut_audio_segment(audio_data['audio_path'], start, end)
@@ -1125,10 +1126,10 @@ async def render_project_video(
     try:
 
         # 1. 데이터 조회
-        p_settings = db.get_project_settings(project_id) or {}
+        p_settings = await async_db.get_project_settings(project_id) or {}
         project_mode = str(p_settings.get("app_mode") or "longform").strip().lower()
         if project_mode == "longform":
-            readiness = sync_project_asset_readiness(project_id)
+            readiness = await async_db.run(sync_project_asset_readiness, project_id)
             if not readiness.get("assets_ready"):
                 raise HTTPException(
                     status_code=409,
@@ -1151,18 +1152,18 @@ async def render_project_video(
         from services.settings_service import settings_service
         global_settings = settings_service.get_settings()
         app_mode = global_settings.get("app_mode", "longform")
-        tts_data = db.get_tts(project_id)
+        tts_data = await async_db.get_tts(project_id)
 
         estimated_payout = _to_int(p_settings.get("estimated_payout"), 0)
         payout_summary = _build_asset_mix_payout_summary(project_id, estimated_payout)
         actual_payout = payout_summary["actual_payout"]
 
-        db.update_project_setting(project_id, "actual_payout", actual_payout)
-        db.update_project_setting(project_id, "video_clip_ratio", payout_summary["video_clip_ratio"])
-        db.update_project_setting(project_id, "total_scenes", payout_summary["total_scenes"])
-        db.update_project_setting(project_id, "video_scenes", payout_summary["video_scenes"])
-        db.update_project_setting(project_id, "image_scenes", payout_summary["image_scenes"])
-        db.update_project_setting(project_id, "asset_mix_summary_json", json.dumps(payout_summary, ensure_ascii=False))
+        await async_db.update_project_setting(project_id, "actual_payout", actual_payout)
+        await async_db.update_project_setting(project_id, "video_clip_ratio", payout_summary["video_clip_ratio"])
+        await async_db.update_project_setting(project_id, "total_scenes", payout_summary["total_scenes"])
+        await async_db.update_project_setting(project_id, "video_scenes", payout_summary["video_scenes"])
+        await async_db.update_project_setting(project_id, "image_scenes", payout_summary["image_scenes"])
+        await async_db.update_project_setting(project_id, "asset_mix_summary_json", json.dumps(payout_summary, ensure_ascii=False))
 
         topic_id = p_settings.get("topic_queue_id")
         if topic_id:
@@ -1184,7 +1185,7 @@ async def render_project_video(
                 print(f"[Payout Sync Warning] Failed to patch topics_queue: {e}")
         
         if request.render_target == "drive_api":
-            db.update_project(project_id, status="remote_packaging")
+            await async_db.update_project(project_id, status="remote_packaging")
             from services.remote_drive_render_service import remote_drive_render_service
 
             def _enqueue_drive_render(pid=project_id, use_subtitles=request.use_subtitles, resolution=request.resolution):
@@ -1210,13 +1211,13 @@ async def render_project_video(
                 "message": "Google Drive API 렌더 대기열에 등록되었습니다.",
             }
 
-        script_data = db.get_script(project_id)
+        script_data = await async_db.get_script(project_id)
         # [FIX] images_data가 이 함수 내에서 한 번도 대입되지 않은 채 아래에서
         # (이미지 존재 여부 체크, 타임라인 폴백 구성, 나레이션 매칭 등) 여러 번
         # 참조되고 있었다 - render_target이 drive_api가 아닌 모든 렌더링 요청이
         # (기본값이 local이라 사실상 전부) NameError로 즉시 실패했다. 같은 값을
         # 만드는 다른 함수(491번 줄)와 동일하게 프로젝트의 이미지 프롬프트를 로드한다.
-        images_data = db.get_image_prompts(project_id)
+        images_data = await async_db.get_image_prompts(project_id)
         # [NEW] Aspect Ratio logic (User requested absolute enforcement)
         # 쇼츠모드에서는 무조건 9:16, 롱폼에서는 무조건 16:9
         # Check project app_mode first, fallback to global app_mode
@@ -1255,7 +1256,7 @@ async def render_project_video(
         # moment. Any scene edited/cropped afterwards was silently rendered as a
         # blank slot even though the DB had the fresh asset. The snapshot is now
         # only used to fill a slot the live DB can't resolve.
-        p_settings = db.get_project_settings(project_id)
+        p_settings = await async_db.get_project_settings(project_id)
         timeline_path = p_settings.get('timeline_images_path') if p_settings else None
 
         def _resolve_scene_media_path(url):
@@ -1307,7 +1308,7 @@ async def render_project_video(
             # [Step 1] Load Scene Settings (for Engine Check)
             scene_data_map = {}
             try:
-                p_settings = db.get_project_settings(project_id) or {}
+                p_settings = await async_db.get_project_settings(project_id) or {}
                 scenes_json = p_settings.get('webtoon_scenes_json')
                 if scenes_json:
                     s_data = json.loads(scenes_json)
@@ -1380,7 +1381,7 @@ async def render_project_video(
                 print(f"DEBUG: Upgraded {upgraded_count} scene(s) to video assets (including auto-generated).")
                 images = patched_images
 
-        project_settings = db.get_project_settings(project_id)
+        project_settings = await async_db.get_project_settings(project_id)
         if not images:
              bg_video_url = project_settings.get("background_video_url")
              if not bg_video_url:
@@ -1930,6 +1931,8 @@ async def render_project_video(
                     web_video_path = f"{web_dir}/{os.path.basename(final_path)}"
                     db.update_project_setting(project_id, "video_path", web_video_path)
                     db.update_project(project_id, status="rendered")
+                    from services.progress import set_render_status
+                    set_render_status(project_id, "completed", 100, video_path=web_video_path)
                     print(f"프로젝트 {project_id} 렌더링 완료: {final_path}")
 
                     # Upload QA Stage 1: technical checks + LUFS auto-normalization
@@ -1975,12 +1978,17 @@ async def render_project_video(
                     pass
                 
                 db.update_project(project_id, status="failed")
+                from services.progress import set_render_status
+                set_render_status(project_id, "failed", -1, error=str(e))
 
         print(f"Adding background task for project {project_id}")
 
         # 상태 업데이트
-        db.update_project(project_id, status="rendering")
-        db.update_project_setting(project_id, "video_path", "")
+        await async_db.update_project(project_id, status="rendering")
+        await async_db.update_project_setting(project_id, "video_path", "")
+        # 이전 렌더의 completed가 새 렌더 구독자에게 snapshot으로 가지 않도록 즉시 초기화
+        from services.progress import set_render_status
+        set_render_status(project_id, "rendering", 0)
 
         intro_v_path = project_settings.get("intro_video_path")
         background_tasks.add_task(render_executor_func, output_dir, request.use_subtitles, target_resolution, bg_video_url, intro_v_path)
@@ -2019,7 +2027,7 @@ async def submit_project_to_drive(project_id: int, background_tasks: BackgroundT
             },
         )
 
-    db.update_project(project_id, status="remote_packaging")
+    await async_db.update_project(project_id, status="remote_packaging")
     from services.remote_drive_render_service import remote_drive_render_service
     from services.topic_queue_sync_service import sync_topic_progress
 
@@ -2053,7 +2061,7 @@ async def submit_project_to_drive(project_id: int, background_tasks: BackgroundT
 async def get_project_status(project_id: int):
     """프로젝트 상태 및 결과물 조회 (Polling용)"""
     try:
-        project = db.get_project(project_id)
+        project = await async_db.get_project(project_id)
         if not project:
              raise HTTPException(404, "Project not found")
         
@@ -2082,8 +2090,8 @@ async def get_project_status(project_id: int):
                         shutil.copy2(source_mp4, final_path)
                         
                         web_video_path = f"{web_dir}/{output_filename}"
-                        db.update_project_setting(project_id, "video_path", web_video_path)
-                        db.update_project(project_id, status="rendered")
+                        await async_db.update_project_setting(project_id, "video_path", web_video_path)
+                        await async_db.update_project(project_id, status="rendered")
                         status = "rendered"
                         
                         # [NEW] 구글 드라이브 업로드 및 Supabase 동기화 백그라운드 구동
@@ -2104,14 +2112,14 @@ async def get_project_status(project_id: int):
                 from services.remote_drive_render_service import remote_drive_render_service
                 remote_row = remote_drive_render_service.sync_completed_result(project_id)
                 if remote_row:
-                    fresh_project = db.get_project(project_id)
+                    fresh_project = await async_db.get_project(project_id)
                     status = fresh_project.get("status", status) if fresh_project else status
             except Exception as se:
                 print(f"[RemoteDrive] Failed to sync remote drive render result: {se}")
 
         # [NEW] 원격 GPU 렌더링 상태 확인 및 다운로드 처리
         if status == "remote_rendering":
-            settings = db.get_project_settings(project_id) or {}
+            settings = await async_db.get_project_settings(project_id) or {}
             remote_url = settings.get("remote_render_url")
             task_id = settings.get("remote_task_id")
             if remote_url and task_id:
@@ -2124,12 +2132,12 @@ async def get_project_status(project_id: int):
                     except Exception as download_err:
                         print(f"Failed to download remote render result: {download_err}")
                 elif res.get("progress") == -1:
-                    db.update_project(project_id, status="failed")
+                    await async_db.update_project(project_id, status="failed")
                     status = "failed"
 
-        settings = db.get_project_settings(project_id) or {}
+        settings = await async_db.get_project_settings(project_id) or {}
         video_path = settings.get("video_path")
-        readiness = sync_project_asset_readiness(project_id)
+        readiness = await async_db.run(sync_project_asset_readiness, project_id)
         
         return {
             "status": "ok",
@@ -2178,7 +2186,7 @@ async def upload_external_video(project_id: int, file: UploadFile = File(...)):
         web_url = f"/output/{rel_path}".replace("\\", "/")
         
         # DB에 저장
-        db.update_project_setting(project_id, 'external_video_path', file_path)
+        await async_db.update_project_setting(project_id, 'external_video_path', file_path)
         
         return {
             "status": "ok",
@@ -2199,7 +2207,7 @@ async def upload_external_video(project_id: int, file: UploadFile = File(...)):
 async def sync_video_to_cloud(project_id: int):
     """로컬 영상을 클라우드(Supabase)로 업로드하고 경로 반환"""
     try:
-        settings = db.get_project_settings(project_id)
+        settings = await async_db.get_project_settings(project_id)
         # 1. 우선순위: 외부 업로드 영상 -> 렌더링된 영상
         video_path = settings.get("external_video_path")
         
@@ -2229,7 +2237,7 @@ async def sync_video_to_cloud(project_id: int):
             return {"status": "error", "error": "클라우드 업로드 실패"}
             
         # Mark as uploaded/reserved locally
-        db.update_project_setting(project_id, 'is_uploaded', 1)
+        await async_db.update_project_setting(project_id, 'is_uploaded', 1)
         
         return {"status": "ok", "cloud_path": cloud_path}
     except Exception as e:
@@ -2241,7 +2249,7 @@ async def delete_external_video(project_id: int):
     """업로드된 외부 영상 삭제"""
     try:
         # DB에서 경로 조회
-        settings = db.get_project_settings(project_id)
+        settings = await async_db.get_project_settings(project_id)
         if not settings or not settings.get('external_video_path'):
             raise HTTPException(404, "업로드된 영상이 없습니다.")
         
@@ -2252,7 +2260,7 @@ async def delete_external_video(project_id: int):
             os.remove(file_path)
         
         # DB에서 경로 제거
-        db.update_project_setting(project_id, 'external_video_path', None)
+        await async_db.update_project_setting(project_id, 'external_video_path', None)
         
         return {"status": "ok"}
         
@@ -2271,13 +2279,13 @@ async def upload_project_to_youtube(
     force_upload: bool = Query(False)
 ):
     """프로젝트 영상 유튜브 업로드 (예약 발행 지원)"""
-    from services.youtube_upload_service import youtube_upload_service
+    from services.youtube_upload_queue import youtube_upload_queue
     from services import learning_service
 
     # 1. 데이터 조회
-    project = db.get_project(project_id)
-    settings = db.get_project_settings(project_id)
-    metadata = db.get_metadata(project_id)
+    project = await async_db.get_project(project_id)
+    settings = await async_db.get_project_settings(project_id)
+    metadata = await async_db.get_metadata(project_id)
     
     if not settings or not settings.get("video_path"):
         raise HTTPException(400, "렌더링된 영상이 없습니다.")
@@ -2330,11 +2338,11 @@ async def upload_project_to_youtube(
         preferred_handle = (settings.get("preferred_youtube_channel_handle") or "").strip()
         channel_id = settings.get("youtube_channel_id")
         if not channel_id and preferred_handle:
-            preferred_channel = db.get_channel_by_handle(preferred_handle)
+            preferred_channel = await async_db.get_channel_by_handle(preferred_handle)
             if preferred_channel and preferred_channel.get("id"):
                 channel_id = preferred_channel["id"]
         if channel_id:
-            channel = db.get_channel(channel_id)
+            channel = await async_db.get_channel(channel_id)
             if channel and channel.get("credentials_path"):
                 cand_path = channel["credentials_path"]
                 if not os.path.isabs(cand_path):
@@ -2345,7 +2353,8 @@ async def upload_project_to_youtube(
             preferred_name = settings.get("preferred_youtube_channel_name") or preferred_handle
             raise HTTPException(400, f"고정 업로드 채널이 아직 로컬에 연동되지 않았습니다: {preferred_name}")
 
-        response = youtube_upload_service.upload_video(
+        response = await youtube_upload_queue.upload(
+            project_id=project_id,
             file_path=video_path,
             title=title,
             description=description,
@@ -2355,9 +2364,9 @@ async def upload_project_to_youtube(
             token_path=token_path,
         )
         video_id = response.get("id")
-        db.update_project_setting(project_id, "is_uploaded", 1)
+        await async_db.update_project_setting(project_id, "is_uploaded", 1)
         if video_id:
-            db.update_project_setting(project_id, "youtube_video_id", video_id)
+            await async_db.update_project_setting(project_id, "youtube_video_id", video_id)
         learning_service.log_event(project_id, "upload_completed", "upload", {
             "youtube_video_id": video_id,
             "url": f"https://youtu.be/{video_id}" if video_id else "",
@@ -2384,11 +2393,11 @@ async def upload_project_to_youtube(
 
 @router.post("/projects/{project_id}/music-upload")
 async def upload_music_project_to_youtube(project_id: int, req: MusicUploadRequest):
-    project = db.get_project(project_id)
+    project = await async_db.get_project(project_id)
     if not project:
         raise HTTPException(404, "Project not found")
 
-    settings = db.get_project_settings(project_id) or {}
+    settings = await async_db.get_project_settings(project_id) or {}
     if (settings.get("app_mode") or "longform") != "longform_music":
         raise HTTPException(400, "Music upload endpoint is only for longform music projects.")
 
@@ -2402,7 +2411,7 @@ async def upload_music_project_to_youtube(project_id: int, req: MusicUploadReque
             requested_publish_at=req.publish_at,
             requested_channel_id=req.channel_id,
         )
-        db.update_project_setting(project_id, "upload_schedule_at", req.publish_at)
+        await async_db.update_project_setting(project_id, "upload_schedule_at", req.publish_at)
         return result
     except Exception as e:
         print(f"[MusicUpload] Upload failed: {e}")
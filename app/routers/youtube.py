@@ -200,7 +200,9 @@ async def auto_upload_youtube(project_id: int):
                 "qa_result": qa_result,
             })
 
-        response = youtube_upload_service.upload_video(
+        from services.youtube_upload_queue import youtube_upload_queue
+        response = await youtube_upload_queue.upload(
+            project_id=project_id,
             file_path=video_path,
             title=title,
             description=description,
@@ -260,6 +262,13 @@ async def auto_upload_youtube(project_id: int):
         raise HTTPException(500, f"업로드 중 오류 발생: {str(e)}")
 
 
+@router.get("/youtube/uploads")
+async def get_youtube_upload_status(project_id: Optional[int] = None):
+    """업로드 대기열 진행 상황 (진행률, 처리량, 남은 시간, 채널별 할당량 상태)"""
+    from services.youtube_upload_queue import youtube_upload_queue
+    return {"status": "ok", **youtube_upload_queue.status(project_id)}
+
+
 @router.post("/projects/{project_id}/youtube/public")
 async def publicize_youtube_video(project_id: int):
     """유튜브 영상을 '공개(public)' 상태로 전환"""
@@ -444,7 +453,9 @@ async def upload_external_to_youtube(
         if preferred_handle and not token_path:
             preferred_name = settings.get("preferred_youtube_channel_name") or preferred_handle
             raise HTTPException(status_code=400, detail=f"고정 업로드 채널이 아직 로컬에 연동되지 않았습니다: {preferred_name}")
-        result = youtube_upload_service.upload_video(
+        from services.youtube_upload_queue import youtube_upload_queue
+        result = await youtube_upload_queue.upload(
+            project_id=project_id,
             file_path=video_path,
             title=title,
             description=description,
@@ -28,13 +28,19 @@ async function resolveUser(email: string): Promise<{ id: string } | null> {
     return data
 }
 
-async function actionList(email: string) {
+const LIST_COLUMNS = 'sync_id, name, topic, status, language, app_mode, employee_email, deleted_at, created_at, updated_at'
+const MAX_GET_SYNC_IDS = 50
+
+async function actionList(email: string, body: any) {
     // employee_email match (not user_id) to stay compatible with rows written
     // before this migration, some of which may have user_id=null if the
     // old client-side _resolve_user_id() lookup failed at write time.
+    // include_payload=false: the desktop fetches payloads only for the projects
+    // it actually restores (action 'get'), instead of every project's JSON blob.
+    const columns = body.include_payload === false ? LIST_COLUMNS : `${LIST_COLUMNS}, project_payload`
     const { data, error } = await supabaseAdmin
         .from(TABLE)
-        .select('sync_id, name, topic, status, language, app_mode, employee_email, project_payload, deleted_at, created_at, updated_at')
+        .select(columns)
         .eq('employee_email', email)
         .is('deleted_at', null)
         .order('updated_at', { ascending: false })
@@ -45,6 +51,38 @@ async function actionList(email: string) {
     return { success: true, projects: data || [] }
 }
 
+async function actionGet(email: string, body: any) {
+    const syncIds = (Array.isArray(body.sync_ids) ? body.sync_ids : [])
+        .map((id: any) => String(id || '').trim())
+        .filter(Boolean)
+        .slice(0, MAX_GET_SYNC_IDS)
+    if (!syncIds.length) {
+        return { success: true, projects: [] }
+    }
+    const { data, error } = await supabaseAdmin
+        .from(TABLE)
+        .select('sync_id, project_payload')
+        .eq('employee_email', email)
+        .in('sync_id', syncIds)
+
+    if (error) {
+        return { success: false, error: '원격 프로젝트 조회에 실패했습니다.' }
+    }
+    return { success: true, projects: data || [] }
+}
+
+function rowColumns(body: any) {
+    return {
+        local_project_id: body.local_project_id ?? null,
+        name: String(body.name || '').slice(0, 500),
+        topic: String(body.topic || '').slice(0, 2000),
+        status: String(body.status || 'draft').slice(0, 50),
+        language: String(body.language || 'ko').slice(0, 10),
+        app_mode: String(body.app_mode || 'longform').slice(0, 50),
+        deleted_at: body.deleted_at ?? null,
+    }
+}
+
 async function actionPush(email: string, userId: string, body: any) {
     const syncId = String(body.sync_id || '').trim()
     if (!syncId) {
@@ -68,22 +106,19 @@ async function actionPush(email: string, userId: string, body: any) {
     }
 
     const now = new Date().toISOString()
-    const row = {
+    const row: Record<string, any> = {
         sync_id: syncId,
         user_id: userId,
         employee_email: email,
-        local_project_id: body.local_project_id ?? null,
-        name: String(body.name || '').slice(0, 500),
-        topic: String(body.topic || '').slice(0, 2000),
-        status: String(body.status || 'draft').slice(0, 50),
-        language: String(body.language || 'ko').slice(0, 10),
-        app_mode: String(body.app_mode || 'longform').slice(0, 50),
+        ...rowColumns(body),
         project_payload: body.project_payload ?? null,
         progress_payload: body.progress_payload ?? null,
-        deleted_at: body.deleted_at ?? null,
         updated_at: now,
         synced_at: now,
     }
+    if (body.payload_hash) {
+        row.payload_hash = String(body.payload_hash).slice(0, 128)
+    }
 
     const { error } = await supabaseAdmin
         .from(TABLE)
@@ -95,6 +130,63 @@ async function actionPush(email: string, userId: string, body: any) {
     return { success: true }
 }
 
+// Field-level delta: merge only the changed top-level project_payload fields.
+// base_hash must match the stored payload_hash (the state the desktop diffed
+// against); otherwise the desktop falls back to a full 'push'.
+async function actionPushDelta(email: string, userId: string, body: any) {
+    const syncId = String(body.sync_id || '').trim()
+    const baseHash = String(body.base_hash || '')
+    if (!syncId || !baseHash || !body.payload_hash) {
+        return { success: false, error: 'sync_id, base_hash and payload_hash are required' }
+    }
+
+    const { data: existing } = await supabaseAdmin
+        .from(TABLE)
+        .select('employee_email, project_payload, progress_payload, payload_hash')
+        .eq('sync_id', syncId)
+        .maybeSingle()
+    if (existing && existing.employee_email && existing.employee_email !== email) {
+        return { success: false, error: 'sync_id belongs to a different account' }
+    }
+    if (!existing || existing.payload_hash !== baseHash) {
+        return { success: false, error: 'hash_mismatch' }
+    }
+
+    const projectPayload = { ...(existing.project_payload || {}), ...(body.changed_fields || {}) }
+    for (const key of Array.isArray(body.removed_fields) ? body.removed_fields : []) {
+        delete projectPayload[String(key)]
+    }
+    const progressPayload = 'progress_payload' in body ? body.progress_payload ?? null : existing.progress_payload
+    if (JSON.stringify(projectPayload).length + JSON.stringify(progressPayload || {}).length > MAX_PAYLOAD_BYTES) {
+        return { success: false, error: 'project payload too large' }
+    }
+
+    const now = new Date().toISOString()
+    // Conditional on payload_hash so two concurrent deltas cannot both apply.
+    const { data, error } = await supabaseAdmin
+        .from(TABLE)
+        .update({
+            user_id: userId,
+            ...rowColumns(body),
+            project_payload: projectPayload,
+            progress_payload: progressPayload,
+            payload_hash: String(body.payload_hash).slice(0, 128),
+            updated_at: now,
+            synced_at: now,
+        })
+        .eq('sync_id', syncId)
+        .eq('payload_hash', baseHash)
+        .select('sync_id')
+
+    if (error) {
+        return { success: false, error: '동기화에 실패했습니다.' }
+    }
+    if (!data || !data.length) {
+        return { success: false, error: 'hash_mismatch' }
+    }
+    return { success: true }
+}
+
 async function actionSoftDelete(email: string, body: any) {
     const syncId = String(body.sync_id || '').trim()
     if (!syncId) {
@@ -149,13 +241,17 @@ export async function POST(req: Request) {
 
         switch (String(action)) {
             case 'list':
-                return NextResponse.json(await actionList(normalizedEmail))
-            case 'push': {
+                return NextResponse.json(await actionList(normalizedEmail, body))
+            case 'get':
+                return NextResponse.json(await actionGet(normalizedEmail, body))
+            case 'push':
+            case 'push_delta': {
                 const user = await resolveUser(normalizedEmail)
                 if (!user) {
                     return NextResponse.json({ success: false, error: '등록되지 않은 직원 이메일입니다.' }, { status: 404 })
                 }
-                return NextResponse.json(await actionPush(normalizedEmail, user.id, body))
+                const push = String(action) === 'push' ? actionPush : actionPushDelta
+                return NextResponse.json(await push(normalizedEmail, user.id, body))
             }
             case 'soft_delete':
                 return NextResponse.json(await actionSoftDelete(normalizedEmail, body))
@@ -242,6 +242,37 @@ export async function POST(req: Request) {
                 return NextResponse.json({ status: 'ok' })
             }
 
+            case 'save_translations_batch': {
+                // Same whitelist as save_translations, for many topics in one
+                // desktop round-trip (the translate page saves a whole list).
+                const lang = String(p.lang || '')
+                const items = Array.isArray(p.items) ? p.items.slice(0, 200) : []
+                if (!TRANSLATABLE_LANGS.has(lang)) {
+                    return badRequest('invalid_lang')
+                }
+                const patches = items
+                    .filter((item: any) => item && item.topic_id)
+                    .map((item: any) => {
+                        const fields = item.fields || {}
+                        return {
+                            topicId: item.topic_id,
+                            patch: {
+                                [`topic_${lang}`]: String(fields[`topic_${lang}`] || '').trim(),
+                                [`category_name_${lang}`]: String(fields[`category_name_${lang}`] || '').trim(),
+                            } as Record<string, string>,
+                        }
+                    })
+                const results = await Promise.all(
+                    patches.map(({ topicId, patch }: { topicId: any; patch: Record<string, string> }) =>
+                        supabaseAdmin.from('topics_queue').update(patch).eq('id', topicId)
+                    )
+                )
+                const failed = patches
+                    .filter((_: unknown, index: number) => results[index].error)
+                    .map(({ topicId }: { topicId: any }) => String(topicId))
+                return NextResponse.json({ status: 'ok', saved: patches.length - failed.length, failed })
+            }
+
             case 'claim_topic': {
                 // Composite action mirroring the exact sequence
                 // app/routers/user_topics.py::claim_topic() used to run
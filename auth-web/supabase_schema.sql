@@ -174,6 +174,7 @@ CREATE TABLE IF NOT EXISTS public.desktop_project_metadata (
     app_mode TEXT,
     project_payload JSONB NOT NULL DEFAULT '{}'::jsonb,
     progress_payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+    payload_hash TEXT,
     deleted_at TIMESTAMPTZ,
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
@@ -103,6 +103,14 @@ class Config:
     HOST = os.getenv("HOST", "127.0.0.1")
     PORT = int(os.getenv("PORT", 8000))
     DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+    # async 라우트용 DB executor 스레드 수 (services/async_db.py, 스레드당 SQLite 연결 1개)
+    DB_EXECUTOR_WORKERS = int(os.getenv("DB_EXECUTOR_WORKERS", 4))
+    # 로그 보관 정리 (services/retention_service.py). 0일이면 해당 테이블은 정리하지 않음
+    RETENTION_ENABLED = os.getenv("RETENTION_ENABLED", "true").lower() == "true"
+    RETENTION_INTERVAL_HOURS = float(os.getenv("RETENTION_INTERVAL_HOURS", 24))
+    RETENTION_AI_LOG_DAYS = int(os.getenv("RETENTION_AI_LOG_DAYS", 90))
+    RETENTION_LEARNING_EVENT_DAYS = int(os.getenv("RETENTION_LEARNING_EVENT_DAYS", 180))
+    RETENTION_LEARNING_SNAPSHOT_DAYS = int(os.getenv("RETENTION_LEARNING_SNAPSHOT_DAYS", 180))
 
     # Remote rendering. USE_EXTERNAL_RENDER now means Google Drive API +
     # Supabase remote_render_queue. DRIVE_RENDER_QUEUE_PATH is legacy-only.
@@ -1,12 +1,15 @@
 # database.py - SQLite 로컬 데이터베이스
 import sqlite3
+import functools
 import json
 import os
+import queue
 import shutil
 import sys
 import threading
 import time as _time
 import uuid
+from concurrent.futures import Future
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -206,7 +209,9 @@ class _ReuseConn:
         return getattr(self._conn, name)
 
 def get_db() -> _ReuseConn:
-    """스레드별 DB 연결 반환 (재사용)"""
+    """스레드별 DB 연결 반환 (재사용). writer 스레드 안에서는 writer 트랜잭션의 view를 반환"""
+    if _writer.in_writer_thread():
+        return _writer.view()
     ensure_local_db_migrated()
     db_path = get_db_path()
     wrapper = getattr(_local, "conn", None)
@@ -215,7 +220,7 @@ def get_db() -> _ReuseConn:
         wrapper = None
     if wrapper is None:
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        raw = sqlite3.connect(str(db_path), timeout=60.0, check_same_thread=False)
+        raw = sqlite3.connect(str(db_path), timeout=DB_BUSY_TIMEOUT_MS / 1000.0, check_same_thread=False)
         raw.row_factory = sqlite3.Row
         # WAL 모드는 연결 생성 시 한 번만 설정
         try:
@@ -229,6 +234,316 @@ def get_db() -> _ReuseConn:
         _local.conn = wrapper
     return wrapper
 
+# ============ 단일 writer 큐 ============
+#
+# 프로세스 내 쓰기는 모두 "db-writer" 스레드 하나가 전용 연결로 처리한다.
+# 큐에 쌓인 쓰기(최대 DB_WRITE_MAX_BATCH개)를 한 트랜잭션으로 묶어
+# group commit 하므로, 같은 프로세스의 스레드끼리 WAL write lock을 두고
+# 경쟁하며 "database is locked" 재시도를 할 일이 없다.
+#
+# get_db()로 쓰던 기존 쓰기 함수는 @_single_writer로 writer 스레드에서 실행한다.
+# writer 스레드 안의 get_db()는 _WriterConnView를 돌려주므로 함수 본문의
+# commit()/rollback()/close()는 그대로 두어도 된다.
+# 아직 writer를 거치지 않는 쓰기 (의도적):
+# - init_db / migrate_db / record_local_db_migration_marker: 시작 시 스키마 생성·마이그레이션
+#   (writer가 쓸 테이블을 만드는 단계라 writer보다 먼저 돈다)
+# - _ensure_global_settings_table: get_global_setting(읽기)에서 불릴 때의 CREATE TABLE IF NOT EXISTS
+# - run_db_maintenance: VACUUM은 트랜잭션 밖에서만 돌므로 자체 autocommit 연결을 쓴다
+#
+# Busy-timeout 정책 (프로세스 간 경합):
+# - Hermes/렌더 워커 등 다른 프로세스와의 경합은 앱 레벨 재시도 루프 대신
+#   SQLite busy handler가 처리한다. 모든 연결은 busy_timeout=DB_BUSY_TIMEOUT_MS.
+# - writer는 BEGIN IMMEDIATE로 write lock을 먼저 잡아, 읽기 후 쓰기 승격 중
+#   SQLITE_BUSY로 트랜잭션이 깨지는 경우를 없앤다.
+# - busy_timeout을 넘겨도 잠겨 있으면 배치 전체를 DB_WRITE_LOCK_RETRIES회까지
+#   다시 시도하고, 그 횟수는 lock_retries 지표로 노출된다.
+
+DB_BUSY_TIMEOUT_MS = 60000
+# 첫 쓰기 후 추가 쓰기를 기다리는 시간(초). 0이면 이미 큐에 쌓인 쓰기만 묶어
+# 단건 쓰기의 지연이 늘지 않는다 (commit 중 들어온 쓰기가 자연스럽게 다음 배치가 됨).
+DB_WRITE_BATCH_WINDOW = 0.0
+DB_WRITE_MAX_BATCH = 64
+DB_WRITE_LOCK_RETRIES = 2
+
+
+class _WriteRequest:
+    __slots__ = ("func", "args", "kwargs", "future")
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+
+
+def _CLOSE_WRITER_CONNECTION(conn):
+    """writer 연결 종료 요청 표식 (실행되지 않음)"""
+
+
+class _WriterConnView:
+    """writer 스레드 안에서 get_db()가 반환하는 연결.
+
+    commit()은 SAVEPOINT db_view까지의 변경을 요청 트랜잭션에 넘기고, rollback()/close()는
+    마지막 commit() 이후 변경만 되돌린다 (스레드별 연결에서의 의미와 같다).
+    실제 COMMIT은 배치가 끝날 때 writer가 한다.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        conn.execute("SAVEPOINT db_view")
+
+    def commit(self):
+        self._conn.execute("RELEASE SAVEPOINT db_view")
+        self._conn.execute("SAVEPOINT db_view")
+
+    def rollback(self):
+        self._conn.execute("ROLLBACK TO SAVEPOINT db_view")
+
+    def close(self):
+        try:
+            self.rollback()
+        except Exception:
+            pass
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class _DbWriter:
+    """프로세스당 1개의 쓰기 스레드. 쓰기 함수는 fn(conn, *args) 형태로 실행된다."""
+
+    def __init__(self):
+        self._queue: "queue.Queue[_WriteRequest]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_path: Optional[str] = None
+        self._view: Optional[_WriterConnView] = None
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "writes": 0,
+            "batches": 0,
+            "errors": 0,
+            "lock_retries": 0,
+            "commit_ms_total": 0.0,
+            "commit_ms_max": 0.0,
+            "last_commit_ms": 0.0,
+        }
+
+    def in_writer_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        request = _WriteRequest(func, args, kwargs)
+        self._ensure_started()
+        self._queue.put(request)
+        return request.future
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+
+    def view(self) -> _WriterConnView:
+        """현재 쓰기 요청의 get_db() 연결 (요청마다 새 savepoint)."""
+        if self._view is None:
+            self._view = _WriterConnView(self.connection())
+        return self._view
+
+    def connection(self) -> sqlite3.Connection:
+        ensure_local_db_migrated()
+        db_path = str(get_db_path())
+        if self._conn is not None and self._conn_path != db_path:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+        if self._conn is None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                db_path,
+                timeout=DB_BUSY_TIMEOUT_MS / 1000.0,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.row_factory = sqlite3.Row
+            try:
+                conn.execute("PRAGMA journal_mode=WAL;")
+                conn.execute("PRAGMA synchronous=NORMAL;")
+                conn.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS};")
+            except Exception:
+                pass
+            self._conn = conn
+            self._conn_path = db_path
+        return self._conn
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = _time.monotonic() + DB_WRITE_BATCH_WINDOW
+            while len(batch) < DB_WRITE_MAX_BATCH:
+                # 직전 commit 동안 쌓인 쓰기는 기다리지 않고 바로 묶는다
+                remaining = deadline - _time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            batch = [req for req in batch if req.future.set_running_or_notify_cancel()]
+            closes = [req for req in batch if req.func is _CLOSE_WRITER_CONNECTION]
+            writes = [req for req in batch if req.func is not _CLOSE_WRITER_CONNECTION]
+            if writes:
+                self._commit_batch(writes)
+            if closes:
+                self._close_connection()
+                for req in closes:
+                    req.future.set_result(None)
+
+    def _close_connection(self):
+        self._view = None
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+        self._conn_path = None
+
+    def _commit_batch(self, batch):
+        for attempt in range(DB_WRITE_LOCK_RETRIES + 1):
+            try:
+                results = self._execute_batch(batch)
+                break
+            except sqlite3.OperationalError as e:
+                if "locked" in str(e).lower() and attempt < DB_WRITE_LOCK_RETRIES:
+                    self._bump("lock_retries")
+                    print(f"[DB] Writer batch locked by another process, retrying ({attempt + 1}/{DB_WRITE_LOCK_RETRIES})")
+                    continue
+                self._bump("errors", len(batch))
+                for req in batch:
+                    req.future.set_exception(e)
+                return
+            except Exception as e:
+                self._bump("errors", len(batch))
+                for req in batch:
+                    req.future.set_exception(e)
+                return
+
+        for req, (ok, value) in zip(batch, results):
+            if ok:
+                req.future.set_result(value)
+            else:
+                req.future.set_exception(value)
+
+    def _execute_batch(self, batch):
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        results = []
+        try:
+            for req in batch:
+                # 개별 쓰기 실패가 같은 배치의 다른 쓰기를 되돌리지 않도록 savepoint로 격리
+                self._view = None
+                conn.execute("SAVEPOINT db_write")
+                try:
+                    value = req.func(conn, *req.args, **req.kwargs)
+                    conn.execute("RELEASE SAVEPOINT db_write")
+                    results.append((True, value))
+                except sqlite3.OperationalError as e:
+                    if "locked" in str(e).lower():
+                        raise
+                    conn.execute("ROLLBACK TO SAVEPOINT db_write")
+                    conn.execute("RELEASE SAVEPOINT db_write")
+                    results.append((False, e))
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT db_write")
+                    conn.execute("RELEASE SAVEPOINT db_write")
+                    results.append((False, e))
+            started = _time.perf_counter()
+            conn.execute("COMMIT")
+            commit_ms = (_time.perf_counter() - started) * 1000.0
+        except Exception:
+            try:
+                conn.execute("ROLLBACK")
+            except Exception:
+                pass
+            raise
+        finally:
+            self._view = None
+
+        failed = sum(1 for ok, _ in results if not ok)
+        with self._stats_lock:
+            self._stats["writes"] += len(batch)
+            self._stats["batches"] += 1
+            self._stats["errors"] += failed
+            self._stats["commit_ms_total"] += commit_ms
+            self._stats["commit_ms_max"] = max(self._stats["commit_ms_max"], commit_ms)
+            self._stats["last_commit_ms"] = commit_ms
+        return results
+
+    def _bump(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            snapshot = dict(self._stats)
+        batches = snapshot["batches"]
+        snapshot["avg_commit_ms"] = round(snapshot["commit_ms_total"] / batches, 3) if batches else 0.0
+        snapshot["avg_batch_size"] = round(snapshot["writes"] / batches, 2) if batches else 0.0
+        snapshot["queue_depth"] = self._queue.qsize()
+        snapshot["busy_timeout_ms"] = DB_BUSY_TIMEOUT_MS
+        snapshot["commit_ms_total"] = round(snapshot["commit_ms_total"], 3)
+        snapshot["commit_ms_max"] = round(snapshot["commit_ms_max"], 3)
+        snapshot["last_commit_ms"] = round(snapshot["last_commit_ms"], 3)
+        return snapshot
+
+
+_writer = _DbWriter()
+
+
+def submit_write(func, *args, **kwargs) -> Future:
+    """쓰기 함수 fn(conn, *args, **kwargs)를 writer 큐에 넣고 Future를 반환."""
+    return _writer.submit(func, *args, **kwargs)
+
+
+def run_write(func, *args, timeout: Optional[float] = None, **kwargs):
+    """writer 스레드에서 쓰기를 실행하고 커밋될 때까지 기다려 결과를 반환.
+
+    writer 스레드 안에서 다시 호출되면(쓰기 함수 중첩) 같은 트랜잭션에서 바로 실행한다.
+    """
+    if _writer.in_writer_thread():
+        return func(_writer.connection(), *args, **kwargs)
+    return _writer.submit(func, *args, **kwargs).result(timeout)
+
+
+def _single_writer(func):
+    """get_db()로 쓰는 함수를 writer 스레드에서 실행한다 (호출자는 커밋까지 기다린다)."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return run_write(lambda _conn: func(*args, **kwargs))
+    return wrapper
+
+
+def close_db_writer_connection(timeout: Optional[float] = None):
+    """대기 중인 쓰기를 모두 커밋한 뒤 writer 연결을 닫는다 (DB 파일 교체/삭제 전)."""
+    if _writer.in_writer_thread():
+        _writer._close_connection()
+        return
+    _writer.submit(_CLOSE_WRITER_CONNECTION).result(timeout)
+
+
+def get_db_write_stats() -> Dict[str, Any]:
+    """writer 큐 지표 (배치 수, lock 재시도, commit latency 등)."""
+    return _writer.stats()
+
+
+@_single_writer
 def reset_rendering_status():
     """서버 시작 시 렌더링 중이던 상태를 초기화"""
     conn = get_db()
@@ -520,6 +835,14 @@ def init_db():
             cursor.execute(f"ALTER TABLE project_learning_snapshots ADD COLUMN {col} {col_type}")
         except Exception:
             pass
+    # 원격 동기화 커서: 스트림별로 마지막으로 처리한 로컬 id (매번 전체 미동기화 행을 스캔하지 않도록)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS remote_sync_cursors (
+            stream TEXT PRIMARY KEY,
+            last_id INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
 
     # 분석 데이터 (주제 찾기 결과)
     cursor.execute("""
@@ -1333,6 +1656,9 @@ scene_type별 구조:
     try:
         cursor.execute("ALTER TABLE ai_generation_logs ADD COLUMN thinking_tokens INTEGER DEFAULT 0")
     except sqlite3.OperationalError: pass
+    try:
+        cursor.execute("ALTER TABLE ai_generation_logs ADD COLUMN remote_synced_at TEXT")
+    except sqlite3.OperationalError: pass
     try:
         cursor.execute("ALTER TABLE project_settings ADD COLUMN creation_mode TEXT DEFAULT 'default'")
     except sqlite3.OperationalError: pass
@@ -1641,6 +1967,35 @@ scene_type별 구조:
     except Exception as e:
         print(f"[Migration] Project sync backfill warning: {e}")
 
+    # [SYNC] 마지막으로 원격에 반영된 project_payload의 필드별 해시 (delta push 기준)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS project_sync_state (
+            project_id INTEGER PRIMARY KEY,
+            sync_id TEXT,
+            payload_hash TEXT,
+            field_hashes_json TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # save_image_prompts/get_image_prompts의 (project_id, scene_number) 조회용
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_image_prompts_project_scene
+        ON image_prompts(project_id, scene_number)
+    """)
+
+    try:
+        _ensure_ai_log_rollups(cursor)
+    except Exception as e:
+        print(f"[Migration] AI log rollup setup warning: {e}")
+
+    # 보관 정리(retention_service)의 created_at 범위 스캔용
+    for table in RETENTION_TABLES:
+        try:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_created ON {table}(created_at)")
+        except Exception as e:
+            print(f"[Migration] Retention index warning ({table}): {e}")
+
     conn.commit()
     print("[DB] Migration completed")
 
@@ -1649,6 +2004,7 @@ scene_type별 구조:
 
 # ============ 프로젝트 CRUD ============
 
+@_single_writer
 def create_project(name: str, topic: str = None, app_mode: str = 'longform', language: str = 'ko', employee_email: str = None, script_style: str = None, image_style: str = None, sync_id: str = None) -> int:
     """새 프로젝트 생성 + 기본 설정 초기화"""
     # DB 연결 전에 외부 설정값 미리 조회 (트랜잭션 중 별도 connection 방지)
@@ -1897,13 +2253,10 @@ def mark_project_dirty(project_id: int):
     """Supabase project metadata sync 대상 표시."""
     if not project_id:
         return
-    conn = get_db()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("UPDATE projects SET sync_dirty = 1, updated_at = CURRENT_TIMESTAMP WHERE id = ?", (project_id,))
-        conn.commit()
-    finally:
-        conn.close()
+    run_write(lambda conn: conn.execute(
+        "UPDATE projects SET sync_dirty = 1, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+        (project_id,),
+    ))
 
 
 def mark_project_synced(project_id: int, synced_at: str = None):
@@ -1911,18 +2264,59 @@ def mark_project_synced(project_id: int, synced_at: str = None):
     if not project_id:
         return
     synced_at = synced_at or datetime.utcnow().isoformat()
+    run_write(lambda conn: conn.execute(
+        "UPDATE projects SET sync_dirty = 0, last_synced_at = ? WHERE id = ?",
+        (synced_at, project_id),
+    ))
+
+
+def get_project_sync_state(project_id: int) -> Optional[Dict[str, Any]]:
+    """마지막 동기화 상태 (sync_id, payload_hash, field_hashes). 없으면 None."""
+    if not project_id:
+        return None
     conn = get_db()
-    cursor = conn.cursor()
     try:
-        cursor.execute(
-            "UPDATE projects SET sync_dirty = 0, last_synced_at = ? WHERE id = ?",
-            (synced_at, project_id),
-        )
-        conn.commit()
+        row = conn.execute("SELECT * FROM project_sync_state WHERE project_id = ?", (project_id,)).fetchone()
+        if not row:
+            return None
+        data = dict(row)
+        data["field_hashes"] = _json_loads_safe(data.pop("field_hashes_json", None), {})
+        return data
+    except sqlite3.OperationalError:
+        return None
     finally:
         conn.close()
 
 
+def save_project_sync_state(project_id: int, sync_id: str, payload_hash: str, field_hashes: Dict[str, str],
+                            synced_at: str = None):
+    """push 성공 후 상태 기록 + sync_dirty 해제를 한 번의 쓰기로."""
+    synced_at = synced_at or datetime.utcnow().isoformat()
+    hashes_json = json.dumps(field_hashes or {}, sort_keys=True)
+
+    def _write(conn):
+        conn.execute(
+            """
+            INSERT INTO project_sync_state (project_id, sync_id, payload_hash, field_hashes_json, updated_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(project_id) DO UPDATE SET sync_id = excluded.sync_id, payload_hash = excluded.payload_hash,
+                field_hashes_json = excluded.field_hashes_json, updated_at = CURRENT_TIMESTAMP
+            """,
+            (project_id, sync_id, payload_hash, hashes_json),
+        )
+        conn.execute("UPDATE projects SET sync_dirty = 0, last_synced_at = ? WHERE id = ?", (synced_at, project_id))
+
+    run_write(_write)
+
+
+def clear_project_sync_state(project_id: int):
+    """원격 상태를 알 수 없게 됐을 때 (해시 불일치 등) - 다음 push는 전체 스냅샷."""
+    if not project_id:
+        return
+    run_write(lambda conn: conn.execute("DELETE FROM project_sync_state WHERE project_id = ?", (project_id,)))
+
+
+@_single_writer
 def mark_project_remote_deleted(project_id: int, deleted_at: str = None):
     """Supabase row soft-delete 성공 표시."""
     if not project_id:
@@ -1970,6 +2364,7 @@ def get_dirty_projects(employee_email: str = None, limit: int = 20) -> List[Dict
     return [dict(row) for row in rows]
 
 
+@_single_writer
 def update_project(project_id: int, **kwargs):
     """프로젝트 업데이트"""
     if not kwargs:
@@ -1990,6 +2385,7 @@ def update_project(project_id: int, **kwargs):
     conn.commit()
     conn.close()
 
+@_single_writer
 def delete_project(project_id: int):
     """프로젝트 삭제 (관련 데이터도 삭제)"""
     mark_project_dirty(project_id)
@@ -2009,6 +2405,7 @@ def delete_project(project_id: int):
     conn.commit()
     conn.close()
 
+@_single_writer
 def move_project(project_id: int, target_mode: str):
     """프로젝트 모드(app_mode) 변경"""
     conn = get_db()
@@ -2020,6 +2417,7 @@ def move_project(project_id: int, target_mode: str):
     conn.close()
     return True
 
+@_single_writer
 def copy_project(project_id: int, target_mode: str):
     """프로젝트 전체 데이터 복제 (대상 모드로 변경)"""
     conn = get_db()
@@ -2116,6 +2514,7 @@ def get_top_analyses(limit: int = 10) -> List[Dict]:
 
 # ============ 분석 데이터 ============
 
+@_single_writer
 def save_analysis(project_id: int, video_data: Dict, analysis_result: Dict):
     """분석 결과 저장"""
     conn = get_db()
@@ -2168,6 +2567,7 @@ def get_analysis(project_id: int) -> Optional[Dict]:
 
 # ============ 대본 ============
 
+@_single_writer
 def save_script(project_id: int, script: str, word_count: int, duration: int):
     """대본 저장 (scripts 테이블 및 project_settings 테이블 동기화)"""
     conn = get_db()
@@ -2192,6 +2592,7 @@ def save_script(project_id: int, script: str, word_count: int, duration: int):
     conn.close()
     mark_project_dirty(project_id)
 
+@_single_writer
 def update_project_render_status(project_id: int, status: str):
     conn = get_db()
     cursor = conn.cursor()
@@ -2200,6 +2601,7 @@ def update_project_render_status(project_id: int, status: str):
     conn.close()
 
 
+@_single_writer
 def create_channel(name: str, handle: str, description: str = None, proxy: str = None) -> int:
     conn = get_db()
     cursor = conn.cursor()
@@ -2210,6 +2612,7 @@ def create_channel(name: str, handle: str, description: str = None, proxy: str =
     conn.close()
     return new_id
 
+@_single_writer
 def delete_channel(channel_id: int):
     conn = get_db()
     cursor = conn.cursor()
@@ -2217,6 +2620,7 @@ def delete_channel(channel_id: int):
     conn.commit()
     conn.close()
 
+@_single_writer
 def update_channel_credentials(channel_id: int, path: str):
     conn = get_db()
     cursor = conn.cursor()
@@ -2225,6 +2629,7 @@ def update_channel_credentials(channel_id: int, path: str):
     conn.commit()
     conn.close()
 
+@_single_writer
 def update_channel(channel_id: int, name: str, handle: str, description: str = None, proxy: str = None):
     conn = get_db()
     cursor = conn.cursor()
@@ -2269,6 +2674,7 @@ def get_script(project_id: int) -> Optional[Dict]:
     print(f"[DB_DEBUG] Script NOT FOUND for project_id: {project_id}")
     return None
 
+@_single_writer
 def save_script_structure(project_id: int, structure: Dict):
     """대본 구조 저장"""
     conn = get_db()
@@ -2346,6 +2752,7 @@ def get_script_structure(project_id: int) -> Optional[Dict]:
 
 # ============ 이미지 프롬프트 ============
 
+@_single_writer
 def update_image_prompt_url(project_id: int, scene_number: int, image_url: str):
     """특정 장면의 이미지 URL 업데이트"""
     conn = get_db()
@@ -2376,6 +2783,7 @@ def update_image_prompt_url(project_id: int, scene_number: int, image_url: str):
     conn.close()
     mark_project_dirty(project_id)
 
+@_single_writer
 def update_image_prompt_video_url(project_id: int, scene_number: int, video_url: str):
     """특정 장면의 비디오 URL 업데이트 (Wan 2.2 Motion)"""
     conn = get_db()
@@ -2404,47 +2812,20 @@ def update_image_prompt_video_url(project_id: int, scene_number: int, video_url:
 
 def save_tts(project_id: int, voice_id: str, voice_name: str, audio_path: str, duration: float):
     """TTS 저장"""
-    import time
-    max_retries = 3
-    retry_delay = 0.5
-    
-    for attempt in range(max_retries):
-        try:
-            conn = get_db()
-            cursor = conn.cursor()
-
-            try:
-                cursor.execute("DELETE FROM tts_audio WHERE project_id = ?", (project_id,))
-
-                cursor.execute("""
-                    INSERT INTO tts_audio (project_id, voice_id, voice_name, audio_path, duration)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (project_id, voice_id, voice_name, audio_path, duration))
+    def _write(conn):
+        conn.execute("DELETE FROM tts_audio WHERE project_id = ?", (project_id,))
+        conn.execute("""
+            INSERT INTO tts_audio (project_id, voice_id, voice_name, audio_path, duration)
+            VALUES (?, ?, ?, ?, ?)
+        """, (project_id, voice_id, voice_name, audio_path, duration))
 
-                conn.commit()
-                mark_project_dirty(project_id)
-                return True
-            except sqlite3.OperationalError as e:
-                if "locked" in str(e).lower():
-                    raise e # Let outer handle retry
-                else:
-                    print(f"Error saving TTS: {e}")
-                    raise e
-            finally:
-                conn.close()
-
-        except sqlite3.OperationalError as e:
-            if "locked" in str(e).lower() and attempt < max_retries - 1:
-                print(f"[DB] Database locked in save_tts, retrying... ({attempt+1}/{max_retries})")
-                time.sleep(retry_delay)
-                retry_delay *= 2
-                continue
-            else:
-                print(f"[DB] Final error in save_tts: {e}")
-                raise e # Notify upstream
-        except Exception as e:
-            print(f"[DB] Unexpected error in save_tts: {e}")
-            raise e
+    try:
+        run_write(_write)
+    except Exception as e:
+        print(f"[DB] Final error in save_tts: {e}")
+        raise
+    mark_project_dirty(project_id)
+    return True
 
 def get_tts(project_id: int) -> Optional[Dict]:
     """TTS 조회"""
@@ -2457,6 +2838,7 @@ def get_tts(project_id: int) -> Optional[Dict]:
 
 # ============ 메타데이터 ============
 
+@_single_writer
 def save_metadata(project_id: int, titles: List[str], description: str,
                   tags: List[str], hashtags: List[str]):
     """메타데이터 저장"""
@@ -2522,6 +2904,7 @@ def get_project_metadata(project_id: int, app_mode: Optional[str] = None) -> Opt
 
 # ============ 썸네일 ============
 
+@_single_writer
 def save_thumbnails(project_id: int, ideas: List[Dict], texts: List[str], full_settings: Dict = None):
     """썸네일 아이디어 및 설정 저장"""
     conn = get_db()
@@ -2561,6 +2944,7 @@ def get_thumbnails(project_id: int) -> Optional[Dict]:
 
 # ============ 프로젝트 핵심 설정 (10가지 요소) ============
 
+@_single_writer
 def save_project_settings(project_id: int, settings: Dict):
     """프로젝트 핵심 설정 저장/업데이트"""
     conn = get_db()
@@ -2674,6 +3058,7 @@ def save_project_settings(project_id: int, settings: Dict):
 
 # ============ 프로젝트 소스 (NotebookLM 기능) ============
 
+@_single_writer
 def add_project_source(project_id: int, source_type: str, title: str, content: str, url: str = None) -> int:
     """프로젝트 소스 추가"""
     conn = get_db()
@@ -2696,6 +3081,7 @@ def get_project_sources(project_id: int) -> List[Dict]:
     conn.close()
     return [dict(row) for row in rows]
 
+@_single_writer
 def delete_project_source(source_id: int):
     """프로젝트 소스 삭제"""
     conn = get_db()
@@ -2704,6 +3090,7 @@ def delete_project_source(source_id: int):
     conn.commit()
     conn.close()
 
+@_single_writer
 def delete_all_project_sources(project_id: int):
     """프로젝트의 모든 소스 삭제"""
     conn = get_db()
@@ -2723,81 +3110,62 @@ def get_project_settings(project_id: int) -> Optional[Dict]:
 
 def update_project_setting(project_id: int, key: str, value: Any):
     """단일 설정 업데이트"""
-    conn = get_db()
-    cursor = conn.cursor()
+    def _write(conn):
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(project_settings)")
+        existing_cols = [col[1] for col in cursor.fetchall()]
 
-    cursor.execute("PRAGMA table_info(project_settings)")
-    existing_cols = [col[1] for col in cursor.fetchall()]
+        if key not in existing_cols:
+            # 동적 키 (예: scene_1_motion)는 테이블 스키마에 즉시 추가
+            try:
+                cursor.execute(f"ALTER TABLE project_settings ADD COLUMN {key} TEXT")
+                print(f"[DB] Added new dynamic column: {key}")
+            except Exception as e:
+                print(f"[DB] Failed to add dynamic column '{key}': {e}")
+                return None
 
-    if key not in existing_cols:
-        # 동적 키 (예: scene_1_motion)는 테이블 스키마에 즉시 추가
-        try:
-            cursor.execute(f"ALTER TABLE project_settings ADD COLUMN {key} TEXT")
-            print(f"[DB] Added new dynamic column: {key}")
-        except Exception as e:
-            print(f"[DB] Failed to add dynamic column '{key}': {e}")
-            conn.close()
-            return False
+        cursor.execute(f"""
+            UPDATE project_settings
+            SET {key} = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE project_id = ?
+        """, (value, project_id))
+        updated = cursor.rowcount
 
-    import time
-    max_retries = 3
-    retry_delay = 0.5
+        # [NEW] 'script' 업데이트 시 scripts 테이블도 동기화
+        if updated and key == 'script' and value:
+            try:
+                # 대략적인 시간 계산 (한국어 1분당 450자 기준)
+                char_count = len(str(value))
+                est_duration = max(5, int(char_count / 7.5)) # 최소 5초
 
-    for attempt in range(max_retries):
-        try:
-            cursor.execute(f"""
-                UPDATE project_settings
-                SET {key} = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE project_id = ?
-            """, (value, project_id))
-            
-            # [NEW] 'script' 업데이트 시 scripts 테이블도 동기화
-            if key == 'script' and value:
-                try:
-                    # 대략적인 시간 계산 (한국어 1분당 450자 기준)
-                    char_count = len(str(value))
-                    est_duration = max(5, int(char_count / 7.5)) # 최소 5초
-                    
-                    cursor.execute("DELETE FROM scripts WHERE project_id = ?", (project_id,))
-                    cursor.execute("""
-                        INSERT INTO scripts (project_id, full_script, word_count, estimated_duration)
-                        VALUES (?, ?, ?, ?)
-                    """, (project_id, value, char_count, est_duration))
-                except Exception as e:
-                    print(f"[DB] Script sync failed in update_project_setting: {e}")
+                cursor.execute("DELETE FROM scripts WHERE project_id = ?", (project_id,))
+                cursor.execute("""
+                    INSERT INTO scripts (project_id, full_script, word_count, estimated_duration)
+                    VALUES (?, ?, ?, ?)
+                """, (project_id, value, char_count, est_duration))
+            except Exception as e:
+                print(f"[DB] Script sync failed in update_project_setting: {e}")
+        return updated
 
-            if cursor.rowcount == 0:
-                conn.close() 
-                if attempt == 0: # Only try insert on first failure if it's not a lock issue
-                    print("[DB] Row not found, falling back to insert")
-                    save_project_settings(project_id, {key: value})
-                return True
+    # 잠금 대기는 writer의 busy_timeout 정책이 처리한다 (앱 레벨 sleep 재시도 없음)
+    try:
+        updated = run_write(_write)
+    except sqlite3.OperationalError as e:
+        print(f"[DB] Error updating project setting: {e}")
+        return False
+    except Exception as e:
+        print(f"[DB] Unexpected error in update_project_setting: {e}")
+        return False
 
-            conn.commit()
-            conn.close()
-            mark_project_dirty(project_id)
-            return True
-
-        except sqlite3.OperationalError as e:
-            if "locked" in str(e).lower() and attempt < max_retries - 1:
-                print(f"[DB] Database locked in update_project_setting, retrying in {retry_delay}s... ({attempt+1}/{max_retries})")
-                time.sleep(retry_delay)
-                retry_delay *= 2 # Exponential backoff
-                # Re-open connection as cursor might be invalidated? typically just retry exec is enough but safer to loop
-                conn.close() # Close and retry gets new conn
-                conn = get_db()
-                cursor = conn.cursor()
-                continue
-            else:
-                print(f"[DB] Error updating project setting: {e}")
-                conn.close()
-                return False
-        except Exception as e:
-             print(f"[DB] Unexpected error in update_project_setting: {e}")
-             conn.close()
-             return False
+    if updated is None:
+        return False
+    if updated == 0:
+        print("[DB] Row not found, falling back to insert")
+        save_project_settings(project_id, {key: value})
+        return True
 
-    return False
+    mark_project_dirty(project_id)
+    return True
 
 
 # ============ 학습형 제작 시스템 로그 ============
@@ -2822,24 +3190,17 @@ def _json_loads_safe(value: Any, fallback: Any = None) -> Any:
 
 def log_learning_event(project_id: int, event_type: str, stage: str = "", payload: Optional[Dict[str, Any]] = None, source: str = "system") -> Optional[int]:
     """제작 과정 학습 이벤트를 append-only로 저장한다."""
-    conn = get_db()
-    cursor = conn.cursor()
     try:
-        cursor.execute(
+        return run_write(lambda conn: conn.execute(
             """
             INSERT INTO project_learning_events (project_id, event_type, stage, source, payload_json)
             VALUES (?, ?, ?, ?, ?)
             """,
             (project_id, event_type, stage or "", source or "system", _json_dumps_safe(payload)),
-        )
-        event_id = cursor.lastrowid
-        conn.commit()
-        return event_id
+        ).lastrowid)
     except Exception as e:
         print(f"[Learning] Failed to log event: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def get_learning_events(project_id: int, limit: int = 200) -> List[Dict[str, Any]]:
@@ -2864,6 +3225,7 @@ def get_learning_events(project_id: int, limit: int = 200) -> List[Dict[str, Any
         conn.close()
 
 
+@_single_writer
 def create_learning_snapshot(project_id: int, snapshot_type: str = "manual", snapshot: Optional[Dict[str, Any]] = None) -> Optional[int]:
     """프로젝트의 특정 시점 학습 스냅샷을 저장한다."""
     snapshot = snapshot or {}
@@ -3012,110 +3374,313 @@ def get_learning_admin_stats(limit: int = 100) -> Dict[str, Any]:
         conn.close()
 
 
-def get_unsynced_learning_events(limit: int = 100) -> List[Dict[str, Any]]:
-    """Supabase로 아직 전송되지 않은 학습 이벤트 조회."""
+_LEARNING_SYNC_TABLES = {
+    "events": "project_learning_events",
+    "snapshots": "project_learning_snapshots",
+}
+_LEARNING_SNAPSHOT_JSON_KEYS = ["reference", "style", "script", "thumbnail", "tts", "video", "qa", "upload"]
+
+
+def _learning_sync_table(stream: str) -> str:
+    table = _LEARNING_SYNC_TABLES.get(stream)
+    if not table:
+        raise ValueError(f"Unknown learning sync stream: {stream}")
+    return table
+
+
+def _get_unsynced_learning_rows(stream: str, limit: int, after_id: Optional[int], retry_up_to_id: Optional[int]) -> List[Dict[str, Any]]:
+    table = _learning_sync_table(stream)
+    where = ["(t.remote_synced_at IS NULL OR t.remote_synced_at = '')"]
+    params: List[Any] = []
+    if after_id is not None:
+        where.append("t.id > ?")
+        params.append(int(after_id))
+    if retry_up_to_id is not None:
+        where.append("t.id <= ? AND t.remote_sync_error IS NOT NULL")
+        params.append(int(retry_up_to_id))
+    # 커서 조회는 id 순서(PK 범위 스캔), 기존 전체 조회는 생성 시각 순서
+    order = "t.id ASC" if after_id is not None or retry_up_to_id is not None else "datetime(t.created_at) ASC, t.id ASC"
+    params.append(max(1, min(int(limit or 100), 500)))
+
     conn = get_db()
     cursor = conn.cursor()
     try:
         cursor.execute(
-            """
-            SELECT e.*, p.sync_id AS project_sync_id, p.employee_email, p.name AS project_name, p.topic AS project_topic
-            FROM project_learning_events e
-            LEFT JOIN projects p ON p.id = e.project_id
-            WHERE e.remote_synced_at IS NULL OR e.remote_synced_at = ''
-            ORDER BY datetime(e.created_at) ASC, e.id ASC
+            f"""
+            SELECT t.*, p.sync_id AS project_sync_id, p.employee_email, p.name AS project_name, p.topic AS project_topic
+            FROM {table} t
+            LEFT JOIN projects p ON p.id = t.project_id
+            WHERE {' AND '.join(where)}
+            ORDER BY {order}
             LIMIT ?
             """,
-            (max(1, min(int(limit or 100), 500)),),
+            params,
         )
         rows = [dict(row) for row in cursor.fetchall()]
         for row in rows:
-            row["payload"] = _json_loads_safe(row.pop("payload_json", None), {})
+            if stream == "events":
+                row["payload"] = _json_loads_safe(row.pop("payload_json", None), {})
+            else:
+                for key in _LEARNING_SNAPSHOT_JSON_KEYS:
+                    row[key] = _json_loads_safe(row.pop(f"{key}_json", None), {})
         return rows
     finally:
         conn.close()
 
 
-def get_unsynced_learning_snapshots(limit: int = 100) -> List[Dict[str, Any]]:
-    """Supabase로 아직 전송되지 않은 학습 스냅샷 조회."""
+def get_unsynced_learning_events(limit: int = 100, after_id: Optional[int] = None,
+                                 retry_up_to_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Supabase로 아직 전송되지 않은 학습 이벤트 조회.
+
+    after_id: 커서 이후의 새 행만 (id 순). retry_up_to_id: 커서 이전에서 오류로 남은 행만."""
+    return _get_unsynced_learning_rows("events", limit, after_id, retry_up_to_id)
+
+
+def get_unsynced_learning_snapshots(limit: int = 100, after_id: Optional[int] = None,
+                                    retry_up_to_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Supabase로 아직 전송되지 않은 학습 스냅샷 조회 (인자는 get_unsynced_learning_events와 같음)."""
+    return _get_unsynced_learning_rows("snapshots", limit, after_id, retry_up_to_id)
+
+
+def get_remote_sync_cursor(stream: str) -> int:
+    """스트림의 마지막 처리 id (없으면 0)."""
     conn = get_db()
-    cursor = conn.cursor()
     try:
-        cursor.execute(
-            """
-            SELECT s.*, p.sync_id AS project_sync_id, p.employee_email, p.name AS project_name, p.topic AS project_topic
-            FROM project_learning_snapshots s
-            LEFT JOIN projects p ON p.id = s.project_id
-            WHERE s.remote_synced_at IS NULL OR s.remote_synced_at = ''
-            ORDER BY datetime(s.created_at) ASC, s.id ASC
-            LIMIT ?
-            """,
-            (max(1, min(int(limit or 100), 500)),),
-        )
-        rows = [dict(row) for row in cursor.fetchall()]
-        for row in rows:
-            for key in ["reference", "style", "script", "thumbnail", "tts", "video", "qa", "upload"]:
-                json_key = f"{key}_json"
-                row[key] = _json_loads_safe(row.pop(json_key, None), {})
-        return rows
+        row = conn.execute("SELECT last_id FROM remote_sync_cursors WHERE stream = ?", (stream,)).fetchone()
+        return int(row["last_id"]) if row else 0
     finally:
         conn.close()
 
 
-def mark_learning_event_remote_synced(event_id: int, synced_at: str = None):
+def commit_learning_sync_batch(stream: str, synced_ids: List[int], synced_at: str = None,
+                               errors: Optional[Dict[int, str]] = None, cursor_id: Optional[int] = None):
+    """배치 결과를 한 트랜잭션으로 기록: 성공 행은 집합 UPDATE 한 번, 실패 행은 오류 기록, 커서 전진."""
+    table = _learning_sync_table(stream)
     synced_at = synced_at or datetime.utcnow().isoformat()
+    synced_ids = [int(x) for x in synced_ids or []]
+    error_rows = [((message or "")[:1000], int(row_id)) for row_id, message in (errors or {}).items()]
+
+    def _write(conn):
+        # SQLite 바인딩 변수 한도(999)를 넘지 않게 나눠서 IN (...)
+        for start in range(0, len(synced_ids), 500):
+            chunk = synced_ids[start:start + 500]
+            conn.execute(
+                f"UPDATE {table} SET remote_synced_at = ?, remote_sync_error = NULL "
+                f"WHERE id IN ({','.join('?' * len(chunk))})",
+                [synced_at, *chunk],
+            )
+        if error_rows:
+            conn.executemany(f"UPDATE {table} SET remote_sync_error = ? WHERE id = ?", error_rows)
+        if cursor_id is not None:
+            conn.execute(
+                """
+                INSERT INTO remote_sync_cursors (stream, last_id, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(stream) DO UPDATE SET last_id = MAX(last_id, excluded.last_id), updated_at = CURRENT_TIMESTAMP
+                """,
+                (stream, int(cursor_id)),
+            )
+
+    run_write(_write)
+
+
+def get_learning_sync_lag(stream: str) -> Dict[str, Any]:
+    """미동기화 행 수, 그중 오류 행 수, 가장 오래된 미동기화 행의 생성 시각."""
+    table = _learning_sync_table(stream)
     conn = get_db()
-    cursor = conn.cursor()
     try:
-        cursor.execute(
-            "UPDATE project_learning_events SET remote_synced_at = ?, remote_sync_error = NULL WHERE id = ?",
-            (synced_at, event_id),
-        )
-        conn.commit()
+        row = conn.execute(
+            f"""
+            SELECT COUNT(*) AS pending,
+                   SUM(CASE WHEN remote_sync_error IS NOT NULL THEN 1 ELSE 0 END) AS errored,
+                   MIN(created_at) AS oldest_pending_at
+            FROM {table}
+            WHERE remote_synced_at IS NULL OR remote_synced_at = ''
+            """
+        ).fetchone()
+        return {
+            "pending": int(row["pending"] or 0),
+            "errored": int(row["errored"] or 0),
+            "oldest_pending_at": row["oldest_pending_at"],
+        }
     finally:
         conn.close()
 
 
+def mark_learning_event_remote_synced(event_id: int, synced_at: str = None):
+    synced_at = synced_at or datetime.utcnow().isoformat()
+    run_write(lambda conn: conn.execute(
+        "UPDATE project_learning_events SET remote_synced_at = ?, remote_sync_error = NULL WHERE id = ?",
+        (synced_at, event_id),
+    ))
+
+
 def mark_learning_snapshot_remote_synced(snapshot_id: int, synced_at: str = None):
     synced_at = synced_at or datetime.utcnow().isoformat()
-    conn = get_db()
-    cursor = conn.cursor()
+    run_write(lambda conn: conn.execute(
+        "UPDATE project_learning_snapshots SET remote_synced_at = ?, remote_sync_error = NULL WHERE id = ?",
+        (synced_at, snapshot_id),
+    ))
+
+
+def mark_ai_log_remote_synced(log_id: int, synced_at: str = None):
+    synced_at = synced_at or datetime.utcnow().isoformat()
     try:
-        cursor.execute(
-            "UPDATE project_learning_snapshots SET remote_synced_at = ?, remote_sync_error = NULL WHERE id = ?",
-            (synced_at, snapshot_id),
-        )
-        conn.commit()
-    finally:
-        conn.close()
+        run_write(lambda conn: conn.execute(
+            "UPDATE ai_generation_logs SET remote_synced_at = ? WHERE id = ?",
+            (synced_at, log_id),
+        ))
+    except Exception as e:
+        print(f"[DB] Failed to mark AI log synced: {e}")
 
 
 def mark_learning_event_remote_sync_error(event_id: int, error: str):
+    run_write(lambda conn: conn.execute(
+        "UPDATE project_learning_events SET remote_sync_error = ? WHERE id = ?",
+        ((error or "")[:1000], event_id),
+    ))
+
+
+def mark_learning_snapshot_remote_sync_error(snapshot_id: int, error: str):
+    run_write(lambda conn: conn.execute(
+        "UPDATE project_learning_snapshots SET remote_sync_error = ? WHERE id = ?",
+        ((error or "")[:1000], snapshot_id),
+    ))
+
+
+# ============ 보관 정리 (retention) ============
+#
+# 원격 동기화가 끝난(remote_synced_at 기록) 오래된 로그만 아카이브 후 삭제한다.
+# 예외: ai_generation_logs는 add_ai_log가 한 번만 push하고 재시도하지 않아
+# (mark_ai_log_remote_synced는 성공한 push만 기록) 실패/로그아웃 상태의 row가 영원히
+# 미동기화로 남는다. 이 테이블은 사용량이 ai_log_rollups에 집계된 row도 정리 대상이다.
+# 파일 기록/스케줄은 services/retention_service.py가 담당하고 여기서는 DB만 다룬다.
+
+RETENTION_TABLES = (
+    "ai_generation_logs",
+    "project_learning_events",
+    "project_learning_snapshots",
+)
+
+_RETENTION_SYNCED_SQL = "remote_synced_at IS NOT NULL AND remote_synced_at != ''"
+_AI_LOG_ROLLED_UP_SQL = """EXISTS (
+    SELECT 1 FROM ai_log_rollups r
+    WHERE r.bucket_hour = strftime('%Y-%m-%d %H:00:00', ai_generation_logs.created_at)
+      AND r.worker_email = COALESCE(ai_generation_logs.worker_email, 'unknown')
+      AND r.task_type = COALESCE(ai_generation_logs.task_type, '')
+      AND r.provider = COALESCE(ai_generation_logs.provider, '')
+      AND r.status = COALESCE(ai_generation_logs.status, '')
+)"""
+_RETENTION_ELIGIBLE_SQL = {
+    "ai_generation_logs": f"(({_RETENTION_SYNCED_SQL}) OR {_AI_LOG_ROLLED_UP_SQL})",
+    "project_learning_events": _RETENTION_SYNCED_SQL,
+    "project_learning_snapshots": _RETENTION_SYNCED_SQL,
+}
+
+
+def get_retention_candidates(table: str, cutoff: str, limit: int = 500) -> List[Dict[str, Any]]:
+    """cutoff(UTC 'YYYY-MM-DD HH:MM:SS') 이전에 생성된 정리 대상 row를 id 순으로 반환"""
+    if table not in RETENTION_TABLES:
+        raise ValueError(f"unknown retention table: {table}")
     conn = get_db()
-    cursor = conn.cursor()
     try:
-        cursor.execute(
-            "UPDATE project_learning_events SET remote_sync_error = ? WHERE id = ?",
-            ((error or "")[:1000], event_id),
-        )
-        conn.commit()
+        rows = conn.execute(
+            f"""
+            SELECT * FROM {table}
+            WHERE created_at < ? AND {_RETENTION_ELIGIBLE_SQL[table]}
+            ORDER BY id
+            LIMIT ?
+            """,
+            (cutoff, int(limit)),
+        ).fetchall()
+        return [dict(row) for row in rows]
     finally:
         conn.close()
 
 
-def mark_learning_snapshot_remote_sync_error(snapshot_id: int, error: str):
+def delete_retained_rows(table: str, ids: List[int]) -> int:
+    """아카이브가 끝난 row 삭제. 정리 조건을 다시 확인하므로 그 사이 대상에서 빠진 row는 남는다."""
+    if table not in RETENTION_TABLES:
+        raise ValueError(f"unknown retention table: {table}")
+    ids = [int(i) for i in ids]
+    if not ids:
+        return 0
+
+    def _delete(conn):
+        deleted = 0
+        purged_through = None
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            if table == "ai_generation_logs":
+                newest = conn.execute(
+                    f"SELECT MAX(created_at) FROM {table} WHERE id IN ({placeholders}) AND {_RETENTION_ELIGIBLE_SQL[table]}",
+                    chunk,
+                ).fetchone()[0]
+                if newest and (purged_through is None or newest > purged_through):
+                    purged_through = newest
+            deleted += conn.execute(
+                f"DELETE FROM {table} WHERE id IN ({placeholders}) AND {_RETENTION_ELIGIBLE_SQL[table]}",
+                chunk,
+            ).rowcount
+        if purged_through:
+            _record_ai_log_purged_through(conn.cursor(), purged_through)
+        return deleted
+
+    return run_write(_delete)
+
+
+def get_retention_table_stats() -> Dict[str, Dict[str, int]]:
+    """보관 정리 대상 테이블의 전체/미동기화 row 수"""
     conn = get_db()
-    cursor = conn.cursor()
     try:
-        cursor.execute(
-            "UPDATE project_learning_snapshots SET remote_sync_error = ? WHERE id = ?",
-            ((error or "")[:1000], snapshot_id),
-        )
-        conn.commit()
+        stats = {}
+        for table in RETENTION_TABLES:
+            row = conn.execute(
+                f"SELECT COUNT(*) AS total, SUM(CASE WHEN {_RETENTION_SYNCED_SQL} THEN 0 ELSE 1 END) AS unsynced FROM {table}"
+            ).fetchone()
+            stats[table] = {"total": row["total"] or 0, "unsynced": row["unsynced"] or 0}
+        return stats
+    finally:
+        conn.close()
+
+
+def run_db_maintenance(incremental_vacuum_pages: int = 2000, vacuum_free_ratio: float = 0.25) -> Dict[str, Any]:
+    """PRAGMA optimize + 여유 페이지 반환 + WAL 체크포인트.
+
+    auto_vacuum이 꺼진 기존 DB는 여유 페이지 비율이 vacuum_free_ratio를 넘을 때
+    한 번만 INCREMENTAL로 전환하며 VACUUM 한다. 이후로는 incremental_vacuum으로
+    조금씩 반환하므로 긴 독점 잠금이 다시 생기지 않는다.
+    """
+    result: Dict[str, Any] = {"optimized": False, "vacuum": None, "freed_pages": 0}
+    # VACUUM은 트랜잭션 밖에서 실행해야 하므로 writer/스레드 연결과 별도의 autocommit 연결 사용
+    conn = sqlite3.connect(str(get_db_path()), timeout=DB_BUSY_TIMEOUT_MS / 1000.0, isolation_level=None)
+    try:
+        conn.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS};")
+        conn.execute("PRAGMA optimize;")
+        result["optimized"] = True
+
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if auto_vacuum == 2:
+            conn.execute(f"PRAGMA incremental_vacuum({int(incremental_vacuum_pages)});")
+            result["vacuum"] = "incremental"
+        elif page_count and free_before / page_count >= vacuum_free_ratio:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
+            conn.execute("VACUUM;")
+            result["vacuum"] = "full"
+        free_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        result["freed_pages"] = max(0, free_before - free_after)
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+    except Exception as e:
+        result["error"] = str(e)
+        print(f"[DB] Maintenance warning: {e}")
     finally:
         conn.close()
+    return result
 
 
+@_single_writer
 def replace_music_track_plans(project_id: int, tracks: List[Dict[str, Any]]) -> None:
     conn = get_db()
     cursor = conn.cursor()
@@ -3176,6 +3741,7 @@ def get_music_track_plans(project_id: int) -> List[Dict[str, Any]]:
     return results
 
 
+@_single_writer
 def update_music_track_plan(project_id: int, track_index: int, updates: Dict[str, Any]) -> bool:
     allowed_fields = [
         "title",
@@ -3221,6 +3787,7 @@ def update_music_track_plan(project_id: int, track_index: int, updates: Dict[str
 
 # ============ 쇼츠 ============
 
+@_single_writer
 def save_shorts(project_id: int, shorts_data: List[Dict]):
     """쇼츠 데이터 저장"""
     conn = get_db()
@@ -3251,6 +3818,7 @@ def get_shorts(project_id: int) -> List[Dict]:
 
 # ============ 캐릭터 관리 ============
 
+@_single_writer
 def save_project_characters(project_id: int, characters: List[Dict]):
     """캐릭터 목록 저장 (기존 데이터 삭제 후 재저장)"""
     conn = get_db()
@@ -3301,6 +3869,7 @@ def get_project_characters(project_id: int) -> List[Dict]:
     conn.close()
     return [dict(row) for row in rows]
 
+@_single_writer
 def update_character_image(project_id: int, name: str, image_url: str):
     """특정 캐릭터 이미지 업데이트"""
     conn = get_db()
@@ -3514,6 +4083,7 @@ def _ensure_global_settings_table(conn=None):
             conn.close()
 
 
+@_single_writer
 def save_global_setting(key: str, value: Any):
     """글로벌 설정 저장"""
     conn = get_db()
@@ -3644,6 +4214,7 @@ def get_subtitle_defaults() -> Dict:
 
 # ============ 성공 전략 지식 베이스 (학습 시스템) ============
 
+@_single_writer
 def save_success_knowledge(category: str, pattern: str, insight: str, source_video_id: str = None, script_style: str = "story"):
     """성공 전략 지식 저장"""
     conn = get_db()
@@ -3729,61 +4300,149 @@ def get_thumbnail_style_presets() -> Dict[str, Dict[str, Any]]:
     return result
 
 
-def save_image_prompts(project_id: int, prompts: list):
-    import json
-    print(f"[DB] save_image_prompts called for {project_id} with {len(prompts)} items")
-    
-    conn = get_db()
+# save_image_prompts가 관리하는 컬럼 (scene_number 제외). 나머지 컬럼(focal_point_y 등)은 보존된다.
+_IMAGE_PROMPT_SAVE_COLUMNS = (
+    "scene_text", "prompt_ko", "prompt_en", "image_url",
+    "script_start", "script_end", "scene_title", "video_url",
+    "sfx_prompt", "bgm_prompt", "sfx_url", "bgm_url", "fade_in", "motion_desc", "engine",
+    "prompt_char", "prompt_bg", "flow_prompt", "scene_type",
+    "is_dual", "start_frame", "end_frame", "prompt_en_start", "prompt_en_end", "scene_text_vi",
+)
+
+# scene_text가 바뀌면 더 이상 맞지 않는 번역 컬럼 (scene_text_vi는 호출자가 함께 보낸다)
+_IMAGE_PROMPT_STALE_TRANSLATIONS = ("scene_text_en", "scene_text_th")
+
+
+def _image_prompt_save_values(prompt: dict) -> tuple:
+    def _frame(key):
+        value = prompt.get(key)
+        return json.dumps(value) if isinstance(value, (dict, list)) else prompt.get(key, '')
+
+    return (
+        prompt.get('scene_text') or prompt.get('scene') or prompt.get('prompt_ko') or '',
+        prompt.get('prompt_ko') or '',
+        prompt.get('prompt_en') or prompt.get('prompt_content') or prompt.get('prompt') or '',
+        prompt.get('image_url'),
+        prompt.get('script_start') or '',
+        prompt.get('script_end') or '',
+        prompt.get('scene_title') or '',
+        prompt.get('video_url', ''),
+        prompt.get('sfx_prompt', ''),
+        prompt.get('bgm_prompt', ''),
+        prompt.get('sfx_url', ''),
+        prompt.get('bgm_url', ''),
+        prompt.get('fade_in', ''),
+        prompt.get('motion_desc', ''),
+        prompt.get('engine', 'wan'),
+        prompt.get('prompt_char', ''),
+        prompt.get('prompt_bg', ''),
+        prompt.get('flow_prompt', ''),
+        prompt.get('scene_type', ''),
+        prompt.get('is_dual', 0),
+        _frame('start_frame'),
+        _frame('end_frame'),
+        prompt.get('prompt_en_start', ''),
+        prompt.get('prompt_en_end', ''),
+        prompt.get('scene_text_vi', ''),
+    )
+
+
+_image_prompt_stale_cols_cache: Dict[str, tuple] = {}
+
+
+def _image_prompt_stale_cols(conn) -> tuple:
+    """이 DB에 있는 _IMAGE_PROMPT_STALE_TRANSLATIONS 컬럼 (DB 경로별로 한 번만 PRAGMA 조회)."""
+    key = str(get_db_path())
+    cols = _image_prompt_stale_cols_cache.get(key)
+    if cols is None:
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(image_prompts)").fetchall()}
+        cols = tuple(col for col in _IMAGE_PROMPT_STALE_TRANSLATIONS if col in existing)
+        _image_prompt_stale_cols_cache[key] = cols
+    return cols
+
+
+def _diff_save_image_prompts(conn, project_id: int, prompts: list) -> Dict[str, int]:
+    """(project_id, scene_number) 기준 diff upsert. writer 트랜잭션 안에서 실행된다."""
     cursor = conn.cursor()
+    stale_cols = _image_prompt_stale_cols(conn)
 
-    try:
-        cursor.execute("DELETE FROM image_prompts WHERE project_id = ?", (project_id,))
+    # 비교는 값 tuple 단위로 하므로 sqlite3.Row 대신 plain tuple로 받는다
+    cursor.row_factory = None
+    cursor.execute(
+        f"SELECT id, scene_number, {', '.join(_IMAGE_PROMPT_SAVE_COLUMNS)} FROM image_prompts "
+        "WHERE project_id = ? ORDER BY scene_number, id",
+        (project_id,),
+    )
+    current: Dict[int, Any] = {}
+    delete_ids = []
+    for row in cursor.fetchall():
+        # 과거 데이터에 같은 scene_number가 중복돼 있으면 가장 오래된 row만 남긴다
+        if row[1] in current:
+            delete_ids.append((row[0],))
+        else:
+            current[row[1]] = row
+
+    inserts = []
+    updated = 0
+    for index, prompt in enumerate(prompts):
+        scene_number = index + 1
+        values = _image_prompt_save_values(prompt)
+        row = current.pop(scene_number, None)
+        if row is None:
+            inserts.append((project_id, scene_number) + values)
+            continue
 
-        for i, prompt in enumerate(prompts):
-            cursor.execute("""
-                INSERT INTO image_prompts
-                (project_id, scene_number, scene_text, prompt_ko, prompt_en, image_url,
-                 script_start, script_end, scene_title, video_url,
-                 sfx_prompt, bgm_prompt, sfx_url, bgm_url, fade_in, motion_desc, engine,
-                 prompt_char, prompt_bg, flow_prompt, scene_type,
-                 is_dual, start_frame, end_frame, prompt_en_start, prompt_en_end, scene_text_vi)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                project_id,
-                i + 1,
-                prompt.get('scene_text') or prompt.get('scene') or prompt.get('prompt_ko') or '',
-                prompt.get('prompt_ko') or '',
-                prompt.get('prompt_en') or prompt.get('prompt_content') or prompt.get('prompt') or '',
-                prompt.get('image_url'),
-                prompt.get('script_start') or '',
-                prompt.get('script_end') or '',
-                prompt.get('scene_title') or '',
-                prompt.get('video_url', ''),
-                prompt.get('sfx_prompt', ''),
-                prompt.get('bgm_prompt', ''),
-                prompt.get('sfx_url', ''),
-                prompt.get('bgm_url', ''),
-                prompt.get('fade_in', ''),
-                prompt.get('motion_desc', ''),
-                prompt.get('engine', 'wan'),
-                prompt.get('prompt_char', ''),
-                prompt.get('prompt_bg', ''),
-                prompt.get('flow_prompt', ''),
-                prompt.get('scene_type', ''),
-                prompt.get('is_dual', 0),
-                json.dumps(prompt.get('start_frame')) if isinstance(prompt.get('start_frame'), (dict, list)) else prompt.get('start_frame', ''),
-                json.dumps(prompt.get('end_frame')) if isinstance(prompt.get('end_frame'), (dict, list)) else prompt.get('end_frame', ''),
-                prompt.get('prompt_en_start', ''),
-                prompt.get('prompt_en_end', ''),
-                prompt.get('scene_text_vi', '')
-            ))
-        conn.commit()
+        if row[2:] == values:
+            continue
+        changed = {
+            col: value
+            for col, old_value, value in zip(_IMAGE_PROMPT_SAVE_COLUMNS, row[2:], values)
+            if old_value != value
+        }
+        if not changed:
+            continue
+        if "scene_text" in changed:
+            for col in stale_cols:
+                changed[col] = None
+        cursor.execute(
+            f"UPDATE image_prompts SET {', '.join(f'{col} = ?' for col in changed)} WHERE id = ?",
+            tuple(changed.values()) + (row[0],),
+        )
+        updated += 1
+
+    if inserts:
+        cursor.executemany(
+            f"INSERT INTO image_prompts (project_id, scene_number, {', '.join(_IMAGE_PROMPT_SAVE_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in range(len(_IMAGE_PROMPT_SAVE_COLUMNS) + 2))})",
+            inserts,
+        )
+    # 목록에서 빠진 씬만 삭제
+    delete_ids.extend((row[0],) for row in current.values())
+    if delete_ids:
+        cursor.executemany("DELETE FROM image_prompts WHERE id = ?", delete_ids)
+
+    changes = {"inserted": len(inserts), "updated": updated, "deleted": len(delete_ids)}
+    if any(changes.values()):
+        # writer 스레드 안이므로 같은 트랜잭션에서 실행된다
         mark_project_dirty(project_id)
+    return changes
+
+
+def save_image_prompts(project_id: int, prompts: list):
+    """씬 프롬프트 저장.
+
+    기존 row를 (project_id, scene_number)로 매칭해 바뀐 컬럼만 UPDATE하고, 새 씬은
+    executemany로 INSERT, 빠진 씬만 DELETE 한다. row id가 유지되므로
+    update_image_prompt_scene_text_*(prompt_id) 호출자가 깨지지 않는다.
+    """
+    print(f"[DB] save_image_prompts called for {project_id} with {len(prompts)} items")
+
+    try:
+        run_write(_diff_save_image_prompts, project_id, prompts)
     except Exception as e:
         print(f"[DB Error] save_image_prompts: {e}")
-    finally:
-        conn.close()
 
+@_single_writer
 def update_image_prompt_scene_text_vi(prompt_id: int, scene_text_vi: str):
     """장면 스크립트 베트남어 번역 업데이트"""
     conn = get_db()
@@ -3792,6 +4451,7 @@ def update_image_prompt_scene_text_vi(prompt_id: int, scene_text_vi: str):
     conn.commit()
     conn.close()
 
+@_single_writer
 def update_image_prompt_scene_text_en(prompt_id: int, scene_text_en: str):
     """장면 스크립트 영어 번역 업데이트"""
     conn = get_db()
@@ -3800,6 +4460,7 @@ def update_image_prompt_scene_text_en(prompt_id: int, scene_text_en: str):
     conn.commit()
     conn.close()
 
+@_single_writer
 def update_image_prompt_scene_text_th(prompt_id: int, scene_text_th: str):
     """장면 스크립트 태국어 UI 번역 업데이트"""
     conn = get_db()
@@ -3855,6 +4516,7 @@ def get_image_prompts(project_id: int):
         conn.close()
 
 # [NEW] Autopilot Presets Helper
+@_single_writer
 def save_autopilot_preset(name: str, settings: dict):
     try:
         conn = get_db()
@@ -3879,6 +4541,7 @@ def get_autopilot_presets():
     finally:
         conn.close()
 
+@_single_writer
 def delete_autopilot_preset(preset_id: int):
     try:
         conn = get_db()
@@ -3936,6 +4599,7 @@ def get_style_preset(style_key: str) -> Optional[Dict]:
     return None
 
 
+@_single_writer
 def save_style_preset(style_key: str, prompt_value: str, image_url: str = None, gemini_instruction: str = None, mode: str = None, display_name_ko: str = None, display_name_vi: str = None):
     """이미지 스타일 프리셋 저장. mode: 'image'(기본) | 'blog' | 'all'"""
     conn = get_db()
@@ -3977,6 +4641,7 @@ def save_style_preset(style_key: str, prompt_value: str, image_url: str = None,
     conn.close()
 
 
+@_single_writer
 def clear_all_style_presets():
     """모든 이미지 스타일 프리셋을 삭제 (sync 전 초기화용)"""
     conn = get_db()
@@ -3986,6 +4651,7 @@ def clear_all_style_presets():
     conn.close()
 
 
+@_single_writer
 def delete_style_preset(style_key: str):
     """Delete one local image-style cache entry."""
     conn = get_db()
@@ -4015,6 +4681,7 @@ def get_subtitle_style_presets():
     finally:
         if conn: conn.close()
 
+@_single_writer
 def save_subtitle_style_preset(name: str, settings_json: str):
     """자막 스타일 프리셋 저장 (Upsert)"""
     conn = get_db()
@@ -4030,6 +4697,7 @@ def save_subtitle_style_preset(name: str, settings_json: str):
     finally:
         if conn: conn.close()
 
+@_single_writer
 def delete_subtitle_style_preset(name: str):
     """자막 스타일 프리셋 삭제"""
     conn = get_db()
@@ -4074,6 +4742,7 @@ def get_shorts_template_preset(name: str, category: Optional[str] = None):
         print(f"[DB Error] get_shorts_template_preset: {e}")
         return None
 
+@_single_writer
 def save_shorts_template_preset(name: str, settings_json: str, image_path: Optional[str] = None, category: str = 'shorts'):
     """숏폼 템플릿 프리셋 저장 (Upsert)"""
     conn = get_db()
@@ -4087,6 +4756,7 @@ def save_shorts_template_preset(name: str, settings_json: str, image_path: Optio
     finally:
         if conn: conn.close()
 
+@_single_writer
 def delete_shorts_template_preset(name: str, category: Optional[str] = None):
     """숏폼 템플릿 프리셋 삭제"""
     conn = get_db()
@@ -4133,6 +4803,7 @@ def get_script_style_presets_detailed():
         }
     return result
 
+@_single_writer
 def save_script_style_preset(style_key: str, prompt_value: str, display_name_ko: str = None, display_name_vi: str = None):
     """대본 스타일 프리셋 저장"""
     conn = get_db()
@@ -4163,6 +4834,7 @@ def save_script_style_preset(style_key: str, prompt_value: str, display_name_ko:
     conn.close()
 
 
+@_single_writer
 def delete_script_style_preset(style_key: str):
     """Delete one local script-style cache entry."""
     conn = get_db()
@@ -4174,6 +4846,7 @@ def delete_script_style_preset(style_key: str):
 
 # Removed duplicate get_thumbnail_style_presets to avoid collision
 
+@_single_writer
 def save_thumbnail_style_preset(style_key: str, prompt_value: str, image_url: str = None, display_name_ko: str = None, display_name_vi: str = None):
     """썸네일 스타일 프리셋 저장"""
     conn = get_db()
@@ -4211,6 +4884,7 @@ def save_thumbnail_style_preset(style_key: str, prompt_value: str, image_url: st
 # 커머스 비디오 관리 (TopView)
 # ============================================
 
+@_single_writer
 def create_commerce_video(video_data):
     """커머스 비디오 레코드 생성"""
     import json
@@ -4246,6 +4920,7 @@ def create_commerce_video(video_data):
     
     return video_id
 
+@_single_writer
 def update_commerce_video(video_id, updates):
     """커머스 비디오 업데이트"""
     conn = get_db()
@@ -4327,6 +5002,7 @@ def get_all_commerce_videos(limit=50):
     
     return videos
 
+@_single_writer
 def delete_commerce_video(video_id):
     """커머스 비디오 삭제"""
     conn = get_db()
@@ -4351,6 +5027,7 @@ def get_webtoon_rules():
     conn.close()
     return [dict(r) for r in rows]
 
+@_single_writer
 def save_webtoon_rule(condition_type, condition_value, action_type, description):
     conn = get_db()
     cursor = conn.cursor()
@@ -4362,6 +5039,7 @@ def save_webtoon_rule(condition_type, condition_value, action_type, description)
     conn.commit()
     conn.close()
 
+@_single_writer
 def delete_webtoon_rule(rule_id):
     conn = get_db()
     cursor = conn.cursor()
@@ -4373,6 +5051,7 @@ def delete_webtoon_rule(rule_id):
 # 퍼블리시 세션 (원소스 멀티유즈)
 # ==========================================
 
+@_single_writer
 def create_publish_session(project_id: int, title: str, content: str) -> int:
     conn = get_db()
     cursor = conn.cursor()
@@ -4417,6 +5096,7 @@ def get_all_publish_sessions() -> List[Dict]:
     conn.close()
     return [dict(r) for r in rows]
 
+@_single_writer
 def update_publish_session(session_id: int, **kwargs):
     conn = get_db()
     cursor = conn.cursor()
@@ -4429,6 +5109,7 @@ def update_publish_session(session_id: int, **kwargs):
     conn.commit()
     conn.close()
 
+@_single_writer
 def delete_publish_session(session_id: int):
     conn = get_db()
     cursor = conn.cursor()
@@ -4439,6 +5120,7 @@ def delete_publish_session(session_id: int):
 
 # 퍼블리시 이미지 CRUD
 
+@_single_writer
 def add_publish_image(session_id: int, position: int, prompt_ko: str, prompt_en: str) -> int:
     conn = get_db()
     cursor = conn.cursor()
@@ -4462,6 +5144,7 @@ def get_publish_images(session_id: int) -> List[Dict]:
     conn.close()
     return [dict(r) for r in rows]
 
+@_single_writer
 def update_publish_image(image_id: int, **kwargs):
     conn = get_db()
     cursor = conn.cursor()
@@ -4474,6 +5157,7 @@ def update_publish_image(image_id: int, **kwargs):
     conn.commit()
     conn.close()
 
+@_single_writer
 def delete_publish_image(image_id: int):
     conn = get_db()
     cursor = conn.cursor()
@@ -4557,18 +5241,14 @@ def add_ai_log(project_id, task_type: str, model_id: str, provider: str, status:
     except:
         pass
 
-    conn = get_db()
-    cursor = conn.cursor()
+    log_id = None
     try:
-        cursor.execute("""
+        log_id = run_write(lambda conn: conn.execute("""
             INSERT INTO ai_generation_logs (project_id, task_type, model_id, provider, status, prompt_summary, error_msg, elapsed_time, input_tokens, output_tokens, balance_after, thinking_tokens, worker_email)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (project_id, task_type, model_id, provider, status, prompt_summary, error_msg, elapsed_time, input_tokens, output_tokens, balance_after, thinking_tokens, worker_email))
-        conn.commit()
+        """, (project_id, task_type, model_id, provider, status, prompt_summary, error_msg, elapsed_time, input_tokens, output_tokens, balance_after, thinking_tokens, worker_email)).lastrowid)
     except Exception as e:
         print(f"[DB] Failed to add AI log: {e}")
-    finally:
-        conn.close()
 
     # 백그라운드에서 Supabase 원격 동기화 (메인 스레드 블로킹 없음)
     import threading
@@ -4669,6 +5349,9 @@ def add_ai_log(project_id, task_type: str, model_id: str, provider: str, status:
                 except Exception:
                     pass
             else:
+                # 원격 반영이 확인된 로그만 보관 정리(retention) 대상이 된다
+                if log_id:
+                    mark_ai_log_remote_synced(log_id)
                 try:
                     print(f"[Sync] Successfully pushed {task_type} log to remote.")
                 except Exception:
@@ -4683,21 +5366,182 @@ def add_ai_log(project_id, task_type: str, model_id: str, provider: str, status:
     threading.Thread(target=_push_remote, daemon=True).start()
 
 
+# ============ AI 로그 일/시간 단위 롤업 ============
+#
+# 정산/토큰 사용량 리포트는 ai_generation_logs 원본 대신 이 롤업을 읽는다.
+# 롤업은 ai_generation_logs INSERT 트리거로 갱신되므로 다른 프로세스나 예전 코드
+# 경로에서 들어온 로그도 빠지지 않는다. 원본 로그를 보관 정리(삭제)해도 롤업은 남는다.
+# bucket_hour(UTC 시 단위)를 함께 저장해 KST 같은 로컬 하루 범위도 정확히 합산한다.
+
+_AI_LOG_ROLLUP_KEY_SQL = """
+    strftime('%Y-%m-%d %H:00:00', {created_at}),
+    date({created_at}),
+    COALESCE({worker_email}, 'unknown'),
+    COALESCE({task_type}, ''),
+    COALESCE({provider}, ''),
+    COALESCE({status}, '')
+"""
+
+
+def _ensure_ai_log_rollups(cursor):
+    """롤업 테이블/트리거 생성. 비어 있으면 기존 로그로 1회 백필한다."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ai_log_rollups (
+            bucket_hour TEXT NOT NULL,
+            day TEXT NOT NULL,
+            worker_email TEXT NOT NULL,
+            task_type TEXT NOT NULL,
+            provider TEXT NOT NULL,
+            status TEXT NOT NULL,
+            call_count INTEGER NOT NULL DEFAULT 0,
+            input_tokens INTEGER NOT NULL DEFAULT 0,
+            output_tokens INTEGER NOT NULL DEFAULT 0,
+            thinking_tokens INTEGER NOT NULL DEFAULT 0,
+            elapsed_time_sum REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (bucket_hour, worker_email, task_type, provider, status)
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_ai_log_rollups_day_worker
+        ON ai_log_rollups(day, worker_email)
+    """)
+    key = _AI_LOG_ROLLUP_KEY_SQL.format(
+        created_at="COALESCE(NEW.created_at, CURRENT_TIMESTAMP)",
+        worker_email="NEW.worker_email",
+        task_type="NEW.task_type",
+        provider="NEW.provider",
+        status="NEW.status",
+    )
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_ai_generation_logs_rollup
+        AFTER INSERT ON ai_generation_logs
+        BEGIN
+            INSERT INTO ai_log_rollups (
+                bucket_hour, day, worker_email, task_type, provider, status,
+                call_count, input_tokens, output_tokens, thinking_tokens, elapsed_time_sum
+            )
+            VALUES (
+                {key},
+                1,
+                COALESCE(NEW.input_tokens, 0),
+                COALESCE(NEW.output_tokens, 0),
+                COALESCE(NEW.thinking_tokens, 0),
+                COALESCE(NEW.elapsed_time, 0)
+            )
+            ON CONFLICT(bucket_hour, worker_email, task_type, provider, status) DO UPDATE SET
+                call_count = call_count + 1,
+                input_tokens = input_tokens + excluded.input_tokens,
+                output_tokens = output_tokens + excluded.output_tokens,
+                thinking_tokens = thinking_tokens + excluded.thinking_tokens,
+                elapsed_time_sum = elapsed_time_sum + excluded.elapsed_time_sum;
+        END
+    """)
+    has_rollups = cursor.execute("SELECT 1 FROM ai_log_rollups LIMIT 1").fetchone()
+    has_logs = cursor.execute("SELECT 1 FROM ai_generation_logs LIMIT 1").fetchone()
+    if has_logs and not has_rollups:
+        _rebuild_ai_log_rollups(cursor)
+        print("[Migration] Backfilled ai_log_rollups from ai_generation_logs")
+
+
+# 보관 정리(delete_retained_rows)가 지운 가장 최근 원본 로그의 created_at.
+# 그날까지의 롤업은 원본이 없어 다시 계산할 수 없으므로 정산 기록으로 보존한다.
+AI_LOG_PURGED_THROUGH_KEY = "ai_log_raw_purged_through"
+
+
+def _record_ai_log_purged_through(cursor, created_at: str):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS global_settings (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("""
+        INSERT INTO global_settings (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(key) DO UPDATE SET value = MAX(COALESCE(value, ''), excluded.value),
+                                       updated_at = CURRENT_TIMESTAMP
+    """, (AI_LOG_PURGED_THROUGH_KEY, created_at))
+
+
+def _ai_log_rebuild_floor(cursor) -> Optional[str]:
+    """롤업을 다시 계산해도 되는 첫 날 (원본이 지워진 마지막 날의 다음 날). 정리 이력이 없으면 None."""
+    try:
+        row = cursor.execute(
+            "SELECT value FROM global_settings WHERE key = ?", (AI_LOG_PURGED_THROUGH_KEY,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    if not row or not row[0]:
+        return None
+    return cursor.execute("SELECT date(?, '+1 day')", (row[0],)).fetchone()[0]
+
+
+def _rebuild_ai_log_rollups(cursor, since_day: str = None):
+    """원본 로그로 롤업을 다시 계산 (since_day 이후 구간만 교체 가능).
+    원본 로그가 정리된 날의 롤업은 지우지 않도록 since_day를 _ai_log_rebuild_floor 이후로 올린다."""
+    floor = _ai_log_rebuild_floor(cursor)
+    if floor and (not since_day or since_day < floor):
+        since_day = floor
+    where = ""
+    params: tuple = ()
+    if since_day:
+        where = "WHERE date(created_at) >= ?"
+        params = (since_day,)
+        cursor.execute("DELETE FROM ai_log_rollups WHERE day >= ?", params)
+    else:
+        cursor.execute("DELETE FROM ai_log_rollups")
+    key = _AI_LOG_ROLLUP_KEY_SQL.format(
+        created_at="created_at",
+        worker_email="worker_email",
+        task_type="task_type",
+        provider="provider",
+        status="status",
+    )
+    cursor.execute(f"""
+        INSERT INTO ai_log_rollups (
+            bucket_hour, day, worker_email, task_type, provider, status,
+            call_count, input_tokens, output_tokens, thinking_tokens, elapsed_time_sum
+        )
+        SELECT {key},
+               COUNT(*),
+               COALESCE(SUM(input_tokens), 0),
+               COALESCE(SUM(output_tokens), 0),
+               COALESCE(SUM(thinking_tokens), 0),
+               COALESCE(SUM(elapsed_time), 0)
+        FROM ai_generation_logs
+        {where}
+        GROUP BY 1, 2, 3, 4, 5, 6
+    """, params)
+
+
+def rebuild_ai_log_rollups(since_day: str = None) -> bool:
+    """롤업 재계산 (관리용 compaction). 보관 정리로 원본 로그가 지워진 날까지는
+    since_day와 관계없이 건드리지 않는다 (_ai_log_rebuild_floor)."""
+    try:
+        run_write(lambda conn: _rebuild_ai_log_rollups(conn.cursor(), since_day))
+        return True
+    except Exception as e:
+        print(f"[DB] Failed to rebuild AI log rollups: {e}")
+        return False
+
+
 def get_daily_token_usage():
     """오늘 하루 사용한 총 토큰량 합계 반환"""
     conn = get_db()
     cursor = conn.cursor()
     try:
-        # KST 기준 오늘 날짜 구하기
+        # KST 기준 오늘 0시~내일 0시를 UTC 시 단위 버킷 범위로 변환
         from datetime import datetime, timedelta, timezone
         kst = timezone(timedelta(hours=9))
-        today = datetime.now(kst).strftime('%Y-%m-%d')
-        
+        start_kst = datetime.now(kst).replace(hour=0, minute=0, second=0, microsecond=0)
+        start_utc = start_kst.astimezone(timezone.utc)
+        end_utc = start_utc + timedelta(days=1)
+
         cursor.execute("""
-            SELECT SUM(input_tokens + output_tokens) as total 
-            FROM ai_generation_logs 
-            WHERE date(created_at, 'localtime') = ?
-        """, (today,))
+            SELECT SUM(input_tokens + output_tokens) as total
+            FROM ai_log_rollups
+            WHERE bucket_hour >= ? AND bucket_hour < ?
+        """, (start_utc.strftime('%Y-%m-%d %H:00:00'), end_utc.strftime('%Y-%m-%d %H:00:00')))
         row = cursor.fetchone()
         return row['total'] if row and row['total'] else 0
     except Exception as e:
@@ -4732,12 +5576,14 @@ def get_ai_logs(limit: int = 100, days: int = None) -> List[Dict[str, Any]]:
     finally:
         conn.close()
 
+@_single_writer
 def clear_ai_logs():
     """모든 AI 로그 삭제"""
     conn = get_db()
     cursor = conn.cursor()
     try:
         cursor.execute("DELETE FROM ai_generation_logs")
+        cursor.execute("DELETE FROM ai_log_rollups")
         conn.commit()
     except Exception as e:
         print(f"[DB] Failed to clear AI logs: {e}")
@@ -4784,24 +5630,24 @@ def get_worker_settlement_stats(
     conn = get_db()
     cursor = conn.cursor()
     try:
-        # 1. AI 작업량(ai_generation_logs) 집계
+        # 1. AI 작업량 집계 (ai_log_rollups 일 단위 롤업)
         query = """
             SELECT
-                COALESCE(worker_email, 'unknown') as worker,
-                COUNT(id) as total_ai_tasks,
-                SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success_ai_tasks,
-                SUM(CASE WHEN task_type = 'tts_gen' THEN 1 ELSE 0 END) as tts_tasks,
-                SUM(CASE WHEN task_type = 'vision_gen' OR task_type = 'image_crop' THEN 1 ELSE 0 END) as media_tasks
-            FROM ai_generation_logs
+                worker_email as worker,
+                SUM(call_count) as total_ai_tasks,
+                SUM(CASE WHEN status = 'success' THEN call_count ELSE 0 END) as success_ai_tasks,
+                SUM(CASE WHEN task_type = 'tts_gen' THEN call_count ELSE 0 END) as tts_tasks,
+                SUM(CASE WHEN task_type = 'vision_gen' OR task_type = 'image_crop' THEN call_count ELSE 0 END) as media_tasks
+            FROM ai_log_rollups
             WHERE 1=1
         """
         params = []
         if start_date:
-            query += " AND created_at >= ?"
-            params.append(f"{start_date} 00:00:00")
+            query += " AND day >= ?"
+            params.append(start_date)
         if end_date:
-            query += " AND created_at <= ?"
-            params.append(f"{end_date} 23:59:59")
+            query += " AND day <= ?"
+            params.append(end_date)
         if email:
             query += " AND worker_email = ?"
             params.append(email)
@@ -4923,6 +5769,7 @@ def get_worker_project_history(employee_email: str):
 
 
 
+@_single_writer
 def create_withdrawal(employee_email: str, amount: float, dest_address: str) -> int:
     conn = get_db()
     cursor = conn.cursor()
@@ -4969,62 +5816,15 @@ def is_user_admin(email: str) -> bool:
 
 
 def get_settlement_summary(start_date=None, end_date=None, email=None):
-    """Get settlement summary for workers"""
-    try:
-        query = """
-            SELECT
-                w.email as worker,
-                COUNT(DISTINCT p.id) as total_projects,
-                SUM(CASE WHEN p.status = 'completed' THEN 1 ELSE 0 END) as completed_projects,
-                COUNT(DISTINCT ai.id) as total_ai_tasks,
-                SUM(CASE WHEN ai.status = 'success' THEN 1 ELSE 0 END) as success_ai_tasks,
-                COUNT(DISTINCT t.id) as tts_tasks,
-                COUNT(DISTINCT m.id) as media_tasks,
-                COALESCE(SUM(p.estimated_payout), 0) as total_estimated_payout
-            FROM workers w
-            LEFT JOIN projects p ON w.email = p.worker_email
-            LEFT JOIN ai_tasks ai ON w.email = ai.worker_email
-            LEFT JOIN tts_tasks t ON w.email = t.worker_email
-            LEFT JOIN media_tasks m ON w.email = m.worker_email
-            WHERE 1=1
-        """
-
-        params = []
-
-        if start_date:
-            query += " AND p.created_at >= ?"
-            params.append(start_date)
-
-        if end_date:
-            query += " AND p.created_at <= ?"
-            params.append(end_date)
-
-        if email:
-            query += " AND w.email = ?"
-            params.append(email)
-
-        query += " GROUP BY w.email ORDER BY w.email"
-
-        results = db.query(query, tuple(params))
-
-        stats = []
-        for row in results:
-            stats.append({
-                "worker": row[0],
-                "total_projects": row[1] or 0,
-                "completed_projects": row[2] or 0,
-                "total_ai_tasks": row[3] or 0,
-                "success_ai_tasks": row[4] or 0,
-                "tts_tasks": row[5] or 0,
-                "media_tasks": row[6] or 0,
-                "total_estimated_payout": row[7] or 0
-            })
-
-        return stats
-    except Exception as e:
-        print(f"Error getting settlement summary: {e}")
-        return []
+    """Get settlement summary for workers (로컬 롤업 기반, 완료 = projects.status)"""
+    return get_worker_settlement_stats(
+        start_date=start_date,
+        end_date=end_date,
+        email=email,
+        approved_only=False,
+    )
 
+@_single_writer
 def delete_user_data(email: str) -> bool:
     """탈퇴 회원의 모든 로컬 데이터를 삭제한다."""
     conn = get_db()
@@ -46,7 +46,7 @@ _set_window_icon()
 from fastapi import FastAPI, Request, HTTPException, Form, BackgroundTasks, Body, Query, UploadFile, File
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any, Union
@@ -466,6 +466,10 @@ async def startup_event():
         from app.services.referral_engagement_service import referral_engagement_service
         asyncio.create_task(referral_engagement_service.start_background_worker())
 
+        # 동기화 끝난 오래된 로그 아카이브 + DB 유지보수
+        from services.retention_service import retention_service
+        asyncio.create_task(retention_service.start_background_worker())
+
         # 키 로드 상태 출력
         from config import Config
         gemini_ok = "✅" if Config.GEMINI_API_KEY else "❌ 없음"
@@ -1310,15 +1314,11 @@ async def upload_intro_video(
         web_url = f"/uploads/intros/{project_id}/intro{file_ext}"
 
         # 데이터베이스에 경로 저장
-        conn = database.get_db()
-        cursor = conn.cursor()
-        cursor.execute("""
+        database.run_write(lambda conn: conn.execute("""
             UPDATE project_settings 
             SET intro_video_path = ?, background_video_url = ?, updated_at = CURRENT_TIMESTAMP
             WHERE project_id = ?
-        """, (str(intro_path), web_url, project_id))
-        conn.commit()
-        conn.close()
+        """, (str(intro_path), web_url, project_id)))
         
         return {
             "status": "success",
@@ -1343,9 +1343,9 @@ async def delete_intro_video(project_id: int):
         SELECT intro_video_path FROM project_settings WHERE project_id = ?
     """, (project_id,))
     row = cursor.fetchone()
+    conn.close()
     
     if not row or not row[0]:
-        conn.close()
         raise HTTPException(404, "인트로 영상이 없습니다.")
     
     intro_path = Path(row[0])
@@ -1354,20 +1354,17 @@ async def delete_intro_video(project_id: int):
         if intro_path.exists():
             intro_path.unlink()
         
-        cursor.execute("""
+        database.run_write(lambda conn: conn.execute("""
             UPDATE project_settings 
             SET intro_video_path = NULL, background_video_url = NULL, updated_at = CURRENT_TIMESTAMP
             WHERE project_id = ?
-        """, (project_id,))
-        conn.commit()
-        conn.close()
+        """, (project_id,)))
         
         return {
             "status": "success",
             "message": "인트로 영상이 삭제되었습니다."
         }
     except Exception as e:
-        conn.close()
         raise HTTPException(500, f"삭제 실패: {str(e)}")
 
 # ===========================================
@@ -1447,6 +1444,11 @@ def start_scheduler():
 @app.on_event("shutdown")
 def shutdown_scheduler():
     scheduler.shutdown()
+    try:
+        from services.async_db import async_db
+        async_db.shutdown(wait=False)
+    except Exception:
+        pass
     # 시스템 트레이 정리
     try:
         from services.tray_service import _icon
@@ -1568,6 +1570,32 @@ async def get_render_status(project_id: int):
     from services.progress import get_render_progress
     return get_render_progress(project_id)
 
+
+@app.get("/api/events")
+async def stream_events(request: Request, events: str = "", project_id: int = None):
+    """렌더 진행률(render)·렌더 큐(render_queue) 변경을 Server-Sent Events로 푸시.
+    접속 직후 현재 상태 snapshot을 보내고 이후 변경분만 보낸다 (폴링 대체).
+    project_id를 주면 해당 프로젝트 이벤트만 보낸다."""
+    from services.event_bus import event_bus, sse_frame
+
+    wanted = {name.strip() for name in events.split(",") if name.strip()}
+    match = None
+    if project_id is not None:
+        match = lambda m: str(m["data"].get("project_id")) == str(project_id)
+
+    async def stream():
+        yield "retry: 3000\n\n"
+        async for message in event_bus.subscribe(wanted, match=match):
+            if await request.is_disconnected():
+                return
+            yield sse_frame(message)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
 @app.post("/api/project/{project_id}/render-queue")
 async def add_to_render_queue(project_id: int):
     """렌더링 대기열에 추가 — 상태를 tts_done으로 설정"""
@@ -1691,14 +1719,10 @@ def recover_project_assets(project_id: int):
         existing_tts = db.get_tts(project_id)
         if not existing_tts:
             print(f"Recovering audio for project {project_id}: {audio_path}")
-            db_conn = db.get_connection()
-            cursor = db_conn.cursor()
-            cursor.execute(
+            db.run_write(lambda conn: conn.execute(
                 "INSERT INTO tts_audio (project_id, audio_path, duration, created_at) VALUES (?, ?, ?, ?)",
                 (project_id, audio_path, 0, datetime.datetime.now().isoformat())
-            )
-            db_conn.commit()
-            db_conn.close()
+            ))
             recovered_audio = True
 
     # 2. 이미지 파일 스캔
@@ -1707,32 +1731,32 @@ def recover_project_assets(project_id: int):
     found_images = glob.glob(image_pattern)
     
     if found_images:
-        db_conn = db.get_connection()
-        cursor = db_conn.cursor()
-        
-        for img_path in found_images:
-            filename = os.path.basename(img_path)
-            try:
-                parts = filename.replace(".png", "").split("_")
-                if len(parts) >= 3:
-                    scene_num = int(parts[2])
-                    
-                    cursor.execute("SELECT id FROM image_prompts WHERE project_id=? AND scene_number=?", (project_id, scene_num))
-                    if not cursor.fetchone():
-                        print(f"Recovering image for project {project_id} scene {scene_num}: {img_path}")
-                        rel_path = os.path.relpath(img_path, config.OUTPUT_DIR)
-                        web_url = f"/output/{rel_path}".replace("\\", "/")
-                        
-                        cursor.execute(
-                            "INSERT INTO image_prompts (project_id, scene_number, prompt, image_path, image_url, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-                            (project_id, scene_num, "Recovered Image", img_path, web_url, datetime.datetime.now().isoformat())
-                        )
-                        recovered_images += 1
-            except Exception as e:
-                print(f"Skipping malformed filename {filename}: {e}")
-                
-        db_conn.commit()
-        db_conn.close()
+        def _recover_images(conn):
+            recovered = 0
+            cursor = conn.cursor()
+            for img_path in found_images:
+                filename = os.path.basename(img_path)
+                try:
+                    parts = filename.replace(".png", "").split("_")
+                    if len(parts) >= 3:
+                        scene_num = int(parts[2])
+
+                        cursor.execute("SELECT id FROM image_prompts WHERE project_id=? AND scene_number=?", (project_id, scene_num))
+                        if not cursor.fetchone():
+                            print(f"Recovering image for project {project_id} scene {scene_num}: {img_path}")
+                            rel_path = os.path.relpath(img_path, config.OUTPUT_DIR)
+                            web_url = f"/output/{rel_path}".replace("\\", "/")
+
+                            cursor.execute(
+                                "INSERT INTO image_prompts (project_id, scene_number, prompt, image_path, image_url, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                                (project_id, scene_num, "Recovered Image", img_path, web_url, datetime.datetime.now().isoformat())
+                            )
+                            recovered += 1
+                except Exception as e:
+                    print(f"Skipping malformed filename {filename}: {e}")
+            return recovered
+
+        recovered_images = db.run_write(_recover_images)
         
     return {'audio': recovered_audio, 'images': recovered_images}
         
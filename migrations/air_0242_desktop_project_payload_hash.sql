@@ -0,0 +1,10 @@
+-- AIR-0242: Field-level delta sync for desktop project metadata.
+--
+-- The desktop app hashes each top-level project_payload field and, after the
+-- first full push, sends only the fields that changed (bridge action
+-- 'push_delta'). payload_hash is the desktop's hash of the state the row
+-- currently holds; a delta is applied only when its base_hash matches it,
+-- otherwise the desktop falls back to a full snapshot.
+
+ALTER TABLE public.desktop_project_metadata
+    ADD COLUMN IF NOT EXISTS payload_hash TEXT;
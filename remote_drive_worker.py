@@ -1,8 +1,10 @@
 import datetime
 import json
 import os
+import queue
 import shutil
 import tempfile
+import threading
 import time
 import zipfile
 import argparse
@@ -13,8 +15,10 @@ import traceback
 import requests
 
 from config import config
+from services.drive_transfer import drive_transfer_manager
 from services.google_drive_service import google_drive_service
 from services.remote_render_service import remote_render_executor_func
+from services.render_blob_store import BLOB_MANIFEST_FORMAT, DriveBlobStore, default_blob_cache, materialize_package
 
 try:
     if hasattr(sys.stdout, "reconfigure"):
@@ -80,6 +84,12 @@ class RemoteDriveWorker:
         self.supabase_url = (os.getenv("NEXT_PUBLIC_SUPABASE_URL") or "").rstrip("/")
         self.supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or ""
         self.max_concurrent_jobs = int(os.getenv("REMOTE_RENDER_MAX_CONCURRENT_JOBS", "1"))
+        # 동시에 렌더하는 작업 수 (전체 동시 렌더 한도를 넘지 않게) / 단계 사이 대기 큐 크기
+        self.render_slots = max(1, int(os.getenv("REMOTE_RENDER_SLOTS", "1")))
+        if self.max_concurrent_jobs > 0:
+            self.render_slots = min(self.render_slots, self.max_concurrent_jobs)
+        self.pipeline_depth = max(1, int(os.getenv("REMOTE_RENDER_PIPELINE_DEPTH", "1")))
+        self.blob_cache = default_blob_cache()
         if not self.supabase_url or not self.supabase_key:
             raise RuntimeError("NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY are required.")
 
@@ -113,7 +123,7 @@ class RemoteDriveWorker:
             return response.json()
         return None
 
-    def _active_rendering_count(self):
+    def _active_rendering_count(self, exclude_worker_id=None):
         active_after = (
             datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=30)
         ).isoformat()
@@ -123,12 +133,21 @@ class RemoteDriveWorker:
             "status": "eq.rendering",
             "updated_at": f"gt.{active_after}",
         }
+        if exclude_worker_id:
+            params["worker_id"] = f"neq.{exclude_worker_id}"
         rows = self._request("GET", self.queue_url, params=params) or []
         return len(rows)
 
-    def fetch_next_job(self):
-        if self.max_concurrent_jobs > 0 and self._active_rendering_count() >= self.max_concurrent_jobs:
-            return None
+    def fetch_next_job(self, pipelined=False):
+        if self.max_concurrent_jobs > 0:
+            if pipelined:
+                # 파이프라인에서는 이 워커가 받아 둔 작업(다운로드·대기·업로드 중)이 아니라
+                # 렌더 슬롯 수만큼을 동시 렌더 한도에 포함한다
+                busy = self._active_rendering_count(exclude_worker_id=self.worker_id) + self.render_slots
+                if busy > self.max_concurrent_jobs:
+                    return None
+            elif self._active_rendering_count() >= self.max_concurrent_jobs:
+                return None
         params = {
             "select": "*",
             "render_mode": "eq.drive_api",
@@ -203,149 +222,224 @@ class RemoteDriveWorker:
             raise RuntimeError(f"Drive 프로젝트 폴더 준비 실패 (카테고리/프로젝트: {folder_category} / {project_name})")
         return folder
 
-    def process_job(self, job):
+    def _prepare_zip_package(self, job, temp_dir):
         job_id = job["id"]
-        asset_file_id = job.get("asset_file_id")
-        if not asset_file_id:
-            raise RuntimeError("큐 작업에 asset_file_id가 없습니다.")
-
-        temp_dir = tempfile.mkdtemp(prefix=f"remote_drive_render_{job_id}_")
         zip_path = os.path.join(temp_dir, "asset_package.zip")
+        self.update_job(job_id, progress=5, message="Google Drive에서 에셋 패키지 다운로드 중...")
+        downloaded = google_drive_service.download_file(job["asset_file_id"], zip_path, token_path=self.google_token_path or None)
+        if not downloaded:
+            raise RuntimeError("Google Drive에서 에셋 패키지 다운로드에 실패했습니다.")
+
+        self.update_job(job_id, progress=12, message="에셋 패키지 압축 해제 중...")
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            zip_ref.extractall(temp_dir)
+
+    def _prepare_blob_package(self, job, temp_dir):
+        """매니페스트 패키지 (services/render_blob_store.py): 로컬 blob 캐시에 없는 파일만 받는다."""
+        job_id = job["id"]
+        self.update_job(job_id, progress=5, message="Google Drive에서 에셋 매니페스트 확인 중...")
+        manifest_text = google_drive_service.read_text_file(job["asset_file_id"], token_path=self.google_token_path or None)
+        if not manifest_text:
+            raise RuntimeError("Google Drive에서 에셋 매니페스트를 읽지 못했습니다.")
+        manifest = json.loads(manifest_text)
+        store = DriveBlobStore((job.get("metadata") or {}).get("blob_folder_id"), token_path=self.google_token_path or None)
+        stats = materialize_package(manifest, temp_dir, store, self.blob_cache)
+        mb = 1024 * 1024
+        self.update_job(
+            job_id,
+            progress=12,
+            message=(
+                f"에셋 준비 완료 (다운로드 {stats['downloaded_files']}개 {stats['downloaded_bytes'] / mb:.1f}MB, "
+                f"캐시 재사용 {stats['cached_files']}개 {stats['cached_bytes'] / mb:.1f}MB)"
+            ),
+        )
+
+    def _mark_failed(self, job_id, error):
+        error_detail = "\n".join(
+            [
+                f"Exception: {type(error).__name__}: {error}",
+                "Traceback:",
+                traceback.format_exc(),
+            ]
+        ).strip()
+        self.update_job(
+            job_id,
+            status="failed",
+            progress=-1,
+            message=f"렌더링 실패: {error}",
+            error_message=error_detail,
+        )
+
+    def _run_stage(self, job, temp_dir, stage, *args):
+        """단계 하나를 실행한다. 실패하면 작업을 failed로 표시하고 작업 폴더를 지운 뒤 예외를 다시 던진다."""
+        try:
+            return stage(job, temp_dir, *args)
+        except Exception as e:
+            self._mark_failed(job["id"], e)
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+    def fetch_stage(self, job):
+        """1단계 (네트워크): 에셋 패키지를 받아 작업 폴더를 만든다. 작업 폴더 경로 반환."""
+        if not job.get("asset_file_id"):
+            error = RuntimeError("큐 작업에 asset_file_id가 없습니다.")
+            self._mark_failed(job["id"], error)
+            raise error
+        temp_dir = tempfile.mkdtemp(prefix=f"remote_drive_render_{job['id']}_")
+        self._run_stage(job, temp_dir, self._fetch)
+        return temp_dir
+
+    def _fetch(self, job, temp_dir):
+        if (job.get("metadata") or {}).get("package_format") == BLOB_MANIFEST_FORMAT:
+            self._prepare_blob_package(job, temp_dir)
+        else:
+            self._prepare_zip_package(job, temp_dir)
+
+    def render_stage(self, job, temp_dir):
+        """2단계 (CPU/GPU): 렌더링. output.mp4 경로 반환."""
+        return self._run_stage(job, temp_dir, self._render)
+
+    def _render(self, job, temp_dir):
+        job_id = job["id"]
+        self.update_job(job_id, progress=20, message="원격 워커에서 영상 렌더링 중...")
+        remote_render_executor_func(job_id, temp_dir, use_gpu=self.use_gpu)
+
+        output_path = os.path.join(temp_dir, "output.mp4")
+        if not os.path.exists(output_path):
+            raise RuntimeError("렌더링은 완료됐지만 output.mp4 파일을 찾을 수 없습니다.")
+        return output_path
+
+    def publish_stage(self, job, temp_dir, output_path):
+        """3단계 (네트워크): 결과 영상·썸네일·metadata.json 업로드 후 완료 처리. 작업 폴더는 항상 지운다."""
         try:
-            self.update_job(job_id, progress=5, message="Google Drive에서 에셋 패키지 다운로드 중...")
-            downloaded = google_drive_service.download_file(asset_file_id, zip_path, token_path=self.google_token_path or None)
-            if not downloaded:
-                raise RuntimeError("Google Drive에서 에셋 패키지 다운로드에 실패했습니다.")
-
-            self.update_job(job_id, progress=12, message="에셋 패키지 압축 해제 중...")
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
-
-            self.update_job(job_id, progress=20, message="원격 워커에서 영상 렌더링 중...")
-            remote_render_executor_func(job_id, temp_dir, use_gpu=self.use_gpu)
-
-            output_path = os.path.join(temp_dir, "output.mp4")
-            if not os.path.exists(output_path):
-                raise RuntimeError("렌더링은 완료됐지만 output.mp4 파일을 찾을 수 없습니다.")
-
-            self.update_job(job_id, progress=92, message="렌더링된 영상을 Google Drive에 업로드 중...")
-            result_filename = self._build_result_filename(job)
-            result_folder = self._resolve_result_folder(job)
-            drive_file = google_drive_service.upsert_file(
-                output_path,
+            self._run_stage(job, temp_dir, self._publish, output_path)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _publish(self, job, temp_dir, output_path):
+        job_id = job["id"]
+        self.update_job(job_id, progress=92, message="렌더링된 영상을 Google Drive에 업로드 중...")
+        result_filename = self._build_result_filename(job)
+        result_folder = self._resolve_result_folder(job)
+        thumbnail_upload = None
+        thumbnail_filename = None
+        packaged_config = None
+        project_metadata_file = None
+        config_path = os.path.join(temp_dir, "config.json")
+        if os.path.exists(config_path):
+            with open(config_path, "r", encoding="utf-8") as f_conf:
+                packaged_config = json.load(f_conf)
+            thumbnail_filename = packaged_config.get("thumbnail_filename")
+            packaged_thumbnail = os.path.join(temp_dir, thumbnail_filename) if thumbnail_filename else None
+            if packaged_thumbnail and os.path.exists(packaged_thumbnail):
+                thumbnail_upload = {
+                    "local_file_path": packaged_thumbnail,
+                    "token_path": self.google_token_path or None,
+                    "folder_id": result_folder.get("id"),
+                    "filename": thumbnail_filename,
+                    "mimetype": "image/png" if thumbnail_filename.lower().endswith(".png") else "image/jpeg",
+                    "description": f"AIR thumbnail for queue job {job_id}",
+                    "make_public": False,
+                }
+
+        # 결과 영상과 썸네일은 동시에 올린다 (metadata.json은 두 파일 ID가 필요해 그 다음)
+        drive_file, thumbnail_file = drive_transfer_manager.upsert_files([
+            {
+                "local_file_path": output_path,
+                "token_path": self.google_token_path or None,
+                "folder_id": result_folder.get("id"),
+                "filename": result_filename,
+                "mimetype": "video/mp4",
+                "description": f"AIR remote render result for queue job {job_id}",
+                "make_public": False,
+            },
+            thumbnail_upload,
+        ])
+        if not drive_file or not drive_file.get("id"):
+            raise RuntimeError("렌더링된 영상을 Google Drive에 업로드하지 못했습니다.")
+
+        if packaged_config is not None:
+            queue_metadata = job.get("metadata") or {}
+            upload_metadata = dict(packaged_config.get("project_upload_metadata") or {})
+            upload_metadata.update({
+                "employee_email": job.get("email") or upload_metadata.get("employee_email") or "",
+                "video_file": drive_file.get("name"),
+                "thumbnail_file": thumbnail_filename,
+                "drive_folder_id": result_folder.get("id"),
+                "drive_video_file_id": drive_file.get("id"),
+                "drive_thumbnail_file_id": (thumbnail_file or {}).get("id") if thumbnail_file else None,
+                "render_mode": "drive_api",
+            })
+            for key in ("track_count", "track_durations", "total_duration_seconds", "app_mode", "render_style", "queue_type"):
+                if queue_metadata.get(key) is not None:
+                    upload_metadata[key] = queue_metadata.get(key)
+            metadata_path = os.path.join(temp_dir, "metadata.json")
+            with open(metadata_path, "w", encoding="utf-8") as f_meta:
+                json.dump(upload_metadata, f_meta, ensure_ascii=False, indent=2)
+            project_metadata_file = google_drive_service.upsert_file(
+                metadata_path,
                 token_path=self.google_token_path or None,
                 folder_id=result_folder.get("id"),
-                filename=result_filename,
-                mimetype="video/mp4",
-                description=f"AIR remote render result for queue job {job_id}",
+                filename="metadata.json",
+                mimetype="application/json",
+                description=f"AIR metadata for queue job {job_id}",
                 make_public=False,
             )
-            if not drive_file or not drive_file.get("id"):
-                raise RuntimeError("렌더링된 영상을 Google Drive에 업로드하지 못했습니다.")
-
-            thumbnail_file = None
-            thumbnail_filename = None
-            packaged_thumbnail = None
-            project_metadata_file = None
-            config_path = os.path.join(temp_dir, "config.json")
-            if os.path.exists(config_path):
-                with open(config_path, "r", encoding="utf-8") as f_conf:
-                    packaged_config = json.load(f_conf)
-                thumbnail_filename = packaged_config.get("thumbnail_filename")
-                if thumbnail_filename:
-                    packaged_thumbnail = os.path.join(temp_dir, thumbnail_filename)
-                if packaged_thumbnail and os.path.exists(packaged_thumbnail):
-                    thumbnail_file = google_drive_service.upsert_file(
-                        packaged_thumbnail,
-                        token_path=self.google_token_path or None,
-                        folder_id=result_folder.get("id"),
-                        filename=thumbnail_filename,
-                        mimetype="image/png" if thumbnail_filename.lower().endswith(".png") else "image/jpeg",
-                        description=f"AIR thumbnail for queue job {job_id}",
-                        make_public=False,
-                    )
-
-                queue_metadata = job.get("metadata") or {}
-                upload_metadata = dict(packaged_config.get("project_upload_metadata") or {})
-                upload_metadata.update({
-                    "employee_email": job.get("email") or upload_metadata.get("employee_email") or "",
-                    "video_file": drive_file.get("name"),
-                    "thumbnail_file": thumbnail_filename,
-                    "drive_folder_id": result_folder.get("id"),
-                    "drive_video_file_id": drive_file.get("id"),
-                    "drive_thumbnail_file_id": (thumbnail_file or {}).get("id") if thumbnail_file else None,
-                    "render_mode": "drive_api",
-                })
-                for key in ("track_count", "track_durations", "total_duration_seconds", "app_mode", "render_style", "queue_type"):
-                    if queue_metadata.get(key) is not None:
-                        upload_metadata[key] = queue_metadata.get(key)
-                metadata_path = os.path.join(temp_dir, "metadata.json")
-                with open(metadata_path, "w", encoding="utf-8") as f_meta:
-                    json.dump(upload_metadata, f_meta, ensure_ascii=False, indent=2)
-                project_metadata_file = google_drive_service.upsert_file(
-                    metadata_path,
-                    token_path=self.google_token_path or None,
-                    folder_id=result_folder.get("id"),
-                    filename="metadata.json",
-                    mimetype="application/json",
-                    description=f"AIR metadata for queue job {job_id}",
-                    make_public=False,
-                )
 
+        self.update_job(
+            job_id,
+            status="completed",
+            progress=100,
+            message="렌더링 완료 (Google Drive 업로드 완료)",
+            result_file_id=drive_file.get("id"),
+            result_file_name=drive_file.get("name"),
+            metadata={
+                **(job.get("metadata") or {}),
+                "result_folder_id": result_folder.get("id"),
+                "result_folder_name": result_folder.get("name"),
+                "result_video_file_id": drive_file.get("id"),
+                "result_thumbnail_file_id": (thumbnail_file or {}).get("id") if thumbnail_file else None,
+                "result_metadata_file_id": (project_metadata_file or {}).get("id") if project_metadata_file else None,
+            },
+            completed_at=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        )
+
+    def process_job(self, job):
+        """한 작업을 세 단계 순서대로 처리한다 (--once, 대시보드 등)."""
+        temp_dir = self.fetch_stage(job)
+        output_path = self.render_stage(job, temp_dir)
+        self.publish_stage(job, temp_dir, output_path)
+
+    def release_job(self, job, temp_dir=None):
+        """받아 두었지만 렌더하지 않은 작업을 대기열로 돌려준다 (워커 종료 시)."""
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        try:
             self.update_job(
-                job_id,
-                status="completed",
-                progress=100,
-                message="렌더링 완료 (Google Drive 업로드 완료)",
-                result_file_id=drive_file.get("id"),
-                result_file_name=drive_file.get("name"),
-                metadata={
-                    **(job.get("metadata") or {}),
-                    "result_folder_id": result_folder.get("id"),
-                    "result_folder_name": result_folder.get("name"),
-                    "result_video_file_id": drive_file.get("id"),
-                    "result_thumbnail_file_id": (thumbnail_file or {}).get("id") if thumbnail_file else None,
-                    "result_metadata_file_id": (project_metadata_file or {}).get("id") if project_metadata_file else None,
-                },
-                completed_at=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                job["id"],
+                status="pending",
+                progress=0,
+                worker_id=None,
+                claimed_at=None,
+                message=f"{self.worker_id} 종료로 대기열에 반환됨",
             )
         except Exception as e:
-            error_detail = "\n".join(
-                [
-                    f"Exception: {type(e).__name__}: {e}",
-                    "Traceback:",
-                    traceback.format_exc(),
-                ]
-            ).strip()
-            self.update_job(
-                job_id,
-                status="failed",
-                progress=-1,
-                message=f"렌더링 실패: {e}",
-                error_message=error_detail,
-            )
-            raise
-        finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            print(f"[RemoteDriveWorker] Failed to release job {job.get('id')}: {e}")
+
+    def run_pipeline(self, should_stop=None, on_change=None):
+        """fetch -> render -> publish 파이프라인으로 작업을 처리한다.
+
+        단계 사이는 크기 pipeline_depth의 큐로 묶여 있어, 작업 N 업로드와 N+2 다운로드가
+        N+1 렌더링과 겹친다. 렌더는 render_slots개 스레드가 동시에 돌린다.
+        should_stop()이 참이 되면 새 작업을 더 가져오지 않고, 렌더 전인 작업은 대기열로 돌려준 뒤
+        렌더 중·업로드 중인 작업을 마치고 돌아온다. on_change(event, job, stages)는 단계가 바뀔 때마다
+        불린다 (stages: {job_id: 단계 이름})."""
+        return RenderPipeline(self, should_stop=should_stop, on_change=on_change).run()
 
     def run_forever(self):
-        print(f"[RemoteDriveWorker] Started as {self.worker_id}")
-        while True:
-            try:
-                job = self.fetch_next_job()
-                if not job:
-                    time.sleep(self.poll_interval)
-                    continue
-                claimed = self.claim_job(job)
-                if not claimed:
-                    continue
-                print(f"[RemoteDriveWorker] Processing job {claimed['id']}")
-                self.process_job(claimed)
-            except KeyboardInterrupt:
-                raise
-            except Exception as e:
-                print(f"[RemoteDriveWorker] Error: {e}")
-                time.sleep(self.poll_interval)
+        print(f"[RemoteDriveWorker] Started as {self.worker_id} "
+              f"(render slots {self.render_slots}, pipeline depth {self.pipeline_depth})")
+        self.run_pipeline()
 
     def run_once(self):
         print(f"[RemoteDriveWorker] Running one polling cycle as {self.worker_id}")
@@ -362,6 +456,147 @@ class RemoteDriveWorker:
         return 0
 
 
+class RenderPipeline:
+    """RemoteDriveWorker.run_pipeline의 구현: fetch(호출 스레드) -> render(슬롯 스레드) -> publish(스레드 1개)."""
+
+    def __init__(self, worker, should_stop=None, on_change=None):
+        self.worker = worker
+        self.should_stop = should_stop or (lambda: False)
+        self.on_change = on_change
+        self.ready = queue.Queue(maxsize=worker.pipeline_depth)      # (job, temp_dir) 렌더 대기
+        self.rendered = queue.Queue(maxsize=worker.pipeline_depth)   # (job, temp_dir, output_path) 업로드 대기
+        self.stages = {}
+        self._lock = threading.Lock()
+        self._fetch_done = threading.Event()
+        self._render_done = threading.Event()
+
+    def _set_stage(self, job, stage):
+        with self._lock:
+            if stage in ("completed", "failed", "released"):
+                self.stages.pop(job["id"], None)
+            else:
+                self.stages[job["id"]] = stage
+            snapshot = dict(self.stages)
+        if self.on_change:
+            try:
+                self.on_change(stage, job, snapshot)
+            except Exception as e:
+                print(f"[RemoteDriveWorker] Pipeline callback error: {e}")
+
+    def run(self):
+        workers = [
+            threading.Thread(target=self._render_loop, name=f"remote-render-slot-{n}", daemon=True)
+            for n in range(self.worker.render_slots)
+        ]
+        publisher = threading.Thread(target=self._publish_loop, name="remote-render-publish", daemon=True)
+        for thread in workers + [publisher]:
+            thread.start()
+        try:
+            self._fetch_loop()
+        finally:
+            self._release_waiting()
+            self._fetch_done.set()
+        for thread in workers:
+            thread.join()
+        self._render_done.set()
+        publisher.join()
+
+    def _note(self, job, **fields):
+        try:
+            self.worker.update_job(job["id"], **fields)
+        except Exception as e:
+            print(f"[RemoteDriveWorker] Failed to update job {job['id']}: {e}")
+
+    @staticmethod
+    def _next(items, upstream_done):
+        """다음 항목. 앞 단계가 끝났고 큐가 비었으면 None."""
+        while True:
+            try:
+                return items.get(timeout=1)
+            except queue.Empty:
+                if upstream_done.is_set():
+                    return None
+
+    def _fetch_loop(self):
+        worker = self.worker
+        while not self.should_stop():
+            if self.ready.full():
+                time.sleep(1)
+                continue
+            try:
+                job = worker.fetch_next_job(pipelined=True)
+                claimed = worker.claim_job(job) if job else None
+            except Exception as e:
+                print(f"[RemoteDriveWorker] Error: {e}")
+                claimed = None
+                job = None
+            if not claimed:
+                if not job:
+                    time.sleep(worker.poll_interval)
+                continue
+            print(f"[RemoteDriveWorker] Fetching job {claimed['id']}")
+            self._set_stage(claimed, "fetching")
+            try:
+                temp_dir = worker.fetch_stage(claimed)
+            except KeyboardInterrupt:
+                worker.release_job(claimed)
+                raise
+            except Exception as e:
+                print(f"[RemoteDriveWorker] Job {claimed['id']} failed while fetching: {e}")
+                self._set_stage(claimed, "failed")
+                continue
+            if self.ready.full():
+                self._note(claimed, progress=15, message="렌더 슬롯 대기 중...")
+            self._set_stage(claimed, "queued")
+            self.ready.put((claimed, temp_dir))
+
+    def _release_waiting(self):
+        """렌더를 시작하지 않은 작업은 다른 워커가 가져가도록 돌려준다."""
+        while True:
+            try:
+                item = self.ready.get_nowait()
+            except queue.Empty:
+                return
+            job, temp_dir = item
+            self.worker.release_job(job, temp_dir)
+            self._set_stage(job, "released")
+
+    def _render_loop(self):
+        while True:
+            item = self._next(self.ready, self._fetch_done)
+            if item is None:
+                return
+            job, temp_dir = item
+            print(f"[RemoteDriveWorker] Rendering job {job['id']}")
+            self._set_stage(job, "rendering")
+            try:
+                output_path = self.worker.render_stage(job, temp_dir)
+            except Exception as e:
+                print(f"[RemoteDriveWorker] Job {job['id']} failed while rendering: {e}")
+                self._set_stage(job, "failed")
+                continue
+            if self.rendered.full():
+                self._note(job, progress=90, message="렌더링 완료, 업로드 대기 중...")
+            self._set_stage(job, "rendered")
+            self.rendered.put((job, temp_dir, output_path))
+
+    def _publish_loop(self):
+        while True:
+            item = self._next(self.rendered, self._render_done)
+            if item is None:
+                return
+            job, temp_dir, output_path = item
+            print(f"[RemoteDriveWorker] Publishing job {job['id']}")
+            self._set_stage(job, "publishing")
+            try:
+                self.worker.publish_stage(job, temp_dir, output_path)
+            except Exception as e:
+                print(f"[RemoteDriveWorker] Job {job['id']} failed while publishing: {e}")
+                self._set_stage(job, "failed")
+                continue
+            self._set_stage(job, "completed")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="AIR Google Drive API remote render worker")
     parser.add_argument("--once", action="store_true", help="process at most one pending job and exit")
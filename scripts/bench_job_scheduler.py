@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Job scheduler simulation: FifoPolicy vs FairSharePolicy (worker/job_store.py)
+
+Replays a mixed workload through the real job_store.submit_job() /
+claim_next_job() / transition() code on a temporary jobs.db, driven by a
+simulated clock, and reports queue wait (claim time - submit time) per
+source:
+
+- autopilot:  a 120-job batch at t=0, then 20 more every 30 minutes
+- dashboard:  manual submissions, Poisson, one every ~7 minutes
+- local_api:  priority-1 submissions, one every ~15 minutes
+
+Usage:
+    python scripts/bench_job_scheduler.py [--workers 2] [--hours 6] [--seed 7]
+"""
+import argparse
+import heapq
+import os
+import random
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+WORKER_DIR = ROOT / "worker"
+if str(WORKER_DIR) not in sys.path:
+    sys.path.insert(0, str(WORKER_DIR))
+
+import job_store  # noqa: E402
+import job_wakeup  # noqa: E402
+
+JOB_TYPE = "hermes_topic"
+SERVICE_SECONDS = {"autopilot": 240.0, "dashboard": 180.0, "local_api": 120.0}
+
+
+class SimClock:
+    """Stands in for the `time` module inside job_store."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self):
+        return self.now
+
+
+def build_arrivals(hours, rng):
+    horizon = hours * 3600.0
+    arrivals = [(0.0, "autopilot", 0)] * 120
+    t = 1800.0
+    while t < horizon:
+        arrivals += [(t, "autopilot", 0)] * 20
+        t += 1800.0
+    for source, mean_gap, priority in (("dashboard", 420.0, 0), ("local_api", 900.0, 1)):
+        t = rng.expovariate(1.0 / mean_gap)
+        while t < horizon:
+            arrivals.append((t, source, priority))
+            t += rng.expovariate(1.0 / mean_gap)
+    return sorted(arrivals, key=lambda a: a[0])
+
+
+def simulate(policy, arrivals, workers, clock):
+    start = clock.now
+    events = [(start + at, 0, i, "arrive", (source, priority)) for i, (at, source, priority) in enumerate(arrivals)]
+    heapq.heapify(events)
+    seq = len(events)
+    idle = workers
+    waits = {}
+    while events:
+        at, _, _, kind, data = heapq.heappop(events)
+        clock.now = at
+        if kind == "arrive":
+            source, priority = data
+            job_store.submit_job(JOB_TYPE, {}, priority=priority, source=source, max_retries=0)
+        else:
+            job_store.transition(data, job_store.FAILED, reason="simulated completion")
+            idle += 1
+        while idle:
+            job = job_store.claim_next_job([JOB_TYPE], os.getpid(), policy=policy)
+            if not job:
+                break
+            idle -= 1
+            waits.setdefault(job["source"], []).append(job["started_at"] - job["created_at"])
+            seq += 1
+            heapq.heappush(events, (clock.now + SERVICE_SECONDS[job["source"]], 1, seq, "done", job["job_id"]))
+    return waits
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--hours", type=float, default=6.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    arrivals = build_arrivals(args.hours, random.Random(args.seed))
+    clock = SimClock()
+    job_store.time = clock
+    policies = [
+        job_store.FifoPolicy(candidates_per_flow=1),
+        job_store.FairSharePolicy(),
+    ]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        job_wakeup.WAKEUP_DIR = Path(tmp) / "wakeup"
+        for policy in policies:
+            job_store.JOB_DB_PATH = Path(tmp) / f"{policy.name}.db"
+            job_store._local.conn = None
+            job_store.init_db()
+            waits = simulate(policy, arrivals, args.workers, clock)
+            job_store._local.conn.close()
+            job_store._local.conn = None
+            for source in sorted(waits):
+                minutes = [w / 60.0 for w in waits[source]]
+                rows.append((policy.name, source, len(minutes), statistics.median(minutes),
+                             _percentile(minutes, 0.9), _percentile(minutes, 0.99), max(minutes)))
+
+    print(f"workers={args.workers} hours={args.hours} jobs={len(arrivals)} (wait in minutes)")
+    print(f"{'policy':<6} {'source':<10} {'jobs':>5} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for policy, source, count, p50, p90, p99, worst in rows:
+        print(f"{policy:<6} {source:<10} {count:>5} {p50:>8.1f} {p90:>8.1f} {p99:>8.1f} {worst:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
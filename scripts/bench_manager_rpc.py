@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Local API -> Worker Manager command round-trip: file IPC vs socket RPC
+
+Runs the real WorkerManager.run_supervisor_loop() (with the child-process
+supervision stubbed out) on temporary state/command directories and times
+ipc.wait_for_result(ipc.submit_command(...)) (file channel) against
+manager_rpc.call(...) (socket channel) for a no-op command.
+
+Usage:
+    python scripts/bench_manager_rpc.py [--calls 20]
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+WORKER_DIR = ROOT / "worker"
+if str(WORKER_DIR) not in sys.path:
+    sys.path.insert(0, str(WORKER_DIR))
+
+import ipc  # noqa: E402
+import local_api_token  # noqa: E402
+import manager  # noqa: E402
+import manager_rpc  # noqa: E402
+
+BENCH_COMMAND = "bench_noop"  # unknown to the Manager - answered immediately with an error result
+
+
+class BenchManager(manager.WorkerManager):
+    def supervise_once(self):
+        self.poll_commands()
+
+    def _publish_status(self):
+        pass
+
+
+def _point_at(tmp: Path):
+    for name in ("COMMAND_DIR", "RESULT_DIR"):
+        path = tmp / name.lower()
+        path.mkdir()
+        setattr(ipc, name, path)
+    manager.COMMAND_DIR = ipc.COMMAND_DIR
+    manager_rpc.RPC_PORT_FILE = tmp / "manager_rpc.port"
+    local_api_token._DPAPI_AVAILABLE = False
+    local_api_token.TOKEN_FILE_PLAIN = tmp / "local_api_token.txt"
+    local_api_token.TOKEN_FILE_DPAPI = tmp / "local_api_token.dpapi"
+    local_api_token._restrict_to_current_user = lambda path: None
+
+
+def _time_calls(func, calls):
+    timings = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000.0)
+        assert "error" in result, result
+        # Random offset so file IPC is not measured in phase with the tick.
+        time.sleep(random.uniform(0.0, manager.MANAGER_TICK_SECONDS))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _point_at(Path(tmp))
+        mgr = BenchManager()
+        mgr.start_rpc_server()
+        loop = threading.Thread(target=mgr.run_supervisor_loop, daemon=True)
+        loop.start()
+        try:
+            results = {
+                "file": _time_calls(lambda: ipc.wait_for_result(ipc.submit_command(BENCH_COMMAND)), args.calls),
+                "rpc": _time_calls(lambda: manager_rpc.call(BENCH_COMMAND), args.calls),
+            }
+        finally:
+            mgr._stopping = True
+            mgr._wake.set()
+            loop.join(5)
+            mgr.rpc_server.close()
+
+    print(f"calls={args.calls} manager tick={manager.MANAGER_TICK_SECONDS}s (round trip in ms)")
+    print(f"{'channel':<8} {'p50':>8} {'p90':>8} {'max':>8}")
+    for channel, timings in results.items():
+        ordered = sorted(timings)
+        p90 = ordered[min(len(ordered) - 1, int(round(0.9 * (len(ordered) - 1))))]
+        print(f"{channel:<8} {statistics.median(timings):>8.2f} {p90:>8.2f} {max(timings):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
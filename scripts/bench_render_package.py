@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+렌더 패키지 벤치마크: 임시 폴더 복사 + ZIP_DEFLATED vs 스트리밍 RenderPackage
+
+53씬 1080p 프로젝트와 같은 구성의 가짜 자산(씬 이미지 PNG 53장 중 10장은 MP4 클립,
+TTS MP3, 인트로 MP4, 썸네일, config.json)을 만들어 두 방식의 빌드 시간과
+디스크 쓰기량(임시 복사 + zip)을 비교한다. 미디어는 실제처럼 거의 압축되지 않는 바이트다.
+
+Usage:
+    python scripts/bench_render_package.py [--rounds 3] [--scenes 53]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+from services.render_package import RenderPackage  # noqa: E402
+
+IMAGE_BYTES = 1_800_000     # 1080p PNG 한 장
+CLIP_BYTES = 6_000_000      # 5초 1080p 씬 클립
+AUDIO_BYTES = 9_000_000     # 약 10분 TTS MP3
+INTRO_BYTES = 12_000_000
+
+
+def make_assets(root: Path, scenes: int) -> list:
+    """(원본 경로, 패키지 내 경로) 목록"""
+    entries = []
+
+    def write(name, size):
+        path = root / name
+        path.write_bytes(os.urandom(size))
+        return path
+
+    for n in range(1, scenes + 1):
+        if n % 5 == 0:
+            entries.append((write(f"scene_{n:03d}.mp4", CLIP_BYTES), f"images/scene_{n:03d}.mp4"))
+        else:
+            entries.append((write(f"scene_{n:03d}.png", IMAGE_BYTES), f"images/scene_{n:03d}.png"))
+    entries.append((write("tts.mp3", AUDIO_BYTES), "audio/tts.mp3"))
+    entries.append((write("intro.mp4", INTRO_BYTES), "intro.mp4"))
+    entries.append((write("thumb.png", IMAGE_BYTES), "thumbnail.png"))
+    return entries
+
+
+def make_config(scenes: int) -> dict:
+    return {
+        "images": [f"scene_{n:03d}.png" for n in range(1, scenes + 1)],
+        "subtitles": [{"start": i * 4.0, "end": i * 4.0 + 3.5, "text": f"자막 {i} " * 6} for i in range(400)],
+        "render_settings": {"subtitle_bg_enabled": 1, "font_size": 48},
+    }
+
+
+def legacy_package(entries, config_data, zip_path):
+    """스트리밍 빌더 도입 전: 임시 폴더에 copy2 후 os.walk로 ZIP_DEFLATED"""
+    temp_dir = tempfile.mkdtemp(prefix="bench_render_pkg_")
+    written = 0
+    try:
+        for src, arcname in entries:
+            dest = os.path.join(temp_dir, arcname)
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.copy2(src, dest)
+            written += os.path.getsize(dest)
+        with open(os.path.join(temp_dir, "config.json"), "w", encoding="utf-8") as f_conf:
+            json.dump(config_data, f_conf, ensure_ascii=False, indent=4)
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for root, _dirs, files in os.walk(temp_dir):
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    zipf.write(file_path, os.path.relpath(file_path, temp_dir))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return written + os.path.getsize(zip_path)
+
+
+def streaming_package(entries, config_data, zip_path):
+    package = RenderPackage(zip_path)
+    for src, arcname in entries:
+        package.add_file(src, arcname)
+    package.add_json("config.json", config_data)
+    package.build()
+    return os.path.getsize(zip_path)
+
+
+def measure(func, entries, config_data, zip_path, rounds):
+    timings = []
+    written = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        written = func(entries, config_data, zip_path)
+        timings.append(time.perf_counter() - started)
+        os.remove(zip_path)
+    return statistics.median(timings), written
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--scenes", type=int, default=53)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        entries = make_assets(tmp, args.scenes)
+        config_data = make_config(args.scenes)
+        source_bytes = sum(src.stat().st_size for src, _ in entries)
+        zip_path = str(tmp / "pkg.zip")
+        legacy = measure(legacy_package, entries, config_data, zip_path, args.rounds)
+        streaming = measure(streaming_package, entries, config_data, zip_path, args.rounds)
+
+    mb = 1024 * 1024
+    print(f"{args.scenes} scenes, {source_bytes / mb:.0f} MB of media, median of {args.rounds} rounds")
+    print(f"{'builder':<10} {'seconds':>8} {'MB written':>11}")
+    print(f"{'legacy':<10} {legacy[0]:>8.2f} {legacy[1] / mb:>11.0f}")
+    print(f"{'streaming':<10} {streaming[0]:>8.2f} {streaming[1] / mb:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+save_image_prompts 벤치마크: 기존 DELETE + 전체 재INSERT vs diff upsert
+
+임시 DB에 53/200씬 프로젝트를 만들고 다음 시나리오를 비교한다.
+- initial: 빈 프로젝트에 전체 저장
+- resave:  변경 없이 다시 저장 (프롬프트 편집 화면의 자동 저장)
+- edit1:   씬 1개 프롬프트만 수정 후 저장
+- trim:    마지막 씬 1개 삭제 후 저장
+
+Usage:
+    python scripts/bench_save_image_prompts.py [--rounds 20]
+"""
+import argparse
+import json
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO))
+
+import database as db  # noqa: E402
+
+
+def legacy_save_image_prompts(project_id, prompts):
+    """diff upsert 도입 전 구현 (DELETE 후 씬마다 INSERT)"""
+    conn = db.get_db()
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM image_prompts WHERE project_id = ?", (project_id,))
+    columns = ", ".join(db._IMAGE_PROMPT_SAVE_COLUMNS)
+    placeholders = ", ".join("?" for _ in range(len(db._IMAGE_PROMPT_SAVE_COLUMNS) + 2))
+    for i, prompt in enumerate(prompts):
+        cursor.execute(
+            f"INSERT INTO image_prompts (project_id, scene_number, {columns}) VALUES ({placeholders})",
+            (project_id, i + 1) + db._image_prompt_save_values(prompt),
+        )
+    conn.commit()
+    conn.close()
+    db.mark_project_dirty(project_id)
+
+
+def make_prompts(count):
+    return [
+        {
+            "scene_text": f"장면 {n} 내레이션 " * 8,
+            "prompt_ko": f"장면 {n} 프롬프트",
+            "prompt_en": f"cinematic shot {n}, dramatic lighting, 35mm film " * 4,
+            "image_url": f"/output/1/images/scene_{n:03d}.png",
+            "motion_desc": "slow zoom in",
+            "engine": "wan",
+            "start_frame": {"x": 0.5, "y": 0.5},
+        }
+        for n in range(1, count + 1)
+    ]
+
+
+def install_write_counter():
+    """image_prompts에 발생한 row 쓰기(INSERT/UPDATE/DELETE) 수를 세는 트리거"""
+    conn = sqlite3.connect(str(db.get_db_path()))
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS bench_row_writes (n INTEGER NOT NULL);
+        INSERT INTO bench_row_writes (n) VALUES (0);
+        CREATE TRIGGER IF NOT EXISTS bench_ip_ins AFTER INSERT ON image_prompts
+            BEGIN UPDATE bench_row_writes SET n = n + 1; END;
+        CREATE TRIGGER IF NOT EXISTS bench_ip_upd AFTER UPDATE ON image_prompts
+            BEGIN UPDATE bench_row_writes SET n = n + 1; END;
+        CREATE TRIGGER IF NOT EXISTS bench_ip_del AFTER DELETE ON image_prompts
+            BEGIN UPDATE bench_row_writes SET n = n + 1; END;
+        """
+    )
+    conn.commit()
+    conn.close()
+
+
+def _row_writes():
+    conn = sqlite3.connect(str(db.get_db_path()))
+    try:
+        return conn.execute("SELECT n FROM bench_row_writes").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def measure(func, project_id, prompts):
+    before = _row_writes()
+    started = time.perf_counter()
+    func(project_id, prompts)
+    elapsed = (time.perf_counter() - started) * 1000.0
+    return elapsed, _row_writes() - before
+
+
+def run_scenarios(func, project_id, scene_count, rounds):
+    base = make_prompts(scene_count)
+    edited = json.loads(json.dumps(base))
+    edited[scene_count // 2]["prompt_en"] = "edited prompt"
+    trimmed = base[:-1]
+
+    results = {}
+    for name, payload, reset in [
+        ("initial", base, True),
+        ("resave", base, False),
+        ("edit1", edited, False),
+        ("trim", trimmed, False),
+    ]:
+        timings = []
+        writes = 0
+        for _ in range(rounds):
+            if reset:
+                legacy_save_image_prompts(project_id, [])
+            else:
+                db.save_image_prompts(project_id, base)
+            elapsed, row_writes = measure(func, project_id, payload)
+            timings.append(elapsed)
+            writes += row_writes
+        results[name] = (statistics.median(timings), writes / rounds)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        db.get_db_path = lambda: db_path
+        db._migration_checked = True
+        # 번역 컬럼 ALTER는 image_prompts 생성 전에 실행되므로 앱 재시작처럼 두 번 초기화
+        db.init_db()
+        db.init_db()
+        db.migrate_db()
+        project_id = db.create_project("bench", "bench")
+        install_write_counter()
+
+        # 실제 호출 경로와 같게 출력은 억제
+        real_print = print
+        import builtins
+        builtins.print = lambda *a, **k: None
+        try:
+            rows = []
+            for scene_count in (53, 200):
+                legacy = run_scenarios(legacy_save_image_prompts, project_id, scene_count, args.rounds)
+                diff = run_scenarios(db.save_image_prompts, project_id, scene_count, args.rounds)
+                for scenario in legacy:
+                    rows.append((scene_count, scenario, legacy[scenario], diff[scenario]))
+        finally:
+            builtins.print = real_print
+        db.close_db_writer_connection(10)
+        db.close_db_connections()
+
+    print(f"{'scenes':>6} {'scenario':<8} {'legacy ms':>10} {'diff ms':>9} {'legacy rows':>12} {'diff rows':>10}")
+    for scene_count, scenario, (legacy_ms, legacy_rows), (diff_ms, diff_rows) in rows:
+        print(f"{scene_count:>6} {scenario:<8} {legacy_ms:>10.2f} {diff_ms:>9.2f} {legacy_rows:>12.0f} {diff_rows:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+async 라우트의 동기 DB 호출 검사
+
+`async def` 본문에서 database.py 함수를 직접 호출하면 이벤트 루프가 SQLite I/O와
+락 재시도 동안 멈춘다. 이런 호출은 services.async_db.async_db를 통해 await 해야 한다.
+DB를 읽고 쓰는 동기화/준비 상태 헬퍼(BLOCKING_MODULES)도 마찬가지로
+`await async_db.run(func, ...)`로 DB executor에서 실행해야 한다.
+
+- `import database as db`, `from services import sync_service` 같은 모듈 별칭과
+  `from services.longform_asset_readiness import sync_project_asset_readiness` 같은
+  직접 import한 함수 이름을 모듈별로 찾는다
+- await 하는 호출(모듈 안의 async 함수)과 NON_BLOCKING_HELPERS는 제외한다
+- async 함수 안에 정의된 동기 def/lambda(백그라운드 작업 등)는 검사하지 않는다
+
+Usage:
+    python scripts/check_async_db_calls.py                # app/routers 전체
+    python scripts/check_async_db_calls.py app/routers/video.py
+"""
+import ast
+import sys
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Set, Tuple
+
+REPO = Path(__file__).parent.parent
+ROUTERS_DIR = REPO / "app" / "routers"
+
+# 비동기 파사드로 이전을 마친 라우터. tests/test_async_db.py가 위반 0건을 강제한다.
+MIGRATED_ROUTERS = (
+    "app/routers/video.py",
+    "app/routers/image.py",
+    "app/routers/projects.py",
+)
+
+
+# 함수 호출이 동기 DB I/O를 하는 모듈
+BLOCKING_MODULES = (
+    "database",
+    "services.sync_service",
+    "services.project_sync_service",
+    "services.longform_asset_readiness",
+)
+# 위 모듈에 있지만 스레드만 띄우고 바로 돌아오는 함수
+NON_BLOCKING_HELPERS = {"start_upload_and_sync_background"}
+
+
+class SyncDbCall(NamedTuple):
+    path: str
+    lineno: int
+    function: str
+    call: str
+
+
+def _blocking_imports(tree: ast.AST) -> Tuple[Set[str], Set[str]]:
+    """(BLOCKING_MODULES 모듈 별칭, 그 모듈에서 직접 import한 함수 이름)"""
+    aliases, functions = set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for name in node.names:
+                if name.name in BLOCKING_MODULES:
+                    aliases.add(name.asname or name.name)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            for name in node.names:
+                if f"{node.module}.{name.name}" in BLOCKING_MODULES:
+                    aliases.add(name.asname or name.name)
+                elif node.module in BLOCKING_MODULES and name.name not in NON_BLOCKING_HELPERS:
+                    functions.add(name.asname or name.name)
+    return aliases, functions
+
+
+def _blocking_call_name(call: ast.Call, aliases: Set[str], functions: Set[str]) -> Optional[str]:
+    func = call.func
+    if isinstance(func, ast.Name) and func.id in functions:
+        return func.id
+    if isinstance(func, ast.Attribute) and func.attr not in NON_BLOCKING_HELPERS:
+        owner = ast.unparse(func.value)
+        if owner in aliases:
+            return f"{owner}.{func.attr}"
+    return None
+
+
+def find_sync_db_calls(path) -> List[SyncDbCall]:
+    """파일에서 async 함수가 await 없이 호출하는 database/동기화 헬퍼 목록을 반환"""
+    path = Path(path)
+    source = path.read_text(encoding="utf-8-sig")
+    tree = ast.parse(source, filename=str(path))
+    aliases, functions = _blocking_imports(tree)
+    if not aliases and not functions:
+        return []
+
+    found: List[SyncDbCall] = []
+
+    def visit(node: ast.AST, async_name: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.AsyncFunctionDef):
+                visit(child, child.name)
+                continue
+            if isinstance(child, (ast.FunctionDef, ast.Lambda, ast.ClassDef)):
+                visit(child, "")
+                continue
+            if isinstance(child, ast.Await) and isinstance(child.value, ast.Call):
+                # await 하는 호출 자체는 async 함수 - 인자만 검사
+                visit(child.value, async_name)
+                continue
+            if async_name and isinstance(child, ast.Call):
+                name = _blocking_call_name(child, aliases, functions)
+                if name:
+                    found.append(SyncDbCall(str(path), child.lineno, async_name, name))
+            visit(child, async_name)
+
+    visit(tree, "")
+    return found
+
+
+def main(argv: List[str]) -> int:
+    paths = [Path(arg) for arg in argv] or sorted(ROUTERS_DIR.glob("*.py"))
+    total = 0
+    for path in paths:
+        calls = find_sync_db_calls(path)
+        total += len(calls)
+        for call in calls:
+            print(f"{call.path}:{call.lineno}: {call.call}() in async def {call.function}")
+    print(f"\n{total} sync DB call(s) from async functions")
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
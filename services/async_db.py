@@ -0,0 +1,115 @@
+"""
+database.py 비동기 파사드
+
+FastAPI의 `async def` 라우트가 동기 SQLite 함수를 이벤트 루프에서 직접 호출하면
+쿼리/락 재시도(time.sleep) 동안 진행률 폴링을 포함한 모든 요청이 멈춘다.
+이 모듈은 database.py 함수를 전용 DB 스레드 풀(최대 DB_EXECUTOR_WORKERS개)에서
+실행하고 결과를 await 할 수 있게 감싼다.
+
+    from services.async_db import async_db
+
+    project = await async_db.get_project(project_id)
+    await async_db.update_project_setting(project_id, "video_path", path)
+
+database.py는 스레드별 연결을 캐시하므로 풀 크기가 곧 동시 연결 수의 상한이다.
+함수는 호출 시점에 database 모듈에서 조회하므로 테스트의 patch.object(db, ...)도
+그대로 적용된다.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Sequence
+
+import database as db
+
+try:
+    from config import config
+except Exception:
+    config = None
+
+DEFAULT_DB_EXECUTOR_WORKERS = 4
+DB_THREAD_NAME_PREFIX = "async-db"
+
+# get_db()는 호출한 스레드의 연결을 돌려주므로 이벤트 루프로 가져오면 안 된다.
+# raw SQL이 필요하면 execute_write()/fetch_all()/run()을 사용한다.
+_CONNECTION_FUNCTIONS = frozenset({"get_db", "close_db_connections"})
+
+
+class AsyncDatabase:
+    """database.py 함수를 bounded DB executor에서 실행하는 비동기 파사드"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        if self._max_workers:
+            return max(1, int(self._max_workers))
+        configured = getattr(config, "DB_EXECUTOR_WORKERS", DEFAULT_DB_EXECUTOR_WORKERS)
+        try:
+            return max(1, int(configured))
+        except (TypeError, ValueError):
+            return DEFAULT_DB_EXECUTOR_WORKERS
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                executor = self._executor
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=DB_THREAD_NAME_PREFIX,
+                    )
+                    self._executor = executor
+        return executor
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """임의의 동기 DB 작업을 DB executor에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def execute_write(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """단일 쓰기 SQL을 db writer에서 실행 후 커밋. 영향받은 row 수를 반환"""
+        return await self.run(db.run_write, lambda conn: conn.execute(sql, tuple(params)).rowcount)
+
+    async def fetch_all(self, sql: str, params: Sequence[Any] = ()) -> list:
+        """읽기 SQL 결과를 dict 리스트로 반환"""
+        def _fetch() -> list:
+            conn = db.get_db()
+            try:
+                return [dict(row) for row in conn.execute(sql, tuple(params)).fetchall()]
+            finally:
+                conn.close()
+
+        return await self.run(_fetch)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_") or name in _CONNECTION_FUNCTIONS:
+            raise AttributeError(name)
+        if not callable(getattr(db, name, None)):
+            raise AttributeError(f"database has no function '{name}'")
+
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            # patch.object(db, name) 등 런타임 교체를 따르도록 호출 시점에 조회
+            return await self.run(getattr(db, name), *args, **kwargs)
+
+        _call.__name__ = name
+        _call.__qualname__ = f"AsyncDatabase.{name}"
+        return _call
+
+
+async_db = AsyncDatabase()
@@ -2515,7 +2515,10 @@ JSON만 출력하세요:
         try:
             # 1. Video Upload
             print(f"🚀 [Upload] Starting YouTube upload (Privacy: {privacy}, Schedule: {publish_time}, Channel: {channel_id or 'Default'})")
-            response = youtube_upload_service.upload_video(
+            # 대기열에서 업로드 - 이벤트 루프를 막지 않고, 다른 채널 업로드와 동시에 진행된다
+            from services.youtube_upload_queue import youtube_upload_queue
+            response = await youtube_upload_queue.upload(
+                project_id=project_id,
                 file_path=video_path, 
                 title=ai_title,
                 description=ai_desc, 
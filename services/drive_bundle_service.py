@@ -5,6 +5,7 @@ from typing import Any, Dict, Optional
 
 import database as db
 from config import config
+from services.drive_transfer import drive_transfer_manager
 from services.google_drive_service import google_drive_service
 from services.sync_service import _resolve_local_asset_path
 
@@ -161,22 +162,22 @@ class DriveBundleService:
         temp_dir = tempfile.mkdtemp(prefix=f"drive_bundle_{project_id}_")
         video_filename = video_file.get("name") or f"project_{project_id}.mp4"
         video_path = os.path.join(temp_dir, video_filename)
-        downloaded_video = google_drive_service.download_file(video_file.get("id"), video_path, token_path=token_path)
-        if not downloaded_video or not os.path.exists(downloaded_video):
-            raise FileNotFoundError("Failed to download Drive video file.")
-
         thumbnail_path = None
         thumbnail_file = bundle.get("thumbnail_file") or {}
         if thumbnail_file.get("id"):
-            thumb_name = thumbnail_file.get("name") or "thumbnail.png"
-            thumbnail_path = os.path.join(temp_dir, thumb_name)
-            downloaded_thumb = google_drive_service.download_file(
-                thumbnail_file.get("id"),
-                thumbnail_path,
-                token_path=token_path,
-            )
-            if not downloaded_thumb or not os.path.exists(downloaded_thumb):
-                thumbnail_path = None
+            thumbnail_path = os.path.join(temp_dir, thumbnail_file.get("name") or "thumbnail.png")
+
+        downloaded_video, downloaded_thumb = drive_transfer_manager.download_files(
+            [
+                (video_file.get("id"), video_path),
+                (thumbnail_file.get("id"), thumbnail_path) if thumbnail_path else None,
+            ],
+            token_path=token_path,
+        )
+        if not downloaded_video or not os.path.exists(downloaded_video):
+            raise FileNotFoundError("Failed to download Drive video file.")
+        if not downloaded_thumb or not os.path.exists(downloaded_thumb):
+            thumbnail_path = None
 
         if not thumbnail_path:
             local_thumb = _resolve_local_asset_path(
@@ -0,0 +1,245 @@
+"""
+Google Drive 전송 관리자
+
+GoogleDriveService는 파일을 하나씩, 기본 청크로 올리고 받았고 ensure_folder / find_file은
+호출될 때마다 files().list를 한 번씩 돌렸다. 결과 동기화(sync_service)나 원격 워커의 결과
+업로드는 실제 전송보다 폴더·파일 ID 조회 왕복에 더 많은 시간을 썼다.
+
+- DriveIdCache: (부모 폴더, 이름, mimeType) -> Drive 메타데이터 TTL 캐시. 찾은 것/만든 것만 담는다.
+- ResumableSessionStore: 재개 가능한 업로드 세션 URI와 진행 중 다운로드를 JSON 파일에 기록해
+  프로세스가 중간에 죽어도 다음 실행에서 이어서 전송한다.
+- DriveTransferManager: 여러 업로드/다운로드를 스레드 풀에서 동시에 돌린다.
+  GoogleDriveService는 호출마다 자체 Drive 클라이언트(httplib2)를 만들므로 스레드 간 공유가 없다.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+DEFAULT_ID_CACHE_TTL_SECONDS = 600
+# Drive가 재개 세션 URI를 보존하는 기간(1주)보다 조금 짧게
+SESSION_MAX_AGE_SECONDS = 6 * 24 * 3600
+DEFAULT_TRANSFER_WORKERS = 4
+
+
+class DriveIdCache:
+    """(parent_id, name, mime_type) -> 메타데이터. 스레드 안전, 만료된 항목은 조회 시 버린다."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_ID_CACHE_TTL_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._items: dict = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(parent_id, name, mime_type=None) -> tuple:
+        return (parent_id or '', str(name), mime_type or '')
+
+    def get(self, parent_id, name, mime_type=None) -> Optional[dict]:
+        key = self._key(parent_id, name, mime_type)
+        with self._lock:
+            cached = self._items.get(key)
+            if not cached:
+                return None
+            expires_at, item = cached
+            if expires_at <= self._clock():
+                del self._items[key]
+                return None
+            return dict(item)
+
+    def put(self, parent_id, name, item: Optional[dict], mime_type=None):
+        if not item or not item.get('id') or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._items[self._key(parent_id, name, mime_type)] = (self._clock() + self.ttl_seconds, dict(item))
+
+    def invalidate(self, parent_id=None, name=None):
+        """부모/이름이 일치하는 항목을 지운다 (둘 다 None이면 전부)."""
+        with self._lock:
+            for key in list(self._items):
+                if parent_id is not None and key[0] != parent_id:
+                    continue
+                if name is not None and key[1] != str(name):
+                    continue
+                del self._items[key]
+
+
+@contextmanager
+def _file_lock(path: str):
+    """프로세스 간 배타 잠금 (잠금 전용 파일). 서버/워커/원격 드라이브 프로세스가 같은 세션 파일을 쓴다."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, 'a+b') as handle:
+        handle.seek(0)
+        if sys.platform == 'win32':
+            import msvcrt
+
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class ResumableSessionStore:
+    """전송 키 -> 재개 정보(업로드 세션 URI 등). 값이 바뀔 때마다 파일에 원자적으로 기록한다.
+
+    같은 파일을 여러 프로세스가 함께 쓰므로, 기록할 때는 파일 잠금 안에서 디스크의 최신 내용을
+    다시 읽고 자기 변경만 얹어 저장한다 (다른 프로세스의 세션을 덮어쓰지 않는다)."""
+
+    def __init__(self, path: str, max_age_seconds: float = SESSION_MAX_AGE_SECONDS):
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._sessions = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f_in:
+                data = json.load(f_in)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        cutoff = time.time() - self.max_age_seconds
+        return {key: entry for key, entry in data.items()
+                if isinstance(entry, dict) and entry.get('saved_at', 0) >= cutoff}
+
+    def _save(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        part_path = f'{self.path}.{os.getpid()}.{threading.get_ident()}.part'
+        try:
+            with open(part_path, 'w', encoding='utf-8') as f_out:
+                json.dump(self._sessions, f_out, ensure_ascii=False, indent=2)
+            os.replace(part_path, self.path)
+        except OSError as e:
+            print(f"[DriveTransfer] 재개 세션 기록 실패: {e}")
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+
+    def _update(self, change: Callable[[dict], bool]):
+        """파일 잠금 -> 디스크 내용 다시 읽기 -> change(sessions)가 True면 저장."""
+        with self._lock:
+            try:
+                with _file_lock(f'{self.path}.lock'):
+                    self._sessions = self._load()
+                    if change(self._sessions):
+                        self._save()
+            except OSError as e:
+                print(f"[DriveTransfer] 재개 세션 잠금 실패: {e}")
+
+    def get(self, key: str) -> Optional[str]:
+        return (self.get_entry(key) or {}).get('value')
+
+    def get_entry(self, key: str) -> Optional[dict]:
+        """value와 함께 put에 넘긴 부가 정보(예: offset)까지 돌려준다. 다른 프로세스의 기록도 보이도록 파일에서 읽는다."""
+        with self._lock:
+            self._sessions = self._load()
+            entry = self._sessions.get(key)
+            if not entry or entry.get('saved_at', 0) < time.time() - self.max_age_seconds:
+                return None
+            return dict(entry)
+
+    def put(self, key: str, value: str, **extra):
+        def change(sessions):
+            current = sessions.get(key) or {}
+            if current.get('value') == value and all(current.get(k) == v for k, v in extra.items()):
+                return False
+            sessions[key] = {**extra, 'value': value, 'saved_at': time.time()}
+            return True
+
+        self._update(change)
+
+    def drop(self, key: str):
+        self._update(lambda sessions: sessions.pop(key, None) is not None)
+
+
+def default_session_store(env_name: str = 'DRIVE_TRANSFER_SESSION_FILE',
+                          filename: str = 'drive_transfer_sessions.json') -> ResumableSessionStore:
+    from config import config
+
+    path = os.getenv(env_name) or os.path.join(config.LOCAL_APP_DATA_DIR, filename)
+    return ResumableSessionStore(path)
+
+
+def query_upload_status(request):
+    """재개 세션에 서버가 받은 바이트 수를 묻고 request.resumable_progress를 거기에 맞춘다.
+
+    googleapiclient HttpRequest의 공개 속성(http, resumable, resumable_uri, postproc)만 쓴다:
+    `Content-Range: bytes */<size>` 빈 PUT을 보내 308이면 Range 헤더의 마지막 바이트 다음부터,
+    200/201이면 업로드가 이미 끝난 것이므로 응답 본문을 돌려준다 (아니면 None).
+    만료된 세션(404/410) 등 나머지 응답은 HttpError로 올린다."""
+    from googleapiclient.errors import HttpError
+
+    size = request.resumable.size()
+    headers = {'Content-Range': f"bytes */{size if size is not None else '*'}", 'Content-Length': '0'}
+    resp, content = request.http.request(request.resumable_uri, method='PUT', headers=headers)
+    if resp.status in (200, 201):
+        return request.postproc(resp, content)
+    if resp.status != 308:
+        raise HttpError(resp, content, uri=request.resumable_uri)
+    received = resp.get('range')
+    request.resumable_progress = int(received.rsplit('-', 1)[1]) + 1 if received else 0
+    return None
+
+
+class DriveTransferManager:
+    """GoogleDriveService의 upsert_file / download_file을 여러 개 동시에 실행한다.
+
+    결과는 입력 순서대로 돌려준다 (실패한 전송은 기존 메서드와 같이 None)."""
+
+    def __init__(self, max_workers: Optional[int] = None, drive=None):
+        if max_workers is None:
+            max_workers = int(os.getenv('DRIVE_TRANSFER_WORKERS', DEFAULT_TRANSFER_WORKERS) or DEFAULT_TRANSFER_WORKERS)
+        self.max_workers = max(1, max_workers)
+        self._drive = drive
+
+    @property
+    def drive(self):
+        if self._drive is None:
+            from services.google_drive_service import google_drive_service
+
+            self._drive = google_drive_service
+        return self._drive
+
+    def _run(self, func: Callable, jobs: list) -> list:
+        if len(jobs) <= 1 or self.max_workers == 1:
+            return [func(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs)),
+                                thread_name_prefix='drive-transfer') as pool:
+            return list(pool.map(func, jobs))
+
+    def upsert_files(self, uploads: list) -> list:
+        """uploads: upsert_file 키워드 인자 dict 목록 (local_file_path 필수). None 항목은 건너뛴다."""
+        return self._run(lambda kwargs: self.drive.upsert_file(**kwargs) if kwargs else None, list(uploads))
+
+    def download_files(self, downloads: list, token_path=None) -> list:
+        """downloads: (file_id, local_file_path) 목록. None 항목은 건너뛴다."""
+        def download(item):
+            if not item:
+                return None
+            file_id, local_file_path = item
+            return self.drive.download_file(file_id, local_file_path, token_path=token_path)
+
+        return self._run(download, list(downloads))
+
+
+drive_transfer_manager = DriveTransferManager()
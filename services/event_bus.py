@@ -0,0 +1,140 @@
+"""
+프로세스 내 이벤트 버스 (렌더 진행률·렌더 큐 상태 푸시)
+
+렌더 화면은 /api/project/{id}/render/status를 1초마다, 트레이 상태 수집기는
+10초마다 폴링했다. 이제 RENDER_PROGRESS와 RenderQueueWorker가 값이 바뀔 때
+event_bus.publish()를 호출하고, /api/events(SSE)와 트레이 수집기가 이를 구독한다.
+
+- (event, key)별 최신 메시지를 보관해 두었다가 새 구독자에게 snapshot으로 먼저 보낸다.
+- 구독자 큐는 key별 최신값만 남긴다(느린 클라이언트는 중간 진행률을 건너뛴다).
+- publish()는 렌더 스레드 등 어느 스레드에서 호출해도 된다.
+"""
+import asyncio
+import json
+import threading
+from typing import AsyncIterator, Callable, Optional
+
+RENDER = "render"              # 로컬 렌더 진행률 (services/progress.py)
+RENDER_QUEUE = "render_queue"  # 원격 렌더 요청 처리 큐 (services/render_queue_worker.py)
+SNAPSHOT = "snapshot"
+HEARTBEAT_SECONDS = 15.0
+MAX_RETAINED = 500
+
+
+class Subscriber:
+    """구독자 한 명의 대기 메시지. (event, key)별 최신값만 남긴다 (worker/event_bus.py도 사용)."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, events: set, match: Optional[Callable[[dict], bool]]):
+        self.loop = loop
+        self.events = events
+        self.match = match
+        self.pending: dict = {}
+        self.ready = asyncio.Event()
+
+    def wants(self, message: dict) -> bool:
+        if self.events and message["event"] not in self.events:
+            return False
+        return self.match is None or bool(self.match(message))
+
+    def offer(self, message: dict):
+        if not self.wants(message):
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            pass  # 이벤트 루프가 이미 닫힘 - 구독자 종료됨
+
+    def _put(self, message: dict):
+        slot = (message["event"], message["key"])
+        self.pending.pop(slot, None)
+        self.pending[slot] = message
+        self.ready.set()
+
+    async def next_batch(self, timeout: float) -> list:
+        try:
+            await asyncio.wait_for(self.ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        self.ready.clear()
+        batch = list(self.pending.values())
+        self.pending.clear()
+        return batch
+
+
+class EventBus:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: set = set()
+        self._listeners: list = []
+        self._retained: dict = {}
+        self._seq = 0
+
+    def publish(self, event: str, data: dict, *, key=None) -> dict:
+        """이벤트 발행 (스레드 안전). 최신값을 보관하고 모든 구독자·리스너에 전달한다."""
+        with self._lock:
+            self._seq += 1
+            message = {"id": self._seq, "event": event, "key": "" if key is None else str(key), "data": data}
+            self._retained[(event, message["key"])] = message
+            if len(self._retained) > MAX_RETAINED:
+                oldest = min(self._retained, key=lambda slot: self._retained[slot]["id"])
+                del self._retained[oldest]
+            subscribers = list(self._subscribers)
+            listeners = list(self._listeners)
+        for subscriber in subscribers:
+            subscriber.offer(message)
+        for listener in listeners:
+            try:
+                listener(message)
+            except Exception as e:
+                print(f"[EventBus] 리스너 에러: {e}")
+        return message
+
+    def add_listener(self, callback: Callable[[dict], None]):
+        """동기 콜백 등록 (트레이 수집기 등). publish()를 호출한 스레드에서 실행되므로 빨리 반환해야 한다."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[dict], None]):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def retained(self, event: Optional[str] = None) -> list:
+        with self._lock:
+            messages = sorted(self._retained.values(), key=lambda m: m["id"])
+        return [m for m in messages if event is None or m["event"] == event]
+
+    async def subscribe(self, events=None, *, match: Optional[Callable[[dict], bool]] = None,
+                        heartbeat: float = HEARTBEAT_SECONDS) -> AsyncIterator[Optional[dict]]:
+        """snapshot 메시지(보관 중인 현재 상태)를 먼저, 이후 변경분을 발행 순서대로 내보낸다.
+        None은 heartbeat(해당 시간 동안 변경 없음)."""
+        subscriber = Subscriber(asyncio.get_running_loop(), set(events or ()), match)
+        with self._lock:
+            # 스냅샷과 같은 락 안에서 등록해야 그 사이 발행된 이벤트를 놓치지 않는다.
+            self._subscribers.add(subscriber)
+            snapshot = [m for m in sorted(self._retained.values(), key=lambda m: m["id"]) if subscriber.wants(m)]
+        try:
+            yield {"id": snapshot[-1]["id"] if snapshot else 0, "event": SNAPSHOT, "key": "",
+                   "data": {"events": snapshot}}
+            while True:
+                batch = await subscriber.next_batch(heartbeat)
+                if not batch:
+                    yield None
+                for message in batch:
+                    yield message
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+
+def sse_frame(message: Optional[dict]) -> str:
+    """Server-Sent Events 프레임 한 개 (None = keepalive 주석)."""
+    if message is None:
+        return ": keepalive\n\n"
+    data = message["data"] if message["event"] == SNAPSHOT else {"key": message["key"], "data": message["data"]}
+    return f"id: {message['id']}\nevent: {message['event']}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+# ── 모듈 수준 싱글톤 ──
+
+event_bus = EventBus()
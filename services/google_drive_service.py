@@ -5,14 +5,77 @@ from io import BytesIO
 
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload, MediaIoBaseUpload
 
 from services import drive_bridge_client
+from services.drive_transfer import DriveIdCache, default_session_store, query_upload_status
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+# Resumable chunk sizes must be multiples of 256 KiB. 16 MiB keeps the number of
+# round-trips low without holding a whole video in memory on retry.
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+TRANSFER_RETRIES = 3
+# Partial downloads are only resumed while these still match (see download_file).
+DOWNLOAD_FINGERPRINT_FIELDS = "size, md5Checksum, modifiedTime"
 
 
 class GoogleDriveService:
     def __init__(self):
         self.logger = logging.getLogger("GoogleDriveService")
+        self.id_cache = DriveIdCache()
+        self._session_store = None
+
+    @property
+    def session_store(self):
+        """Resumable upload/download sessions persisted across restarts (loaded lazily)."""
+        if self._session_store is None:
+            self._session_store = default_session_store()
+        return self._session_store
+
+    @staticmethod
+    def _upload_session_key(action, local_file_path, folder_id, filename, file_id=None):
+        stat = os.stat(local_file_path)
+        return ":".join([
+            action,
+            folder_id or "",
+            file_id or "",
+            filename,
+            os.path.abspath(local_file_path),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+        ])
+
+    def _execute_resumable(self, request, session_key=None):
+        """Run a resumable upload chunk by chunk, persisting the session URI under `session_key`.
+
+        A saved session is resumed by first asking Drive how many bytes it already has;
+        an expired session (404/410) is dropped and the upload starts over."""
+        store = self.session_store if session_key else None
+        saved_uri = store.get(session_key) if store else None
+        response = None
+        if saved_uri:
+            request.resumable_uri = saved_uri
+            try:
+                response = query_upload_status(request)
+                self.logger.info(f"Resuming Drive upload session for {session_key} at {request.resumable_progress}")
+            except HttpError as e:
+                if getattr(e.resp, "status", None) not in (404, 410):
+                    raise
+                store.drop(session_key)
+                saved_uri = None
+                request.resumable_uri = None
+                request.resumable_progress = 0
+
+        while response is None:
+            _status, response = request.next_chunk(num_retries=TRANSFER_RETRIES)
+            if store and request.resumable_uri and request.resumable_uri != saved_uri:
+                saved_uri = request.resumable_uri
+                store.put(session_key, saved_uri)
+        if store:
+            store.drop(session_key)
+        return response
 
     def _get_drive_service(self, token_path=None):
         """Build a Google Drive client using a short-lived access token from
@@ -48,13 +111,19 @@ class GoogleDriveService:
             media = MediaFileUpload(
                 local_file_path,
                 mimetype=mimetype or "application/octet-stream",
+                chunksize=UPLOAD_CHUNK_SIZE,
                 resumable=True,
             )
-            file = drive_service.files().create(
+            request = drive_service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields="id, name, mimeType, size, md5Checksum, webViewLink",
-            ).execute()
+            )
+            file = self._execute_resumable(
+                request,
+                self._upload_session_key("create", local_file_path, folder_id, file_metadata["name"]),
+            )
+            self.id_cache.put(folder_id, file_metadata["name"], file)
 
             if make_public:
                 try:
@@ -71,17 +140,48 @@ class GoogleDriveService:
             self.logger.error(f"Google Drive file upload failed: {e}")
             return None
 
+    def upload_stream(self, stream, filename, token_path=None, folder_id=None, mimetype=None, description=None):
+        """Upload from a seekable binary stream (e.g. a zip member) without writing a local file first."""
+        try:
+            drive_service = self._get_drive_service(token_path)
+            file_metadata = {"name": filename}
+            if description:
+                file_metadata["description"] = description
+            if folder_id:
+                file_metadata["parents"] = [folder_id]
+            media = MediaIoBaseUpload(
+                stream,
+                mimetype=mimetype or "application/octet-stream",
+                chunksize=UPLOAD_CHUNK_SIZE,
+                resumable=True,
+            )
+            file = self._execute_resumable(drive_service.files().create(
+                body=file_metadata,
+                media_body=media,
+                fields="id, name, mimeType, size, md5Checksum, webViewLink",
+            ))
+            self.id_cache.put(folder_id, filename, file)
+            self.logger.info(f"Drive stream upload success: {file.get('name')} ({file.get('id')})")
+            return file
+        except Exception as e:
+            self.logger.error(f"Google Drive stream upload failed: {e}")
+            return None
+
     def ensure_folder(self, folder_name, token_path=None, parent_folder_id=None):
         """Find or create a Google Drive folder and return its metadata."""
         if not folder_name:
             return None
 
+        safe_name = str(folder_name).strip()
+        cached = self.id_cache.get(parent_folder_id, safe_name, FOLDER_MIME_TYPE)
+        if cached:
+            return cached
+
         try:
             drive_service = self._get_drive_service(token_path)
-            safe_name = str(folder_name).strip()
             escaped_name = safe_name.replace("\\", "\\\\").replace("'", "\\'")
             query_parts = [
-                "mimeType = 'application/vnd.google-apps.folder'",
+                f"mimeType = '{FOLDER_MIME_TYPE}'",
                 f"name = '{escaped_name}'",
                 "trashed = false",
             ]
@@ -96,11 +196,12 @@ class GoogleDriveService:
             ).execute()
             files = response.get("files", [])
             if files:
+                self.id_cache.put(parent_folder_id, safe_name, files[0], FOLDER_MIME_TYPE)
                 return files[0]
 
             metadata = {
                 "name": safe_name,
-                "mimeType": "application/vnd.google-apps.folder",
+                "mimeType": FOLDER_MIME_TYPE,
             }
             if parent_folder_id:
                 metadata["parents"] = [parent_folder_id]
@@ -109,6 +210,7 @@ class GoogleDriveService:
                 body=metadata,
                 fields="id, name, mimeType, parents, webViewLink",
             ).execute()
+            self.id_cache.put(parent_folder_id, safe_name, folder, FOLDER_MIME_TYPE)
             self.logger.info(f"Drive folder ready: {folder.get('name')} ({folder.get('id')})")
             return folder
         except Exception as e:
@@ -140,6 +242,10 @@ class GoogleDriveService:
         if not filename:
             return None
 
+        cached = self.id_cache.get(folder_id, filename, mime_type)
+        if cached:
+            return cached
+
         try:
             drive_service = self._get_drive_service(token_path)
             escaped_name = str(filename).replace("\\", "\\\\").replace("'", "\\'")
@@ -159,17 +265,51 @@ class GoogleDriveService:
                 pageSize=10,
             ).execute()
             files = response.get("files", [])
-            return files[0] if files else None
+            if not files:
+                return None
+            self.id_cache.put(folder_id, filename, files[0], mime_type)
+            return files[0]
         except Exception as e:
             self.logger.error(f"Google Drive find file failed: {e}")
             return None
 
+    def find_files_by_names(self, filenames, token_path=None, folder_id=None, batch_size=40):
+        """{name: file metadata} for the given names in a folder - one files.list query per batch of names."""
+        names = sorted({str(name) for name in filenames or [] if name})
+        found = {}
+        if not names:
+            return found
+        drive_service = self._get_drive_service(token_path)
+        for start in range(0, len(names), batch_size):
+            batch = names[start:start + batch_size]
+            name_terms = " or ".join(
+                "name = '{}'".format(name.replace("\\", "\\\\").replace("'", "\\'")) for name in batch
+            )
+            query_parts = [f"({name_terms})", "trashed = false"]
+            if folder_id:
+                query_parts.append(f"'{folder_id}' in parents")
+            page_token = None
+            while True:
+                response = drive_service.files().list(
+                    q=" and ".join(query_parts),
+                    spaces="drive",
+                    fields="nextPageToken, files(id, name, size, md5Checksum, modifiedTime)",
+                    pageSize=1000,
+                    pageToken=page_token,
+                ).execute()
+                for item in response.get("files", []):
+                    found.setdefault(item.get("name"), item)
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
+        return found
+
     def find_folder(self, folder_name, token_path=None, parent_folder_id=None):
         return self.find_file(
             folder_name,
             token_path=token_path,
             folder_id=parent_folder_id,
-            mime_type="application/vnd.google-apps.folder",
+            mime_type=FOLDER_MIME_TYPE,
         )
 
     def get_file_metadata(self, file_id, token_path=None, fields=None):
@@ -202,6 +342,37 @@ class GoogleDriveService:
             self.logger.error(f"Google Drive list files failed: {e}")
             return []
 
+    def iter_folder_files(self, folder_id, token_path=None, fields="id, name, size, modifiedTime"):
+        """Yield every (non-trashed) file in a folder, following nextPageToken."""
+        drive_service = self._get_drive_service(token_path)
+        page_token = None
+        while True:
+            response = drive_service.files().list(
+                q=f"'{folder_id}' in parents and trashed = false",
+                spaces="drive",
+                fields=f"nextPageToken, files({fields})",
+                pageSize=1000,
+                pageToken=page_token,
+            ).execute()
+            yield from response.get("files", [])
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+    def touch_file(self, file_id, modified_time, token_path=None):
+        """Set a file's modifiedTime (RFC 3339) without touching its content."""
+        drive_service = self._get_drive_service(token_path)
+        return drive_service.files().update(
+            fileId=file_id,
+            body={"modifiedTime": modified_time},
+            fields="id, modifiedTime",
+        ).execute()
+
+    def delete_file(self, file_id, token_path=None):
+        drive_service = self._get_drive_service(token_path)
+        drive_service.files().delete(fileId=file_id).execute()
+        self.id_cache.invalidate()
+
     def upsert_file(
         self,
         local_file_path,
@@ -234,18 +405,39 @@ class GoogleDriveService:
             media = MediaFileUpload(
                 local_file_path,
                 mimetype=mimetype or "application/octet-stream",
+                chunksize=UPLOAD_CHUNK_SIZE,
                 resumable=True,
             )
             body = {"name": final_name}
             if description:
                 body["description"] = description
 
-            updated = drive_service.files().update(
+            request = drive_service.files().update(
                 fileId=existing["id"],
                 body=body,
                 media_body=media,
                 fields="id, name, mimeType, size, md5Checksum, webViewLink, parents",
-            ).execute()
+            )
+            try:
+                updated = self._execute_resumable(
+                    request,
+                    self._upload_session_key("update", local_file_path, folder_id, final_name, existing["id"]),
+                )
+            except HttpError as e:
+                if getattr(e.resp, "status", None) != 404:
+                    raise
+                # The cached file was deleted on Drive since we looked it up.
+                self.id_cache.invalidate(folder_id, final_name)
+                return self.upload_file(
+                    local_file_path,
+                    token_path=token_path,
+                    folder_id=folder_id,
+                    filename=final_name,
+                    mimetype=mimetype,
+                    description=description,
+                    make_public=make_public,
+                )
+            self.id_cache.put(folder_id, final_name, updated)
 
             if make_public:
                 try:
@@ -263,21 +455,60 @@ class GoogleDriveService:
             return None
 
     def download_file(self, file_id, local_file_path, token_path=None):
-        """Download a Google Drive file by file ID."""
+        """Download a Google Drive file by file ID.
+
+        Bytes go to `<path>.part` first; an interrupted download continues from the partial
+        file on the next call, but only while the Drive file's size/md5Checksum/modifiedTime
+        still match the ones recorded when the partial file was started (upsert_file replaces
+        content under the same ID)."""
+        part_path = f"{local_file_path}.part"
+        session_key = f"download:{file_id}:{os.path.abspath(local_file_path)}"
         try:
             drive_service = self._get_drive_service(token_path)
-            os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
-            request = drive_service.files().get_media(fileId=file_id)
-            with open(local_file_path, "wb") as fh:
-                downloader = MediaIoBaseDownload(fh, request)
-                done = False
-                while not done:
-                    _, done = downloader.next_chunk()
+            os.makedirs(os.path.dirname(local_file_path) or ".", exist_ok=True)
+            remote = drive_service.files().get(fileId=file_id, fields=DOWNLOAD_FINGERPRINT_FIELDS).execute()
+            fingerprint = {field: remote.get(field) for field in ("size", "md5Checksum", "modifiedTime")}
+            entry = self.session_store.get_entry(session_key) or {}
+            offset = 0
+            if (
+                entry.get("value") == file_id
+                and all(entry.get(field) == value for field, value in fingerprint.items())
+                and os.path.exists(part_path)
+            ):
+                offset = os.path.getsize(part_path)
+            self.session_store.put(session_key, file_id, **fingerprint)
+            size = int(fingerprint["size"]) if fingerprint["size"] is not None else None
+            try:
+                self._download_to(drive_service, file_id, part_path, offset, size)
+            except HttpError:
+                if not offset:
+                    raise
+                self._download_to(drive_service, file_id, part_path, 0, size)
+            os.replace(part_path, local_file_path)
+            self.session_store.drop(session_key)
             return local_file_path
         except Exception as e:
             self.logger.error(f"Google Drive file download failed: {e}")
             return None
 
+    def _download_to(self, drive_service, file_id, part_path, offset, size=None):
+        """Fetch `[offset, size)` in DOWNLOAD_CHUNK_SIZE pieces with explicit Range headers."""
+        if size is None or (offset and offset > size):
+            offset = 0
+        with open(part_path, "ab" if offset else "wb") as fh:
+            if size is None:
+                fh.write(drive_service.files().get_media(fileId=file_id).execute(num_retries=TRANSFER_RETRIES))
+                return
+            while offset < size:
+                end = min(offset + DOWNLOAD_CHUNK_SIZE, size) - 1
+                request = drive_service.files().get_media(fileId=file_id)
+                request.headers["Range"] = f"bytes={offset}-{end}"
+                chunk = request.execute(num_retries=TRANSFER_RETRIES)
+                if not chunk:
+                    raise IOError(f"Empty Drive response for bytes {offset}-{end} of {file_id}")
+                fh.write(chunk)
+                offset += len(chunk)
+
     def read_text_file(self, file_id, token_path=None, encoding="utf-8"):
         if not file_id:
             return None
@@ -285,7 +516,7 @@ class GoogleDriveService:
             drive_service = self._get_drive_service(token_path)
             request = drive_service.files().get_media(fileId=file_id)
             buffer = BytesIO()
-            downloader = MediaIoBaseDownload(buffer, request)
+            downloader = MediaIoBaseDownload(buffer, request, chunksize=DOWNLOAD_CHUNK_SIZE)
             done = False
             while not done:
                 _, done = downloader.next_chunk()
@@ -9,7 +9,6 @@ rendering, review, or upload flows.
 from __future__ import annotations
 
 import json
-import threading
 from typing import Any, Dict, Optional
 
 import database as db
@@ -135,14 +134,12 @@ def collect_project_learning_context(project_id: int) -> Dict[str, Any]:
 
 
 def _sync_remote_best_effort():
-    def _run():
-        try:
-            from services.learning_sync_service import sync_learning_data
-            sync_learning_data(limit=50)
-        except Exception as exc:
-            print(f"[Learning] Remote sync skipped: {exc}")
-
-    threading.Thread(target=_run, daemon=True).start()
+    # One background flusher batches everything logged within a short window (no thread per event).
+    try:
+        from services.learning_sync_service import request_sync
+        request_sync()
+    except Exception as exc:
+        print(f"[Learning] Remote sync skipped: {exc}")
 
 
 def log_event(project_id: int, event_type: str, stage: str = "", payload: Optional[Dict[str, Any]] = None, source: str = "system") -> Optional[int]:
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import collections
 import datetime
-from typing import Any, Dict
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Optional
 
 import database as db
 from services.web_admin_client import web_admin_client
@@ -11,19 +15,50 @@ from services.web_admin_client import web_admin_client
 
 LEARNING_EVENTS_TABLE = "project_learning_events"
 LEARNING_SNAPSHOTS_TABLE = "project_learning_snapshots"
+SYNC_BATCH_SIZE = 200
+# Events logged within this window are pushed together by the background flusher.
+FLUSH_DELAY_SECONDS = 2.0
+THROUGHPUT_WINDOW_SECONDS = 300
+
+_SYNC_LOCK = threading.Lock()
+_flusher_lock = threading.Lock()
+_flush_requested = threading.Event()
+_flusher: Optional[threading.Thread] = None
+
+_STATS_LOCK = threading.Lock()
+_STATS: Dict[str, Any] = {
+    "runs": 0,
+    "batches": 0,
+    "rows_synced": 0,
+    "rows_failed": 0,
+    "stalled_batches": 0,
+    "last_run_at": None,
+    "last_success_at": None,
+    "last_duration_ms": None,
+}
+_THROUGHPUT_WINDOW: "collections.deque" = collections.deque()
 
 
 def _utc_now() -> str:
     return datetime.datetime.now(datetime.timezone.utc).isoformat()
 
 
+_USER_ID_CACHE: Dict[str, str] = {}
+
+
 def _resolve_user_id(email: str) -> str:
     if not email:
         return ""
+    if email in _USER_ID_CACHE:
+        return _USER_ID_CACHE[email]
     try:
-        return web_admin_client.resolve_user_id(email=email) or ""
+        user_id = web_admin_client.resolve_user_id(email=email) or ""
     except Exception:
         return ""
+    if user_id:
+        # A batch usually holds many rows of the same employee - resolve each email once.
+        _USER_ID_CACHE[email] = user_id
+    return user_id
 
 
 def _event_payload(row: Dict[str, Any]) -> Dict[str, Any]:
@@ -81,6 +116,90 @@ def _upsert_learning_row(table: str, key: str, payload: Dict[str, Any]) -> bool:
     return web_admin_client.upsert_by_key(table, key, payload[key], payload, timeout=10)
 
 
+def _idempotency_key(stream: str, payloads) -> str:
+    """Same rows -> same key, so a retried batch is recognisable as a replay."""
+    digest = hashlib.sha256("\n".join(payload["sync_key"] for payload in payloads).encode("utf-8")).hexdigest()
+    return f"learning-{stream}-{digest[:32]}"
+
+
+def _record_stats(**fields: int) -> None:
+    now = time.time()
+    with _STATS_LOCK:
+        for key, value in fields.items():
+            _STATS[key] = _STATS.get(key, 0) + value
+        _STATS["last_run_at"] = now
+        if fields.get("rows_synced"):
+            _STATS["last_success_at"] = now
+            _THROUGHPUT_WINDOW.append((now, fields["rows_synced"]))
+        while _THROUGHPUT_WINDOW and _THROUGHPUT_WINDOW[0][0] < now - THROUGHPUT_WINDOW_SECONDS:
+            _THROUGHPUT_WINDOW.popleft()
+
+
+def _is_transient_failure(outcome: Dict[str, Any]) -> bool:
+    """No response, 429 or 5xx: the server is down or overloaded, not rejecting particular rows."""
+    return any(status is None or status == 429 or status >= 500 for status in outcome.get("failed_statuses") or [])
+
+
+def _push_batch(stream: str, table: str, rows, build_payload, result: Dict[str, int], advance_cursor: bool) -> bool:
+    """Push one batch and record it locally in a single write.
+
+    Returns False when nothing in the batch reached Supabase (outage): the cursor then stays
+    put, so the next run retries the same rows instead of erroring everything behind it."""
+    if not rows:
+        return True
+    built, errors, synced_ids = [], {}, []
+    for row in rows:
+        result[f"{stream}_attempted"] += 1
+        try:
+            built.append((row.get("id"), build_payload(row)))
+        except Exception as exc:
+            errors[row.get("id")] = str(exc)
+
+    stalled = False
+    if built:
+        payloads = [payload for _row_id, payload in built]
+        outcome = web_admin_client.upsert_many(
+            table, payloads, on_conflict="sync_key", timeout=15, idempotency_key=_idempotency_key(stream, payloads),
+        )
+        if not outcome["failed"]:
+            synced_ids = [row_id for row_id, _payload in built]
+        elif _is_transient_failure(outcome):
+            # Retrying row by row against an unreachable server only multiplies the timeouts.
+            message = "; ".join(outcome.get("errors") or []) or "Supabase batch upsert failed"
+            for row_id, _payload in built:
+                errors[row_id] = message
+            stalled = True
+        else:
+            # A chunk was rejected (4xx) - fall back to row-by-row so one bad row does not block the rest.
+            for row_id, payload in built:
+                try:
+                    if _upsert_learning_row(table, "sync_key", payload):
+                        synced_ids.append(row_id)
+                    else:
+                        errors[row_id] = "Supabase upsert returned false"
+                except Exception as exc:
+                    errors[row_id] = str(exc)
+            stalled = not synced_ids
+
+    cursor_id = max(row.get("id") or 0 for row in rows) if advance_cursor and not stalled else None
+    db.commit_learning_sync_batch(stream, synced_ids, _utc_now(), errors=errors, cursor_id=cursor_id)
+    result[f"{stream}_synced"] += len(synced_ids)
+    result[f"{stream}_failed"] += len(errors)
+    _record_stats(batches=1, rows_synced=len(synced_ids), rows_failed=len(errors), stalled_batches=int(stalled))
+    return not stalled
+
+
+def _sync_stream(stream: str, table: str, fetch_rows, build_payload, limit: int, result: Dict[str, int]) -> None:
+    """New rows after the persistent cursor first; leftover capacity retries rows that errored earlier."""
+    cursor = db.get_remote_sync_cursor(stream)
+    rows = fetch_rows(limit, after_id=cursor)
+    if not _push_batch(stream, table, rows, build_payload, result, advance_cursor=True):
+        return
+    if len(rows) < limit and cursor:
+        retry_rows = fetch_rows(limit - len(rows), retry_up_to_id=cursor)
+        _push_batch(stream, table, retry_rows, build_payload, result, advance_cursor=False)
+
+
 def sync_learning_data(limit: int = 100) -> Dict[str, int]:
     """Sync pending learning events/snapshots to Supabase without blocking production flows."""
     result = {
@@ -95,36 +214,76 @@ def sync_learning_data(limit: int = 100) -> Dict[str, int]:
     if not web_admin_client.has_supabase():
         return result
 
-    for event in db.get_unsynced_learning_events(limit):
-        event_id = event.get("id")
-        result["events_attempted"] += 1
+    limit = max(1, min(int(limit or SYNC_BATCH_SIZE), 500))
+    started = time.perf_counter()
+    # Admin stats, startup and the background flusher may all call in; one run at a time.
+    with _SYNC_LOCK:
+        _sync_stream("events", LEARNING_EVENTS_TABLE, db.get_unsynced_learning_events, _event_payload, limit, result)
+        _sync_stream("snapshots", LEARNING_SNAPSHOTS_TABLE, db.get_unsynced_learning_snapshots, _snapshot_payload, limit, result)
+    _record_stats(runs=1)
+    with _STATS_LOCK:
+        _STATS["last_duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+    if result["events_attempted"] or result["snapshots_attempted"]:
+        print(f"[LearningSync] {result}")
+    return result
+
+
+def _flush_loop() -> None:
+    global _flusher
+    while True:
+        time.sleep(FLUSH_DELAY_SECONDS)
+        _flush_requested.clear()
         try:
-            payload = _event_payload(event)
-            if _upsert_learning_row(LEARNING_EVENTS_TABLE, "sync_key", payload):
-                db.mark_learning_event_remote_synced(event_id, payload["synced_at"])
-                result["events_synced"] += 1
-            else:
-                db.mark_learning_event_remote_sync_error(event_id, "Supabase upsert returned false")
-                result["events_failed"] += 1
+            result = sync_learning_data(limit=SYNC_BATCH_SIZE)
+            if max(result["events_attempted"], result["snapshots_attempted"]) >= SYNC_BATCH_SIZE:
+                _flush_requested.set()  # a full batch means more is waiting
         except Exception as exc:
-            db.mark_learning_event_remote_sync_error(event_id, str(exc))
-            result["events_failed"] += 1
+            print(f"[LearningSync] Background sync skipped: {exc}")
+        with _flusher_lock:
+            if not _flush_requested.is_set():
+                _flusher = None
+                return
+
+
+def request_sync() -> None:
+    """Ask for a background sync. Calls arriving while one is pending coalesce into the same batch."""
+    global _flusher
+    with _flusher_lock:
+        _flush_requested.set()
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="learning-sync", daemon=True)
+            _flusher.start()
 
-    for snapshot in db.get_unsynced_learning_snapshots(limit):
-        snapshot_id = snapshot.get("id")
-        result["snapshots_attempted"] += 1
+
+def _lag_seconds(oldest_pending_at) -> Optional[float]:
+    if not oldest_pending_at:
+        return None
+    try:
+        created = datetime.datetime.fromisoformat(str(oldest_pending_at).replace("Z", ""))
+    except ValueError:
+        return None
+    if created.tzinfo is not None:
+        created = created.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return max(0.0, round((now - created).total_seconds(), 1))
+
+
+def sync_status() -> Dict[str, Any]:
+    """Throughput and lag of the remote learning sync, for the admin stats page."""
+    now = time.time()
+    with _STATS_LOCK:
+        stats = dict(_STATS)
+        recent = sum(count for ts, count in _THROUGHPUT_WINDOW if ts >= now - THROUGHPUT_WINDOW_SECONDS)
+    stats["rows_per_minute"] = round(recent * 60 / THROUGHPUT_WINDOW_SECONDS, 1)
+    streams = {}
+    for stream in ("events", "snapshots"):
         try:
-            payload = _snapshot_payload(snapshot)
-            if _upsert_learning_row(LEARNING_SNAPSHOTS_TABLE, "sync_key", payload):
-                db.mark_learning_snapshot_remote_synced(snapshot_id, payload["synced_at"])
-                result["snapshots_synced"] += 1
-            else:
-                db.mark_learning_snapshot_remote_sync_error(snapshot_id, "Supabase upsert returned false")
-                result["snapshots_failed"] += 1
+            lag = db.get_learning_sync_lag(stream)
+            lag["cursor"] = db.get_remote_sync_cursor(stream)
         except Exception as exc:
-            db.mark_learning_snapshot_remote_sync_error(snapshot_id, str(exc))
-            result["snapshots_failed"] += 1
-
-    if result["events_attempted"] or result["snapshots_attempted"]:
-        print(f"[LearningSync] {result}")
-    return result
+            lag = {"error": str(exc)}
+        lag["lag_seconds"] = _lag_seconds(lag.get("oldest_pending_at"))
+        streams[stream] = lag
+    stats["streams"] = streams
+    return stats
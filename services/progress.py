@@ -1,10 +1,23 @@
 from proglog import ProgressBarLogger
 import time
 
+from services.event_bus import RENDER, event_bus
+
 # Global store for render progress: {project_id: percentage} (0-100)
 # Also store state: 'rendering', 'completed', 'failed'
 RENDER_PROGRESS = {}
 
+
+def _set_progress(project_id, status, progress, **extra):
+    """RENDER_PROGRESS 갱신 + 값이 바뀐 경우에만 render 이벤트 발행
+    (MoviePy 콜백은 프레임마다 불리지만 퍼센트는 1% 단위로만 바뀐다)."""
+    entry = {"status": status, "progress": progress, **extra}
+    if RENDER_PROGRESS.get(project_id) == entry:
+        return
+    RENDER_PROGRESS[project_id] = entry
+    event_bus.publish(RENDER, {"project_id": project_id, **entry}, key=project_id)
+
+
 class RenderLogger(ProgressBarLogger):
     def __init__(self, project_id, start_pct=0, end_pct=100):
         super().__init__()
@@ -14,10 +27,7 @@ class RenderLogger(ProgressBarLogger):
         self.last_update = 0
         
         # Initialize or update existing progress to the start_pct
-        RENDER_PROGRESS[project_id] = {
-            "status": "rendering",
-            "progress": start_pct
-        }
+        _set_progress(project_id, "rendering", start_pct)
 
     def callback(self, **changes):
         # changes format: {'bars': {'t': {'index': 50, 'total': 100, ...}}}
@@ -35,10 +45,7 @@ class RenderLogger(ProgressBarLogger):
                     global_percentage = int(self.start_pct + (local_percentage * range_size))
                     
                     # Update global store
-                    RENDER_PROGRESS[self.project_id] = {
-                        "status": "rendering",
-                        "progress": global_percentage
-                    }
+                    _set_progress(self.project_id, "rendering", global_percentage)
 
     def bars_callback(self, bar, attr, value, old_value=None):
         # Some versions of proglog use this
@@ -47,8 +54,5 @@ class RenderLogger(ProgressBarLogger):
 def get_render_progress(project_id):
     return RENDER_PROGRESS.get(project_id, {"status": "unknown", "progress": 0})
 
-def set_render_status(project_id, status, progress=0):
-    RENDER_PROGRESS[project_id] = {
-        "status": status,
-        "progress": progress
-    }
+def set_render_status(project_id, status, progress=0, **extra):
+    _set_progress(project_id, status, progress, **extra)
@@ -7,6 +7,7 @@ import database as db
 from config import config
 from services.drive_bundle_service import drive_bundle_service
 from services.sync_service import upsert_web_admin_publishing_request
+from services.youtube_upload_queue import youtube_upload_queue
 from services.youtube_upload_service import youtube_upload_service
 from services import learning_service
 
@@ -191,7 +192,9 @@ def publish_project_to_youtube(
         if preferred_handle and not token_path:
             preferred_name = settings.get("preferred_youtube_channel_name") or preferred_handle
             raise RuntimeError(f"Fixed upload channel is not connected locally: {preferred_name}")
-        result = youtube_upload_service.upload_video(
+        # 채널별 동시 업로드/할당량 제한을 지키도록 대기열을 거친다 (이 스레드는 끝날 때까지 대기)
+        result = youtube_upload_queue.wait(youtube_upload_queue.submit(
+            project_id=project_id,
             file_path=video_path,
             title=title,
             description=description,
@@ -200,7 +203,7 @@ def publish_project_to_youtube(
             privacy_status=requested_privacy,
             publish_at=requested_publish_at,
             token_path=token_path,
-        )
+        ))
 
         if not result or not result.get("id"):
             raise RuntimeError((result or {}).get("error", "YouTube upload failed"))
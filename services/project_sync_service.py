@@ -11,18 +11,82 @@ on every call, with no error surfaced anywhere. A fresh install (or any
 machine whose local SQLite lost a project row) showed an empty project list
 even though the row was sitting in Supabase. Migrated to the same
 email + HMAC session_token bridge pattern as referral.py/support.py.
+
+Pushes are field-level deltas: project_sync_state keeps a hash per top-level
+payload field as last accepted by the server, and only fields whose hash
+changed are sent (action "push_delta", guarded by the previous payload hash).
+A full snapshot is sent on first sync, after a hash mismatch, or when the
+bridge does not know push_delta yet.
 """
 import datetime
+import hashlib
 import json
 import os
 import re
-from typing import Any, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 import database as db
 from services.web_admin_client import web_admin_client
 
 
 _PATH_KEY_RE = re.compile(r"(path|url|file|image|video|audio|thumbnail)", re.IGNORECASE)
+# progress_payload is a separate remote column but is hashed like a payload field.
+PROGRESS_FIELD = "progress_payload"
+DEFAULT_SYNC_WORKERS = 4
+RESTORE_FETCH_CHUNK = 20
+
+_STATS_LOCK = threading.Lock()
+_SYNC_STATS: Dict[str, int] = {
+    "full_pushes": 0,
+    "delta_pushes": 0,
+    "unchanged_skips": 0,
+    "hash_mismatches": 0,
+    "bytes_sent": 0,
+}
+
+
+def _sync_workers() -> int:
+    try:
+        return max(1, int(os.getenv("PROJECT_SYNC_WORKERS", DEFAULT_SYNC_WORKERS)))
+    except ValueError:
+        return DEFAULT_SYNC_WORKERS
+
+
+def _run_bounded(func, items: list) -> list:
+    """Run func over items on a small thread pool; results keep input order."""
+    workers = min(_sync_workers(), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="project-sync") as pool:
+        return list(pool.map(func, items))
+
+
+def _count(**fields: int) -> None:
+    with _STATS_LOCK:
+        for key, value in fields.items():
+            _SYNC_STATS[key] = _SYNC_STATS.get(key, 0) + value
+
+
+def sync_stats() -> Dict[str, int]:
+    with _STATS_LOCK:
+        return dict(_SYNC_STATS)
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def field_hashes(payload: Dict[str, Any], progress_payload: Any) -> Dict[str, str]:
+    hashes = {key: hashlib.sha256(_canonical(value).encode("utf-8")).hexdigest()[:32] for key, value in payload.items()}
+    hashes[PROGRESS_FIELD] = hashlib.sha256(_canonical(progress_payload).encode("utf-8")).hexdigest()[:32]
+    return hashes
+
+
+def payload_hash(hashes: Dict[str, str]) -> str:
+    """Hash of the whole synced state, derived from the per-field hashes."""
+    return hashlib.sha256("\n".join(f"{key}:{hashes[key]}" for key in sorted(hashes)).encode("utf-8")).hexdigest()
 
 
 def _bridge(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -75,8 +139,8 @@ def _project_app_mode(full_data: Dict[str, Any]) -> str:
     return settings.get("app_mode") or "longform"
 
 
-def build_project_payload(project_id: int) -> Optional[Dict[str, Any]]:
-    full_data = db.get_project_full_data_v2(project_id)
+def build_project_payload(project_id: int, full_data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    full_data = full_data or db.get_project_full_data_v2(project_id)
     if not full_data:
         return None
 
@@ -107,16 +171,21 @@ def build_project_payload(project_id: int) -> Optional[Dict[str, Any]]:
     return _sanitize(payload)
 
 
+def _push(action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    _count(bytes_sent=len(_canonical(params).encode("utf-8")))
+    return _bridge(action, params)
+
+
 def sync_project_metadata(project_id: int, employee_email: str = "") -> bool:
     project = db.get_project(project_id)
     if not project:
         return False
 
-    payload = build_project_payload(project_id)
+    full_data = db.get_project_full_data_v2(project_id) or {}
+    payload = build_project_payload(project_id, full_data)
     if payload is None:
         return False
 
-    full_data = db.get_project_full_data_v2(project_id) or {}
     progress_payload = {}
     try:
         from services.topic_queue_sync_service import build_project_progress_snapshot
@@ -130,7 +199,7 @@ def sync_project_metadata(project_id: int, employee_email: str = "") -> bool:
         db.mark_project_dirty(project_id)
         return False
 
-    result = _bridge("push", {
+    columns = {
         "sync_id": sync_id,
         "local_project_id": project_id,
         "name": project.get("name") or "",
@@ -138,14 +207,58 @@ def sync_project_metadata(project_id: int, employee_email: str = "") -> bool:
         "status": project.get("status") or "draft",
         "language": project.get("language") or "ko",
         "app_mode": _project_app_mode(full_data),
-        "project_payload": payload,
-        "progress_payload": progress_payload,
         "deleted_at": project.get("remote_deleted_at"),
-    })
+    }
+    # Row columns are hashed too, so a rename alone still counts as a change.
+    hashes = field_hashes(payload, progress_payload)
+    hashes["_columns"] = hashlib.sha256(_canonical(columns).encode("utf-8")).hexdigest()[:32]
+    new_hash = payload_hash(hashes)
+
+    state = db.get_project_sync_state(project_id)
+    if state and state.get("sync_id") != sync_id:
+        state = None
+
+    result: Dict[str, Any] = {}
+    if state and state.get("payload_hash"):
+        if state["payload_hash"] == new_hash:
+            _count(unchanged_skips=1)
+            db.mark_project_synced(project_id, now)
+            return True
+        previous = state.get("field_hashes") or {}
+        changed = {key: value for key, value in payload.items() if previous.get(key) != hashes[key]}
+        delta = {
+            **columns,
+            "base_hash": state["payload_hash"],
+            "payload_hash": new_hash,
+            "changed_fields": changed,
+            "removed_fields": [key for key in previous if key not in hashes],
+        }
+        if previous.get(PROGRESS_FIELD) != hashes[PROGRESS_FIELD]:
+            delta["progress_payload"] = progress_payload
+        result = _push("push_delta", delta)
+        if result.get("success"):
+            _count(delta_pushes=1)
+        elif result.get("error") == "hash_mismatch" or "Unknown action" in str(result.get("error") or ""):
+            # Remote row changed elsewhere (or an older bridge) - fall back to a full snapshot.
+            _count(hash_mismatches=1)
+            db.clear_project_sync_state(project_id)
+            result = {}
+
+    if not result:
+        result = _push("push", {
+            **columns,
+            "project_payload": payload,
+            "progress_payload": progress_payload,
+            "payload_hash": new_hash,
+        })
+        if result.get("success"):
+            _count(full_pushes=1)
 
     if result.get("success"):
-        db.mark_project_synced(project_id, now)
+        db.save_project_sync_state(project_id, sync_id, new_hash, hashes, now)
         return True
+    # A failed delta keeps the old state: if the server did apply it, the next delta
+    # sees a hash mismatch and falls back to a full snapshot.
     db.mark_project_dirty(project_id)
     if result.get("error") != "not_logged_in":
         print(f"[ProjectSync] Failed to sync project {project_id}: {result.get('error')}")
@@ -167,31 +280,35 @@ def sync_project_deleted(project: Dict[str, Any]) -> bool:
 
 
 def sync_dirty_projects(employee_email: str = "", limit: int = 20) -> Dict[str, int]:
-    projects = db.get_dirty_projects(employee_email=employee_email or None, limit=limit)
-    result = {"attempted": 0, "synced": 0, "failed": 0}
-    for project in projects:
-        pid = project.get("id")
-        if not pid:
-            continue
-        result["attempted"] += 1
-        if sync_project_metadata(pid, employee_email=employee_email or project.get("employee_email") or ""):
-            result["synced"] += 1
-        else:
-            result["failed"] += 1
+    projects = [p for p in db.get_dirty_projects(employee_email=employee_email or None, limit=limit) if p.get("id")]
+    result = {"attempted": len(projects), "synced": 0, "failed": 0}
+
+    def _sync(project):
+        try:
+            return sync_project_metadata(project["id"], employee_email=employee_email or project.get("employee_email") or "")
+        except Exception as e:
+            print(f"[ProjectSync] Error syncing project {project.get('id')}: {e}")
+            return False
+
+    for ok in _run_bounded(_sync, projects):
+        result["synced" if ok else "failed"] += 1
     if result["attempted"]:
-        print(f"[ProjectSync] Dirty sync result: {json.dumps(result, ensure_ascii=False)}")
+        print(f"[ProjectSync] Dirty sync result: {json.dumps(result, ensure_ascii=False)} stats={sync_stats()}")
     return result
 
 
-def fetch_remote_projects(employee_email: str) -> list:
+def fetch_remote_projects(employee_email: str, include_payload: bool = True) -> list:
     """Supabase에서 사용자의 프로젝트 목록을 가져옵니다 (project_payload 포함 -
     복원 시 설정값까지 함께 복원하려면 필요. 예전 코드는 select에서
     project_payload를 빼먹어 복원돼도 항상 빈 설정으로 생성되는 별개의
-    잠재 버그가 있었다 - 브릿지로 옮기며 같이 고쳤다)."""
+    잠재 버그가 있었다 - 브릿지로 옮기며 같이 고쳤다).
+
+    include_payload=False면 목록만 받고 payload는 복원할 프로젝트만 따로 받는다
+    (fetch_remote_payloads). 예전 브릿지는 이 옵션을 무시하고 항상 payload를 준다."""
     if not employee_email:
         return []
 
-    result = _bridge("list")
+    result = _bridge("list", None if include_payload else {"include_payload": False})
     if not result.get("success"):
         if result.get("error") != "not_logged_in":
             print(f"[ProjectSync] Failed to fetch remote projects: {result.get('error')}")
@@ -199,6 +316,25 @@ def fetch_remote_projects(employee_email: str) -> list:
     return result.get("projects") or []
 
 
+def fetch_remote_payloads(sync_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """sync_id -> project_payload. 청크 단위 요청을 제한된 동시성으로 보낸다."""
+    chunks = [sync_ids[i:i + RESTORE_FETCH_CHUNK] for i in range(0, len(sync_ids), RESTORE_FETCH_CHUNK)]
+
+    def _fetch(chunk):
+        result = _bridge("get", {"sync_ids": chunk})
+        if not result.get("success"):
+            print(f"[ProjectSync] Failed to fetch remote payloads: {result.get('error')}")
+            return []
+        return result.get("projects") or []
+
+    payloads = {}
+    for rows in _run_bounded(_fetch, chunks):
+        for row in rows:
+            if row.get("sync_id"):
+                payloads[row["sync_id"]] = row.get("project_payload") or {}
+    return payloads
+
+
 def ensure_local_projects_from_remote(employee_email: str) -> Dict[str, int]:
     """Supabase에 있는 프로젝트가 로컬에 없으면 복원합니다.
 
@@ -211,8 +347,8 @@ def ensure_local_projects_from_remote(employee_email: str) -> Dict[str, int]:
     result = {"fetched": 0, "restored": 0, "skipped": 0, "failed": 0}
 
     try:
-        # 1. 원격 프로젝트 목록 가져오기
-        remote_projects = fetch_remote_projects(employee_email)
+        # 1. 원격 프로젝트 목록 가져오기 (payload 제외)
+        remote_projects = fetch_remote_projects(employee_email, include_payload=False)
         result["fetched"] = len(remote_projects)
 
         if not remote_projects:
@@ -233,20 +369,36 @@ def ensure_local_projects_from_remote(employee_email: str) -> Dict[str, int]:
 
         print(f"[ProjectSync] Found {len(to_restore)} projects to restore from Supabase")
 
-        # 4. 각 프로젝트 복원
-        for rp in to_restore:
-            sync_id = rp.get("sync_id")
+        # 4. 복원할 프로젝트의 payload만 받기 (예전 브릿지는 목록에 이미 포함)
+        missing = [rp["sync_id"] for rp in to_restore if "project_payload" not in rp]
+        if missing:
+            payloads = fetch_remote_payloads(missing)
+            for rp in to_restore:
+                if rp["sync_id"] in payloads:
+                    rp["project_payload"] = payloads[rp["sync_id"]]
+            # payload를 못 받은 프로젝트는 빈 설정으로 만들지 않는다 - 로컬에 생기면 다시 복원되지
+            # 않으므로, 실패로 세고 다음 실행에서 재시도한다.
+            unfetched = [rp for rp in to_restore if "project_payload" not in rp]
+            if unfetched:
+                print(f"[ProjectSync] Payload fetch failed for {len(unfetched)} project(s); retrying next run")
+                result["failed"] += len(unfetched)
+                to_restore = [rp for rp in to_restore if "project_payload" in rp]
+
+        # 5. 제한된 동시성으로 복원 (DB 쓰기는 writer 큐가 직렬화)
+        def _restore(rp):
             try:
                 restored_id = restore_project_from_remote(rp)
-                if restored_id:
-                    result["restored"] += 1
-                    print(f"[ProjectSync] Restored project: {rp.get('name')} (ID: {restored_id})")
-                else:
-                    result["failed"] += 1
-                    print(f"[ProjectSync] Failed to restore project: {rp.get('name')}")
             except Exception as e:
-                result["failed"] += 1
                 print(f"[ProjectSync] Error restoring project {rp.get('name')}: {e}")
+                return False
+            if restored_id:
+                print(f"[ProjectSync] Restored project: {rp.get('name')} (ID: {restored_id})")
+                return True
+            print(f"[ProjectSync] Failed to restore project: {rp.get('name')}")
+            return False
+
+        for ok in _run_bounded(_restore, to_restore):
+            result["restored" if ok else "failed"] += 1
 
         return result
 
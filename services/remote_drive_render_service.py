@@ -2,6 +2,7 @@ import datetime
 import json
 import os
 import re
+import time
 import uuid
 
 import requests
@@ -12,12 +13,36 @@ from services.auth_service import auth_service
 from services.google_drive_service import google_drive_service
 from services.project_publish_service import queue_project_for_admin_publish
 from services.remote_render_service import package_project_assets
+from services.render_blob_store import (
+    BLOB_MANIFEST_FORMAT,
+    DriveBlobStore,
+    blob_ttl_seconds,
+    publish_package,
+    write_manifest_file,
+)
+from services.render_package import read_manifest
 from services.web_admin_client import web_admin_client
 
 
+BLOB_SWEEP_INTERVAL_SECONDS = 6 * 3600
+
+
+def packaging_progress_callback(project_id: int):
+    """progress_callback for package_*_project_assets: reports the zip write as render status
+    "remote_packaging" with its percent, so the render status poll and /api/events show it."""
+    from services.progress import set_render_status
+
+    def report(percent: int, message: str):
+        set_render_status(project_id, "remote_packaging", percent, message=message)
+
+    return report
+
+
 class RemoteDriveRenderService:
     """Google Drive API + Supabase queue entrypoint for remote rendering."""
 
+    _last_blob_sweep = 0.0
+
     def _load_remote_drive_settings(self):
         """Ensure Drive API render settings saved in web-admin are available locally."""
         if getattr(config, "REMOTE_RENDER_DRIVE_FOLDER_ID", "") and getattr(config, "REMOTE_RENDER_GOOGLE_TOKEN_PATH", ""):
@@ -190,6 +215,72 @@ class RemoteDriveRenderService:
             db.update_project_setting(project_id, "admin_publish_error", str(publish_queue_error))
         return row
 
+    def _package_transport(self):
+        """기본은 zip. 배포된 원격 워커가 모두 blob 매니페스트(air_render_blobs_v1)를 받을 수 있게
+        업데이트된 뒤에만 remote_render_package_transport 설정을 'blobs'로 바꾼다."""
+        return (db.get_global_setting("remote_render_package_transport", "zip") or "zip").strip().lower()
+
+    def _sweep_render_blobs(self, store):
+        """blob 폴더에서 TTL(REMOTE_RENDER_BLOB_TTL_DAYS)이 지난 blob을 지운다. 프로세스당 BLOB_SWEEP_INTERVAL_SECONDS에 한 번."""
+        now = time.time()
+        if now - self._last_blob_sweep < BLOB_SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_blob_sweep = now
+        try:
+            removed = store.sweep(blob_ttl_seconds(), now=now)
+            if removed:
+                print(f"[RemoteDriveRender] 오래된 렌더 blob {removed}개 정리")
+        except Exception as e:
+            print(f"[RemoteDriveRender] 렌더 blob 정리 실패: {e}")
+
+    def _upload_package(self, project_id: int, package_path: str, folder_id, token_path):
+        """패키지를 Drive에 올리고 (asset 파일 메타데이터, 큐 metadata에 더할 필드)를 반환한다.
+
+        remote_render_package_transport 설정이 'blobs'이고 manifest.json이 있는 패키지는 blob 델타 전송
+        (services/render_blob_store.py) - 저장소에 없는 파일만 올리고 asset 파일은 작은 매니페스트가 된다.
+        그 밖에는 (기본값) zip 전체를 올린다."""
+        if self._package_transport() == "blobs" and read_manifest(package_path):
+            store = DriveBlobStore.ensure(parent_folder_id=folder_id, token_path=token_path)
+            manifest, stats = publish_package(package_path, store)
+            manifest_path = write_manifest_file(manifest, f"{package_path}.manifest.json")
+            try:
+                drive_file = google_drive_service.upload_file(
+                    manifest_path,
+                    token_path=token_path,
+                    folder_id=folder_id,
+                    filename=f"remote_render_manifest_{project_id}.json",
+                    mimetype="application/json",
+                    description=f"AIR remote render asset manifest for project {project_id}",
+                    make_public=False,
+                )
+            finally:
+                try:
+                    os.remove(manifest_path)
+                except OSError:
+                    pass
+            self._sweep_render_blobs(store)
+            print(
+                f"[RemoteDriveRender] 프로젝트 {project_id} 패키지 델타 전송: "
+                f"업로드 {stats['uploaded_files']}개 {stats['uploaded_bytes'] / 1048576:.1f}MB, "
+                f"재사용 {stats['reused_files']}개 {stats['reused_bytes'] / 1048576:.1f}MB"
+            )
+            return drive_file, {
+                "package_format": BLOB_MANIFEST_FORMAT,
+                "blob_folder_id": store.folder_id,
+                "package_uploaded_bytes": stats["uploaded_bytes"],
+                "package_reused_bytes": stats["reused_bytes"],
+            }
+
+        drive_file = google_drive_service.upload_file(
+            package_path,
+            token_path=token_path,
+            folder_id=folder_id,
+            mimetype="application/zip",
+            description=f"AIR remote render asset package for project {project_id}",
+            make_public=False,
+        )
+        return drive_file, {}
+
     def enqueue_packaged_project(self, project_id: int, package_path: str, metadata=None, token_path=None):
         project = db.get_project(project_id)
         if not project:
@@ -201,14 +292,7 @@ class RemoteDriveRenderService:
         token_path = token_path or self._get_google_token_path()
         task_id = str(uuid.uuid4())
 
-        drive_file = google_drive_service.upload_file(
-            package_path,
-            token_path=token_path,
-            folder_id=folder_id,
-            mimetype="application/zip",
-            description=f"AIR remote render asset package for project {project_id}",
-            make_public=False,
-        )
+        drive_file, package_fields = self._upload_package(project_id, package_path, folder_id, token_path)
         if not drive_file or not drive_file.get("id"):
             raise RuntimeError("Failed to upload remote render asset package to Google Drive.")
 
@@ -241,6 +325,7 @@ class RemoteDriveRenderService:
                 "asset_md5": drive_file.get("md5Checksum"),
                 "asset_web_link": drive_file.get("webViewLink"),
                 "source": "picadiri_local_app",
+                **package_fields,
             }
         )
         payload = {
@@ -286,7 +371,12 @@ class RemoteDriveRenderService:
         zip_path = None
 
         try:
-            zip_path = package_project_assets(project_id, use_subtitles=use_subtitles, resolution=resolution)
+            zip_path = package_project_assets(
+                project_id,
+                use_subtitles=use_subtitles,
+                resolution=resolution,
+                progress_callback=packaging_progress_callback(project_id),
+            )
             if not zip_path or not os.path.exists(zip_path):
                 raise RuntimeError("Failed to create remote render asset package.")
             metadata = {
@@ -1,8 +1,6 @@
 ﻿import os
 import json
 import shutil
-import zipfile
-import tempfile
 import time
 import glob
 import re
@@ -11,6 +9,7 @@ import subprocess
 from config import config
 import database as db
 from app.modes import is_shorts_mode
+from services.render_package import RenderPackage
 
 
 def _detect_nvenc(ffmpeg_exe: str) -> bool:
@@ -138,9 +137,9 @@ def _compute_image_durations(starts_or_durations, scene_count: int, audio_durati
     return durations
 
 
-def _copy_project_sfx_package(project_id: int, p_settings: dict, subs: list, image_timing_starts, temp_dir: str) -> list:
+def _add_project_sfx_package(project_id: int, p_settings: dict, subs: list, image_timing_starts, package: RenderPackage) -> list:
     try:
-        from services.sfx_service import build_render_sfx_cues, package_sfx_cues
+        from services.sfx_service import build_render_sfx_cues, plan_sfx_package
 
         cues = build_render_sfx_cues(
             p_settings,
@@ -148,7 +147,12 @@ def _copy_project_sfx_package(project_id: int, p_settings: dict, subs: list, ima
             project_id=project_id,
             image_timing_starts=image_timing_starts if isinstance(image_timing_starts, list) else None,
         )
-        return package_sfx_cues(cues, temp_dir)
+        packaged = []
+        for cue, source_path in plan_sfx_package(cues):
+            if cue['relative_path'] not in package:
+                package.add_file(source_path, cue['relative_path'])
+            packaged.append(cue)
+        return packaged
     except Exception as exc:
         print(f"[SFX] Failed to prepare SFX package: {exc}")
         return []
@@ -179,343 +183,314 @@ def _build_project_upload_metadata(project_id: int, project_obj: dict, p_setting
     }
 
 
-def package_project_assets(project_id: int, use_subtitles: bool = True, resolution: str = '1080p') -> str:
-    """Package local render inputs for remote rendering."""
-    temp_dir = tempfile.mkdtemp(prefix=f'render_pkg_{project_id}_')
-
-    try:
-        images_dir = os.path.join(temp_dir, 'images')
-        audio_dir = os.path.join(temp_dir, 'audio')
-        os.makedirs(images_dir, exist_ok=True)
-        os.makedirs(audio_dir, exist_ok=True)
-
-        images_data = db.get_image_prompts(project_id) or []
-        tts_data = db.get_tts(project_id) or {}
-        p_settings = db.get_project_settings(project_id) or {}
-        global_settings = db.get_global_setting('app_mode', 'longform')
-
-        proj_mode = p_settings.get('app_mode', global_settings)
-        is_shorts_project = is_shorts_mode(proj_mode) or p_settings.get('is_shorts') is True
-        project_aspect = '9:16' if is_shorts_project else '16:9'
-
-        audio_path = tts_data.get('audio_path')
-        if not audio_path or not os.path.exists(audio_path):
-            # [FIX] This used to silently continue with audio_filename=None,
-            # producing a package that uploads fine and only fails ~10+
-            # minutes later on the remote worker with "TTS audio file was
-            # not found." Fail fast here instead, before any Drive upload.
-            raise RuntimeError(
-                f"TTS audio file is missing on disk for project {project_id} "
-                f"(expected at: {audio_path or '(no audio_path saved)'}). "
-                "Regenerate TTS before submitting for remote render."
-            )
-        audio_filename = os.path.basename(audio_path)
-        shutil.copy2(audio_path, os.path.join(audio_dir, audio_filename))
-
-        # [FIX] Live DB is now the primary source when packaging for remote
-        # render - the timeline snapshot used to take priority and permanently
-        # locked in whatever image_url/video_url existed at the time it was
-        # written, so scenes edited/cropped afterwards were packaged as blank
-        # slots. The snapshot is now only used to fill a slot the DB can't
-        # resolve.
-        images = []
-        for img in images_data:
-            target_url = img.get('image_url') or img.get('video_url')
-            fpath = _resolve_packaged_asset_path(target_url)
-            images.append(fpath if fpath and os.path.exists(fpath) else '')
+def _render_package_path(project_id: int, filename: str) -> str:
+    zip_output_dir = os.path.join(config.OUTPUT_DIR, f'project_{project_id}')
+    os.makedirs(zip_output_dir, exist_ok=True)
+    return os.path.join(zip_output_dir, filename)
+
+
+def package_project_assets(project_id: int, use_subtitles: bool = True, resolution: str = '1080p',
+                           progress_callback=None) -> str:
+    """Package local render inputs for remote rendering.
+
+    Source files are streamed straight into the zip (services/render_package.py) -
+    no staging copy, media stored uncompressed, manifest.json with per-file sha256.
+    progress_callback(percent, message) is called while the zip is written."""
+    package = RenderPackage(_render_package_path(project_id, f'remote_render_pkg_{project_id}.zip'), progress_callback)
+
+    images_data = db.get_image_prompts(project_id) or []
+    tts_data = db.get_tts(project_id) or {}
+    p_settings = db.get_project_settings(project_id) or {}
+    global_settings = db.get_global_setting('app_mode', 'longform')
+
+    proj_mode = p_settings.get('app_mode', global_settings)
+    is_shorts_project = is_shorts_mode(proj_mode) or p_settings.get('is_shorts') is True
+    project_aspect = '9:16' if is_shorts_project else '16:9'
+
+    audio_path = tts_data.get('audio_path')
+    if not audio_path or not os.path.exists(audio_path):
+        # [FIX] This used to silently continue with audio_filename=None,
+        # producing a package that uploads fine and only fails ~10+
+        # minutes later on the remote worker with "TTS audio file was
+        # not found." Fail fast here instead, before any Drive upload.
+        raise RuntimeError(
+            f"TTS audio file is missing on disk for project {project_id} "
+            f"(expected at: {audio_path or '(no audio_path saved)'}). "
+            "Regenerate TTS before submitting for remote render."
+        )
+    audio_filename = os.path.basename(audio_path)
+    package.add_file(audio_path, f'audio/{audio_filename}')
+
+    # [FIX] Live DB is now the primary source when packaging for remote
+    # render - the timeline snapshot used to take priority and permanently
+    # locked in whatever image_url/video_url existed at the time it was
+    # written, so scenes edited/cropped afterwards were packaged as blank
+    # slots. The snapshot is now only used to fill a slot the DB can't
+    # resolve.
+    images = []
+    for img in images_data:
+        target_url = img.get('image_url') or img.get('video_url')
+        fpath = _resolve_packaged_asset_path(target_url)
+        images.append(fpath if fpath and os.path.exists(fpath) else '')
+
+    timeline_path = p_settings.get('timeline_images_path')
+    if timeline_path and os.path.exists(timeline_path):
+        try:
+            with open(timeline_path, 'r', encoding='utf-8') as f:
+                urls = json.load(f)
+            if len(urls) == len(images):
+                for idx, url in enumerate(urls):
+                    if images[idx]:
+                        continue
+                    fpath = _resolve_packaged_asset_path(url)
+                    if fpath and os.path.exists(fpath):
+                        images[idx] = fpath
+        except Exception:
+            pass
+
+    img_to_video = {}
+    for prompt in images_data:
+        v_url = prompt.get('video_url')
+        i_url = prompt.get('image_url')
+        if i_url and v_url:
+            img_to_video[os.path.basename(i_url)] = v_url
+
+    final_images_filenames = []
+    for img_path in images:
+        if not img_path:
+            final_images_filenames.append(None)
+            continue
 
-        timeline_path = p_settings.get('timeline_images_path')
-        if timeline_path and os.path.exists(timeline_path):
+        base_name = os.path.basename(img_path)
+        if base_name in img_to_video:
+            v_url = img_to_video[base_name]
+            v_path = _resolve_packaged_asset_path(v_url)
+            if v_path and os.path.exists(v_path):
+                img_path = v_path
+                base_name = os.path.basename(img_path)
+
+        package.add_file(img_path, f'images/{base_name}')
+        final_images_filenames.append(base_name)
+
+    subs = []
+    if use_subtitles:
+        db_sub_path = p_settings.get('subtitle_path')
+        if db_sub_path and os.path.exists(db_sub_path):
             try:
-                with open(timeline_path, 'r', encoding='utf-8') as f:
-                    urls = json.load(f)
-                if len(urls) == len(images):
-                    for idx, url in enumerate(urls):
-                        if images[idx]:
-                            continue
-                        fpath = _resolve_packaged_asset_path(url)
-                        if fpath and os.path.exists(fpath):
-                            images[idx] = fpath
+                with open(db_sub_path, 'r', encoding='utf-8') as f:
+                    subs = json.load(f)
             except Exception:
                 pass
-
-        img_to_video = {}
-        for prompt in images_data:
-            v_url = prompt.get('video_url')
-            i_url = prompt.get('image_url')
-            if i_url and v_url:
-                img_to_video[os.path.basename(i_url)] = v_url
-
-        final_images_filenames = []
-        for img_path in images:
-            if not img_path:
-                final_images_filenames.append(None)
-                continue
-
-            base_name = os.path.basename(img_path)
-            if base_name in img_to_video:
-                v_url = img_to_video[base_name]
-                v_path = _resolve_packaged_asset_path(v_url)
-                if v_path and os.path.exists(v_path):
-                    img_path = v_path
-                    base_name = os.path.basename(img_path)
-
-            dest_path = os.path.join(images_dir, base_name)
-            shutil.copy2(img_path, dest_path)
-            final_images_filenames.append(base_name)
-
-        subs = []
-        if use_subtitles:
-            db_sub_path = p_settings.get('subtitle_path')
-            if db_sub_path and os.path.exists(db_sub_path):
+        if not subs:
+            output_dir_local, _ = db.get_project_output_dir(project_id) if hasattr(db, 'get_project_output_dir') else (os.path.join(config.OUTPUT_DIR, f'project_{project_id}'), '')
+            saved_sub_path = os.path.join(output_dir_local, f'subtitles_{project_id}.json')
+            if os.path.exists(saved_sub_path):
                 try:
-                    with open(db_sub_path, 'r', encoding='utf-8') as f:
+                    with open(saved_sub_path, 'r', encoding='utf-8') as f:
                         subs = json.load(f)
                 except Exception:
                     pass
-            if not subs:
-                output_dir_local, _ = db.get_project_output_dir(project_id) if hasattr(db, 'get_project_output_dir') else (os.path.join(config.OUTPUT_DIR, f'project_{project_id}'), '')
-                saved_sub_path = os.path.join(output_dir_local, f'subtitles_{project_id}.json')
-                if os.path.exists(saved_sub_path):
-                    try:
-                        with open(saved_sub_path, 'r', encoding='utf-8') as f:
-                            subs = json.load(f)
-                    except Exception:
-                        pass
-        subs = _sanitize_subtitles_for_render(subs)
-
-        render_settings = dict(p_settings)
-        if render_settings.get('subtitle_bg_enabled') is None and render_settings.get('bg_enabled') is None:
-            render_settings['subtitle_bg_enabled'] = 1
-        elif render_settings.get('subtitle_bg_enabled') is None:
-            render_settings['subtitle_bg_enabled'] = render_settings.get('bg_enabled', 1)
-        if render_settings.get('bg_enabled') is None:
-            render_settings['bg_enabled'] = render_settings.get('subtitle_bg_enabled', 1)
-
-        stored_effects = []
-        effects_path = p_settings.get('image_effects_path')
-        if effects_path and os.path.exists(effects_path):
-            try:
-                with open(effects_path, 'r', encoding='utf-8') as f_eff:
-                    raw_effects = json.load(f_eff)
-                if isinstance(raw_effects, list):
-                    stored_effects = raw_effects
-            except Exception:
-                stored_effects = []
-
-        image_effects = []
-        focal_point_ys = []
-        for idx, img in enumerate(images_data):
-            scene_number = img.get('scene_number') or (idx + 1)
-            explicit_effect = p_settings.get(f'scene_{scene_number}_motion')
-            if explicit_effect:
-                image_effects.append(explicit_effect)
-            elif idx < len(stored_effects) and stored_effects[idx]:
-                image_effects.append(stored_effects[idx])
-            else:
-                image_effects.append('auto_classify')
-            try:
-                focal_point_ys.append(float(img.get('focal_point_y', 0.5) or 0.5))
-            except Exception:
-                focal_point_ys.append(0.5)
-
-        while len(image_effects) < len(final_images_filenames):
+    subs = _sanitize_subtitles_for_render(subs)
+
+    render_settings = dict(p_settings)
+    if render_settings.get('subtitle_bg_enabled') is None and render_settings.get('bg_enabled') is None:
+        render_settings['subtitle_bg_enabled'] = 1
+    elif render_settings.get('subtitle_bg_enabled') is None:
+        render_settings['subtitle_bg_enabled'] = render_settings.get('bg_enabled', 1)
+    if render_settings.get('bg_enabled') is None:
+        render_settings['bg_enabled'] = render_settings.get('subtitle_bg_enabled', 1)
+
+    stored_effects = []
+    effects_path = p_settings.get('image_effects_path')
+    if effects_path and os.path.exists(effects_path):
+        try:
+            with open(effects_path, 'r', encoding='utf-8') as f_eff:
+                raw_effects = json.load(f_eff)
+            if isinstance(raw_effects, list):
+                stored_effects = raw_effects
+        except Exception:
+            stored_effects = []
+
+    image_effects = []
+    focal_point_ys = []
+    for idx, img in enumerate(images_data):
+        scene_number = img.get('scene_number') or (idx + 1)
+        explicit_effect = p_settings.get(f'scene_{scene_number}_motion')
+        if explicit_effect:
+            image_effects.append(explicit_effect)
+        elif idx < len(stored_effects) and stored_effects[idx]:
+            image_effects.append(stored_effects[idx])
+        else:
             image_effects.append('auto_classify')
-        while len(focal_point_ys) < len(final_images_filenames):
+        try:
+            focal_point_ys.append(float(img.get('focal_point_y', 0.5) or 0.5))
+        except Exception:
             focal_point_ys.append(0.5)
 
-        image_timing_starts = None
-        tm_path = p_settings.get('image_timings_path')
-        if tm_path and os.path.exists(tm_path):
-            try:
-                with open(tm_path, 'r', encoding='utf-8') as f_tm:
-                    image_timing_starts = json.load(f_tm)
-            except Exception:
-                pass
+    while len(image_effects) < len(final_images_filenames):
+        image_effects.append('auto_classify')
+    while len(focal_point_ys) < len(final_images_filenames):
+        focal_point_ys.append(0.5)
 
-        sfx_cues = _copy_project_sfx_package(project_id, p_settings, subs, image_timing_starts, temp_dir)
+    image_timing_starts = None
+    tm_path = p_settings.get('image_timings_path')
+    if tm_path and os.path.exists(tm_path):
+        try:
+            with open(tm_path, 'r', encoding='utf-8') as f_tm:
+                image_timing_starts = json.load(f_tm)
+        except Exception:
+            pass
 
-        bg_video_url = p_settings.get('bg_video_url')
-        intro_video_path = p_settings.get('intro_video_path')
-        intro_filename = None
-        if intro_video_path and os.path.exists(intro_video_path):
-            intro_filename = os.path.basename(intro_video_path)
-            shutil.copy2(intro_video_path, os.path.join(temp_dir, intro_filename))
+    sfx_cues = _add_project_sfx_package(project_id, p_settings, subs, image_timing_starts, package)
 
-        template_overlay_filename = None
-        preset_name = render_settings.get('shorts_template_preset')
-        if preset_name:
-            try:
-                all_presets = db.get_shorts_template_presets()
-                match = next((p for p in all_presets if p['name'] == preset_name), None)
-                image_path = match.get('image_path') if match else None
-                if image_path and os.path.exists(image_path):
-                    overlays_dir = os.path.join(temp_dir, 'overlays')
-                    os.makedirs(overlays_dir, exist_ok=True)
-                    template_overlay_filename = os.path.basename(image_path)
-                    shutil.copy2(image_path, os.path.join(overlays_dir, template_overlay_filename))
-            except Exception:
-                pass
+    bg_video_url = p_settings.get('bg_video_url')
+    intro_video_path = p_settings.get('intro_video_path')
+    intro_filename = None
+    if intro_video_path and os.path.exists(intro_video_path):
+        intro_filename = os.path.basename(intro_video_path)
+        package.add_file(intro_video_path, intro_filename)
 
-        from services.auth_service import auth_service
-        project_obj = db.get_project(project_id) or {}
-        project_name = project_obj.get('name', f'Project {project_id}')
-        project_upload_metadata = _build_project_upload_metadata(project_id, project_obj, p_settings)
-
-        thumbnail_filename = None
-        thumbnail_url = p_settings.get('thumbnail_url') or p_settings.get('thumbnail_path')
-        thumbnail_local_path = _resolve_packaged_asset_path(thumbnail_url) if thumbnail_url else None
-        if thumbnail_local_path and os.path.exists(thumbnail_local_path):
-            thumb_ext = os.path.splitext(thumbnail_local_path)[1] or '.png'
-            thumbnail_filename = f"thumbnail{thumb_ext.lower()}"
-            shutil.copy2(thumbnail_local_path, os.path.join(temp_dir, thumbnail_filename))
-
-        metadata = {
-            'project_id': project_id,
-            'project_name': project_name,
-            'email': auth_service.get_user_email() or 'unknown',
-            'use_subtitles': use_subtitles,
-            'resolution': resolution,
-            'aspect_ratio': project_aspect,
-            'audio_filename': audio_filename,
-            'audio_duration': tts_data.get('duration'),
-            'images': final_images_filenames,
-            'subtitles': subs,
-            'render_settings': render_settings,
-            'image_timing_starts': image_timing_starts,
-            'image_effects': image_effects,
-            'sfx_cues': sfx_cues,
-            'focal_point_ys': focal_point_ys,
-            'bg_video_url': bg_video_url,
-            'intro_filename': intro_filename,
-            'template_overlay_filename': template_overlay_filename,
-            'content_aspect_ratio': p_settings.get('aspect_ratio'),
-            'app_mode': proj_mode,
-            'thumbnail_filename': thumbnail_filename,
-            'project_upload_metadata': project_upload_metadata,
-        }
-
-        with open(os.path.join(temp_dir, 'config.json'), 'w', encoding='utf-8') as f_conf:
-            json.dump(metadata, f_conf, ensure_ascii=False, indent=4)
-
-        zip_output_dir = os.path.join(config.OUTPUT_DIR, f'project_{project_id}')
-        os.makedirs(zip_output_dir, exist_ok=True)
-        zip_path = os.path.join(zip_output_dir, f'remote_render_pkg_{project_id}.zip')
-
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, temp_dir)
-                    zipf.write(file_path, rel_path)
-
-        return zip_path
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-def package_music_project_assets(project_id: int, track_file_paths, playlist_title: str = "", resolution: str = "1080p") -> str:
-    """Package longform-music playlist assets for remote rendering."""
-    temp_dir = tempfile.mkdtemp(prefix=f'music_render_pkg_{project_id}_')
+    template_overlay_filename = None
+    preset_name = render_settings.get('shorts_template_preset')
+    if preset_name:
+        try:
+            all_presets = db.get_shorts_template_presets()
+            match = next((p for p in all_presets if p['name'] == preset_name), None)
+            image_path = match.get('image_path') if match else None
+            if image_path and os.path.exists(image_path):
+                template_overlay_filename = os.path.basename(image_path)
+                package.add_file(image_path, f'overlays/{template_overlay_filename}')
+        except Exception:
+            pass
+
+    from services.auth_service import auth_service
+    project_obj = db.get_project(project_id) or {}
+    project_name = project_obj.get('name', f'Project {project_id}')
+    project_upload_metadata = _build_project_upload_metadata(project_id, project_obj, p_settings)
+
+    thumbnail_filename = None
+    thumbnail_url = p_settings.get('thumbnail_url') or p_settings.get('thumbnail_path')
+    thumbnail_local_path = _resolve_packaged_asset_path(thumbnail_url) if thumbnail_url else None
+    if thumbnail_local_path and os.path.exists(thumbnail_local_path):
+        thumb_ext = os.path.splitext(thumbnail_local_path)[1] or '.png'
+        thumbnail_filename = f"thumbnail{thumb_ext.lower()}"
+        package.add_file(thumbnail_local_path, thumbnail_filename)
+
+    metadata = {
+        'project_id': project_id,
+        'project_name': project_name,
+        'email': auth_service.get_user_email() or 'unknown',
+        'use_subtitles': use_subtitles,
+        'resolution': resolution,
+        'aspect_ratio': project_aspect,
+        'audio_filename': audio_filename,
+        'audio_duration': tts_data.get('duration'),
+        'images': final_images_filenames,
+        'subtitles': subs,
+        'render_settings': render_settings,
+        'image_timing_starts': image_timing_starts,
+        'image_effects': image_effects,
+        'sfx_cues': sfx_cues,
+        'focal_point_ys': focal_point_ys,
+        'bg_video_url': bg_video_url,
+        'intro_filename': intro_filename,
+        'template_overlay_filename': template_overlay_filename,
+        'content_aspect_ratio': p_settings.get('aspect_ratio'),
+        'app_mode': proj_mode,
+        'thumbnail_filename': thumbnail_filename,
+        'project_upload_metadata': project_upload_metadata,
+    }
 
-    try:
-        audio_dir = os.path.join(temp_dir, 'audio')
-        os.makedirs(audio_dir, exist_ok=True)
-
-        p_settings = db.get_project_settings(project_id) or {}
-        project_obj = db.get_project(project_id) or {}
-        output_title = (
-            playlist_title
-            or p_settings.get("title")
-            or p_settings.get("playlist_title")
-            or project_obj.get("topic")
-            or project_obj.get("name")
-            or f"Project {project_id}"
-        )
+    package.add_json('config.json', metadata)
+    package.build()
+    return package.zip_path
+
+
+def package_music_project_assets(project_id: int, track_file_paths, playlist_title: str = "", resolution: str = "1080p",
+                                 progress_callback=None) -> str:
+    """Package longform-music playlist assets for remote rendering (streamed, see package_project_assets)."""
+    package = RenderPackage(_render_package_path(project_id, f'remote_music_render_pkg_{project_id}.zip'), progress_callback)
+
+    p_settings = db.get_project_settings(project_id) or {}
+    project_obj = db.get_project(project_id) or {}
+    output_title = (
+        playlist_title
+        or p_settings.get("title")
+        or p_settings.get("playlist_title")
+        or project_obj.get("topic")
+        or project_obj.get("name")
+        or f"Project {project_id}"
+    )
+
+    track_entries = []
+    for index, raw_path in enumerate(track_file_paths or []):
+        local_path = _resolve_packaged_asset_path(raw_path)
+        if not local_path or not os.path.exists(local_path):
+            continue
+        ext = os.path.splitext(local_path)[1].lower() or ".mp3"
+        filename = f"track_{index:02d}{ext}"
+        package.add_file(local_path, f'audio/{filename}')
+        track_entries.append({
+            "filename": filename,
+            "source_path": raw_path,
+            "title": f"Track {index + 1:02d}",
+        })
+
+    if not track_entries:
+        raise RuntimeError("No generated music tracks were found for remote rendering.")
+
+    cover_filename = None
+    cover_path = _resolve_packaged_asset_path(p_settings.get("template_image_url") or p_settings.get("thumbnail_url"))
+    if cover_path and os.path.exists(cover_path):
+        cover_filename = f"cover{os.path.splitext(cover_path)[1].lower() or '.jpg'}"
+        package.add_file(cover_path, cover_filename)
+
+    background_filename = None
+    background_path = _resolve_packaged_asset_path(p_settings.get("background_video_url"))
+    if background_path and os.path.exists(background_path):
+        background_filename = f"background{os.path.splitext(background_path)[1].lower()}"
+        package.add_file(background_path, background_filename)
+
+    intro_filename = None
+    intro_path = p_settings.get("intro_video_path")
+    if intro_path and os.path.exists(intro_path):
+        intro_filename = f"intro{os.path.splitext(intro_path)[1].lower() or '.mp4'}"
+        package.add_file(intro_path, intro_filename)
+
+    intro_bgm_filename = None
+    intro_bgm_path = _resolve_packaged_asset_path(p_settings.get("intro_bgm_path"))
+    if intro_bgm_path and os.path.exists(intro_bgm_path):
+        intro_bgm_filename = f"intro_bgm{os.path.splitext(intro_bgm_path)[1].lower() or '.mp3'}"
+        package.add_file(intro_bgm_path, intro_bgm_filename)
+
+    thumbnail_filename = None
+    thumbnail_path = _resolve_packaged_asset_path(p_settings.get("thumbnail_url"))
+    if thumbnail_path and os.path.exists(thumbnail_path):
+        thumbnail_filename = f"thumbnail{os.path.splitext(thumbnail_path)[1].lower() or '.jpg'}"
+        package.add_file(thumbnail_path, thumbnail_filename)
+
+    metadata = {
+        'project_id': project_id,
+        'project_name': project_obj.get('name') or f'Project {project_id}',
+        'playlist_title': output_title,
+        'resolution': resolution,
+        'aspect_ratio': '16:9',
+        'app_mode': 'longform_music',
+        'render_style': 'music_playlist',
+        'track_entries': track_entries,
+        'cover_filename': cover_filename,
+        'background_filename': background_filename,
+        'intro_filename': intro_filename,
+        'intro_bgm_filename': intro_bgm_filename,
+        'intro_bgm_prompt': p_settings.get("intro_bgm_prompt"),
+        'intro_video_prompt': p_settings.get("intro_video_prompt"),
+        'thumbnail_filename': thumbnail_filename,
+        'project_upload_metadata': _build_project_upload_metadata(project_id, project_obj, p_settings),
+    }
 
-        track_entries = []
-        for index, raw_path in enumerate(track_file_paths or []):
-            local_path = _resolve_packaged_asset_path(raw_path)
-            if not local_path or not os.path.exists(local_path):
-                continue
-            ext = os.path.splitext(local_path)[1].lower() or ".mp3"
-            filename = f"track_{index:02d}{ext}"
-            shutil.copy2(local_path, os.path.join(audio_dir, filename))
-            track_entries.append({
-                "filename": filename,
-                "source_path": raw_path,
-                "title": f"Track {index + 1:02d}",
-            })
-
-        if not track_entries:
-            raise RuntimeError("No generated music tracks were found for remote rendering.")
-
-        cover_filename = None
-        cover_path = _resolve_packaged_asset_path(p_settings.get("template_image_url") or p_settings.get("thumbnail_url"))
-        if cover_path and os.path.exists(cover_path):
-            cover_filename = f"cover{os.path.splitext(cover_path)[1].lower() or '.jpg'}"
-            shutil.copy2(cover_path, os.path.join(temp_dir, cover_filename))
-
-        background_filename = None
-        background_path = _resolve_packaged_asset_path(p_settings.get("background_video_url"))
-        if background_path and os.path.exists(background_path):
-            background_filename = f"background{os.path.splitext(background_path)[1].lower()}"
-            shutil.copy2(background_path, os.path.join(temp_dir, background_filename))
-
-        intro_filename = None
-        intro_path = p_settings.get("intro_video_path")
-        if intro_path and os.path.exists(intro_path):
-            intro_filename = f"intro{os.path.splitext(intro_path)[1].lower() or '.mp4'}"
-            shutil.copy2(intro_path, os.path.join(temp_dir, intro_filename))
-
-        intro_bgm_filename = None
-        intro_bgm_path = _resolve_packaged_asset_path(p_settings.get("intro_bgm_path"))
-        if intro_bgm_path and os.path.exists(intro_bgm_path):
-            intro_bgm_filename = f"intro_bgm{os.path.splitext(intro_bgm_path)[1].lower() or '.mp3'}"
-            shutil.copy2(intro_bgm_path, os.path.join(temp_dir, intro_bgm_filename))
-
-        thumbnail_filename = None
-        thumbnail_path = _resolve_packaged_asset_path(p_settings.get("thumbnail_url"))
-        if thumbnail_path and os.path.exists(thumbnail_path):
-            thumbnail_filename = f"thumbnail{os.path.splitext(thumbnail_path)[1].lower() or '.jpg'}"
-            shutil.copy2(thumbnail_path, os.path.join(temp_dir, thumbnail_filename))
-
-        metadata = {
-            'project_id': project_id,
-            'project_name': project_obj.get('name') or f'Project {project_id}',
-            'playlist_title': output_title,
-            'resolution': resolution,
-            'aspect_ratio': '16:9',
-            'app_mode': 'longform_music',
-            'render_style': 'music_playlist',
-            'track_entries': track_entries,
-            'cover_filename': cover_filename,
-            'background_filename': background_filename,
-            'intro_filename': intro_filename,
-            'intro_bgm_filename': intro_bgm_filename,
-            'intro_bgm_prompt': p_settings.get("intro_bgm_prompt"),
-            'intro_video_prompt': p_settings.get("intro_video_prompt"),
-            'thumbnail_filename': thumbnail_filename,
-            'project_upload_metadata': _build_project_upload_metadata(project_id, project_obj, p_settings),
-        }
-
-        with open(os.path.join(temp_dir, 'config.json'), 'w', encoding='utf-8') as f_conf:
-            json.dump(metadata, f_conf, ensure_ascii=False, indent=4)
-
-        zip_output_dir = os.path.join(config.OUTPUT_DIR, f'project_{project_id}')
-        os.makedirs(zip_output_dir, exist_ok=True)
-        zip_path = os.path.join(zip_output_dir, f'remote_music_render_pkg_{project_id}.zip')
-
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, _dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, temp_dir)
-                    zipf.write(file_path, rel_path)
-
-        return zip_path
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    package.add_json('config.json', metadata)
+    package.build()
+    return package.zip_path
 
 
 def remote_render_executor_func(task_id: str, temp_dir: str, use_gpu: bool = False):
@@ -0,0 +1,337 @@
+"""
+원격 렌더 패키지 델타 전송 (콘텐츠 주소 blob 저장소)
+
+Drive 렌더 큐에 제출할 때마다 패키지 zip 전체를 올리고, 원격 워커(remote_drive_worker.py)는
+매번 zip 전체를 받아 풀었다. 씬 이미지 한 장만 고친 재제출도 수백 MB를 주고받았다.
+
+이제 패키지는 "매니페스트 + blob"으로 전송된다.
+- 파일 내용은 sha256 이름의 blob으로 BlobStore(Drive 폴더 등)에 한 번만 올라간다.
+- 제출 측(publish_package)은 RenderPackage zip의 manifest.json을 읽어 저장소에 없는 blob만 올리고,
+  각 파일의 blob 참조(ref)를 붙인 매니페스트를 큐의 asset 파일로 올린다.
+- 워커 측(materialize_package)은 로컬 BlobCache에 없는 blob만 받아 sha256을 검증한 뒤
+  작업 폴더에 파일을 배치한다. 캐시는 최근 사용 순으로 max_bytes까지 유지한다.
+- 저장소 blob은 수정 시각 기준 TTL(REMOTE_RENDER_BLOB_TTL_DAYS)로 정리한다(sweep). 제출 때 재사용한
+  blob은 TTL의 절반이 지났으면 수정 시각을 갱신(keep_alive)하므로, 제출된 작업의 blob은 그 뒤로
+  최소 TTL/2 동안 남아 있다.
+"""
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from typing import Callable, Optional
+
+from services.render_package import CHUNK_SIZE, read_manifest
+
+BLOB_MANIFEST_FORMAT = 'air_render_blobs_v1'
+BLOB_FOLDER_NAME = 'air_render_blobs'
+DEFAULT_BLOB_TTL_DAYS = 14
+
+
+def blob_ttl_seconds() -> float:
+    try:
+        days = float(os.getenv('REMOTE_RENDER_BLOB_TTL_DAYS', DEFAULT_BLOB_TTL_DAYS) or DEFAULT_BLOB_TTL_DAYS)
+    except ValueError:
+        days = DEFAULT_BLOB_TTL_DAYS
+    return days * 86400
+
+
+def _rfc3339_epoch(value) -> float:
+    try:
+        return datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f_in:
+        for chunk in iter(lambda: f_in.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """blob 저장소 인터페이스. ref는 저장소가 정하는 문자열 (Drive file id, 파일 경로 등)."""
+
+    def lookup(self, digests) -> dict:
+        """{digest: ref} — 이미 저장된 blob만"""
+        raise NotImplementedError
+
+    def put(self, digest: str, stream, size: int) -> str:
+        raise NotImplementedError
+
+    def fetch(self, digest: str, ref: str, dest_path: str):
+        raise NotImplementedError
+
+    def keep_alive(self, refs: dict, max_age_seconds: float):
+        """재사용한 blob({digest: ref})이 sweep에 지워지지 않도록 수정 시각을 갱신한다 (TTL/2가 지난 것만)."""
+
+    def sweep(self, max_age_seconds: float, now: Optional[float] = None) -> int:
+        """수정된 지 max_age_seconds가 넘은 blob을 지우고 지운 개수를 반환한다."""
+        return 0
+
+
+class DriveBlobStore(BlobStore):
+    """Google Drive 폴더 하나에 blob을 sha256 파일명으로 저장한다."""
+
+    def __init__(self, folder_id: str, token_path=None):
+        self.folder_id = folder_id
+        self.token_path = token_path
+        self._modified = {}  # lookup에서 본 digest -> 수정 시각(epoch)
+
+    @classmethod
+    def ensure(cls, parent_folder_id=None, token_path=None) -> 'DriveBlobStore':
+        from services.google_drive_service import google_drive_service
+
+        folder = google_drive_service.ensure_folder(BLOB_FOLDER_NAME, token_path=token_path,
+                                                    parent_folder_id=parent_folder_id)
+        if not folder or not folder.get('id'):
+            raise RuntimeError('Failed to prepare the render blob folder on Google Drive.')
+        return cls(folder['id'], token_path=token_path)
+
+    def lookup(self, digests) -> dict:
+        from services.google_drive_service import google_drive_service
+
+        found = google_drive_service.find_files_by_names(digests, token_path=self.token_path, folder_id=self.folder_id)
+        self._modified.update({name: _rfc3339_epoch(item.get('modifiedTime')) for name, item in found.items()})
+        return {name: item['id'] for name, item in found.items()}
+
+    def put(self, digest: str, stream, size: int) -> str:
+        from services.google_drive_service import google_drive_service
+
+        uploaded = google_drive_service.upload_stream(stream, digest, token_path=self.token_path,
+                                                      folder_id=self.folder_id)
+        if not uploaded or not uploaded.get('id'):
+            raise RuntimeError(f'Failed to upload render blob {digest[:12]} to Google Drive.')
+        return uploaded['id']
+
+    def fetch(self, digest: str, ref: str, dest_path: str):
+        from services.google_drive_service import google_drive_service
+
+        if not google_drive_service.download_file(ref, dest_path, token_path=self.token_path):
+            raise RuntimeError(f'Failed to download render blob {digest[:12]} from Google Drive.')
+
+    def keep_alive(self, refs: dict, max_age_seconds: float):
+        from services.google_drive_service import google_drive_service
+
+        cutoff = time.time() - max_age_seconds / 2
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat().replace('+00:00', 'Z')
+        for digest, ref in refs.items():
+            if self._modified.get(digest, 0) < cutoff:
+                google_drive_service.touch_file(ref, now, token_path=self.token_path)
+                self._modified[digest] = time.time()
+
+    def sweep(self, max_age_seconds: float, now: Optional[float] = None) -> int:
+        from services.google_drive_service import google_drive_service
+
+        cutoff = (now or time.time()) - max_age_seconds
+        stale = [item['id'] for item in google_drive_service.iter_folder_files(self.folder_id, token_path=self.token_path)
+                 if _rfc3339_epoch(item.get('modifiedTime')) < cutoff]
+        for file_id in stale:
+            google_drive_service.delete_file(file_id, token_path=self.token_path)
+        return len(stale)
+
+
+class LocalDirBlobStore(BlobStore):
+    """공유 폴더(NAS 등)나 테스트용 — root/ab/abcdef... 로 저장한다."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def lookup(self, digests) -> dict:
+        return {digest: self._path(digest) for digest in digests if os.path.exists(self._path(digest))}
+
+    def put(self, digest: str, stream, size: int) -> str:
+        path = self._path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        part_path = f'{path}.{os.getpid()}.part'
+        with open(part_path, 'wb') as f_out:
+            shutil.copyfileobj(stream, f_out, CHUNK_SIZE)
+        os.replace(part_path, path)
+        return path
+
+    def fetch(self, digest: str, ref: str, dest_path: str):
+        shutil.copyfile(ref, dest_path)
+
+    def keep_alive(self, refs: dict, max_age_seconds: float):
+        cutoff = time.time() - max_age_seconds / 2
+        for path in refs.values():
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.utime(path, None)
+            except OSError:
+                pass
+
+    def sweep(self, max_age_seconds: float, now: Optional[float] = None) -> int:
+        cutoff = (now or time.time()) - max_age_seconds
+        removed = 0
+        for dirpath, _dirs, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+def publish_package(zip_path: str, store: BlobStore,
+                    progress_callback: Optional[Callable[[int, str], None]] = None) -> tuple:
+    """RenderPackage zip의 blob 중 저장소에 없는 것만 올린다.
+
+    (ref가 붙은 매니페스트, {'uploaded_bytes', 'reused_bytes', 'uploaded_files', 'reused_files'}) 반환.
+    manifest.json이 없는 (예전 방식) zip이면 ValueError."""
+    manifest = read_manifest(zip_path)
+    if not manifest:
+        raise ValueError(f'Render package has no manifest: {zip_path}')
+    files = manifest.get('files') or []
+    refs = store.lookup({entry['sha256'] for entry in files})
+    store.keep_alive(dict(refs), blob_ttl_seconds())
+    missing = [entry for entry in files if entry['sha256'] not in refs]
+    stats = {
+        'uploaded_bytes': 0,
+        'reused_bytes': sum(entry['size'] for entry in files if entry['sha256'] in refs),
+        'uploaded_files': 0,
+        'reused_files': len(files) - len(missing),
+    }
+    missing_total = sum(entry['size'] for entry in missing) or 1
+
+    with zipfile.ZipFile(zip_path, 'r') as zipf:
+        for entry in missing:
+            if entry['sha256'] in refs:  # 같은 내용의 파일이 패키지 안에 두 번
+                stats['reused_bytes'] += entry['size']
+                stats['reused_files'] += 1
+                continue
+            with zipf.open(entry['path']) as member:
+                refs[entry['sha256']] = store.put(entry['sha256'], member, entry['size'])
+            stats['uploaded_bytes'] += entry['size']
+            stats['uploaded_files'] += 1
+            if progress_callback:
+                progress_callback(min(100, int(stats['uploaded_bytes'] * 100 / missing_total)),
+                                  f"에셋 업로드 중... {entry['path']}")
+
+    published = dict(manifest, format=BLOB_MANIFEST_FORMAT,
+                     files=[dict(entry, ref=refs[entry['sha256']]) for entry in files])
+    return published, stats
+
+
+class BlobCache:
+    """워커 로컬 blob 캐시. 사용할 때마다 mtime을 갱신하고, trim()이 오래된 것부터 지운다."""
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def get(self, digest: str) -> Optional[str]:
+        path = self.path(digest)
+        if not os.path.exists(path):
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return path
+
+    def fetch_into(self, digest: str, ref: str, store: BlobStore) -> str:
+        """저장소에서 받아 sha256을 검증한 뒤 캐시에 넣는다."""
+        path = self.path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, part_path = tempfile.mkstemp(prefix=f'{digest[:12]}_', suffix='.part', dir=os.path.dirname(path))
+        os.close(fd)
+        try:
+            store.fetch(digest, ref, part_path)
+            actual = _sha256_file(part_path)
+            if actual != digest:
+                raise RuntimeError(f'Render blob hash mismatch: expected {digest[:12]}, got {actual[:12]}')
+            os.replace(part_path, path)
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        return path
+
+    def trim(self, keep=()):
+        """max_bytes를 넘으면 오래 안 쓴 blob부터 지운다 (`keep`은 제외)."""
+        keep = set(keep)
+        blobs = []
+        total = 0
+        for dirpath, _dirs, files in os.walk(self.root):
+            for name in files:
+                if name.endswith('.part'):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                total += stat.st_size
+                blobs.append((stat.st_mtime, stat.st_size, name, path))
+        for _mtime, size, name, path in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            if name in keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+def materialize_package(manifest: dict, dest_dir: str, store: BlobStore, cache: BlobCache,
+                        progress_callback: Optional[Callable[[int, str], None]] = None) -> dict:
+    """매니페스트의 파일을 dest_dir에 배치한다. 캐시에 없는 blob만 저장소에서 받는다.
+
+    {'downloaded_bytes', 'cached_bytes', 'downloaded_files', 'cached_files'} 반환."""
+    if manifest.get('format') != BLOB_MANIFEST_FORMAT:
+        raise ValueError(f"Unsupported render package manifest format: {manifest.get('format')}")
+    files = manifest.get('files') or []
+    stats = {'downloaded_bytes': 0, 'cached_bytes': 0, 'downloaded_files': 0, 'cached_files': 0}
+    total = sum(entry['size'] for entry in files) or 1
+    done = 0
+    dest_root = os.path.abspath(dest_dir)
+    for entry in files:
+        dest_path = os.path.abspath(os.path.join(dest_root, *entry['path'].split('/')))
+        if os.path.commonpath([dest_root, dest_path]) != dest_root:
+            raise ValueError(f"Render package path escapes the work dir: {entry['path']}")
+        blob_path = cache.get(entry['sha256'])
+        if blob_path:
+            stats['cached_bytes'] += entry['size']
+            stats['cached_files'] += 1
+        else:
+            blob_path = cache.fetch_into(entry['sha256'], entry['ref'], store)
+            stats['downloaded_bytes'] += entry['size']
+            stats['downloaded_files'] += 1
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        shutil.copyfile(blob_path, dest_path)
+        done += entry['size']
+        if progress_callback:
+            progress_callback(min(100, int(done * 100 / total)), f"에셋 준비 중... {entry['path']}")
+    cache.trim(keep={entry['sha256'] for entry in files})
+    return stats
+
+
+def default_blob_cache() -> BlobCache:
+    from config import config
+
+    root = os.getenv('REMOTE_RENDER_BLOB_CACHE_DIR') or os.path.join(config.LOCAL_APP_DATA_DIR, 'render_blob_cache')
+    max_gb = float(os.getenv('REMOTE_RENDER_BLOB_CACHE_MAX_GB', '20') or 20)
+    return BlobCache(root, int(max_gb * 1024 ** 3))
+
+
+def write_manifest_file(manifest: dict, path: str) -> str:
+    with open(path, 'w', encoding='utf-8') as f_out:
+        json.dump(manifest, f_out, ensure_ascii=False, indent=2)
+    return path
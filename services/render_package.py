@@ -0,0 +1,140 @@
+"""
+원격 렌더 패키지(zip) 스트리밍 빌더
+
+package_project_assets / package_music_project_assets는 이미지·오디오·인트로·썸네일을
+전부 임시 폴더에 shutil.copy2로 복사한 뒤 그 폴더를 다시 읽어 ZIP_DEFLATED로 압축했다.
+MP3/MP4/PNG/JPEG는 거의 줄지 않으므로 패키지 하나마다 전체 복사 2번 + 헛된 DEFLATE CPU가 들었다.
+
+RenderPackage는 원본 파일을 zip 엔트리로 바로 흘려 쓴다 (중간 복사 없음).
+- 이미 압축된 미디어는 ZIP_STORED, JSON/텍스트만 ZIP_DEFLATED
+- 쓰는 동안 sha256을 함께 계산해 manifest.json(경로·크기·해시)을 마지막 엔트리로 기록
+- progress_callback(percent, message)로 진행률(바이트 기준) 보고
+- <zip>.part에 쓴 뒤 완료 시 os.replace — 실패해도 반쪽짜리 zip이 남지 않는다
+"""
+import hashlib
+import json
+import os
+import zipfile
+from typing import Callable, Optional
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+# 이 확장자만 DEFLATE — 나머지(영상·오디오·이미지)는 이미 압축돼 있어 STORED로 담는다
+DEFLATE_EXTENSIONS = {'.json', '.txt', '.srt', '.vtt', '.ass', '.csv', '.xml', '.md'}
+
+
+def compress_type_for(arcname: str) -> int:
+    ext = os.path.splitext(arcname)[1].lower()
+    return zipfile.ZIP_DEFLATED if ext in DEFLATE_EXTENSIONS else zipfile.ZIP_STORED
+
+
+class RenderPackage:
+    """엔트리를 모아 두었다가 build()에서 한 번에 zip으로 쓴다.
+
+    같은 arcname을 다시 추가하면 나중 것이 이긴다 (임시 폴더에 copy2로 덮어쓰던 기존 동작과 동일)."""
+
+    def __init__(self, zip_path: str, progress_callback: Optional[Callable[[int, str], None]] = None):
+        self.zip_path = zip_path
+        self.progress_callback = progress_callback
+        self._entries: dict = {}  # arcname -> 원본 파일 경로(str) 또는 bytes
+        self._done = 0
+        self._total = 0
+        self._last_percent = -1
+
+    def add_file(self, src_path: str, arcname: str) -> str:
+        arcname = arcname.replace(os.sep, '/')
+        self._entries[arcname] = os.fspath(src_path)
+        return arcname
+
+    def add_json(self, arcname: str, data) -> str:
+        arcname = arcname.replace(os.sep, '/')
+        self._entries[arcname] = json.dumps(data, ensure_ascii=False, indent=4).encode('utf-8')
+        return arcname
+
+    def __contains__(self, arcname: str) -> bool:
+        return arcname in self._entries
+
+    def build(self) -> dict:
+        """zip을 쓰고 manifest(dict)를 반환한다."""
+        if MANIFEST_NAME in self._entries:
+            raise ValueError(f'{MANIFEST_NAME} is reserved for the package manifest')
+        self._total = sum(
+            len(source) if isinstance(source, bytes) else os.path.getsize(source)
+            for source in self._entries.values()
+        )
+        self._done = 0
+        self._report(f'렌더 패키지 작성 중... (0/{len(self._entries)})')
+
+        part_path = self.zip_path + '.part'
+        files = []
+        try:
+            with zipfile.ZipFile(part_path, 'w', allowZip64=True) as zipf:
+                for index, (arcname, source) in enumerate(self._entries.items(), start=1):
+                    if isinstance(source, bytes):
+                        files.append(self._write_bytes(zipf, arcname, source))
+                    else:
+                        files.append(self._write_file(zipf, arcname, source))
+                    self._report(f'렌더 패키지 작성 중... ({index}/{len(self._entries)})')
+                manifest = {
+                    'version': MANIFEST_VERSION,
+                    'total_size': self._total,
+                    'files': files,
+                }
+                zipf.writestr(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2),
+                              compress_type=zipfile.ZIP_DEFLATED)
+            os.replace(part_path, self.zip_path)
+        except BaseException:
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            raise
+        return manifest
+
+    def _write_file(self, zipf: zipfile.ZipFile, arcname: str, src_path: str) -> dict:
+        zinfo = zipfile.ZipInfo.from_file(src_path, arcname)
+        zinfo.compress_type = compress_type_for(arcname)
+        digest = hashlib.sha256()
+        size = 0
+        with open(src_path, 'rb') as f_src, \
+                zipf.open(zinfo, 'w', force_zip64=zinfo.file_size >= zipfile.ZIP64_LIMIT) as f_dst:
+            while True:
+                chunk = f_src.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                f_dst.write(chunk)
+                size += len(chunk)
+                self._advance(len(chunk), arcname)
+        return {'path': arcname, 'size': size, 'sha256': digest.hexdigest()}
+
+    def _write_bytes(self, zipf: zipfile.ZipFile, arcname: str, data: bytes) -> dict:
+        zipf.writestr(arcname, data, compress_type=compress_type_for(arcname))
+        self._advance(len(data), arcname)
+        return {'path': arcname, 'size': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+
+    def _advance(self, nbytes: int, arcname: str):
+        self._done += nbytes
+        self._report(f'렌더 패키지 작성 중... {arcname}')
+
+    def _report(self, message: str):
+        if not self.progress_callback:
+            return
+        percent = 100 if not self._total else min(100, int(self._done * 100 / self._total))
+        if percent == self._last_percent:
+            return
+        self._last_percent = percent
+        try:
+            self.progress_callback(percent, message)
+        except Exception as e:
+            print(f"[RenderPackage] 진행률 콜백 에러: {e}")
+
+
+def read_manifest(zip_path: str) -> Optional[dict]:
+    """패키지의 manifest.json (이 빌더 이전에 만든 패키지면 None)."""
+    with zipfile.ZipFile(zip_path, 'r') as zipf:
+        try:
+            return json.loads(zipf.read(MANIFEST_NAME).decode('utf-8'))
+        except KeyError:
+            return None
@@ -6,6 +6,8 @@ import json
 import requests
 import datetime
 
+from services.event_bus import RENDER_QUEUE, event_bus
+
 class RenderQueueWorker:
     def __init__(self):
         self.task_queue = queue.Queue()
@@ -36,6 +38,16 @@ class RenderQueueWorker:
         self.start()
         
     def _update_supabase_status(self, task_id: str, project_id: int, project_name: str, email: str, status: str, progress: int, message: str):
+        # 로컬 구독자(/api/events, 트레이)에는 Supabase 설정 여부와 관계없이 즉시 푸시
+        event_bus.publish(RENDER_QUEUE, {
+            "task_id": task_id,
+            "project_id": project_id,
+            "project_name": project_name,
+            "status": status,
+            "progress": progress,
+            "message": message,
+        }, key=task_id)
+
         supabase_url = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
         supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
         if not supabase_url or not supabase_key:
@@ -0,0 +1,173 @@
+"""
+로컬 로그 보관 정리 (retention)
+
+ai_generation_logs / project_learning_events / project_learning_snapshots는
+데스크톱 설치마다 끝없이 쌓여 WAL, 백업, ensure_local_db_migrated 복사를 느리게 한다.
+테이블별 보관 기간(일)보다 오래되고 원격 동기화가 끝난 row를
+    <DB 폴더>/archive/<table>-<YYYY-MM>.jsonl.gz
+에 gzip JSONL로 옮긴 뒤 라이브 테이블에서 배치 단위로 삭제한다.
+아카이브 파일을 fsync 한 다음에만 삭제하므로 중간에 죽어도 row가 사라지지 않는다
+(최악의 경우 같은 row가 아카이브에 두 번 기록되며, 각 줄의 id로 구분할 수 있다).
+remote_synced_at이 비어 있는 row는 삭제하지 않는다. 단 ai_generation_logs는 원격 push를
+재시도하지 않으므로, 사용량이 ai_log_rollups에 집계된 row면 미동기화여도 정리한다.
+
+정리 후에는 database.run_db_maintenance()로 PRAGMA optimize와 incremental vacuum을 실행한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+import traceback
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import database as db
+from config import config
+
+ARCHIVE_DIR_NAME = "archive"
+DEFAULT_BATCH_SIZE = 500
+# 한 번의 실행에서 테이블당 처리할 최대 배치 수 (긴 쓰기 점유 방지)
+DEFAULT_MAX_BATCHES = 20
+
+# 테이블별 보관 기간 설정 키
+RETENTION_POLICY_KEYS = {
+    "ai_generation_logs": ("RETENTION_AI_LOG_DAYS", 90),
+    "project_learning_events": ("RETENTION_LEARNING_EVENT_DAYS", 180),
+    "project_learning_snapshots": ("RETENTION_LEARNING_SNAPSHOT_DAYS", 180),
+}
+
+
+def get_retention_policies() -> Dict[str, int]:
+    """테이블 -> 보관 일수 (0 이하면 정리 안 함)"""
+    policies = {}
+    for table, (key, default) in RETENTION_POLICY_KEYS.items():
+        try:
+            policies[table] = int(getattr(config, key, default))
+        except (TypeError, ValueError):
+            policies[table] = default
+    return policies
+
+
+def get_archive_dir() -> Path:
+    return Path(db.get_db_path()).parent / ARCHIVE_DIR_NAME
+
+
+def _cutoff(days: int, now: Optional[datetime] = None) -> str:
+    # created_at은 SQLite CURRENT_TIMESTAMP(UTC) 형식
+    now = now or datetime.now(timezone.utc)
+    return (now - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _archive_rows(table: str, rows: List[Dict[str, Any]]) -> None:
+    """row를 생성 월별 gzip JSONL에 추가 기록 후 fsync"""
+    archive_dir = get_archive_dir()
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    by_month: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        month = str(row.get("created_at") or "")[:7] or "unknown"
+        by_month.setdefault(month, []).append(row)
+
+    for month, month_rows in by_month.items():
+        path = archive_dir / f"{table}-{month}.jsonl.gz"
+        # gzip 멤버를 이어붙이는 방식이라 기존 파일을 다시 쓰지 않는다 (gzip.open으로 그대로 읽힘)
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as gz:
+                for row in month_rows:
+                    gz.write((json.dumps(row, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+
+
+def read_archive(table: str, month: str) -> List[Dict[str, Any]]:
+    """아카이브 파일 한 개를 읽어 row 리스트로 반환 (복구/감사용)"""
+    path = get_archive_dir() / f"{table}-{month}.jsonl.gz"
+    if not path.exists():
+        return []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def archive_table(
+    table: str,
+    days: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: int = DEFAULT_MAX_BATCHES,
+    now: Optional[datetime] = None,
+) -> Dict[str, int]:
+    """보관 기간이 지난 정리 대상 row를 배치 단위로 아카이브 후 삭제"""
+    result = {"archived": 0, "deleted": 0, "batches": 0}
+    if days <= 0:
+        return result
+    cutoff = _cutoff(days, now)
+    for _ in range(max(1, int(max_batches))):
+        rows = db.get_retention_candidates(table, cutoff, batch_size)
+        if not rows:
+            break
+        _archive_rows(table, rows)
+        result["archived"] += len(rows)
+        result["deleted"] += db.delete_retained_rows(table, [row["id"] for row in rows])
+        result["batches"] += 1
+        if len(rows) < batch_size:
+            break
+    return result
+
+
+def run_retention(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: int = DEFAULT_MAX_BATCHES,
+    maintenance: bool = True,
+) -> Dict[str, Any]:
+    """모든 정책 적용 + DB 유지보수 1회 실행"""
+    summary: Dict[str, Any] = {"tables": {}}
+    for table, days in get_retention_policies().items():
+        try:
+            summary["tables"][table] = archive_table(table, days, batch_size, max_batches)
+        except Exception as e:
+            print(f"[Retention] {table} failed: {e}")
+            summary["tables"][table] = {"error": str(e)}
+    if maintenance:
+        summary["maintenance"] = db.run_db_maintenance()
+    return summary
+
+
+class RetentionService:
+    def __init__(self):
+        self.running = False
+        self.last_result: Optional[Dict[str, Any]] = None
+
+    @property
+    def interval_seconds(self) -> float:
+        try:
+            hours = float(getattr(config, "RETENTION_INTERVAL_HOURS", 24))
+        except (TypeError, ValueError):
+            hours = 24
+        return max(0.1, hours) * 3600
+
+    async def start_background_worker(self):
+        if self.running or not getattr(config, "RETENTION_ENABLED", True):
+            return
+        self.running = True
+        print("[Retention] Background worker started")
+
+        # 시작 직후 렌더/동기화와 겹치지 않도록 잠시 대기
+        await asyncio.sleep(300)
+
+        while self.running:
+            try:
+                self.last_result = await asyncio.to_thread(run_retention)
+                archived = sum(
+                    t.get("archived", 0) for t in self.last_result.get("tables", {}).values()
+                )
+                if archived:
+                    print(f"[Retention] Archived {archived} rows")
+            except Exception as e:
+                print(f"[Retention] Error: {e}")
+                traceback.print_exc()
+
+            await asyncio.sleep(self.interval_seconds)
+
+
+retention_service = RetentionService()
@@ -417,10 +417,9 @@ def build_render_sfx_cues(settings: dict[str, Any] | None, subtitles: list[dict[
     return infer_sfx_cues_from_subtitles(subtitles or [])
 
 
-def package_sfx_cues(cues: list[dict[str, Any]], temp_dir: str | Path) -> list[dict[str, Any]]:
-    packaged: list[dict[str, Any]] = []
-    sfx_dir = Path(temp_dir) / "sfx"
-    sfx_dir.mkdir(parents=True, exist_ok=True)
+def plan_sfx_package(cues: list[dict[str, Any]]) -> list[tuple[dict[str, Any], Path]]:
+    """(packaged cue, source file) pairs; each cue's relative_path is where the file goes in the package."""
+    planned: list[tuple[dict[str, Any], Path]] = []
     for index, cue in enumerate(cues or []):
         if cue.get("enabled") is False:
             continue
@@ -430,13 +429,22 @@ def package_sfx_cues(cues: list[dict[str, Any]], temp_dir: str | Path) -> list[d
         ext = path.suffix.lower() or ".mp3"
         safe_stem = re.sub(r"[^a-zA-Z0-9_-]+", "_", path.stem)[:48]
         dest_name = f"sfx_{index:03d}_{safe_stem}{ext}"
-        dest = sfx_dir / dest_name
-        if not dest.exists():
-            shutil.copy2(path, dest)
         packaged_cue = dict(cue)
         packaged_cue.pop("path", None)
         packaged_cue["filename"] = dest_name
         packaged_cue["relative_path"] = f"sfx/{dest_name}"
+        planned.append((packaged_cue, path))
+    return planned
+
+
+def package_sfx_cues(cues: list[dict[str, Any]], temp_dir: str | Path) -> list[dict[str, Any]]:
+    sfx_dir = Path(temp_dir) / "sfx"
+    sfx_dir.mkdir(parents=True, exist_ok=True)
+    packaged: list[dict[str, Any]] = []
+    for packaged_cue, path in plan_sfx_package(cues):
+        dest = sfx_dir / packaged_cue["filename"]
+        if not dest.exists():
+            shutil.copy2(path, dest)
         packaged.append(packaged_cue)
     return packaged
 
@@ -7,6 +7,7 @@ from typing import Optional
 import database as db
 from config import config
 from services.auth_service import auth_service
+from services.drive_transfer import drive_transfer_manager
 from services.google_drive_service import google_drive_service
 from services.web_admin_client import web_admin_client
 
@@ -165,32 +166,37 @@ def upload_and_sync_video(project_id: int, local_video_path: str):
         print(f"[Sync] Uploading project bundle to Google Drive folder {project_folder.get('name')}...")
 
         video_filename = os.path.basename(local_video_path)
-        video_file = google_drive_service.upsert_file(
-            local_video_path,
-            folder_id=project_folder.get("id"),
-            filename=video_filename,
-            mimetype="video/mp4",
-            description=f"AIR rendered video for project {project_id}",
-            make_public=False,
-        )
-        if not video_file:
-            print("[Sync] Google Drive video upload failed")
-            return
-
         thumbnail_path = _resolve_local_asset_path(settings.get("thumbnail_url") or settings.get("thumbnail_path"))
-        thumbnail_file = None
+        thumbnail_upload = None
         thumbnail_file_name = None
         if thumbnail_path and os.path.exists(thumbnail_path):
             ext = os.path.splitext(thumbnail_path)[1] or ".png"
             thumbnail_file_name = f"thumbnail{ext.lower()}"
-            thumbnail_file = google_drive_service.upsert_file(
-                thumbnail_path,
-                folder_id=project_folder.get("id"),
-                filename=thumbnail_file_name,
-                mimetype=f"image/{ext.lower().lstrip('.')}" if ext.lower() != ".jpg" else "image/jpeg",
-                description=f"AIR thumbnail for project {project_id}",
-                make_public=False,
-            )
+            thumbnail_upload = {
+                "local_file_path": thumbnail_path,
+                "folder_id": project_folder.get("id"),
+                "filename": thumbnail_file_name,
+                "mimetype": f"image/{ext.lower().lstrip('.')}" if ext.lower() != ".jpg" else "image/jpeg",
+                "description": f"AIR thumbnail for project {project_id}",
+                "make_public": False,
+            }
+
+        # The video and thumbnail are independent, so they upload concurrently. metadata.json
+        # describes the video and is only written once the video is on Drive.
+        video_file, thumbnail_file = drive_transfer_manager.upsert_files([
+            {
+                "local_file_path": local_video_path,
+                "folder_id": project_folder.get("id"),
+                "filename": video_filename,
+                "mimetype": "video/mp4",
+                "description": f"AIR rendered video for project {project_id}",
+                "make_public": False,
+            },
+            thumbnail_upload,
+        ])
+        if not video_file:
+            print("[Sync] Google Drive video upload failed")
+            return
 
         metadata_payload = _build_project_drive_metadata(project_id, video_filename, thumbnail_file_name)
         with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as tmp:
@@ -2,6 +2,9 @@
 AIR Studio 시스템 트레이 상태 수집기
 로컬 렌더링, 원격 렌더 큐, Hermes 워커 상태를 주기적으로 수집하고
 변경을 감지하여 콜백을 트리거합니다.
+
+로컬 렌더 진행률·렌더 큐 변경은 services/event_bus.py 이벤트로 즉시 반영하고,
+Supabase(원격 렌더·Hermes)만 poll_interval마다 조회합니다.
 """
 from __future__ import annotations
 
@@ -114,6 +117,10 @@ class TrayStatusCollector:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._last_snapshot: Optional[TraySnapshot] = None
+        self._wake = threading.Event()
+        # 마지막 Supabase 조회 결과 - 로컬 이벤트로 깨어난 수집에서 재사용
+        self._remote_render_jobs: List[RenderJobStatus] = []
+        self._remote_hermes_jobs: List[HermesJobStatus] = []
 
         # 변경 감지 콜백: (old_snapshot, new_snapshot, changes_dict)
         self._on_change: Optional[Callable] = None
@@ -140,6 +147,8 @@ class TrayStatusCollector:
         if self._running:
             return
         self._running = True
+        from services.event_bus import event_bus
+        event_bus.add_listener(self._on_event)
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
         print("[TrayStatusCollector] 상태 수집기 시작 "
@@ -147,6 +156,9 @@ class TrayStatusCollector:
 
     def stop(self):
         self._running = False
+        from services.event_bus import event_bus
+        event_bus.remove_listener(self._on_event)
+        self._wake.set()
 
     def get_current_snapshot(self) -> TraySnapshot:
         with self._lock:
@@ -154,10 +166,19 @@ class TrayStatusCollector:
 
     # ── 내부 폴링 루프 ──
 
+    def _on_event(self, message: dict):
+        from services.event_bus import RENDER, RENDER_QUEUE
+        if message.get("event") in (RENDER, RENDER_QUEUE):
+            self._wake.set()
+
     def _poll_loop(self):
+        next_remote_at = 0.0
         while self._running:
+            include_remote = time.monotonic() >= next_remote_at
+            if include_remote:
+                next_remote_at = time.monotonic() + self._poll_interval
             try:
-                snapshot = self._collect_snapshot()
+                snapshot = self._collect_snapshot(include_remote=include_remote)
                 changes = self._detect_changes(self._last_snapshot, snapshot)
 
                 with self._lock:
@@ -172,11 +193,15 @@ class TrayStatusCollector:
             except Exception as e:
                 print(f"[TrayStatusCollector] 폴링 에러: {e}")
 
-            time.sleep(self._poll_interval)
+            # 로컬 렌더 이벤트가 오면 즉시, 아니면 다음 Supabase 조회 시점에 깨어난다.
+            # 진행률 이벤트가 몰려도 최소 간격(1초)은 지킨다.
+            time.sleep(1.0)
+            self._wake.wait(max(0.0, next_remote_at - time.monotonic()))
+            self._wake.clear()
 
     # ── 상태 수집 ──
 
-    def _collect_snapshot(self) -> TraySnapshot:
+    def _collect_snapshot(self, include_remote: bool = True) -> TraySnapshot:
         snapshot = TraySnapshot()
 
         # 1) 로컬 렌더 진행률 (in-memory RENDER_PROGRESS dict)
@@ -185,12 +210,18 @@ class TrayStatusCollector:
         # 2) 로컬 렌더 큐 상태 (RenderQueueWorker)
         self._collect_queue_worker_status(snapshot)
 
-        # 3) 원격 Drive API 렌더 상태 (Supabase)
-        self._collect_remote_render_status(snapshot)
-
-        # 4) Hermes 워커 상태 (Supabase)
-        self._collect_hermes_status(snapshot)
-
+        if include_remote:
+            remote = TraySnapshot()
+            # 3) 원격 Drive API 렌더 상태 (Supabase)
+            self._collect_remote_render_status(remote)
+            # 4) Hermes 워커 상태 (Supabase)
+            self._collect_hermes_status(remote)
+            self._remote_render_jobs = remote.render_jobs
+            self._remote_hermes_jobs = remote.hermes_jobs
+
+        for job in self._remote_render_jobs:
+            self._upsert_render_job(snapshot, job)
+        snapshot.hermes_jobs.extend(self._remote_hermes_jobs)
         return snapshot
 
     def _collect_local_render_progress(self, snapshot: TraySnapshot):
@@ -200,7 +231,7 @@ class TrayStatusCollector:
             from database import db
 
             for project_id_str, data in list(RENDER_PROGRESS.items()):
-                pid = int(project_id_str) if project_id_str.isdigit() else 0
+                pid = int(project_id_str) if str(project_id_str).isdigit() else 0
                 status = data.get("status", "unknown")
                 progress = data.get("progress", 0)
 
@@ -1,13 +1,15 @@
 """GitHub Releases based updater for the packaged AIR Studio app."""
 
 import hashlib
+import json
 import os
 import subprocess
 import sys
 import threading
 import time
 import zipfile
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
 from typing import Optional
 
 import requests
@@ -18,6 +20,24 @@ from config import config
 
 RELEASES_API_URL = "https://api.github.com/repos/ibnetsoft/AIR-releases/releases/latest"
 APP_EXE_NAME = "AIRStudio.exe"
+# Delta packages hold only the files that changed between two releases, plus a
+# manifest naming the base version and the files to delete. See
+# tools/build_update_delta.py.
+DELTA_ASSET_TEMPLATE = "AIRStudio-{from_version}-to-{to_version}-win-x64-delta.zip"
+DELTA_MANIFEST_NAME = "update-delta.json"
+
+# Downloads of at least MIN_RANGED_SIZE bytes from servers that honour Range
+# are fetched as RANGE_PART_SIZE parts on DOWNLOAD_WORKERS connections.
+RANGE_PART_SIZE = 8 * 1024 * 1024
+MIN_RANGED_SIZE = 2 * RANGE_PART_SIZE
+DOWNLOAD_WORKERS = 4
+PART_RETRIES = 3
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _is_safe_relative_path(value: str) -> bool:
+    path = PurePosixPath(str(value or "").replace("\\", "/"))
+    return bool(path.parts) and not path.is_absolute() and ".." not in path.parts and ":" not in str(path)
 
 
 class UpdaterService:
@@ -26,6 +46,7 @@ class UpdaterService:
         self.download_progress = 0
         self.download_error = None
         self.download_path: Optional[Path] = None
+        self.download_kind: Optional[str] = None
         self.expected_sha256: Optional[str] = None
         self.release_info = None
         self.is_applying = False
@@ -141,9 +162,9 @@ class UpdaterService:
                 }
 
             has_update = version.parse(latest_version) > version.parse(current_version)
-            digest = str(asset.get("digest", ""))
-            if digest.startswith("sha256:"):
-                digest = digest.split(":", 1)[1]
+            digest = self._asset_sha256(asset)
+            delta_name = DELTA_ASSET_TEMPLATE.format(from_version=current_version, to_version=latest_version)
+            delta_asset = next((item for item in release.get("assets", []) if item.get("name") == delta_name), None)
             info = {
                 "has_update": has_update,
                 "can_apply_update": True,
@@ -153,6 +174,12 @@ class UpdaterService:
                 "asset_name": asset.get("name"),
                 "sha256": digest or None,
                 "release_url": release.get("html_url"),
+                "delta": {
+                    "download_url": delta_asset.get("browser_download_url"),
+                    "asset_name": delta_name,
+                    "sha256": self._asset_sha256(delta_asset),
+                    "size": delta_asset.get("size"),
+                } if delta_asset else None,
             }
             self.release_info = info
             return info
@@ -164,6 +191,13 @@ class UpdaterService:
                 "error": str(exc),
             }
 
+    @staticmethod
+    def _asset_sha256(asset: dict) -> Optional[str]:
+        digest = str(asset.get("digest", ""))
+        if digest.startswith("sha256:"):
+            digest = digest.split(":", 1)[1]
+        return digest or None
+
     def start_download(self, url: str, expected_sha256: Optional[str] = None) -> bool:
         with self._lock:
             if not self.can_apply_update:
@@ -174,42 +208,165 @@ class UpdaterService:
             self.is_downloading = True
             self.download_progress = 0
             self.download_error = None
+            self.download_kind = None
             self.expected_sha256 = expected_sha256
             self.download_path = self._update_dir / "AIRStudio-update.zip"
 
-        thread = threading.Thread(target=self._download_worker, args=(url,), daemon=True)
+        # The delta is only used for the release it was published with, and
+        # only when it has a digest to verify against.
+        delta = None
+        info = self.release_info or {}
+        if info.get("download_url") == url and (info.get("delta") or {}).get("sha256"):
+            delta = info["delta"]
+
+        thread = threading.Thread(target=self._download_worker, args=(url, delta), daemon=True)
         thread.start()
         return True
 
-    def _download_worker(self, url: str):
+    def _download_worker(self, url: str, delta: Optional[dict] = None):
         try:
             assert self.download_path is not None
-            temporary_path = self.download_path.with_suffix(".download")
-            response = requests.get(url, stream=True, timeout=(15, 120))
-            response.raise_for_status()
-            total_size = int(response.headers.get("content-length", 0))
-            downloaded = 0
-            digest = hashlib.sha256()
-            with temporary_path.open("wb") as output:
-                for chunk in response.iter_content(1024 * 1024):
-                    if not chunk:
-                        continue
-                    output.write(chunk)
-                    digest.update(chunk)
-                    downloaded += len(chunk)
-                    self.download_progress = int(downloaded * 100 / total_size) if total_size else 0
-
-            actual_sha256 = digest.hexdigest()
-            if self.expected_sha256 and actual_sha256.lower() != self.expected_sha256.lower():
-                raise ValueError("Downloaded file did not pass SHA256 verification.")
-            temporary_path.replace(self.download_path)
-            self.download_progress = 100
+            if delta:
+                try:
+                    self.download_kind = "delta"
+                    self._fetch(delta["download_url"], delta["sha256"], "delta")
+                    return
+                except Exception as exc:
+                    print(f"[Updater] Delta update unavailable, downloading the full package: {exc}")
+                    self.download_progress = 0
+            self.download_kind = "full"
+            self._fetch(url, self.expected_sha256, "full")
         except Exception as exc:
             self.download_error = str(exc)
             self.download_progress = 0
         finally:
             self.is_downloading = False
 
+    def _fetch(self, url: str, expected_sha256: Optional[str], kind: str):
+        """Download to a kind-specific temporary file, verify, then move into download_path."""
+        temporary_path = self.download_path.with_name(f"{self.download_path.stem}-{kind}.download")
+        total_size, validator = self._probe(url)
+        if total_size and total_size >= MIN_RANGED_SIZE:
+            actual_sha256 = self._download_ranged(url, total_size, validator, temporary_path)
+        else:
+            actual_sha256 = self._download_stream(url, temporary_path)
+
+        if expected_sha256 and actual_sha256.lower() != expected_sha256.lower():
+            temporary_path.unlink(missing_ok=True)
+            raise ValueError("Downloaded file did not pass SHA256 verification.")
+        temporary_path.replace(self.download_path)
+        self.download_progress = 100
+
+    @staticmethod
+    def _probe(url: str) -> tuple[Optional[int], str]:
+        """Return (size, validator) when the server serves byte ranges, else (None, "")."""
+        response = requests.get(url, headers={"Range": "bytes=0-0"}, stream=True, timeout=(15, 60))
+        try:
+            if response.status_code != 206:
+                return None, ""
+            total = response.headers.get("Content-Range", "").rsplit("/", 1)[-1]
+            validator = response.headers.get("ETag") or response.headers.get("Last-Modified") or ""
+            return (int(total), validator) if total.isdigit() else (None, "")
+        finally:
+            response.close()
+
+    def _download_stream(self, url: str, temporary_path: Path) -> str:
+        response = requests.get(url, stream=True, timeout=(15, 120))
+        response.raise_for_status()
+        total_size = int(response.headers.get("content-length", 0))
+        downloaded = 0
+        digest = hashlib.sha256()
+        with temporary_path.open("wb") as output:
+            for chunk in response.iter_content(1024 * 1024):
+                if not chunk:
+                    continue
+                output.write(chunk)
+                digest.update(chunk)
+                downloaded += len(chunk)
+                self.download_progress = int(downloaded * 100 / total_size) if total_size else 0
+        return digest.hexdigest()
+
+    def _download_ranged(self, url: str, total_size: int, validator: str, temporary_path: Path) -> str:
+        """Fetch byte ranges in parallel into a preallocated file.
+
+        Finished parts are recorded in a sidecar so an interrupted download
+        resumes with the missing parts only. The SHA256 is computed in file
+        order while later parts are still downloading: each part is hashed as
+        soon as it and every part before it are on disk."""
+        state_path = temporary_path.with_name(temporary_path.name + ".json")
+        parts = [
+            (index, start, min(start + RANGE_PART_SIZE, total_size) - 1)
+            for index, start in enumerate(range(0, total_size, RANGE_PART_SIZE))
+        ]
+        identity = {"url": url, "size": total_size, "validator": validator}
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = {}
+        done = set(state.get("done") or [])
+        if {key: state.get(key) for key in identity} != identity or not temporary_path.exists() \
+                or temporary_path.stat().st_size != total_size:
+            done = set()
+            with temporary_path.open("wb") as output:
+                output.truncate(total_size)
+
+        lock = threading.Lock()
+        downloaded = [sum(end - start + 1 for index, start, end in parts if index in done)]
+
+        def save_state():
+            state_path.write_text(json.dumps({**identity, "done": sorted(done)}), encoding="utf-8")
+
+        def fetch_part(part):
+            index, start, end = part
+            for attempt in range(PART_RETRIES):
+                written = 0
+                try:
+                    response = requests.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True,
+                                            timeout=(15, 120))
+                    if response.status_code != 206:
+                        raise ValueError(f"Range request returned HTTP {response.status_code}")
+                    with temporary_path.open("r+b") as output:
+                        output.seek(start)
+                        for chunk in response.iter_content(1024 * 1024):
+                            output.write(chunk)
+                            written += len(chunk)
+                            with lock:
+                                downloaded[0] += len(chunk)
+                                self.download_progress = min(99, int(downloaded[0] * 100 / total_size))
+                    if written != end - start + 1:
+                        raise ValueError(f"Short read for bytes {start}-{end}")
+                    with lock:
+                        done.add(index)
+                        save_state()
+                    return
+                except (requests.RequestException, ValueError, OSError):
+                    with lock:
+                        downloaded[0] -= written
+                    if attempt + 1 >= PART_RETRIES:
+                        raise
+                    time.sleep(2 ** attempt)
+
+        digest = hashlib.sha256()
+        pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="update-download")
+        try:
+            futures = {part[0]: pool.submit(fetch_part, part) for part in parts if part[0] not in done}
+            with temporary_path.open("rb") as reader:
+                for index, start, end in parts:
+                    if index in futures:
+                        futures[index].result()
+                    reader.seek(start)
+                    remaining = end - start + 1
+                    while remaining:
+                        block = reader.read(min(HASH_BLOCK_SIZE, remaining))
+                        if not block:
+                            raise ValueError("Downloaded file is shorter than expected.")
+                        digest.update(block)
+                        remaining -= len(block)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        state_path.unlink(missing_ok=True)
+        return digest.hexdigest()
+
     def apply_update_and_restart(self):
         if not self.can_apply_update:
             return False, "In-place updates are only available in the installed AIR Studio app."
@@ -223,9 +380,17 @@ class UpdaterService:
         try:
             with zipfile.ZipFile(self.download_path) as archive:
                 names = {item.filename.replace("\\", "/") for item in archive.infolist()}
-                if APP_EXE_NAME not in names or "version.json" not in names:
+                if DELTA_MANIFEST_NAME in names:
+                    manifest = json.loads(archive.read(DELTA_MANIFEST_NAME))
+                    if str(manifest.get("from_version") or "") != self.current_version:
+                        return False, "The delta update package was built for a different installed version."
+                    if not all(_is_safe_relative_path(item) for item in manifest.get("removed") or []):
+                        return False, "The delta update package lists an invalid file to remove."
+                    if "version.json" not in names:
+                        return False, "The delta update package is missing version.json."
+                elif APP_EXE_NAME not in names or "version.json" not in names:
                     return False, "The update package does not contain a complete AIR Studio app."
-        except (OSError, zipfile.BadZipFile) as exc:
+        except (OSError, ValueError, zipfile.BadZipFile) as exc:
             return False, f"Unable to validate the update package: {exc}"
 
         script_path = self._update_dir / "apply_update.ps1"
@@ -267,8 +432,17 @@ try {{
     if (Test-Path $extract) {{ Remove-Item $extract -Recurse -Force }}
     New-Item -ItemType Directory -Force -Path $extract | Out-Null
     Expand-Archive -LiteralPath $zip -DestinationPath $extract -Force
-    if (-not (Test-Path (Join-Path $extract 'AIRStudio.exe'))) {{ throw 'Update package is missing AIRStudio.exe.' }}
+    $deltaManifest = Join-Path $extract '{DELTA_MANIFEST_NAME}'
+    $isDelta = Test-Path -LiteralPath $deltaManifest
+    if (-not $isDelta -and -not (Test-Path (Join-Path $extract 'AIRStudio.exe'))) {{ throw 'Update package is missing AIRStudio.exe.' }}
     if (-not (Test-Path (Join-Path $extract 'version.json'))) {{ throw 'Update package is missing version.json.' }}
+    if ($isDelta) {{
+        $delta = Get-Content -LiteralPath $deltaManifest -Raw | ConvertFrom-Json
+        foreach ($relative in @($delta.removed)) {{
+            if ($relative) {{ Remove-Item -LiteralPath (Join-Path $app $relative) -Recurse -Force -ErrorAction SilentlyContinue }}
+        }}
+        Remove-Item -LiteralPath $deltaManifest -Force
+    }}
     Copy-Item -Path (Join-Path $extract '*') -Destination $app -Recurse -Force
     Remove-Item $zip -Force -ErrorAction SilentlyContinue
     Remove-Item $extract -Recurse -Force -ErrorAction SilentlyContinue
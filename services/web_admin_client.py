@@ -1,12 +1,18 @@
+import json
 import os
+import random
 import re
 import secrets
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 
 def _load_packaged_env():
@@ -54,8 +60,19 @@ def _human_error(value: Any, fallback: str) -> str:
     return fallback
 
 
+# Transient statuses worth retrying on idempotent requests.
+RETRY_STATUSES = {429, 502, 503, 504}
+# PostgREST rows per batch request (keeps bodies well under the gateway limit).
+BATCH_CHUNK_SIZE = 500
+
+
 class WebAdminClient:
-    """Small wrapper for Vercel web-admin and Supabase REST integration."""
+    """Small wrapper for Vercel web-admin and Supabase REST integration.
+
+    All requests share one pooled HTTPAdapter (keep-alive, gzip responses) through
+    a per-thread Session. Idempotent calls (GET/PUT/DELETE/PATCH and upserts) are
+    retried on connection errors and 429/5xx gateway responses with jittered backoff.
+    """
 
     KEY_MAP = {
         "sys_api_gemini": "GEMINI_API_KEY",
@@ -98,6 +115,94 @@ class WebAdminClient:
 
     def __init__(self):
         self.timeout = 10
+        self.max_retries = 3
+        self.retry_backoff = 0.5
+        self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._local = threading.local()
+        self._metrics: Dict[str, Dict[str, Any]] = {}
+        self._metrics_lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            self._local.session = session
+        return session
+
+    @staticmethod
+    def _metric_name(method: str, url: str) -> str:
+        path = url.split("://", 1)[-1].split("?", 1)[0]
+        path = path.split("/", 1)[1] if "/" in path else ""
+        for prefix in ("rest/v1/", "auth/v1/", "api/"):
+            if path.startswith(prefix):
+                path = path[len(prefix):]
+                break
+        # Drop per-row ids (auth users etc.) so metrics group by endpoint.
+        path = "/".join(part for part in path.split("/") if not UUID_RE.match(part))
+        return f"{method} {path}"
+
+    def _record(self, name: str, elapsed: float, response=None, retries: int = 0, failed: bool = False,
+                bytes_sent: int = 0):
+        with self._metrics_lock:
+            entry = self._metrics.setdefault(
+                name,
+                {"requests": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "max_ms": 0.0, "bytes_sent": 0},
+            )
+            entry["requests"] += 1
+            entry["retries"] += retries
+            entry["bytes_sent"] += bytes_sent
+            entry["total_ms"] += elapsed * 1000
+            entry["max_ms"] = max(entry["max_ms"], elapsed * 1000)
+            if failed or response is None or response.status_code >= 400:
+                entry["errors"] += 1
+
+    def request_metrics(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint counters: requests, errors, retries, avg/max latency and request bytes."""
+        with self._metrics_lock:
+            snapshot = {
+                name: dict(entry, avg_ms=round(entry["total_ms"] / entry["requests"], 1) if entry["requests"] else 0.0)
+                for name, entry in self._metrics.items()
+            }
+            if reset:
+                self._metrics.clear()
+        return snapshot
+
+    def _retry_delay(self, attempt: int, response=None) -> float:
+        retry_after = (response.headers.get("Retry-After") if response is not None else None) or ""
+        if retry_after.strip().isdigit():
+            return min(float(retry_after), 30.0)
+        return min(self.retry_backoff * (2 ** attempt), 8.0) * random.uniform(0.5, 1.5)
+
+    def request(self, method: str, url: str, *, idempotent: Optional[bool] = None, **kwargs):
+        """Send through the pooled session; retries idempotent requests on transient failures."""
+        if idempotent is None:
+            idempotent = method in ("GET", "HEAD", "PUT", "DELETE", "PATCH")
+        attempts = self.max_retries + 1 if idempotent else 1
+        if "json" in kwargs:
+            body = json.dumps(kwargs.pop("json"), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            kwargs["data"] = body
+            kwargs["headers"] = {"Content-Type": "application/json", **(kwargs.get("headers") or {})}
+        bytes_sent = len(kwargs.get("data") or b"")
+        name = self._metric_name(method, url)
+        started = time.perf_counter()
+        for attempt in range(attempts):
+            try:
+                response = self._session().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt + 1 >= attempts:
+                    self._record(name, time.perf_counter() - started, retries=attempt, failed=True,
+                                 bytes_sent=bytes_sent)
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+            if response.status_code in RETRY_STATUSES and attempt + 1 < attempts:
+                time.sleep(self._retry_delay(attempt, response))
+                continue
+            self._record(name, time.perf_counter() - started, response, retries=attempt, bytes_sent=bytes_sent)
+            return response
 
     @property
     def dashboard_url(self) -> str:
@@ -147,7 +252,8 @@ class WebAdminClient:
         if not self.has_supabase():
             return None
         self._disable_warnings()
-        return requests.get(
+        return self.request(
+            "GET",
             f"{self.supabase_url}/rest/v1/{table}",
             headers=self.headers(),
             params=params or {},
@@ -170,7 +276,8 @@ class WebAdminClient:
         headers = self.headers(content_type=True)
         if return_representation:
             headers["Prefer"] = "return=representation"
-        return requests.post(
+        return self.request(
+            "POST",
             f"{self.supabase_url}/rest/v1/{table}",
             headers=headers,
             json=payload,
@@ -189,7 +296,8 @@ class WebAdminClient:
         if not self.has_supabase() or not function_name:
             return None
         self._disable_warnings()
-        return requests.post(
+        return self.request(
+            "POST",
             f"{self.supabase_url}/rest/v1/rpc/{function_name}",
             headers=self.headers(content_type=True),
             json=payload or {},
@@ -205,13 +313,15 @@ class WebAdminClient:
         *,
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
+        return_representation: bool = True,
     ):
         if not self.has_supabase():
             return None
         self._disable_warnings()
         headers = self.headers(content_type=True)
-        headers["Prefer"] = "return=representation"
-        return requests.patch(
+        headers["Prefer"] = "return=representation" if return_representation else "return=minimal"
+        return self.request(
+            "PATCH",
             f"{self.supabase_url}/rest/v1/{table}",
             headers=headers,
             params=params or {},
@@ -256,11 +366,151 @@ class WebAdminClient:
             return False
         return True
 
+    @staticmethod
+    def _chunks(rows: List[Any], size: int):
+        size = max(1, int(size or BATCH_CHUNK_SIZE))
+        for start in range(0, len(rows), size):
+            yield rows[start:start + size]
+
+    def upsert_many(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        *,
+        on_conflict: str,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        timeout: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Multi-row upsert: one PostgREST POST (merge-duplicates on `on_conflict`) per chunk.
+
+        `on_conflict` must name a unique column. Returns {"ok": rows written, "failed": rows in
+        failed chunks, "errors": [...], "failed_statuses": [HTTP status per failed chunk, None when
+        the request never got a response]}; a failed chunk does not stop the remaining ones.
+        `idempotency_key` is sent per chunk as an `Idempotency-Key` header (suffixed with the chunk index)."""
+        result: Dict[str, Any] = {"ok": 0, "failed": 0, "errors": [], "failed_statuses": []}
+        rows = [row for row in rows or [] if row]
+        if not rows:
+            return result
+        if not self.has_supabase():
+            result["failed"] = len(rows)
+            result["errors"].append("Supabase is not configured")
+            result["failed_statuses"].append(None)
+            return result
+        self._disable_warnings()
+        headers = self.headers(content_type=True)
+        headers["Prefer"] = "resolution=merge-duplicates,return=minimal"
+        for index, chunk in enumerate(self._chunks(rows, chunk_size)):
+            if idempotency_key:
+                headers = {**headers, "Idempotency-Key": f"{idempotency_key}:{index}"}
+            try:
+                response = self.request(
+                    "POST",
+                    f"{self.supabase_url}/rest/v1/{table}",
+                    idempotent=True,
+                    headers=headers,
+                    params={"on_conflict": on_conflict},
+                    json=chunk,
+                    timeout=timeout or self.timeout,
+                    verify=False,
+                    proxies={"http": None, "https": None},
+                )
+            except Exception as e:
+                response, error = None, str(e)
+            else:
+                error = None if response.status_code < 400 else f"HTTP {response.status_code} {response.text[:300]}"
+            if error:
+                print(f"[WebAdmin] {table} batch upsert failed ({len(chunk)} rows): {error}")
+                result["failed"] += len(chunk)
+                result["errors"].append(error)
+                result["failed_statuses"].append(response.status_code if response is not None else None)
+            else:
+                result["ok"] += len(chunk)
+        return result
+
+    def patch_many(
+        self,
+        table: str,
+        key: str,
+        rows: List[Dict[str, Any]],
+        *,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        max_workers: int = 4,
+        timeout: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Patch many rows identified by `key` (each row holds its key value plus the fields to set).
+
+        PostgREST has no per-row bulk PATCH, so rows with identical field values are grouped into
+        one `key=in.(...)` request per chunk, and the distinct groups are sent concurrently over the
+        pooled session. Never inserts. Returns {"ok", "failed", "errors"} counted in rows."""
+        result: Dict[str, Any] = {"ok": 0, "failed": 0, "errors": []}
+        groups: Dict[str, Dict[str, Any]] = {}
+        for row in rows or []:
+            if not row or row.get(key) in (None, ""):
+                continue
+            fields = {name: value for name, value in row.items() if name != key}
+            if not fields:
+                continue
+            signature = json.dumps(fields, sort_keys=True, ensure_ascii=False, default=str)
+            group = groups.setdefault(signature, {"fields": fields, "keys": []})
+            group["keys"].append(row[key])
+        requests_to_send = [
+            (group["fields"], keys)
+            for group in groups.values()
+            for keys in self._chunks(group["keys"], chunk_size)
+        ]
+        if not requests_to_send:
+            return result
+        if not self.has_supabase():
+            result["failed"] = sum(len(keys) for _fields, keys in requests_to_send)
+            result["errors"].append("Supabase is not configured")
+            return result
+
+        def send(item):
+            fields, keys = item
+            values = ",".join(self._postgrest_value(value) for value in keys)
+            try:
+                response = self.supabase_patch(
+                    table,
+                    fields,
+                    params={key: f"in.({values})"},
+                    timeout=timeout,
+                    return_representation=False,
+                )
+            except Exception as e:
+                return keys, str(e)
+            if response.status_code >= 400:
+                return keys, f"HTTP {response.status_code} {response.text[:300]}"
+            return keys, None
+
+        workers = max(1, min(max_workers, len(requests_to_send)))
+        if workers == 1:
+            outcomes = [send(item) for item in requests_to_send]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="web-admin-patch") as pool:
+                outcomes = list(pool.map(send, requests_to_send))
+        for keys, error in outcomes:
+            if error:
+                print(f"[WebAdmin] {table} batch patch failed ({len(keys)} rows): {error}")
+                result["failed"] += len(keys)
+                result["errors"].append(error)
+            else:
+                result["ok"] += len(keys)
+        return result
+
+    @staticmethod
+    def _postgrest_value(value: Any) -> str:
+        text = str(value)
+        if re.fullmatch(r"[A-Za-z0-9_.:@-]+", text):
+            return text
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
     def create_auth_user(self, *, email: str, metadata: Dict[str, Any]) -> Optional[str]:
         if not self.has_supabase():
             return None
         self._disable_warnings()
-        response = requests.post(
+        response = self.request(
+            "POST",
             f"{self.supabase_url}/auth/v1/admin/users",
             headers=self.headers(content_type=True),
             json={
@@ -402,7 +652,8 @@ class WebAdminClient:
             return False
         self._disable_warnings()
         try:
-            response = requests.put(
+            response = self.request(
+                "PUT",
                 f"{self.supabase_url}/auth/v1/admin/users/{user_id}",
                 headers=self.headers(content_type=True),
                 json={"user_metadata": new_metadata},
@@ -419,7 +670,8 @@ class WebAdminClient:
         if not self.has_supabase() or not email:
             return None
         self._disable_warnings()
-        response = requests.get(
+        response = self.request(
+            "GET",
             f"{self.supabase_url}/auth/v1/admin/users",
             headers=self.headers(content_type=True),
             timeout=self.timeout,
@@ -451,7 +703,8 @@ class WebAdminClient:
             payload = {"email": email, "password": password}
             if lang:
                 payload["lang"] = lang
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.dashboard_url}/api/desktop-login",
                 json=payload,
                 headers=self.dashboard_headers(content_type=True),
@@ -476,7 +729,8 @@ class WebAdminClient:
         절대 회원등급/토큰잔액/공용 API키를 내려주지 않는다 - 그렇지 않으면 이메일만
         아는 누구나 그 정보를 조회할 수 있는 구멍이 된다."""
         try:
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.dashboard_url}/api/desktop-resync",
                 json={"email": email, "session_token": session_token},
                 headers=self.dashboard_headers(content_type=True),
@@ -508,7 +762,8 @@ class WebAdminClient:
                 "action": action,
             }
             payload.update(params or {})
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.dashboard_url}/api/desktop-referrals",
                 json=payload,
                 headers=self.dashboard_headers(content_type=True),
@@ -539,7 +794,8 @@ class WebAdminClient:
                 "action": action,
             }
             payload.update(params or {})
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.dashboard_url}/api/desktop-support",
                 json=payload,
                 headers=self.dashboard_headers(content_type=True),
@@ -560,7 +816,8 @@ class WebAdminClient:
         [AIR-0229] lang을 함께 보내면 auth-web이 저장해둔 자동번역
         (title_en/title_vi/title_th 등)을 title/body 자리에 대신 채워 응답한다."""
         try:
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.dashboard_url}/api/desktop-announcements",
                 json={"email": email, "session_token": session_token, "action": "list", "lang": lang},
                 headers=self.dashboard_headers(content_type=True),
@@ -594,7 +851,8 @@ class WebAdminClient:
                 "action": action,
             }
             payload.update(params or {})
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.dashboard_url}/api/desktop-project-sync",
                 json=payload,
                 headers=self.dashboard_headers(content_type=True),
@@ -622,7 +880,8 @@ class WebAdminClient:
         supabase_patch("profiles", ...)로 SUPABASE_SERVICE_ROLE_KEY를 직접
         썼으나, 그 키가 패키징된 앱에서 제거되어 더 이상 동작하지 않는다."""
         try:
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.dashboard_url}/api/desktop-profile-update",
                 json={
                     "email": email,
@@ -648,7 +907,8 @@ class WebAdminClient:
         현재 비밀번호 확인/신규 비밀번호 저장을 서버 쪽
         /api/desktop-change-password에서 수행하고 결과만 돌려받는다."""
         try:
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.dashboard_url}/api/desktop-change-password",
                 json={
                     "email": email,
@@ -804,7 +1064,8 @@ class WebAdminClient:
         headers = self.headers(content_type=True)
         headers["Prefer"] = "resolution=merge-duplicates,return=representation"
         try:
-            response = requests.post(
+            response = self.request(
+                "POST",
                 f"{self.supabase_url}/rest/v1/style_presets?on_conflict=key_code",
                 headers=headers,
                 json=payload,
@@ -824,7 +1085,8 @@ class WebAdminClient:
         if not self.has_supabase():
             return {"success": False, "error": "중앙 스타일 저장소 연결 설정이 없습니다."}
         try:
-            response = requests.delete(
+            response = self.request(
+                "DELETE",
                 f"{self.supabase_url}/rest/v1/style_presets",
                 headers=self.headers(),
                 params={"key_code": f"eq.{key_code}"},
@@ -956,7 +1218,8 @@ class WebAdminClient:
             return False
         self._disable_warnings()
         try:
-            response = requests.delete(
+            response = self.request(
+                "DELETE",
                 f"{self.supabase_url}/auth/v1/admin/users/{user_id}",
                 headers=self.headers(),
                 timeout=self.timeout,
@@ -979,7 +1242,8 @@ class WebAdminClient:
             return False
         self._disable_warnings()
         try:
-            response = requests.delete(
+            response = self.request(
+                "DELETE",
                 f"{self.supabase_url}/rest/v1/profiles",
                 headers=self.headers(),
                 params={"id": f"eq.{user_id}"},
@@ -1003,7 +1267,8 @@ class WebAdminClient:
             return False
         self._disable_warnings()
         try:
-            response = requests.delete(
+            response = self.request(
+                "DELETE",
                 f"{self.supabase_url}/rest/v1/withdrawals",
                 headers=self.headers(),
                 params={"user_id": f"eq.{user_id}"},
@@ -1065,7 +1330,8 @@ class WebAdminClient:
             return {"success": False, "error": "invalid_params"}
 
         # Supabase RPC 함수 호출
-        response = requests.post(
+        response = self.request(
+            "POST",
             f"{self.supabase_url}/rest/v1/rpc/admin_update_tenant_commission",
             headers=self.headers(content_type=True),
             json={
@@ -1095,7 +1361,8 @@ class WebAdminClient:
         if not self.has_supabase() or not user_id:
             return {"error": "invalid_params"}
 
-        response = requests.post(
+        response = self.request(
+            "POST",
             f"{self.supabase_url}/rest/v1/rpc/calculate_commission",
             headers=self.headers(content_type=True),
             json={
@@ -1120,7 +1387,8 @@ class WebAdminClient:
         if not self.has_supabase() or not user_id:
             return {"enabled": False}
 
-        response = requests.post(
+        response = self.request(
+            "POST",
             f"{self.supabase_url}/rest/v1/rpc/get_tenant_watermark",
             headers=self.headers(content_type=True),
             json={"p_user_id": user_id},
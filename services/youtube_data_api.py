@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import xml.etree.ElementTree as ET
 from typing import Any, Dict, Iterable, Tuple
 
@@ -148,22 +149,54 @@ async def async_youtube_list_by_ids(
     part: str,
     timeout: float = 15.0,
     max_ids_per_call: int = 50,
+    concurrency: int = 1,
 ) -> dict:
-    """Call a YouTube list endpoint in quota-cheap 50-ID batches."""
+    """Call a YouTube list endpoint in quota-cheap 50-ID batches.
+
+    With ``concurrency`` > 1 the batches run in parallel and batch N starts at
+    key N of the pool, so the quota cost is spread across keys instead of
+    draining the primary key first. A failed batch then no longer aborts the
+    call: its error is reported under ``errors`` and the other batches' items
+    are still returned (the first error is returned only if every batch fails).
+    """
     cleaned_ids = unique_nonempty(ids)
     if not cleaned_ids:
         return {"items": [], "batch_count": 0, "responses": []}
+    batches = list(_chunks(cleaned_ids, max_ids_per_call))
+    if concurrency <= 1 or len(batches) == 1:
+        responses: list[dict] = []
+        for batch in batches:
+            data = await async_youtube_get(endpoint, {"part": part, "id": ",".join(batch)}, timeout=timeout)
+            if data.get("error"):
+                return data
+            responses.append(data)
+        errors: list[dict] = []
+    else:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(offset: int, batch: list[str]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await async_youtube_get(
+                        endpoint,
+                        {"part": part, "id": ",".join(batch)},
+                        timeout=timeout,
+                        key_offset=offset,
+                    )
+                except httpx.HTTPError as exc:
+                    return {"error": "YOUTUBE_API_ERROR", "message": str(exc) or type(exc).__name__}
+
+        results = await asyncio.gather(*(fetch(offset, batch) for offset, batch in enumerate(batches)))
+        responses = [data for data in results if not data.get("error")]
+        errors = [data for data in results if data.get("error")]
+        if not responses:
+            return errors[0]
     items: list[dict] = []
-    responses: list[dict] = []
-    for batch in _chunks(cleaned_ids, max_ids_per_call):
-        data = await async_youtube_get(endpoint, {"part": part, "id": ",".join(batch)}, timeout=timeout)
-        if data.get("error"):
-            return data
-        responses.append(data)
+    for data in responses:
         batch_items = data.get("items") if isinstance(data, dict) else []
         if isinstance(batch_items, list):
             items.extend(batch_items)
-    return {
+    result = {
         "items": items,
         "batch_count": len(responses),
         "responses": responses,
@@ -172,6 +205,9 @@ async def async_youtube_list_by_ids(
             None,
         ),
     }
+    if errors:
+        result["errors"] = errors
+    return result
 
 
 async def async_youtube_get(
@@ -179,15 +215,20 @@ async def async_youtube_get(
     params: Dict[str, Any] | None = None,
     *,
     timeout: float = 15.0,
+    key_offset: int = 0,
 ) -> Dict[str, Any]:
     keys = normalized_youtube_keys()
     if not keys:
         return {"error": "YOUTUBE_API_KEY_NOT_CONFIGURED", "message": "YouTube API key is not configured."}
+    # Rotate the failover order; reported key indexes stay relative to the configured pool.
+    start = key_offset % len(keys)
+    ordered = list(enumerate(keys, start=1))
+    ordered = ordered[start:] + ordered[:start]
 
     url = path_or_url if path_or_url.startswith("http") else f"{config.YOUTUBE_BASE_URL}/{path_or_url.lstrip('/')}"
     failures: list[Tuple[int, int, str]] = []
     async with httpx.AsyncClient(timeout=timeout) as client:
-        for index, key in enumerate(keys, start=1):
+        for index, key in ordered:
             response = await client.get(url, params=_with_key(params, key))
             try:
                 data = response.json()
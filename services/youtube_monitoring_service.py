@@ -6,12 +6,13 @@ upload/release flow; they only reduce the amount of learning data available.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import os
 import re
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from config import config
 from services.web_admin_client import web_admin_client
@@ -92,12 +93,31 @@ def _duration_seconds(value: str) -> Optional[int]:
     return parts["days"] * 86400 + parts["hours"] * 3600 + parts["minutes"] * 60 + parts["seconds"]
 
 
+def _metrics_from_item(video_id: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    stats = item.get("statistics") or {}
+    snippet = item.get("snippet") or {}
+    details = item.get("contentDetails") or {}
+    return {
+        "video_id": video_id,
+        "title": snippet.get("title") or "",
+        "channel_id": snippet.get("channelId") or "",
+        "channel_title": snippet.get("channelTitle") or "",
+        "published_at": snippet.get("publishedAt") or "",
+        "duration_seconds": _duration_seconds(details.get("duration") or ""),
+        "views": _to_int(stats.get("viewCount")),
+        "likes": _to_int(stats.get("likeCount")),
+        "comments": _to_int(stats.get("commentCount")),
+        "raw_payload": item,
+    }
+
+
 class YouTubeMonitoringService:
     def __init__(self):
         self.running = False
         self.thread = None
         self.interval = int(os.getenv("YOUTUBE_MONITOR_INTERVAL_SECONDS", "3600") or "3600")
         self.batch_limit = int(os.getenv("YOUTUBE_MONITOR_BATCH_LIMIT", "50") or "50")
+        self.fetch_concurrency = int(os.getenv("YOUTUBE_MONITOR_FETCH_CONCURRENCY", "4") or "4")
 
     def start(self):
         if self.running:
@@ -119,7 +139,7 @@ class YouTubeMonitoringService:
             time.sleep(max(60, self.interval))
 
     def collect_due_public_videos(self) -> Dict[str, int]:
-        result = {"seen": 0, "due": 0, "captured": 0, "failed": 0}
+        result = {"seen": 0, "due": 0, "captured": 0, "failed": 0, "batches": 0}
         if not web_admin_client.has_supabase():
             return result
 
@@ -129,6 +149,9 @@ class YouTubeMonitoringService:
 
         requests_list = self._fetch_public_requests()
         now = _utc_now()
+        # slot hours -> due captures. Videos at the same capture age go into the same
+        # videos.list batches, and every capture of a cycle is stamped with one captured_at.
+        due_by_slot: Dict[int, List[Dict[str, Any]]] = {}
         for req in requests_list:
             result["seen"] += 1
             metadata = req.get("metadata") or {}
@@ -148,16 +171,42 @@ class YouTubeMonitoringService:
             if slot is None:
                 continue
             result["due"] += 1
+            due_by_slot.setdefault(slot, []).append({
+                "req": req,
+                "metadata": metadata,
+                "video_id": video_id,
+                "slot_hours": slot,
+                "public_at": public_at,
+            })
+
+        if not due_by_slot:
+            return result
 
+        due = [item for slot in sorted(due_by_slot) for item in due_by_slot[slot]]
+        try:
+            metrics_by_id, batches = self._fetch_metrics_batch([item["video_id"] for item in due])
+        except Exception as exc:
+            result["failed"] += len(due)
+            print(f"[YouTubeMonitor] metrics fetch failed for {len(due)} video(s): {exc}")
+            return result
+        result["batches"] = batches
+
+        captures = []
+        for item in due:
+            metrics = metrics_by_id.get(item["video_id"])
+            if not metrics:
+                # Not returned by videos.list (private, deleted, or its batch failed);
+                # the slot stays uncaptured and is retried next cycle.
+                continue
             try:
-                metrics = self._fetch_video_metrics(video_id, api_key)
-                if not metrics:
-                    continue
-                self._persist_capture(req, metadata, video_id, slot, public_at, metrics)
-                result["captured"] += 1
+                captures.append(self._build_capture(**item, metrics=metrics, now=now))
             except Exception as exc:
                 result["failed"] += 1
-                print(f"[YouTubeMonitor] capture failed video={video_id}: {exc}")
+                print(f"[YouTubeMonitor] capture failed video={item['video_id']}: {exc}")
+
+        persisted = self._persist_captures(captures)
+        result["captured"] += persisted
+        result["failed"] += len(captures) - persisted
 
         if result["due"] or result["captured"] or result["failed"]:
             print(f"[YouTubeMonitor] {result}")
@@ -204,36 +253,30 @@ class YouTubeMonitoringService:
         due_slots = [slot for slot in MONITORING_SLOTS_HOURS if slot <= hours_since_public and slot not in captured]
         return due_slots[0] if due_slots else None
 
-    def _fetch_video_metrics(self, video_id: str, api_key: str) -> Dict[str, Any]:
-        from services.youtube_data_api import sync_youtube_get
+    def _fetch_metrics_batch(self, video_ids: List[str]) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """Fetch metrics for many videos with 50-ID videos.list calls run concurrently.
+
+        Returns ({video_id: metrics}, successful batch count). Videos missing from
+        the response are simply absent from the mapping."""
+        from services.youtube_data_api import async_youtube_list_by_ids
 
-        data = sync_youtube_get(
+        data = asyncio.run(async_youtube_list_by_ids(
             "videos",
-            {
-                "part": "snippet,statistics,contentDetails",
-                "id": video_id,
-            },
+            video_ids,
+            part="snippet,statistics,contentDetails",
             timeout=20,
-        )
-        items = data.get("items") or []
-        if not items:
-            raise RuntimeError("Video not found or not accessible through YouTube Data API.")
-        item = items[0]
-        stats = item.get("statistics") or {}
-        snippet = item.get("snippet") or {}
-        details = item.get("contentDetails") or {}
-        return {
-            "video_id": video_id,
-            "title": snippet.get("title") or "",
-            "channel_id": snippet.get("channelId") or "",
-            "channel_title": snippet.get("channelTitle") or "",
-            "published_at": snippet.get("publishedAt") or "",
-            "duration_seconds": _duration_seconds(details.get("duration") or ""),
-            "views": _to_int(stats.get("viewCount")),
-            "likes": _to_int(stats.get("likeCount")),
-            "comments": _to_int(stats.get("commentCount")),
-            "raw_payload": item,
-        }
+            concurrency=max(1, self.fetch_concurrency),
+        ))
+        if data.get("error"):
+            raise RuntimeError(data.get("message") or data["error"])
+        for error in data.get("errors") or []:
+            print(f"[YouTubeMonitor] videos.list batch failed: {error.get('message') or error.get('error')}")
+        metrics_by_id = {}
+        for item in data.get("items") or []:
+            video_id = item.get("id") if isinstance(item, dict) else None
+            if video_id:
+                metrics_by_id[video_id] = _metrics_from_item(video_id, item)
+        return metrics_by_id, int(data.get("batch_count") or 0)
 
     def _score(self, metrics: Dict[str, Any], slot_hours: int) -> Dict[str, Any]:
         views = max(0, int(metrics.get("views") or 0))
@@ -289,7 +332,7 @@ class YouTubeMonitoringService:
             "recommendations": recommendations,
         }
 
-    def _persist_capture(
+    def _build_capture(
         self,
         req: Dict[str, Any],
         metadata: Dict[str, Any],
@@ -297,8 +340,10 @@ class YouTubeMonitoringService:
         slot_hours: int,
         public_at: datetime.datetime,
         metrics: Dict[str, Any],
-    ):
-        now = _utc_now()
+        now: Optional[datetime.datetime] = None,
+    ) -> Dict[str, Any]:
+        """Build the rows one capture writes; _persist_captures sends them in bulk."""
+        now = now or _utc_now()
         project_id = metadata.get("project_id")
         score = self._score(metrics, slot_hours)
         learning = self._build_learning_summary(metrics, score, slot_hours)
@@ -346,9 +391,7 @@ class YouTubeMonitoringService:
             "generation_context": generation_context,
         }
 
-        web_admin_client.upsert_by_key("youtube_video_metrics", "sync_key", metric_payload["sync_key"], metric_payload, timeout=15)
-        web_admin_client.upsert_by_key("video_learning_snapshots", "sync_key", snapshot_payload["sync_key"], snapshot_payload, timeout=15)
-
+        event_payload = None
         if project_id not in (None, ""):
             event_payload = {
                 "sync_key": f"event:youtube_monitor:{video_id}:{slot_hours}",
@@ -366,7 +409,6 @@ class YouTubeMonitoringService:
                 "local_created_at": _iso(now),
                 "synced_at": _iso(now),
             }
-            web_admin_client.upsert_by_key("project_learning_events", "sync_key", event_payload["sync_key"], event_payload, timeout=15)
 
         monitoring = metadata.get("youtube_monitoring") or {}
         captured_slots = sorted({
@@ -388,12 +430,50 @@ class YouTubeMonitoringService:
                 },
             },
         }
-        web_admin_client.supabase_patch(
+        return {
+            "video_id": video_id,
+            "metric": metric_payload,
+            "snapshot": snapshot_payload,
+            "event": event_payload,
+            "request_patch": {"id": req.get("id"), "metadata": next_metadata},
+        }
+
+    def _persist_captures(self, captures: List[Dict[str, Any]]) -> int:
+        """Write all captures of a cycle with one bulk upsert per table.
+
+        Slots are only marked captured on the publishing request when its metric,
+        snapshot and learning-event rows were stored, so a failed write is retried
+        next cycle (the upserts are keyed by sync_key, so the retry is idempotent).
+        Returns the number of captures persisted."""
+        if not captures:
+            return 0
+        tables = (
+            ("youtube_video_metrics", "metric"),
+            ("video_learning_snapshots", "snapshot"),
+        )
+        for table, field in tables:
+            rows = [capture[field] for capture in captures]
+            outcome = web_admin_client.upsert_many(table, rows, on_conflict="sync_key", timeout=15)
+            if outcome["failed"]:
+                print(f"[YouTubeMonitor] {table} bulk write failed: {'; '.join(outcome['errors'][:3])}")
+                return 0
+
+        events = [capture["event"] for capture in captures if capture["event"]]
+        if events:
+            outcome = web_admin_client.upsert_many("project_learning_events", events, on_conflict="sync_key", timeout=15)
+            if outcome["failed"]:
+                print(f"[YouTubeMonitor] project_learning_events bulk write failed: {'; '.join(outcome['errors'][:3])}")
+                return 0
+
+        outcome = web_admin_client.patch_many(
             "publishing_requests",
-            {"metadata": next_metadata},
-            params={"id": f"eq.{req.get('id')}"},
+            "id",
+            [capture["request_patch"] for capture in captures],
             timeout=15,
         )
+        if outcome["failed"]:
+            print(f"[YouTubeMonitor] publishing_requests update failed: {'; '.join(outcome['errors'][:3])}")
+        return outcome["ok"]
 
 
 youtube_monitoring_service = YouTubeMonitoringService()
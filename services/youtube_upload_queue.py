@@ -0,0 +1,262 @@
+"""
+YouTube 업로드 대기열
+
+youtube_upload_service.upload_video는 호출한 스레드에서 끝날 때까지 붙잡고 있었고, async 라우터
+(auto_upload)와 오토파일럿(_upload_video)은 이를 이벤트 루프에서 바로 불러 모든 채널의 업로드가
+하나씩 줄을 섰다.
+
+- 업로드는 워커 스레드 풀(YOUTUBE_UPLOAD_WORKERS)에서 돌고, 호출자는 await upload(...)로 기다린다.
+- 채널(토큰) 단위로 동시 업로드 수(YOUTUBE_UPLOAD_PER_CHANNEL)와 하루 업로드 수
+  (YOUTUBE_DAILY_UPLOADS_PER_CHANNEL, 0이면 무제한)를 제한한다. 서로 다른 채널/프록시는 동시에 올라간다.
+- quotaExceeded / uploadLimitExceeded를 받은 채널은 할당량이 초기화되는 시각(태평양 시간 자정)까지
+  막아 두고, 그 채널의 대기 작업은 바로 실패시킨다.
+- 재개 세션/청크 크기 조정/재연결은 upload_video(_execute_resumable)가 맡고, 여기서는 진행률을 받아
+  처리량과 남은 시간을 계산해 status()로 보여준다.
+"""
+import asyncio
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+DEFAULT_UPLOAD_WORKERS = 3
+DEFAULT_UPLOADS_PER_CHANNEL = 1
+# 처리량은 최근 이 구간의 진행률로 계산
+THROUGHPUT_WINDOW_SECONDS = 30.0
+FINISHED_JOBS_KEPT = 50
+QUOTA_ERROR_REASONS = ("quotaExceeded", "uploadLimitExceeded", "dailyLimitExceeded")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _is_quota_error(error: Exception) -> bool:
+    text = str(error)
+    return any(reason in text for reason in QUOTA_ERROR_REASONS)
+
+
+def next_quota_reset(now: Optional[datetime] = None) -> datetime:
+    """YouTube Data API 할당량 초기화 시각 (태평양 시간 자정)을 UTC로."""
+    now = now or datetime.now(timezone.utc)
+    try:
+        from zoneinfo import ZoneInfo
+        pacific = now.astimezone(ZoneInfo("America/Los_Angeles"))
+    except Exception:
+        pacific = now.astimezone(timezone(timedelta(hours=-8)))
+    midnight = (pacific + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return midnight.astimezone(timezone.utc)
+
+
+class UploadJob:
+    """대기열의 업로드 하나. 진행률은 upload_video의 progress_callback으로 갱신된다."""
+
+    def __init__(self, job_id: str, channel_key: str, upload_kwargs: dict, project_id=None,
+                 clock: Callable[[], float] = time.time):
+        self.id = job_id
+        self.channel_key = channel_key
+        self.upload_kwargs = upload_kwargs
+        self.project_id = project_id
+        self._clock = clock
+        self.state = "queued"
+        self.sent_bytes = 0
+        try:
+            self.total_bytes = os.path.getsize(upload_kwargs.get("file_path") or "")
+        except OSError:
+            self.total_bytes = 0
+        self.queued_at = clock()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+        self._samples = deque()
+
+    def progress(self, sent_bytes: int, total_bytes: int):
+        now = self._clock()
+        self.sent_bytes = sent_bytes
+        if total_bytes:
+            self.total_bytes = total_bytes
+        self._samples.append((now, sent_bytes))
+        while len(self._samples) > 2 and self._samples[0][0] < now - THROUGHPUT_WINDOW_SECONDS:
+            self._samples.popleft()
+
+    def bytes_per_second(self) -> float:
+        if len(self._samples) < 2:
+            return 0.0
+        (t0, b0), (t1, b1) = self._samples[0], self._samples[-1]
+        return (b1 - b0) / (t1 - t0) if t1 > t0 else 0.0
+
+    def to_dict(self) -> dict:
+        rate = self.bytes_per_second() if self.state == "uploading" else 0.0
+        remaining = max(0, self.total_bytes - self.sent_bytes)
+        return {
+            "id": self.id,
+            "project_id": self.project_id,
+            "channel": self.channel_key,
+            "title": self.upload_kwargs.get("title") or "",
+            "state": self.state,
+            "sent_bytes": self.sent_bytes,
+            "total_bytes": self.total_bytes,
+            "percent": round(self.sent_bytes * 100 / self.total_bytes, 1) if self.total_bytes else 0.0,
+            "bytes_per_second": round(rate),
+            "eta_seconds": round(remaining / rate) if rate > 0 else None,
+            "video_id": (self.result or {}).get("id"),
+            "error": str(self.error) if self.error else None,
+            "queued_at": self.queued_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class YouTubeUploadQueue:
+    """채널별 동시성/할당량 제한을 지키며 여러 업로드를 병렬로 처리한다."""
+
+    def __init__(self, max_workers: Optional[int] = None, per_channel: Optional[int] = None,
+                 daily_limit: Optional[int] = None, uploader=None, clock: Callable[[], float] = time.time):
+        self.max_workers = max(1, max_workers if max_workers is not None
+                               else _env_int("YOUTUBE_UPLOAD_WORKERS", DEFAULT_UPLOAD_WORKERS))
+        self.per_channel = max(1, per_channel if per_channel is not None
+                               else _env_int("YOUTUBE_UPLOAD_PER_CHANNEL", DEFAULT_UPLOADS_PER_CHANNEL))
+        self.daily_limit = max(0, daily_limit if daily_limit is not None
+                               else _env_int("YOUTUBE_DAILY_UPLOADS_PER_CHANNEL", 0))
+        self._uploader = uploader
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._pending = []
+        self._jobs = {}
+        self._finished = deque()
+        self._active = {}
+        self._uploaded = {}  # channel -> (quota day, count)
+        self._blocked_until = {}  # channel -> epoch seconds
+        self._workers = []
+        self._ids = itertools.count(1)
+
+    @property
+    def uploader(self):
+        if self._uploader is None:
+            from services.youtube_upload_service import youtube_upload_service
+
+            self._uploader = youtube_upload_service
+        return self._uploader
+
+    def _quota_day(self) -> str:
+        return next_quota_reset(datetime.fromtimestamp(self._clock(), timezone.utc)).date().isoformat()
+
+    def _uploaded_today(self, channel: str) -> int:
+        day, count = self._uploaded.get(channel, ("", 0))
+        return count if day == self._quota_day() else 0
+
+    def _channel_refusal(self, channel: str) -> Optional[str]:
+        if self._blocked_until.get(channel, 0) > self._clock():
+            return "YouTube 업로드 할당량이 소진된 채널입니다. 할당량이 초기화된 뒤 다시 시도해주세요."
+        if self.daily_limit and self._uploaded_today(channel) >= self.daily_limit:
+            return f"채널의 하루 업로드 한도({self.daily_limit}건)에 도달했습니다."
+        return None
+
+    def submit(self, *, project_id=None, channel_key: Optional[str] = None, **upload_kwargs) -> UploadJob:
+        """upload_video 키워드 인자로 작업을 넣는다. channel_key 기본값은 token_path (없으면 기본 채널)."""
+        channel = channel_key or upload_kwargs.get("token_path") or "default"
+        job = UploadJob(f"yt-{next(self._ids)}", channel, upload_kwargs, project_id, self._clock)
+        with self._cond:
+            self._jobs[job.id] = job
+            self._pending.append(job)
+            while len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._worker_loop, name=f"youtube-upload-{len(self._workers) + 1}",
+                                          daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            self._cond.notify_all()
+        return job
+
+    def wait(self, job: UploadJob, timeout: Optional[float] = None) -> dict:
+        if not job.done.wait(timeout):
+            raise TimeoutError(f"YouTube 업로드 대기 시간 초과: {job.id}")
+        if job.error:
+            raise job.error
+        return job.result
+
+    async def upload(self, *, project_id=None, channel_key: Optional[str] = None, **upload_kwargs) -> dict:
+        """이벤트 루프를 막지 않고 업로드가 끝날 때까지 기다린다 (upload_video와 같은 반환값)."""
+        job = self.submit(project_id=project_id, channel_key=channel_key, **upload_kwargs)
+        return await asyncio.to_thread(self.wait, job)
+
+    def _take_next(self) -> Optional[UploadJob]:
+        """실행할 수 있는 첫 작업. 할당량에 막힌 채널의 작업은 여기서 실패 처리한다."""
+        for job in list(self._pending):
+            refusal = self._channel_refusal(job.channel_key)
+            if refusal:
+                self._pending.remove(job)
+                self._finish(job, error=RuntimeError(refusal))
+                continue
+            if self._active.get(job.channel_key, 0) < self.per_channel:
+                self._pending.remove(job)
+                self._active[job.channel_key] = self._active.get(job.channel_key, 0) + 1
+                job.state = "uploading"
+                job.started_at = self._clock()
+                return job
+        return None
+
+    def _finish(self, job: UploadJob, result=None, error=None):
+        job.result, job.error = result, error
+        job.state = "failed" if error else "completed"
+        job.finished_at = self._clock()
+        self._finished.append(job.id)
+        while len(self._finished) > FINISHED_JOBS_KEPT:
+            self._jobs.pop(self._finished.popleft(), None)
+        job.done.set()
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                job = self._take_next()
+                while job is None:
+                    self._cond.wait()
+                    job = self._take_next()
+            result, error = None, None
+            try:
+                result = self.uploader.upload_video(**job.upload_kwargs, progress_callback=job.progress)
+            except Exception as e:
+                error = e
+            with self._cond:
+                channel = job.channel_key
+                self._active[channel] -= 1
+                if error is None:
+                    self._uploaded[channel] = (self._quota_day(), self._uploaded_today(channel) + 1)
+                elif _is_quota_error(error):
+                    reset_at = next_quota_reset(datetime.fromtimestamp(self._clock(), timezone.utc))
+                    self._blocked_until[channel] = reset_at.timestamp()
+                    print(f"[YouTubeUpload] {channel} 할당량 소진 - {reset_at.isoformat()}까지 업로드 중지")
+                self._finish(job, result, error)
+                self._cond.notify_all()
+
+    def status(self, project_id=None) -> dict:
+        """UI용 진행 상황: 작업별 진행률/처리량/ETA와 채널별 상태."""
+        with self._cond:
+            jobs = [job for job in self._jobs.values() if project_id is None or job.project_id == project_id]
+            channels = {}
+            for channel in set(self._active) | set(self._uploaded) | set(self._blocked_until):
+                blocked = self._blocked_until.get(channel, 0)
+                channels[channel] = {
+                    "active": self._active.get(channel, 0),
+                    "uploaded_today": self._uploaded_today(channel),
+                    "blocked_until": blocked if blocked > self._clock() else None,
+                }
+            items = [job.to_dict() for job in sorted(jobs, key=lambda j: j.queued_at)]
+        uploading = [item for item in items if item["state"] == "uploading"]
+        return {
+            "jobs": items,
+            "queued": sum(1 for item in items if item["state"] == "queued"),
+            "uploading": len(uploading),
+            "bytes_per_second": sum(item["bytes_per_second"] for item in uploading),
+            "channels": channels,
+        }
+
+
+youtube_upload_queue = YouTubeUploadQueue()
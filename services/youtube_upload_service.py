@@ -2,11 +2,34 @@
 import os
 import pickle
 import json
+import time
+import httplib2
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 
+from services.drive_transfer import query_upload_status
+
+# 청크 크기: 256KiB 배수여야 한다. 청크 하나가 CHUNK_TARGET_SECONDS 근처가 되도록 두 배/절반으로 조정
+# (채널별로 기억했다가 다음 업로드의 MediaFileUpload에 쓴다)
+UPLOAD_CHUNK_MIN = 8 * 1024 * 1024
+UPLOAD_CHUNK_MAX = 128 * 1024 * 1024
+CHUNK_TARGET_SECONDS = 8.0
+# 연결이 끊겼을 때 서버가 확인한 마지막 바이트부터 다시 시도하는 횟수
+UPLOAD_RECONNECT_RETRIES = 8
+RETRYABLE_STATUSES = (500, 502, 503, 504)
+
+
+def _tune_chunk_size(chunk_size: int, elapsed: float) -> int:
+    if elapsed < CHUNK_TARGET_SECONDS / 2 and chunk_size < UPLOAD_CHUNK_MAX:
+        return chunk_size * 2
+    if elapsed > CHUNK_TARGET_SECONDS * 2 and chunk_size > UPLOAD_CHUNK_MIN:
+        return chunk_size // 2
+    return chunk_size
+
+
 class YouTubeUploadService:
     def __init__(self):
         from config import config
@@ -19,6 +42,98 @@ class YouTubeUploadService:
         ]
         self.api_service_name = "youtube"
         self.api_version = "v3"
+        self._session_store = None
+        self._chunk_sizes = {}
+
+    @property
+    def session_store(self):
+        """재개 가능한 업로드 세션 URI/offset 기록 (프로세스가 죽어도 이어서 업로드)."""
+        if self._session_store is None:
+            from services.drive_transfer import default_session_store
+            self._session_store = default_session_store('YOUTUBE_UPLOAD_SESSION_FILE', 'youtube_upload_sessions.json')
+        return self._session_store
+
+    @staticmethod
+    def _upload_session_key(file_path: str, token_path: str = None, title: str = "") -> str:
+        stat = os.stat(file_path)
+        return ":".join([
+            "youtube",
+            os.path.abspath(token_path) if token_path else "default",
+            os.path.abspath(file_path),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            title,
+        ])
+
+    def _execute_resumable(self, request, media, session_key: str = None, progress_callback=None,
+                           sleep=time.sleep, chunk_key: str = "default"):
+        """청크 단위 재개 업로드.
+
+        - 저장된 세션이 있으면 서버에 받은 바이트 수를 물어본 뒤(query_upload_status) 그 다음부터 보낸다.
+        - 연결 오류/5xx는 같은 세션으로 재시도한다. 다시 보내기 전에 서버가 확인한 바이트 수를
+          물어 resumable_progress를 맞춘다.
+        - 만료된 세션(404/410)은 버리고 처음부터 다시 보낸다.
+        - 청크 전송 시간으로 chunk_key(채널)의 다음 업로드 청크 크기를 조정한다.
+        progress_callback(sent_bytes, total_bytes)는 청크마다 호출된다."""
+        store = self.session_store if session_key else None
+        entry = store.get_entry(session_key) if store else None
+        saved_uri = (entry or {}).get("value")
+        resync = False
+        if saved_uri:
+            request.resumable_uri = saved_uri
+            resync = True
+            print(f"[YouTube] 업로드 세션 재개 ({entry.get('offset', 0)} bytes 전송됨)")
+
+        total = media.size() or 0
+        failures = 0
+        response = None
+        while response is None:
+            before = request.resumable_progress
+            started = time.monotonic()
+            try:
+                if resync:
+                    resync = False
+                    # 서버가 끝까지 받았으면 응답 본문이 오고, 아니면 다음 청크는 확인된 바이트부터
+                    response = query_upload_status(request)
+                    continue
+                _status, response = request.next_chunk()
+            except HttpError as e:
+                status = getattr(e.resp, "status", None)
+                if saved_uri and status in (404, 410):
+                    store.drop(session_key)
+                    saved_uri = None
+                    request.resumable_uri = None
+                    request.resumable_progress = 0
+                    continue
+                if status not in RETRYABLE_STATUSES or failures >= UPLOAD_RECONNECT_RETRIES:
+                    raise
+                failures += 1
+                resync = request.resumable_uri is not None
+                sleep(min(2 ** failures, 60))
+                continue
+            except (httplib2.HttpLib2Error, OSError) as e:
+                if failures >= UPLOAD_RECONNECT_RETRIES:
+                    raise
+                failures += 1
+                resync = request.resumable_uri is not None
+                print(f"[YouTube] 업로드 연결 오류, 서버 확인 후 재시도 ({failures}): {e}")
+                sleep(min(2 ** failures, 60))
+                continue
+            failures = 0
+
+            if response is None:
+                if request.resumable_progress > before:
+                    self._chunk_sizes[chunk_key] = _tune_chunk_size(media.chunksize(), time.monotonic() - started)
+                if store and request.resumable_uri:
+                    saved_uri = request.resumable_uri
+                    store.put(session_key, saved_uri, offset=request.resumable_progress)
+                if progress_callback:
+                    progress_callback(request.resumable_progress, total)
+        if progress_callback:
+            progress_callback(total, total)
+        if store:
+            store.drop(session_key)
+        return response
 
     def get_authenticated_service(self, token_path: str = None, interactive: bool = False, proxy: str = None):
         """인증된 YouTube API 서비스 객체 반환 (채널별 토큰 및 프록시 우회 지원)"""
@@ -130,9 +245,11 @@ class YouTubeUploadService:
         privacy_status: str = "private",
         publish_at: str = None,
         token_path: str = None, # [NEW] 인증 토큰 경로
-        proxy: str = None # [NEW] 프록시 정보
+        proxy: str = None, # [NEW] 프록시 정보
+        progress_callback=None,
+        resume: bool = True,
     ) -> dict:
-        """비디오 업로드 (채널 지정 가능)"""
+        """비디오 업로드 (채널 지정 가능). 청크 단위 재개 업로드 - 병렬/대기열은 youtube_upload_queue."""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
 
@@ -158,9 +275,10 @@ class YouTubeUploadService:
             "status": status_body
         }
 
+        chunk_key = os.path.abspath(token_path) if token_path else "default"
         media = MediaFileUpload(
             file_path,
-            chunksize=-1, 
+            chunksize=self._chunk_sizes.get(chunk_key, UPLOAD_CHUNK_MIN),
             resumable=True
         )
 
@@ -171,7 +289,8 @@ class YouTubeUploadService:
         )
 
         print(f"업로드 시작: {title}")
-        response = request.execute()
+        session_key = self._upload_session_key(file_path, token_path, title) if resume else None
+        response = self._execute_resumable(request, media, session_key, progress_callback, chunk_key=chunk_key)
         print(f"업로드 완료: https://youtu.be/{response['id']}")
         
         return response
@@ -0,0 +1,42 @@
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """worker/job_store on a fresh jobs.db (and wakeup dir) under tmp_path."""
+    if str(WORKER) not in sys.path:
+        sys.path.insert(0, str(WORKER))
+    import job_store
+    import job_wakeup
+
+    monkeypatch.setattr(job_store, "JOB_DB_PATH", tmp_path / "jobs.db")
+    monkeypatch.setattr(job_wakeup, "WAKEUP_DIR", tmp_path / "wakeup")
+    monkeypatch.setattr(job_store._local, "conn", None, raising=False)
+    job_store.init_db()
+    yield job_store
+    conn = getattr(job_store._local, "conn", None)
+    if conn is not None:
+        conn.close()
+    job_store._local.conn = None
+
+
+@pytest.fixture
+def local_db(tmp_path, monkeypatch):
+    """Path of a throwaway SQLite file that database.py reads and writes instead of the app DB.
+
+    The test creates its own schema there; the writer thread and the cached
+    connections are closed afterwards so the next test starts clean."""
+    import database as db
+
+    db_path = tmp_path / "local.db"
+    monkeypatch.setattr(db, "get_db_path", lambda: db_path)
+    monkeypatch.setattr(db, "ensure_local_db_migrated", lambda: None)
+    yield db_path
+    db.close_db_writer_connection(10)
+    db.close_db_connections()
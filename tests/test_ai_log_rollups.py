@@ -0,0 +1,136 @@
+import sqlite3
+import unittest
+
+import pytest
+
+import database as db
+from app.routers.settings import _iter_settlement_csv
+
+
+class AiLogRollupTest(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _local_db(self, local_db):
+        self.db_path = local_db
+
+    def setUp(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript(
+            """
+            CREATE TABLE ai_generation_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                project_id INTEGER, task_type TEXT, model_id TEXT, provider TEXT, status TEXT,
+                prompt_summary TEXT, error_msg TEXT, elapsed_time REAL,
+                input_tokens INTEGER DEFAULT 0, output_tokens INTEGER DEFAULT 0,
+                thinking_tokens INTEGER DEFAULT 0, worker_email TEXT, remote_synced_at TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE projects (id INTEGER PRIMARY KEY, status TEXT, employee_email TEXT,
+                                   updated_at TIMESTAMP);
+            CREATE TABLE project_settings (id INTEGER PRIMARY KEY, project_id INTEGER UNIQUE,
+                                           admin_publish_status TEXT, actual_payout INTEGER,
+                                           estimated_payout INTEGER);
+            INSERT INTO ai_generation_logs (task_type, provider, status, input_tokens, output_tokens, worker_email, created_at)
+                VALUES ('script_gen', 'gemini', 'success', 10, 5, 'a@x', '2026-01-01 03:00:00');
+            """
+        )
+        self._migrate(conn)
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _migrate(conn):
+        db._ensure_ai_log_rollups(conn.cursor())
+
+    def _insert(self, **row):
+        conn = sqlite3.connect(str(self.db_path))
+        columns = ", ".join(row)
+        conn.execute(
+            f"INSERT INTO ai_generation_logs ({columns}) VALUES ({', '.join('?' for _ in row)})",
+            tuple(row.values()),
+        )
+        conn.commit()
+        conn.close()
+
+    def _rollups(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            return [dict(r) for r in conn.execute("SELECT * FROM ai_log_rollups ORDER BY bucket_hour, task_type, status")]
+        finally:
+            conn.close()
+
+    def test_existing_logs_are_backfilled_once(self):
+        rows = self._rollups()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual((rows[0]["day"], rows[0]["call_count"], rows[0]["input_tokens"]), ("2026-01-01", 1, 10))
+
+        conn = sqlite3.connect(str(self.db_path))
+        self._migrate(conn)
+        conn.commit()
+        conn.close()
+        self.assertEqual(self._rollups()[0]["call_count"], 1)
+
+    def test_insert_trigger_accumulates_per_hour_bucket(self):
+        self._insert(task_type="script_gen", provider="gemini", status="success", input_tokens=1,
+                     output_tokens=2, worker_email="a@x", created_at="2026-01-01 03:59:00")
+        self._insert(task_type="tts_gen", provider="google", status="failed", worker_email=None,
+                     created_at="2026-01-01 04:10:00")
+
+        rows = self._rollups()
+        self.assertEqual(rows[0]["call_count"], 2)
+        self.assertEqual((rows[0]["input_tokens"], rows[0]["output_tokens"]), (11, 7))
+        self.assertEqual((rows[1]["worker_email"], rows[1]["bucket_hour"]), ("unknown", "2026-01-01 04:00:00"))
+
+    def test_settlement_stats_read_rollups_after_logs_are_purged(self):
+        self._insert(task_type="tts_gen", provider="google", status="success", worker_email="a@x",
+                     created_at="2026-01-02 10:00:00")
+        self._insert(task_type="image_crop", provider="local", status="failed", worker_email="a@x",
+                     created_at="2026-01-03 10:00:00")
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("DELETE FROM ai_generation_logs")
+        conn.commit()
+        conn.close()
+
+        stats = db.get_worker_settlement_stats("2026-01-01", "2026-01-02", approved_only=False)
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(
+            (stats[0]["worker"], stats[0]["total_ai_tasks"], stats[0]["success_ai_tasks"], stats[0]["tts_tasks"]),
+            ("a@x", 2, 2, 1),
+        )
+
+    def test_rebuild_recomputes_from_remaining_logs(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("UPDATE ai_log_rollups SET call_count = 99")
+        conn.commit()
+        conn.close()
+
+        self.assertTrue(db.rebuild_ai_log_rollups())
+        self.assertEqual(self._rollups()[0]["call_count"], 1)
+
+    def test_rebuild_keeps_rollups_of_days_purged_by_retention(self):
+        self._insert(task_type="script_gen", provider="gemini", status="success", worker_email="a@x",
+                     created_at="2026-01-05 10:00:00")
+        old_ids = [r["id"] for r in db.get_retention_candidates("ai_generation_logs", "2026-01-02 00:00:00")]
+        self.assertEqual(db.delete_retained_rows("ai_generation_logs", old_ids), 1)
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("UPDATE ai_log_rollups SET call_count = 99 WHERE day = '2026-01-05'")
+        conn.commit()
+        conn.close()
+
+        self.assertTrue(db.rebuild_ai_log_rollups())
+        self.assertEqual(
+            [(r["day"], r["call_count"]) for r in self._rollups()], [("2026-01-01", 1), ("2026-01-05", 1)]
+        )
+
+    def test_settlement_csv_is_streamed_line_by_line(self):
+        stats = [
+            {"worker": "a@x", "completed_projects": 2, "total_projects": 3, "success_ai_tasks": 4},
+            {"worker": None, "success_ai_tasks": 1},
+        ]
+        lines = list(_iter_settlement_csv(stats, project_pay=100, ai_pay=10))
+
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("\ufeffworker,approved_projects"))
+        self.assertEqual(lines[1].strip(), "a@x,2,3,4,0,0,0,200,40,240")
+        self.assertEqual(lines[2].strip(), "unknown,0,0,1,0,0,0,0,10,10")
+
@@ -0,0 +1,128 @@
+import asyncio
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import database as db
+from scripts.check_async_db_calls import MIGRATED_ROUTERS, REPO, find_sync_db_calls
+from services.async_db import DB_THREAD_NAME_PREFIX, AsyncDatabase
+
+
+class AsyncDatabaseFacadeTest(unittest.TestCase):
+    def setUp(self):
+        self.adb = AsyncDatabase(max_workers=2)
+
+    def tearDown(self):
+        self.adb.shutdown()
+
+    def test_calls_run_on_db_executor_thread(self):
+        seen = {}
+
+        def fake_get_project(project_id):
+            seen["thread"] = threading.current_thread().name
+            return {"id": project_id}
+
+        with patch.object(db, "get_project", side_effect=fake_get_project):
+            result = asyncio.run(self.adb.get_project(7))
+
+        self.assertEqual(result, {"id": 7})
+        self.assertTrue(seen["thread"].startswith(DB_THREAD_NAME_PREFIX))
+        self.assertNotEqual(seen["thread"], threading.current_thread().name)
+
+    def test_slow_db_call_does_not_block_event_loop(self):
+        release = threading.Event()
+
+        def slow_update(*_args):
+            release.wait(2)
+            return True
+
+        async def scenario():
+            task = asyncio.create_task(self.adb.update_project_setting(1, "status", "x"))
+            # 이벤트 루프가 살아 있어야 이 sleep이 곧바로 끝난다
+            await asyncio.sleep(0.01)
+            self.assertFalse(task.done())
+            release.set()
+            return await task
+
+        with patch.object(db, "update_project_setting", side_effect=slow_update):
+            self.assertTrue(asyncio.run(scenario()))
+
+    def test_connection_helpers_are_not_exposed(self):
+        with self.assertRaises(AttributeError):
+            self.adb.get_db
+        with self.assertRaises(AttributeError):
+            self.adb.not_a_database_function
+
+    def test_execute_write_and_fetch_all(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "async.db"
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+            conn.commit()
+            conn.close()
+
+            async def scenario():
+                changed = await self.adb.execute_write("INSERT INTO items (name) VALUES (?)", ("a",))
+                rows = await self.adb.fetch_all("SELECT name FROM items")
+                return changed, rows
+
+            with patch.object(db, "get_db_path", return_value=db_path), \
+                    patch.object(db, "ensure_local_db_migrated"):
+                changed, rows = asyncio.run(scenario())
+                self.adb.shutdown()
+
+        self.assertEqual(changed, 1)
+        self.assertEqual(rows, [{"name": "a"}])
+
+
+class AsyncRouteDbLintTest(unittest.TestCase):
+    def test_migrated_routers_have_no_sync_db_calls(self):
+        violations = []
+        for rel_path in MIGRATED_ROUTERS:
+            violations.extend(find_sync_db_calls(REPO / rel_path))
+        self.assertEqual(
+            violations,
+            [],
+            "async routes must await services.async_db.async_db instead of calling database.py directly",
+        )
+
+    def test_lint_ignores_sync_helpers_nested_in_async_routes(self):
+        source = (
+            "import database as db\n"
+            "async def route(pid):\n"
+            "    def _background():\n"
+            "        db.update_project(pid)\n"
+            "    return db.get_project(pid)\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sample.py"
+            path.write_text(source, encoding="utf-8")
+            calls = find_sync_db_calls(path)
+
+        self.assertEqual([(call.lineno, call.call) for call in calls], [(5, "db.get_project")])
+
+    def test_lint_flags_blocking_sync_helpers_unless_run_on_db_executor(self):
+        source = (
+            "from services.async_db import async_db\n"
+            "from services.longform_asset_readiness import sync_project_asset_readiness\n"
+            "from services.sync_service import start_upload_and_sync_background\n"
+            "async def route(pid):\n"
+            "    start_upload_and_sync_background(pid)\n"
+            "    await async_db.run(sync_project_asset_readiness, pid)\n"
+            "    return sync_project_asset_readiness(pid)\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sample.py"
+            path.write_text(source, encoding="utf-8")
+            calls = find_sync_db_calls(path)
+
+        self.assertEqual(
+            [(call.lineno, call.call) for call in calls], [(7, "sync_project_asset_readiness")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import sqlite3
+import threading
+import unittest
+
+import pytest
+
+import database as db
+
+
+class SingleWriterQueueTest(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _local_db(self, local_db):
+        self.db_path = local_db
+
+    def setUp(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript(
+            """
+            CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+            CREATE TABLE projects (id INTEGER PRIMARY KEY, sync_dirty INTEGER DEFAULT 0,
+                                   updated_at TIMESTAMP);
+            CREATE TABLE project_settings (id INTEGER PRIMARY KEY, project_id INTEGER UNIQUE,
+                                           title TEXT, updated_at TIMESTAMP);
+            INSERT INTO projects (id) VALUES (1);
+            INSERT INTO project_settings (project_id, title) VALUES (1, 'old');
+            """
+        )
+        conn.commit()
+        conn.close()
+
+    def _count_items(self):
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_concurrent_writes_are_group_committed(self):
+        before = db.get_db_write_stats()
+
+        def worker(offset):
+            futures = [
+                db.submit_write(lambda conn, n=n: conn.execute("INSERT INTO items (name) VALUES (?)", (f"i{n}",)))
+                for n in range(offset, offset + 25)
+            ]
+            for future in futures:
+                future.result(10)
+
+        threads = [threading.Thread(target=worker, args=(i * 25,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        after = db.get_db_write_stats()
+        self.assertEqual(self._count_items(), 100)
+        self.assertEqual(after["writes"] - before["writes"], 100)
+        self.assertLess(after["batches"] - before["batches"], 100)
+        self.assertIn("avg_commit_ms", after)
+        self.assertEqual(after["busy_timeout_ms"], db.DB_BUSY_TIMEOUT_MS)
+
+    def test_failed_write_does_not_roll_back_its_batch(self):
+        ok = db.submit_write(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('a')"))
+        dup = db.submit_write(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('a')"))
+        other = db.submit_write(lambda conn: conn.execute("INSERT INTO items (name) VALUES ('b')"))
+
+        ok.result(10)
+        other.result(10)
+        with self.assertRaises(sqlite3.IntegrityError):
+            dup.result(10)
+        self.assertEqual(self._count_items(), 2)
+
+    def test_nested_run_write_uses_the_same_transaction(self):
+        def outer(conn):
+            conn.execute("INSERT INTO items (name) VALUES ('outer')")
+            return db.run_write(lambda inner: inner.execute("INSERT INTO items (name) VALUES ('inner')").lastrowid)
+
+        self.assertTrue(db.run_write(outer))
+        self.assertEqual(self._count_items(), 2)
+
+    def test_update_project_setting_goes_through_writer(self):
+        self.assertTrue(db.update_project_setting(1, "title", "new"))
+        self.assertTrue(db.update_project_setting(1, "scene_3_motion", "pan_up"))
+
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            row = conn.execute("SELECT title, scene_3_motion FROM project_settings WHERE project_id = 1").fetchone()
+            dirty = conn.execute("SELECT sync_dirty FROM projects WHERE id = 1").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(row, ("new", "pan_up"))
+        self.assertEqual(dirty, 1)
+
+    def test_get_db_writers_run_on_the_writer_thread(self):
+        threads = []
+
+        @db._single_writer
+        def legacy_writer(name, keep):
+            threads.append(threading.current_thread().name)
+            conn = db.get_db()
+            conn.execute("INSERT INTO items (name) VALUES (?)", (name,))
+            if keep:
+                conn.commit()
+            conn.close()
+
+        legacy_writer("kept", True)
+        legacy_writer("dropped", False)
+
+        self.assertEqual(threads, ["db-writer", "db-writer"])
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            names = [row[0] for row in conn.execute("SELECT name FROM items")]
+        finally:
+            conn.close()
+        # close() 전에 commit()하지 않은 변경은 스레드별 연결과 같이 되돌려진다
+        self.assertEqual(names, ["kept"])
+
@@ -0,0 +1,242 @@
+import threading
+import time
+
+import pytest
+
+from services import google_drive_service as drive_module
+from services.drive_transfer import DriveIdCache, DriveTransferManager, ResumableSessionStore
+
+
+class _Call:
+    def __init__(self, result):
+        self.result = result
+
+    def execute(self):
+        return self.result
+
+
+class FakeFiles:
+    def __init__(self):
+        self.list_calls = 0
+        self.created = []
+
+    def list(self, **kwargs):
+        self.list_calls += 1
+        return _Call({"files": []})
+
+    def create(self, body=None, fields=None, media_body=None):
+        item = {"id": f"id-{len(self.created)}", "name": body["name"]}
+        self.created.append(body)
+        return _Call(item)
+
+
+class FakeDrive:
+    def __init__(self):
+        self.files_api = FakeFiles()
+
+    def files(self):
+        return self.files_api
+
+
+@pytest.fixture
+def drive(tmp_path, monkeypatch):
+    service = drive_module.GoogleDriveService()
+    service._session_store = ResumableSessionStore(str(tmp_path / "sessions.json"))
+    fake = FakeDrive()
+    monkeypatch.setattr(service, "_get_drive_service", lambda token_path=None: fake)
+    return service, fake
+
+
+def test_project_folders_are_listed_once_then_served_from_cache(drive):
+    service, fake = drive
+    first = service.ensure_project_folder("a@b.com", "프로젝트", root_folder_id="root")
+    assert (fake.files_api.list_calls, len(fake.files_api.created)) == (2, 2)
+
+    again = service.ensure_project_folder("a@b.com", "프로젝트", root_folder_id="root")
+    found = service.find_folder("a@b.com", parent_folder_id="root")
+    assert again == first and found["id"] == "id-0"
+    assert fake.files_api.list_calls == 2
+
+
+def test_id_cache_entries_expire():
+    now = [100.0]
+    cache = DriveIdCache(ttl_seconds=10, clock=lambda: now[0])
+    cache.put("parent", "video.mp4", {"id": "f1"})
+    assert cache.get("parent", "video.mp4") == {"id": "f1"}
+    now[0] += 11
+    assert cache.get("parent", "video.mp4") is None
+
+
+class FakeMedia:
+    def size(self):
+        return 3
+
+
+class FakeResponse(dict):
+    def __init__(self, status, **headers):
+        super().__init__(headers)
+        self.status = status
+
+
+class FakeHttp:
+    """Answers the status query (empty PUT) with the bytes the server has acknowledged."""
+
+    def __init__(self, request):
+        self.request_obj = request
+        self.queries = []
+
+    def request(self, uri, method="GET", headers=None, **kwargs):
+        self.queries.append(headers["Content-Range"])
+        return FakeResponse(308, range=f"bytes=0-{self.request_obj.server_offset - 1}"), b""
+
+
+class FakeResumableRequest:
+    """Stands in for googleapiclient's HttpRequest: three chunks, may die after the first."""
+
+    def __init__(self, fail_after=None, server_offset=0):
+        self.resumable = FakeMedia()
+        self.http = FakeHttp(self)
+        self.resumable_uri = None
+        self.resumable_progress = 0
+        self.server_offset = server_offset
+        self.fail_after = fail_after
+        self.sent = []
+
+    def next_chunk(self, num_retries=0):
+        if self.resumable_uri is None:
+            self.resumable_uri = "https://upload/session-1"
+        if self.fail_after is not None and len(self.sent) >= self.fail_after:
+            raise ConnectionError("network dropped")
+        self.sent.append(self.resumable_progress)
+        self.resumable_progress += 1
+        self.server_offset = self.resumable_progress
+        if self.resumable_progress == 3:
+            return None, {"id": "uploaded"}
+        return object(), None
+
+
+def test_interrupted_upload_resumes_from_saved_session(tmp_path, drive):
+    service, _fake = drive
+    with pytest.raises(ConnectionError):
+        service._execute_resumable(FakeResumableRequest(fail_after=1), "create:video.mp4")
+
+    # A new process reloads the session file, asks Drive for its offset and continues from there.
+    service._session_store = ResumableSessionStore(str(tmp_path / "sessions.json"))
+    resumed = FakeResumableRequest(server_offset=1)
+    assert service._execute_resumable(resumed, "create:video.mp4") == {"id": "uploaded"}
+    assert resumed.http.queries == ["bytes */3"]
+    assert resumed.sent == [1, 2]
+    assert service.session_store.get("create:video.mp4") is None
+
+
+class FakeMediaRequest:
+    def __init__(self, content):
+        self.content = content
+        self.headers = {}
+
+    def execute(self, num_retries=0):
+        start, end = self.headers["Range"].split("=")[1].split("-")
+        return self.content[int(start):int(end) + 1]
+
+
+class DownloadFiles:
+    def __init__(self, content, md5):
+        self.content = content
+        self.md5 = md5
+        self.ranges = []
+
+    def get(self, fileId=None, fields=None):
+        return _Call({"size": str(len(self.content)), "md5Checksum": self.md5, "modifiedTime": self.md5})
+
+    def get_media(self, fileId=None):
+        request = FakeMediaRequest(self.content)
+        original = request.execute
+
+        def execute(num_retries=0):
+            self.ranges.append(request.headers["Range"])
+            return original(num_retries)
+
+        request.execute = execute
+        return request
+
+
+def test_partial_download_is_discarded_when_the_drive_file_changed(tmp_path, drive, monkeypatch):
+    service, _fake = drive
+    monkeypatch.setattr(drive_module, "DOWNLOAD_CHUNK_SIZE", 4)
+    target = tmp_path / "video.mp4"
+    files = DownloadFiles(b"old-content!", "v1")
+    monkeypatch.setattr(service, "_get_drive_service", lambda token_path=None: type("D", (), {"files": lambda self: files})())
+
+    # An interrupted download of v1 left four bytes behind.
+    (tmp_path / "video.mp4.part").write_bytes(b"old-")
+    service.session_store.put(f"download:f1:{target}", "f1", size="12", md5Checksum="v1", modifiedTime="v1")
+    assert service.download_file("f1", str(target)) == str(target)
+    assert target.read_bytes() == b"old-content!"
+    assert files.ranges == ["bytes=4-7", "bytes=8-11"]
+
+    # Same leftover, but the file was replaced under the same ID: start again from byte 0.
+    (tmp_path / "video.mp4.part").write_bytes(b"old-")
+    service.session_store.put(f"download:f1:{target}", "f1", size="12", md5Checksum="v1", modifiedTime="v1")
+    files.content, files.md5, files.ranges = b"NEW-CONTENT!", "v2", []
+    assert service.download_file("f1", str(target)) == str(target)
+    assert target.read_bytes() == b"NEW-CONTENT!"
+    assert files.ranges[0] == "bytes=0-3"
+
+
+def test_session_store_drops_stale_sessions(tmp_path):
+    store = ResumableSessionStore(str(tmp_path / "sessions.json"), max_age_seconds=60)
+    store.put("old", "https://upload/old")
+    store._sessions["old"]["saved_at"] = time.time() - 120
+    store._save()
+    assert ResumableSessionStore(str(tmp_path / "sessions.json"), max_age_seconds=60).get("old") is None
+
+
+def test_session_stores_sharing_a_file_keep_each_others_sessions(tmp_path):
+    path = str(tmp_path / "sessions.json")
+    server, worker = ResumableSessionStore(path), ResumableSessionStore(path)
+    server.put("server-upload", "https://upload/a")
+    worker.put("worker-upload", "https://upload/b")
+    server.drop("missing")
+
+    reloaded = ResumableSessionStore(path)
+    assert reloaded.get("server-upload") == "https://upload/a"
+    assert reloaded.get("worker-upload") == "https://upload/b"
+    worker.drop("server-upload")
+    assert server.get("server-upload") is None
+
+
+def test_transfer_manager_runs_uploads_concurrently_in_order():
+    started = threading.Barrier(3, timeout=5)
+
+    class SlowDrive:
+        def upsert_file(self, local_file_path, **kwargs):
+            started.wait()  # all three must be in flight at once
+            return {"name": kwargs["filename"]}
+
+    manager = DriveTransferManager(max_workers=4, drive=SlowDrive())
+    results = manager.upsert_files([
+        {"local_file_path": "a", "filename": "video.mp4"},
+        None,
+        {"local_file_path": "b", "filename": "thumbnail.png"},
+        {"local_file_path": "c", "filename": "metadata.json"},
+    ])
+    assert results == [{"name": "video.mp4"}, None, {"name": "thumbnail.png"}, {"name": "metadata.json"}]
+
+
+def test_metadata_is_not_uploaded_when_the_video_upload_fails(monkeypatch):
+    from services import sync_service
+
+    uploads = []
+    monkeypatch.setattr(sync_service.db, "get_project", lambda project_id: {"name": "p", "employee_email": "a@b.com"})
+    monkeypatch.setattr(sync_service.db, "get_project_settings", lambda project_id: {})
+    monkeypatch.setattr(sync_service, "_get_drive_root_folder_id", lambda: "root")
+    monkeypatch.setattr(sync_service.google_drive_service, "ensure_project_folder",
+                        lambda **kwargs: {"id": "folder", "name": "p"})
+    monkeypatch.setattr(sync_service.drive_transfer_manager, "upsert_files",
+                        lambda items: [None for _item in items])
+    monkeypatch.setattr(sync_service.google_drive_service, "upsert_file",
+                        lambda path, **kwargs: uploads.append(kwargs["filename"]))
+
+    sync_service.upload_and_sync_video(1, "/tmp/video.mp4")
+
+    assert uploads == []
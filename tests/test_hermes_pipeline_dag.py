@@ -0,0 +1,135 @@
+import json
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+
+
+def _complete(store, job_id, result_path=None):
+    store.claim_next_job([store.get_job(job_id)["job_type"]], 1)
+    for status in (store.PREPARING, store.RENDERING, store.UPLOADING):
+        store.transition(job_id, status)
+    return store.transition(job_id, store.COMPLETED, output_path=str(result_path) if result_path else None)
+
+
+def _fail(store, job_id):
+    store.claim_next_job([store.get_job(job_id)["job_type"]], 1)
+    return store.transition(job_id, store.FAILED, error_message="boom")
+
+
+def test_downstream_stage_is_enqueued_with_result_reference(store, tmp_path):
+    pipeline_id = store.create_pipeline(
+        [
+            {"stage": "plan", "job_type": "script_plan_generate", "payload": {"topic": "t"}},
+            {
+                "stage": "script",
+                "job_type": "script_generate",
+                "depends_on": ["plan"],
+                "inputs": {"structure": "plan.structure"},
+                "payload": {"topic": "t"},
+            },
+        ],
+        source="autopilot",
+        priority=100,
+    )
+    stages = store.get_pipeline(pipeline_id)["stages"]
+    assert stages["plan"]["status"] == store.QUEUED
+    assert stages["script"]["status"] == store.STAGE_WAITING
+
+    result_path = tmp_path / "plan.json"
+    result_path.write_text(json.dumps({"structure": {"scenes": []}}), encoding="utf-8")
+    _complete(store, stages["plan"]["job_id"], result_path)
+
+    script = store.get_pipeline(pipeline_id)["stages"]["script"]
+    job = store.get_job(script["job_id"])
+    assert (job["status"], job["source"], job["priority"]) == (store.QUEUED, "autopilot", 100)
+    assert job["payload"]["pipeline_inputs"]["structure"] == {
+        "stage": "plan",
+        "job_id": stages["plan"]["job_id"],
+        "result_ref": str(result_path),
+        "field": "structure",
+    }
+    assert "structure" not in job["payload"]
+
+
+def test_independent_stages_are_enqueued_together(store):
+    pipeline_id = store.create_pipeline(
+        [
+            {"stage": "script", "job_type": "script_generate", "payload": {}},
+            {"stage": "anchors", "job_type": "topic_research", "depends_on": ["script"], "payload": {}},
+            {"stage": "metadata", "job_type": "publish_metadata_generate", "depends_on": ["script"], "payload": {}},
+            {"stage": "package", "job_type": "topic_research", "depends_on": ["anchors", "metadata"], "payload": {}},
+        ]
+    )
+    _complete(store, store.get_pipeline(pipeline_id)["stages"]["script"]["job_id"])
+
+    stages = store.get_pipeline(pipeline_id)["stages"]
+    assert stages["anchors"]["status"] == stages["metadata"]["status"] == store.QUEUED
+    assert stages["package"]["status"] == store.STAGE_WAITING
+
+    _complete(store, stages["metadata"]["job_id"])
+    assert store.get_pipeline(pipeline_id)["stages"]["package"]["status"] == store.STAGE_WAITING
+    _complete(store, stages["anchors"]["job_id"])
+    assert store.get_pipeline(pipeline_id)["stages"]["package"]["status"] == store.QUEUED
+
+
+def test_caller_submitted_stage_and_late_template(store):
+    pipeline_id = store.create_pipeline(
+        [
+            {"stage": "research", "job_type": "web_research"},
+            {"stage": "plan", "job_type": "script_plan_generate", "depends_on": ["research"]},
+        ]
+    )
+    assert store.pipeline_jobs(pipeline_id) == []
+    research_id = store.submit_job("web_research", {"topic": "t"}, pipeline_id=pipeline_id, stage="research")
+    _complete(store, research_id)
+    assert store.get_pipeline(pipeline_id)["stages"]["plan"]["job_id"] is None
+
+    [plan_id] = store.set_stage_payload(pipeline_id, "plan", {"topic": "t"})
+    assert store.pipeline_for_job(plan_id)["pipeline_id"] == pipeline_id
+    assert [job["job_id"] for job in store.pipeline_jobs(pipeline_id)] == [research_id, plan_id]
+    with pytest.raises(KeyError):
+        store.submit_job("web_research", {}, pipeline_id=pipeline_id, stage="missing")
+
+
+def test_resume_restarts_from_failed_stage(store):
+    pipeline_id = store.create_pipeline(
+        [
+            {"stage": "plan", "job_type": "script_plan_generate", "payload": {"topic": "t"}},
+            {"stage": "script", "job_type": "script_generate", "depends_on": ["plan"], "payload": {}, "max_retries": 0},
+        ]
+    )
+    plan_id = store.get_pipeline(pipeline_id)["stages"]["plan"]["job_id"]
+    _complete(store, plan_id)
+    failed_id = store.get_pipeline(pipeline_id)["stages"]["script"]["job_id"]
+    _fail(store, failed_id)
+    assert store.get_pipeline(pipeline_id)["status"] == store.FAILED
+
+    [resumed] = store.resume_pipeline(pipeline_id)
+    assert resumed["stage"] == "script" and resumed["job_id"] != failed_id
+    assert store.get_job(resumed["job_id"])["payload"]["resume_from_job_id"] == failed_id
+    assert store.get_job(plan_id)["status"] == store.COMPLETED  # completed stages are not re-run
+
+    # A late transition of the superseded job must not touch the stage.
+    store.transition(failed_id, store.QUEUED)
+    assert store.get_pipeline(pipeline_id)["stages"]["script"]["job_id"] == resumed["job_id"]
+    store.transition(failed_id, store.CANCELED)
+    _complete(store, resumed["job_id"])
+    assert store.get_pipeline(pipeline_id)["status"] == store.COMPLETED
+    assert store.resume_pipeline(pipeline_id) == []
+
+
+def test_create_pipeline_rejects_forward_edges(store):
+    with pytest.raises(ValueError):
+        store.create_pipeline(
+            [
+                {"stage": "a", "job_type": "web_research", "depends_on": ["b"]},
+                {"stage": "b", "job_type": "web_research"},
+            ]
+        )
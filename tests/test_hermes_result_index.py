@@ -0,0 +1,109 @@
+import json
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+import job_store  # noqa: E402
+import result_index  # noqa: E402
+
+
+@pytest.fixture
+def index(store, tmp_path, monkeypatch):
+    dirs = {result_index.HERMES: tmp_path / "hermes_results", result_index.PACKAGE: tmp_path / "packages"}
+    monkeypatch.setattr(result_index, "RESULT_DIRS", dirs)
+    return dirs
+
+
+def _plan(topic, ts, **extra):
+    return {
+        "job_type": "script_plan_generate",
+        "status": "COMPLETED",
+        "topic_queue_id": topic,
+        "category": "무협",
+        "upload_title": f"제목 {topic}",
+        "structure": {"scenes": [{"scene_order": 1}]},
+        "completed_at": ts,
+        **extra,
+    }
+
+
+def test_saved_results_are_listed_by_topic_with_paging(index):
+    hermes = index[result_index.HERMES]
+    result_index.save(result_index.HERMES, hermes / "plan-a.json", _plan("101", 10.0))
+    result_index.save(result_index.HERMES, hermes / "script-a.json",
+                      {"job_type": "script_generate", "topic_queue_id": "101", "script": "본문", "completed_at": 30.0})
+    # Research alone has nothing to show yet.
+    result_index.save(result_index.HERMES, hermes / "research-b.json",
+                      {"job_type": "web_research", "topic_queue_id": "102", "completed_at": 40.0})
+    result_index.save(result_index.PACKAGE, index[result_index.PACKAGE] / "103.json",
+                      {"topic_queue_id": "103", "script": "완성", "category": "야담", "completed_at": 20.0})
+
+    assert json.loads((hermes / "plan-a.json").read_text(encoding="utf-8"))["topic_queue_id"] == "101"
+    assert not list(hermes.glob("*.tmp"))
+
+    topics, total = job_store.list_result_topics(limit=10)
+    assert total == 2
+    assert [(t["topic_key"], t["updated_at"], t["has_package"]) for t in topics] == [("101", 30.0, 0), ("103", 20.0, 1)]
+    assert topics[0]["title"] == "제목 101"
+
+    page, _ = job_store.list_result_topics(limit=1, offset=1)
+    assert [t["topic_key"] for t in page] == ["103"]
+    assert [t["topic_key"] for t in job_store.list_result_topics(category="야담")[0]] == ["103"]
+    assert [r["result_id"] for r in job_store.list_results(topic_key="101")] == ["script-a", "plan-a"]
+    assert job_store.result_stats(result_index.HERMES) == {"count": 3, "latest_at": 40.0}
+
+
+def test_backfill_imports_existing_files_once(index):
+    hermes = index[result_index.HERMES]
+    hermes.mkdir()
+    (hermes / "old-plan.json").write_text(json.dumps(_plan("7", 5.0)), encoding="utf-8")
+    (hermes / "broken.json").write_text("{not json", encoding="utf-8")
+
+    assert result_index.ensure_backfilled() == 1
+    assert [t["topic_key"] for t in job_store.list_result_topics()[0]] == ["7"]
+
+    (hermes / "late.json").write_text(json.dumps(_plan("8", 6.0)), encoding="utf-8")
+    assert result_index.ensure_backfilled() == 0
+    assert result_index.ensure_backfilled(force=True) == 2
+
+
+def test_dashboard_lists_from_index(index):
+    from worker import dashboard_app
+
+    hermes = index[result_index.HERMES]
+    result_index.save(result_index.HERMES, hermes / "plan.json", _plan("55", 10.0))
+    result_index.save(result_index.HERMES, hermes / "script.json",
+                      {"job_type": "script_generate", "topic_queue_id": "55", "script": "대본 본문", "completed_at": 12.0})
+
+    page = dashboard_app._list_generated_results(limit=10, offset=0, category=None)
+    assert page["total"] == 1
+    [row] = page["results"]
+    assert (row["id"], row["title"], row["scene_count"], row["has_script"]) == ("topic_55", "제목 55", 1, True)
+
+
+def test_dashboard_total_counts_rows_and_keeps_job_only_topics(index):
+    from worker import dashboard_app
+
+    packages = index[result_index.PACKAGE]
+    # One topic with two final packages -> two rows.
+    result_index.save(result_index.PACKAGE, packages / "run-1.json",
+                      {"topic_queue_id": "9", "script": "완성 1", "completed_at": 20.0})
+    result_index.save(result_index.PACKAGE, packages / "run-2.json",
+                      {"topic_queue_id": "9", "script": "완성 2", "completed_at": 30.0})
+    # A topic that only exists as an autopilot job (no result file yet).
+    job_store.submit_job("script_generate", {"topic_queue_id": "77", "script": "작업 본문"}, source="autopilot")
+
+    page = dashboard_app._list_generated_results(limit=10, offset=0, category=None)
+    assert page["total"] == 3 == len(page["results"])
+    assert [row["id"] for row in page["results"]] == ["topic_77", "run-2", "run-1"]
+
+    second = dashboard_app._list_generated_results(limit=2, offset=2, category=None)
+    assert [row["id"] for row in second["results"]] == ["run-1"] and second["total"] == 3
@@ -0,0 +1,108 @@
+import sqlite3
+
+import pytest
+
+import database as db
+from services import learning_sync_service
+
+
+@pytest.fixture
+def learning_db(local_db):
+    conn = sqlite3.connect(str(local_db))
+    conn.executescript(
+        """
+        CREATE TABLE projects (id INTEGER PRIMARY KEY, name TEXT, topic TEXT, sync_id TEXT, employee_email TEXT);
+        CREATE TABLE project_learning_events (id INTEGER PRIMARY KEY AUTOINCREMENT, project_id INTEGER,
+            event_type TEXT, stage TEXT, source TEXT, payload_json TEXT, remote_synced_at TEXT,
+            remote_sync_error TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+        CREATE TABLE project_learning_snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, project_id INTEGER,
+            snapshot_type TEXT, reference_json TEXT, style_json TEXT, script_json TEXT, thumbnail_json TEXT,
+            tts_json TEXT, video_json TEXT, qa_json TEXT, upload_json TEXT, remote_synced_at TEXT,
+            remote_sync_error TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+        CREATE TABLE remote_sync_cursors (stream TEXT PRIMARY KEY, last_id INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+        INSERT INTO projects (id, name, topic, sync_id, employee_email) VALUES (1, 'p', 't', 'sync-1', 'a@b.com');
+        """
+    )
+    conn.executemany(
+        "INSERT INTO project_learning_events (project_id, event_type, payload_json) VALUES (1, ?, '{}')",
+        [(f"event_{n}",) for n in range(5)],
+    )
+    conn.commit()
+    conn.close()
+    return local_db
+
+
+class FakeClient:
+    def __init__(self, fail=False, status=503):
+        self.fail = fail
+        self.status = status
+        self.batches = []
+        self.single_upserts = 0
+
+    def has_supabase(self):
+        return True
+
+    def resolve_user_id(self, email=""):
+        return "user-1"
+
+    def upsert_many(self, table, rows, on_conflict, timeout=None, idempotency_key=None):
+        self.batches.append([row["local_event_id"] for row in rows])
+        if self.fail:
+            return {"ok": 0, "failed": len(rows), "errors": [f"HTTP {self.status}"], "failed_statuses": [self.status]}
+        return {"ok": len(rows), "failed": 0, "errors": [], "failed_statuses": []}
+
+    def upsert_by_key(self, table, key, value, payload, timeout=None):
+        self.single_upserts += 1
+        return not self.fail
+
+
+def _synced(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return [row[0] for row in conn.execute(
+            "SELECT id FROM project_learning_events WHERE remote_synced_at IS NOT NULL ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def test_cursor_advances_and_batches_are_marked_in_one_write(learning_db, monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(learning_sync_service, "web_admin_client", client)
+
+    first = learning_sync_service.sync_learning_data(limit=3)
+    second = learning_sync_service.sync_learning_data(limit=3)
+
+    assert client.batches == [[1, 2, 3], [4, 5]]
+    assert (first["events_synced"], second["events_synced"]) == (3, 2)
+    assert _synced(learning_db) == [1, 2, 3, 4, 5]
+    assert db.get_remote_sync_cursor("events") == 5
+    assert db.get_learning_sync_lag("events")["pending"] == 0
+
+
+def test_outage_keeps_cursor_so_the_same_rows_are_retried(learning_db, monkeypatch):
+    client = FakeClient(fail=True)
+    monkeypatch.setattr(learning_sync_service, "web_admin_client", client)
+
+    result = learning_sync_service.sync_learning_data(limit=3)
+    assert (result["events_synced"], result["events_failed"]) == (0, 3)
+    assert client.single_upserts == 0  # a 5xx stalls without the per-row fallback
+    assert db.get_remote_sync_cursor("events") == 0
+    assert db.get_learning_sync_lag("events")["errored"] == 3
+
+    client.fail = False
+    learning_sync_service.sync_learning_data(limit=3)
+    assert client.batches[-1] == [1, 2, 3]
+    assert db.get_remote_sync_cursor("events") == 3
+    status = learning_sync_service.sync_status()
+    assert status["streams"]["events"]["pending"] == 2 and status["streams"]["events"]["cursor"] == 3
+
+
+def test_rejected_batch_falls_back_to_row_by_row(learning_db, monkeypatch):
+    client = FakeClient(fail=True, status=400)
+    monkeypatch.setattr(learning_sync_service, "web_admin_client", client)
+
+    result = learning_sync_service.sync_learning_data(limit=3)
+
+    assert client.single_upserts == 3
+    assert result["events_failed"] == 3
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+import log_tail  # noqa: E402
+import logging_setup  # noqa: E402
+
+
+def test_tail_reads_only_the_end_and_excludes_partial_line(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_tail, "TAIL_BLOCK_BYTES", 64)
+    path = tmp_path / "render_worker.log"
+    path.write_bytes(b"".join(f"line {i}\r\n".encode() for i in range(1000)) + b"half-writ")
+
+    result = log_tail.tail(path, 3)
+    assert result["lines"] == ["line 997", "line 998", "line 999"]
+
+    with open(path, "ab") as fh:
+        fh.write(b"ten\nnext \xed\x95\x9c\n")
+    follow_up = log_tail.read_since(path, result["cursor"])
+    assert follow_up["lines"] == ["half-written", "next 한"]
+    assert follow_up["rotated"] is False
+    assert log_tail.read_since(path, follow_up["cursor"])["lines"] == []
+
+
+def test_read_since_is_bounded(tmp_path):
+    path = tmp_path / "hermes_worker.log"
+    path.write_text("".join(f"{i:04d}\n" for i in range(100)), encoding="utf-8")
+    cursor = log_tail.make_cursor("", 0)
+    seen = []
+    while True:
+        batch = log_tail.read_since(path, cursor, max_bytes=64)
+        assert len(batch["lines"]) <= 64 // 5
+        seen.extend(batch["lines"])
+        cursor = batch["cursor"]
+        if not batch["more"]:
+            break
+    assert seen == [f"{i:04d}" for i in range(100)]
+
+
+def test_read_since_follows_rotation_without_losing_lines(tmp_path):
+    path = tmp_path / "manager.log"
+    handler = logging_setup._RotatingFileHandler(path, maxBytes=80, backupCount=3, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger("test_log_tail_rotation")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        logger.warning("record 0")
+        cursor = log_tail.tail(path, 10)["cursor"]
+        for i in range(1, 30):
+            logger.warning("record %d", i)
+        assert (tmp_path / "manager.log.1").exists()
+        batch = log_tail.read_since(path, cursor)
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+    # Rotated more than once since the cursor: resumes at the current file,
+    # and everything it returns is in order.
+    assert batch["rotated"] is True
+    numbers = [int(line.split()[1]) for line in batch["lines"]]
+    assert numbers == sorted(numbers) and numbers[-1] == 29
+
+
+def test_read_since_reads_rest_of_rotated_file_first(tmp_path):
+    path = tmp_path / "local_api.log"
+    path.write_text("a\nb\n", encoding="utf-8")
+    cursor = log_tail.tail(path, 1)["cursor"]
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write("c\n")
+    path.rename(tmp_path / "local_api.log.1")
+    path.write_text("d\n", encoding="utf-8")
+
+    batch = log_tail.read_since(path, cursor)
+    assert batch["lines"] == ["c", "d"] and batch["rotated"] is True
+
+
+def test_follow_streams_appended_lines(tmp_path):
+    path = tmp_path / "dashboard.log"
+    path.write_text("first\n", encoding="utf-8")
+
+    async def run():
+        stream = log_tail.follow(path, tail_lines=5, poll_interval=0.01, heartbeat=0.05)
+        first = await stream.__anext__()
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write("second\n")
+        batches = [first]
+        while len(batches) < 3:
+            batches.append(await stream.__anext__())
+        await stream.aclose()
+        return batches
+
+    first, second, third = asyncio.run(run())
+    assert first["lines"] == ["first"]
+    assert second["lines"] == ["second"]
+    assert third is None  # heartbeat while idle
@@ -0,0 +1,92 @@
+import pathlib
+import sys
+import threading
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+import ipc  # noqa: E402
+import local_api_token  # noqa: E402
+import manager_rpc  # noqa: E402
+
+
+@pytest.fixture
+def rpc_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(manager_rpc, "RPC_PORT_FILE", tmp_path / "manager_rpc.port")
+    monkeypatch.setattr(local_api_token, "_DPAPI_AVAILABLE", False)
+    monkeypatch.setattr(local_api_token, "TOKEN_FILE_PLAIN", tmp_path / "token.txt")
+    monkeypatch.setattr(local_api_token, "TOKEN_FILE_DPAPI", tmp_path / "token.dpapi")
+    monkeypatch.setattr(local_api_token, "_restrict_to_current_user", lambda path: None)
+    for name in ("COMMAND_DIR", "RESULT_DIR"):
+        path = tmp_path / name.lower()
+        path.mkdir()
+        monkeypatch.setattr(ipc, name, path)
+    return tmp_path
+
+
+@pytest.fixture
+def server(rpc_env):
+    received = []
+
+    def on_command(cmd):
+        received.append(cmd)
+        return {"success": True, "echo": cmd["params"]}
+
+    srv = manager_rpc.RpcServer(on_command)
+    srv.start()
+    srv.received = received
+    yield srv
+    srv.close()
+
+
+def test_call_round_trip(server):
+    result = manager_rpc.call("stop_process", {"name": "render_worker"}, timeout=5)
+    assert result == {"success": True, "echo": {"name": "render_worker"}}
+    assert server.received[0]["command"] == "stop_process"
+
+
+def test_wrong_token_is_rejected(server, monkeypatch):
+    monkeypatch.setattr(manager_rpc, "get_or_create_token", lambda: "not-the-token")
+    with pytest.raises(manager_rpc.RpcUnavailable):
+        manager_rpc.call("shutdown_all", timeout=5)
+    assert server.received == []
+
+
+def test_send_command_falls_back_to_file_ipc(rpc_env):
+    def fake_manager():
+        while True:
+            commands = ipc.pending_commands()
+            if commands:
+                cmd = ipc.read_command(commands[0])
+                ipc.consume_command(commands[0])
+                ipc.write_result(cmd["command_id"], {"success": True, "via": "file"})
+                return
+
+    manager = threading.Thread(target=fake_manager, daemon=True)
+    manager.start()
+    assert ipc.send_command("start_process", {"name": "hermes_worker"}, timeout=5) == {"success": True, "via": "file"}
+    manager.join(5)
+
+
+def test_status_events_are_streamed(server):
+    events = manager_rpc.iter_events(("status",), timeout=5)
+    received = {}
+
+    def _read():
+        received["event"] = next(events)
+
+    reader = threading.Thread(target=_read)
+    reader.start()
+    for _ in range(500):
+        if server.subscriber_count:
+            break
+        threading.Event().wait(0.01)
+    server.publish("other", {"ignored": True})
+    server.publish("status", {"processes": {}})
+    reader.join(5)
+    events.close()
+    assert received["event"] == {"event": "status", "data": {"processes": {}}}
@@ -0,0 +1,73 @@
+import json
+import pathlib
+import sys
+import time
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+from progress_coalescer import Coalescer, StateFileWriter  # noqa: E402
+
+
+@pytest.fixture
+def store(store, monkeypatch):
+    monkeypatch.setattr(store, "_progress", Coalescer(store._write_progress, interval=0.2))
+    return store
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_coalescer_writes_first_and_trailing_value_only():
+    writes = []
+    coalescer = Coalescer(lambda key, value: writes.append((key, value)), interval=0.2)
+    for value in range(50):
+        coalescer.submit("job", value)
+    assert writes == [("job", 0)]
+    assert _wait_for(lambda: len(writes) == 2)
+    assert writes[-1] == ("job", 49)
+    assert coalescer.submitted == 50 and coalescer.flushed == 2
+
+
+def test_update_progress_is_coalesced_and_eventually_flushed(store):
+    job_id = store.submit_job("render_video", {})
+    for pct in range(1, 41):
+        store.update_progress(job_id, pct, f"frame {pct}")
+    assert store.get_job(job_id)["progress"] == 1
+    assert _wait_for(lambda: store.get_job(job_id)["progress"] == 40)
+    assert store.get_job(job_id)["progress_message"] == "frame 40"
+
+
+def test_transition_carries_pending_progress(store):
+    job_id = store.submit_job("render_video", {})
+    store.claim_next_job(["render_video"], 1)
+    store.transition(job_id, store.PREPARING)
+    store.update_progress(job_id, 5, "first")
+    store.update_progress(job_id, 63, "encoding")
+
+    job = store.transition(job_id, store.RENDERING)
+    assert (job["progress"], job["progress_message"]) == (63, "encoding")
+    assert store._progress.pending(job_id) is None
+
+
+def test_state_writer_forces_status_changes(tmp_path):
+    path = tmp_path / "render_worker.json"
+    writer = StateFileWriter(interval=60)
+    writer.write(path, {"status": "rendering", "current_job_id": "a", "progress": 1})
+    writer.write(path, {"status": "rendering", "current_job_id": "a", "progress": 50})
+    assert json.loads(path.read_text(encoding="utf-8"))["progress"] == 1
+    assert writer.latest(path)["progress"] == 50
+
+    writer.write(path, {"status": "uploading", "current_job_id": "a", "progress": 100})
+    assert json.loads(path.read_text(encoding="utf-8"))["status"] == "uploading"
+    assert not path.with_suffix(".json.tmp").exists()
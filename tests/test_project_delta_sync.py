@@ -0,0 +1,123 @@
+import threading
+
+import pytest
+
+from services import project_sync_service as sync
+
+
+class FakeBridge:
+    """Applies push / push_delta the way the desktop-project-sync route does."""
+
+    def __init__(self):
+        self.rows = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, action, params=None):
+        params = dict(params or {})
+        with self.lock:
+            self.calls.append((action, params))
+            if action == "push":
+                self.rows[params["sync_id"]] = params
+                return {"success": True}
+            if action == "push_delta":
+                row = self.rows.get(params["sync_id"])
+                if not row or row.get("payload_hash") != params["base_hash"]:
+                    return {"success": False, "error": "hash_mismatch"}
+                merged = {**row["project_payload"], **params["changed_fields"]}
+                for key in params["removed_fields"]:
+                    merged.pop(key, None)
+                row.update(project_payload=merged, payload_hash=params["payload_hash"], name=params["name"])
+                if "progress_payload" in params:
+                    row["progress_payload"] = params["progress_payload"]
+                return {"success": True}
+            if action == "get":
+                return {"success": True, "projects": [
+                    {"sync_id": sid, "project_payload": {"settings": {"n": sid}}} for sid in params["sync_ids"]
+                ]}
+            raise AssertionError(action)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    projects = {1: {"id": 1, "sync_id": "s1", "name": "p1", "topic": "t", "status": "draft"}}
+    full_data = {1: {"project": {"id": 1}, "settings": {"app_mode": "longform"}, "script": "a" * 5000,
+                     "image_prompts": [{"scene_number": n, "prompt": f"scene {n}"} for n in range(50)]}}
+    states = {}
+    bridge = FakeBridge()
+
+    monkeypatch.setattr(sync, "_bridge", bridge)
+    monkeypatch.setattr(sync.db, "get_project", lambda pid: projects.get(pid))
+    monkeypatch.setattr(sync.db, "get_project_full_data_v2", lambda pid: full_data.get(pid))
+    monkeypatch.setattr(sync.db, "get_project_sync_state", lambda pid: states.get(pid))
+    monkeypatch.setattr(sync.db, "save_project_sync_state",
+                        lambda pid, sid, h, hashes, synced_at=None: states.__setitem__(
+                            pid, {"sync_id": sid, "payload_hash": h, "field_hashes": hashes}))
+    monkeypatch.setattr(sync.db, "clear_project_sync_state", lambda pid: states.pop(pid, None))
+    monkeypatch.setattr(sync.db, "mark_project_synced", lambda pid, synced_at=None: None)
+    monkeypatch.setattr(sync.db, "mark_project_dirty", lambda pid: None)
+    return projects, full_data, states, bridge
+
+
+def test_second_push_sends_only_changed_fields(env):
+    projects, full_data, _states, bridge = env
+    assert sync.sync_project_metadata(1)
+    assert bridge.calls[-1][0] == "push"
+
+    full_data[1]["settings"] = {"app_mode": "longform", "voice": "b"}
+    assert sync.sync_project_metadata(1)
+    action, params = bridge.calls[-1]
+    assert action == "push_delta"
+    assert list(params["changed_fields"]) == ["settings"]
+    assert "progress_payload" not in params
+    assert bridge.rows["s1"]["project_payload"]["script"] == "a" * 5000
+
+    calls = len(bridge.calls)
+    assert sync.sync_project_metadata(1)  # nothing changed -> no request at all
+    assert len(bridge.calls) == calls
+
+    projects[1]["name"] = "renamed"
+    assert sync.sync_project_metadata(1)
+    assert bridge.calls[-1][0] == "push_delta" and bridge.calls[-1][1]["changed_fields"] == {}
+    assert bridge.rows["s1"]["name"] == "renamed"
+
+
+def test_hash_mismatch_falls_back_to_full_snapshot(env):
+    _projects, full_data, states, bridge = env
+    assert sync.sync_project_metadata(1)
+    bridge.rows["s1"]["payload_hash"] = "changed-on-another-machine"
+
+    full_data[1]["script"] = "b"
+    assert sync.sync_project_metadata(1)
+    assert [action for action, _params in bridge.calls[-2:]] == ["push_delta", "push"]
+    assert states[1]["payload_hash"] == bridge.rows["s1"]["payload_hash"]
+
+
+def test_restore_fetches_payloads_only_for_missing_projects(env, monkeypatch):
+    _projects, _full_data, _states, bridge = env
+    remote = [{"sync_id": f"r{n}", "name": f"remote {n}"} for n in range(3)] + [{"sync_id": "s1", "name": "p1"}]
+    monkeypatch.setattr(sync, "fetch_remote_projects", lambda email, include_payload=True: remote)
+    monkeypatch.setattr(sync.db, "get_projects_with_status", lambda employee_email=None: [{"sync_id": "s1"}])
+    restored = []
+    monkeypatch.setattr(sync, "restore_project_from_remote",
+                        lambda rp: restored.append((rp["sync_id"], rp["project_payload"]["settings"]["n"])) or 10)
+
+    result = sync.ensure_local_projects_from_remote("a@b.com")
+
+    assert result == {"fetched": 4, "restored": 3, "skipped": 0, "failed": 0}
+    assert sorted(restored) == [("r0", "r0"), ("r1", "r1"), ("r2", "r2")]
+    assert [params["sync_ids"] for action, params in bridge.calls if action == "get"] == [["r0", "r1", "r2"]]
+
+
+def test_restore_skips_projects_whose_payload_could_not_be_fetched(env, monkeypatch):
+    remote = [{"sync_id": "r0", "name": "remote 0"}, {"sync_id": "r1", "name": "remote 1"}]
+    monkeypatch.setattr(sync, "fetch_remote_projects", lambda email, include_payload=True: remote)
+    monkeypatch.setattr(sync.db, "get_projects_with_status", lambda employee_email=None: [])
+    monkeypatch.setattr(sync, "fetch_remote_payloads", lambda sync_ids: {"r0": {"settings": {"n": "r0"}}})
+    restored = []
+    monkeypatch.setattr(sync, "restore_project_from_remote", lambda rp: restored.append(rp["sync_id"]) or 10)
+
+    result = sync.ensure_local_projects_from_remote("a@b.com")
+
+    assert restored == ["r0"]
+    assert (result["restored"], result["failed"]) == (1, 1)
@@ -0,0 +1,123 @@
+import threading
+
+import remote_drive_worker
+from remote_drive_worker import RemoteDriveWorker, RenderPipeline
+
+
+class FakeWorker:
+    """Stage methods record their calls; render/publish of chosen jobs block on events."""
+
+    poll_interval = 0
+
+    def __init__(self, jobs, render_slots=1, pipeline_depth=1):
+        self.render_slots = render_slots
+        self.pipeline_depth = pipeline_depth
+        self.pending = list(jobs)
+        self.log = []
+        self.released = []
+        self.updates = []
+        self.lock = threading.Lock()
+        self.gates = {}
+
+    def gate(self, name):
+        return self.gates.setdefault(name, threading.Event())
+
+    def _record(self, entry):
+        with self.lock:
+            self.log.append(entry)
+        self.gate(f"{entry[0]}-{entry[1]}-started").set()
+
+    def fetch_next_job(self, pipelined=False):
+        assert pipelined
+        with self.lock:
+            return self.pending[0] if self.pending else None
+
+    def claim_job(self, job):
+        with self.lock:
+            self.pending.remove(job)
+        return job
+
+    def fetch_stage(self, job):
+        self._record(("fetch", job["id"]))
+        return f"/tmp/job-{job['id']}"
+
+    def render_stage(self, job, temp_dir):
+        self._record(("render", job["id"]))
+        assert self.gate(f"render-{job['id']}-release").wait(5)
+        return f"{temp_dir}/output.mp4"
+
+    def publish_stage(self, job, temp_dir, output_path):
+        self._record(("publish", job["id"]))
+        assert self.gate(f"publish-{job['id']}-release").wait(5)
+
+    def update_job(self, job_id, **fields):
+        self.updates.append((job_id, fields))
+
+    def release_job(self, job, temp_dir=None):
+        self.released.append(job["id"])
+        self.gate("released").set()
+
+
+def test_upload_and_next_download_overlap_with_rendering():
+    worker = FakeWorker([{"id": n} for n in (1, 2, 3)])
+    for n in (1, 2, 3):
+        worker.gate(f"publish-{n}-release").set()
+    worker.gate("render-1-release").set()
+    done = []
+    stop = threading.Event()
+
+    def on_change(event, job, stages):
+        if event == "completed":
+            done.append(job["id"])
+            if len(done) == 3:
+                stop.set()
+
+    runner = threading.Thread(target=RenderPipeline(worker, stop.is_set, on_change).run)
+    runner.start()
+    # While job 2 renders, job 1 has been published and job 3 is already downloaded.
+    assert worker.gate("render-2-started").wait(5)
+    assert worker.gate("publish-1-started").wait(5)
+    assert worker.gate("fetch-3-started").wait(5)
+    assert ("render", 3) not in worker.log
+    worker.gate("render-2-release").set()
+    worker.gate("render-3-release").set()
+    runner.join(10)
+
+    assert not runner.is_alive()
+    assert done == [1, 2, 3]
+    assert worker.released == []
+
+
+def test_stopping_returns_fetched_jobs_that_never_started_rendering():
+    worker = FakeWorker([{"id": n} for n in (1, 2)])
+    worker.gate("publish-1-release").set()
+    stop = threading.Event()
+    runner = threading.Thread(target=RenderPipeline(worker, stop.is_set).run)
+    runner.start()
+    assert worker.gate("render-1-started").wait(5)
+    assert worker.gate("fetch-2-started").wait(5)
+    stop.set()
+    assert worker.gate("released").wait(5)
+    worker.gate("render-1-release").set()
+    runner.join(10)
+
+    assert not runner.is_alive()
+    assert worker.released == [2]
+    assert ("publish", 1) in worker.log and ("render", 2) not in worker.log
+
+
+def test_pipelined_fetch_counts_render_slots_not_own_queued_jobs(monkeypatch):
+    worker = RemoteDriveWorker.__new__(RemoteDriveWorker)
+    worker.worker_id = "pc-1"
+    worker.max_concurrent_jobs = 2
+    worker.render_slots = 1
+    others = {"count": 1}
+    monkeypatch.setattr(worker, "_active_rendering_count",
+                        lambda exclude_worker_id=None: others["count"] + (0 if exclude_worker_id else 3))
+    monkeypatch.setattr(worker, "_request", lambda method, url, **kwargs: [{"id": "next"}])
+    monkeypatch.setattr(remote_drive_worker.RemoteDriveWorker, "queue_url", "https://example/queue")
+
+    assert worker.fetch_next_job(pipelined=True) == {"id": "next"}
+    assert worker.fetch_next_job() is None
+    others["count"] = 2
+    assert worker.fetch_next_job(pipelined=True) is None
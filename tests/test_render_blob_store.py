@@ -0,0 +1,110 @@
+import json
+import os
+
+import pytest
+
+from services.render_blob_store import (
+    BLOB_MANIFEST_FORMAT,
+    BlobCache,
+    LocalDirBlobStore,
+    materialize_package,
+    publish_package,
+)
+from services.render_package import RenderPackage
+
+
+def _build(tmp_path, name, scenes):
+    package = RenderPackage(str(tmp_path / name))
+    for scene_path in scenes:
+        package.add_file(scene_path, f"images/{scene_path.name}")
+    package.add_json("config.json", {"images": [p.name for p in scenes]})
+    package.build()
+    return str(tmp_path / name)
+
+
+@pytest.fixture
+def scenes(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    paths = []
+    for n in range(3):
+        path = source / f"scene_{n}.png"
+        path.write_bytes(bytes([n]) * 4000)
+        paths.append(path)
+    return paths
+
+
+def test_resubmit_uploads_and_downloads_only_changed_blobs(tmp_path, scenes):
+    store = LocalDirBlobStore(str(tmp_path / "store"))
+    cache = BlobCache(str(tmp_path / "cache"), max_bytes=10 ** 9)
+
+    first, stats = publish_package(_build(tmp_path, "v1.zip", scenes), store)
+    assert first["format"] == BLOB_MANIFEST_FORMAT
+    assert stats["uploaded_files"] == 4 and stats["reused_files"] == 0
+    pulled = materialize_package(first, str(tmp_path / "job1"), store, cache)
+    assert pulled["downloaded_files"] == 4
+    assert (tmp_path / "job1" / "images" / "scene_1.png").read_bytes() == scenes[1].read_bytes()
+
+    scenes[1].write_bytes(b"edited" * 100)
+    second, stats = publish_package(_build(tmp_path, "v2.zip", scenes), store)
+    # Only the edited scene is new; config.json is unchanged as well.
+    assert (stats["uploaded_files"], stats["uploaded_bytes"]) == (1, 600)
+    assert stats["reused_files"] == 3
+    pulled = materialize_package(second, str(tmp_path / "job2"), store, cache)
+    assert (pulled["downloaded_files"], pulled["cached_files"]) == (1, 3)
+    assert (tmp_path / "job2" / "images" / "scene_1.png").read_bytes() == b"edited" * 100
+    assert json.loads((tmp_path / "job2" / "config.json").read_text(encoding="utf-8"))["images"][0] == "scene_0.png"
+
+
+def test_corrupt_blob_is_rejected_and_not_cached(tmp_path, scenes):
+    store = LocalDirBlobStore(str(tmp_path / "store"))
+    cache = BlobCache(str(tmp_path / "cache"), max_bytes=10 ** 9)
+    manifest, _stats = publish_package(_build(tmp_path, "v1.zip", scenes), store)
+    entry = manifest["files"][0]
+    with open(entry["ref"], "wb") as f_out:
+        f_out.write(b"tampered")
+
+    with pytest.raises(RuntimeError, match="hash mismatch"):
+        materialize_package(manifest, str(tmp_path / "job"), store, cache)
+    assert cache.get(entry["sha256"]) is None
+    assert not [name for _dir, _dirs, files in os.walk(tmp_path / "cache") for name in files]
+
+
+def test_manifest_paths_cannot_escape_the_work_dir(tmp_path, scenes):
+    store = LocalDirBlobStore(str(tmp_path / "store"))
+    manifest, _stats = publish_package(_build(tmp_path, "v1.zip", scenes), store)
+    manifest["files"][0]["path"] = "../outside.png"
+    with pytest.raises(ValueError):
+        materialize_package(manifest, str(tmp_path / "job"), store, BlobCache(str(tmp_path / "cache"), 10 ** 9))
+    assert not (tmp_path / "outside.png").exists()
+
+
+def test_cache_trim_drops_least_recently_used_first(tmp_path):
+    cache = BlobCache(str(tmp_path / "cache"), max_bytes=2500)
+    for n, digest in enumerate(["aa" * 32, "bb" * 32, "cc" * 32]):
+        path = cache.path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f_out:
+            f_out.write(b"x" * 1000)
+        os.utime(path, (1000 + n, 1000 + n))
+    cache.get("aa" * 32)  # used again -> newest
+
+    cache.trim()
+    assert cache.get("bb" * 32) is None
+    assert cache.get("aa" * 32) and cache.get("cc" * 32)
+
+
+def test_sweep_drops_expired_blobs_but_resubmission_keeps_reused_ones_alive(tmp_path, scenes):
+    store = LocalDirBlobStore(str(tmp_path / "store"))
+    manifest, _stats = publish_package(_build(tmp_path, "v1.zip", scenes[:2]), store)
+    day = 86400
+    for entry in manifest["files"]:
+        os.utime(entry["ref"], (0, 0))  # uploaded long ago
+
+    # scene_0 is reused by a new submission, which refreshes it; scene_1 is not.
+    publish_package(_build(tmp_path, "v2.zip", scenes[:1]), store)
+    removed = store.sweep(14 * day)
+
+    kept = {entry["path"]: os.path.exists(entry["ref"]) for entry in manifest["files"]}
+    assert kept == {"images/scene_0.png": True, "images/scene_1.png": False, "config.json": False}
+    assert removed == 2
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import zipfile
+
+import pytest
+
+from services import remote_render_service
+from services.progress import get_render_progress
+from services.remote_drive_render_service import packaging_progress_callback
+from services.render_package import MANIFEST_NAME, RenderPackage, read_manifest
+
+
+def test_media_is_stored_text_is_deflated_and_manifest_has_hashes(tmp_path):
+    image = tmp_path / "scene_001.png"
+    image.write_bytes(b"\x89PNG" + bytes(range(256)) * 40)
+    audio = tmp_path / "voice.mp3"
+    audio.write_bytes(b"ID3" + b"\x01" * 5000)
+    progress = []
+
+    package = RenderPackage(str(tmp_path / "pkg.zip"), lambda pct, msg: progress.append(pct))
+    package.add_file(image, "images/scene_001.png")
+    package.add_file(audio, "audio/voice.mp3")
+    package.add_json("config.json", {"images": ["scene_001.png"], "title": "제목"})
+    manifest = package.build()
+
+    with zipfile.ZipFile(tmp_path / "pkg.zip") as zf:
+        types = {info.filename: info.compress_type for info in zf.infolist()}
+        assert zf.read("images/scene_001.png") == image.read_bytes()
+        assert json.loads(zf.read("config.json"))["title"] == "제목"
+    assert types["images/scene_001.png"] == zipfile.ZIP_STORED
+    assert types["audio/voice.mp3"] == zipfile.ZIP_STORED
+    assert types["config.json"] == zipfile.ZIP_DEFLATED
+    assert list(types)[-1] == MANIFEST_NAME
+
+    files = {entry["path"]: entry for entry in manifest["files"]}
+    assert files["images/scene_001.png"]["sha256"] == hashlib.sha256(image.read_bytes()).hexdigest()
+    assert files["audio/voice.mp3"]["size"] == audio.stat().st_size
+    assert read_manifest(str(tmp_path / "pkg.zip")) == manifest
+    assert progress[0] == 0 and progress[-1] == 100 and progress == sorted(progress)
+    assert not (tmp_path / "pkg.zip.part").exists()
+
+
+def test_failed_build_leaves_no_partial_zip(tmp_path):
+    package = RenderPackage(str(tmp_path / "pkg.zip"))
+    package.add_json("config.json", {})
+    package.add_file(tmp_path / "missing.mp4", "intro.mp4")
+    with pytest.raises(OSError):
+        package.build()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_music_package_streams_tracks_without_staging(tmp_path, monkeypatch):
+    tracks = []
+    for index in range(2):
+        track = tmp_path / f"song_{index}.mp3"
+        track.write_bytes(b"ID3" + bytes([index]) * 2000)
+        tracks.append(str(track))
+    monkeypatch.setattr(remote_render_service.config, "OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setattr(remote_render_service.db, "get_project_settings", lambda pid: {})
+    monkeypatch.setattr(remote_render_service.db, "get_project", lambda pid: {"name": "플레이리스트"})
+    monkeypatch.setattr(remote_render_service.db, "get_project_metadata", lambda pid, mode=None: {})
+
+    def no_staging(*args, **kwargs):
+        raise AssertionError("render packages must not stage copies")
+
+    monkeypatch.setattr(remote_render_service.shutil, "copy2", no_staging)
+
+    zip_path = remote_render_service.package_music_project_assets(
+        7, tracks, playlist_title="새벽", progress_callback=packaging_progress_callback(7))
+    with zipfile.ZipFile(zip_path) as zf:
+        config = json.loads(zf.read("config.json"))
+        assert zf.read("audio/track_01.mp3") == open(tracks[1], "rb").read()
+    assert [t["filename"] for t in config["track_entries"]] == ["track_00.mp3", "track_01.mp3"]
+    assert config["playlist_title"] == "새벽"
+    assert get_render_progress(7)["status"] == "remote_packaging"
+    assert get_render_progress(7)["progress"] == 100
+    assert {f["path"] for f in read_manifest(zip_path)["files"]} == {
+        "audio/track_00.mp3", "audio/track_01.mp3", "config.json"}
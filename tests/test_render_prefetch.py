@@ -0,0 +1,121 @@
+import logging
+import pathlib
+import sys
+import time
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+import render_worker  # noqa: E402
+
+
+@pytest.fixture
+def central(tmp_path, monkeypatch):
+    """A fake central server with one queued render job and a short lease."""
+    calls = {"claims": 0, "renewals": 0}
+
+    def claim_job(worker_id, worker_instance_id, allowed_job_types):
+        calls["claims"] += 1
+        if calls["claims"] > 1:
+            return None
+        return {"job_id": "remote-1", "job_type": "render_video", "priority": 0,
+                "payload": {"source_path": str(tmp_path / "package.zip")},
+                "lease_id": "lease-1", "lease_expires_at": time.time() + 1.0}
+
+    def renew_lease(remote_job_id, lease_id, worker_instance_id):
+        calls["renewals"] += 1
+        return {"ok": True, "lease_expires_at": time.time() + 1.0}
+
+    def prepare_temp_dir(source_path):
+        temp_dir = tmp_path / "prefetched"
+        temp_dir.mkdir()
+        return temp_dir
+
+    monkeypatch.setattr(render_worker.central_client, "claim_job", claim_job)
+    monkeypatch.setattr(render_worker.central_client, "renew_lease", renew_lease)
+    monkeypatch.setattr(render_worker, "prepare_temp_dir", prepare_temp_dir)
+    monkeypatch.setattr(render_worker, "get_job_logger", lambda job_id: logging.getLogger("test_render_prefetch"))
+    monkeypatch.setattr(render_worker, "LEASE_RENEW_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr(render_worker, "_next_remote_claim_at", 0.0)
+    return calls
+
+
+def test_prefetched_job_holds_no_capacity_until_it_starts(store, central):
+    prefetcher = render_worker._Prefetcher()
+    prefetcher.start()
+    prefetcher.start()  # one prefetch per slot
+    held = prefetcher.take(capacity=1.0)
+    try:
+        assert central["claims"] == 1
+        assert held["temp_dir"].is_dir()
+        job = held["job"]
+        assert job["status"] == store.CLAIMED and job["remote_job_id"] == "remote-1"
+        assert job["cost"] == 1.0  # charged on admission, mirrored with 0
+        deadline = time.time() + 2
+        while central["renewals"] < 2 and time.time() < deadline:
+            time.sleep(0.02)
+        assert central["renewals"] >= 2  # renewed from the claim on, not from the start
+        assert not prefetcher.holding
+    finally:
+        held["renewal"][1].set()
+
+
+def test_prefetched_job_waits_for_capacity_then_is_released(store, central, monkeypatch):
+    running = store.submit_job("render_video", {})
+    store.claim_next_job(["render_video"], 1, capacity=1.0)
+    prefetcher = render_worker._Prefetcher()
+    prefetcher.start()
+
+    assert prefetcher.take(capacity=1.0) is None
+    assert prefetcher.holding
+    assert store.active_cost(["render_video"]) == 1.0
+    assert store.get_job(running)["cost"] == 1.0
+
+    monkeypatch.setattr(render_worker, "RENDER_PREFETCH_MAX_HOLD_SECONDS", 0.0)
+    assert prefetcher.take(capacity=1.0) is None
+    assert prefetcher.holding  # the slot's own job still runs - keep holding
+    prefetcher.current_finished()
+    assert prefetcher.take(capacity=1.0) is None
+    assert not prefetcher.holding
+    released = [j for j in store.list_jobs() if j["source"] == "central_server"]
+    assert [j["status"] for j in released] == [store.CANCELED]
+    assert not (pathlib.Path(released[0]["payload"]["source_path"]).parent / "prefetched").exists()
+
+
+def test_long_render_keeps_the_prefetched_lease_past_the_hold_limit(store, central, monkeypatch):
+    monkeypatch.setattr(render_worker, "RENDER_PREFETCH_MAX_HOLD_SECONDS", 0.1)
+    prefetcher = render_worker._Prefetcher()
+    prefetcher.start()
+    prefetcher._thread.join()
+
+    time.sleep(0.4)  # the current render outlasts the hold limit
+    renewals = central["renewals"]
+    time.sleep(0.2)
+    assert central["renewals"] > renewals  # still renewing while the slot is busy
+
+    prefetcher.current_finished()
+    held = prefetcher.take(capacity=1.0)
+    try:
+        assert held is not None and held["job"]["status"] == store.CLAIMED
+        assert held["temp_dir"].is_dir()
+    finally:
+        held["renewal"][1].set()
+
+
+def test_prefetched_job_with_lapsed_lease_is_not_started(store, central, monkeypatch):
+    def failing_renewal(*args):
+        raise render_worker.central_client.CentralServerUnavailable("down")
+
+    monkeypatch.setattr(render_worker.central_client, "renew_lease", failing_renewal)
+    prefetcher = render_worker._Prefetcher()
+    prefetcher.start()
+    prefetcher._thread.join()
+    job_id = prefetcher._held["job"]["job_id"]
+    store.update_lease(job_id, time.time() - 1)
+
+    assert prefetcher.take(capacity=1.0) is None
+    assert store.get_job(job_id)["status"] == store.CANCELED
@@ -0,0 +1,37 @@
+import asyncio
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from services import progress  # noqa: E402
+from services.event_bus import RENDER, EventBus  # noqa: E402
+
+
+def test_render_progress_is_published_only_when_it_changes(monkeypatch):
+    bus = EventBus()
+    monkeypatch.setattr(progress, "event_bus", bus)
+    monkeypatch.setattr(progress, "RENDER_PROGRESS", {})
+    seen = []
+    bus.add_listener(seen.append)
+
+    logger = progress.RenderLogger(7, start_pct=50, end_pct=100)
+    for index in (0, 1, 2, 50, 51):
+        logger.callback(bars={"t": {"index": index, "total": 100}})
+    progress.set_render_status(7, "completed", 100, video_path="/output/7/final.mp4")
+
+    assert [(m["data"]["status"], m["data"]["progress"]) for m in seen] == [
+        ("rendering", 50), ("rendering", 51), ("rendering", 75), ("completed", 100)
+    ]
+    assert progress.get_render_progress(7)["video_path"] == "/output/7/final.mp4"
+
+    async def first_snapshot():
+        stream = bus.subscribe({RENDER}, match=lambda m: m["data"]["project_id"] == 7)
+        snapshot = await stream.__anext__()
+        await stream.aclose()
+        return snapshot
+
+    [latest] = asyncio.run(first_snapshot())["data"]["events"]
+    assert latest["data"]["status"] == "completed"
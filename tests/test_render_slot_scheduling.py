@@ -0,0 +1,82 @@
+import os
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+import render_capacity  # noqa: E402
+from render_capacity import HostResources, estimate_job_cost, plan_render_slots  # noqa: E402
+
+
+def test_cpu_encode_is_limited_by_cores_and_ram():
+    host = HostResources(cpu_cores=16, total_ram_mb=8192, available_ram_mb=6000)
+    plan = plan_render_slots(host, encoder="libx264", gpu_active=False, max_slots=8)
+    assert plan.slots == 2
+    assert plan.limited_by == "ram"
+    assert plan.capacity == 2.0
+
+    host = HostResources(cpu_cores=8, total_ram_mb=65536, available_ram_mb=60000)
+    assert plan_render_slots(host, encoder="libx264", gpu_active=False, max_slots=8).slots == 2
+
+
+def test_hardware_encoder_is_limited_by_sessions():
+    host = HostResources(cpu_cores=32, total_ram_mb=65536, available_ram_mb=60000)
+    plan = plan_render_slots(host, encoder="h264_nvenc", gpu_active=True, max_slots=8)
+    assert plan.hardware_encoder
+    assert plan.limited_by == "encoder_sessions"
+    assert plan.slots == render_capacity.RENDER_GPU_ENCODER_SESSIONS
+
+
+def test_memory_pressure_drops_to_one_but_keeps_busy_slots():
+    host = HostResources(cpu_cores=32, total_ram_mb=65536, available_ram_mb=100)
+    plan = plan_render_slots(host, busy_slots=3, encoder="libx264", gpu_active=False, max_slots=4)
+    assert plan.memory_pressure
+    assert plan.slots == 3  # busy slots are never shrunk away
+    assert plan.capacity == 1.0  # ...but nothing new is admitted
+
+
+def test_job_cost_scales_with_resolution_duration_and_effects():
+    assert estimate_job_cost("render_video", {}) == 1.0
+    assert estimate_job_cost("hermes_topic", {"resolution": "4k"}) == 1.0
+    assert estimate_job_cost("render_video", {"resolution": "4k"}) == 4.0
+    assert estimate_job_cost("render_video", {"duration_seconds": 1200}) == 2.0
+    assert estimate_job_cost("render_video", {"resolution": "720p", "duration": 60}) == 0.25
+    assert estimate_job_cost("render_video", {"effects": ["a", "b"], "subtitles": True}) == 1.45
+
+
+def test_claim_admits_jobs_up_to_capacity(store):
+    first = store.submit_job("render_video", {})
+    second = store.submit_job("render_video", {})
+    third = store.submit_job("render_video", {})
+
+    assert store.claim_next_job(["render_video"], os.getpid(), capacity=2.0, worker_slot="render_worker")["job_id"] == first
+    claimed = store.claim_next_job(["render_video"], os.getpid(), capacity=2.0, worker_slot="render_worker_2")
+    assert claimed["job_id"] == second
+    assert claimed["worker_slot"] == "render_worker_2"
+    assert store.claim_next_job(["render_video"], os.getpid(), capacity=2.0, worker_slot="render_worker_3") is None
+
+    store.transition(first, store.FAILED, reason="test")
+    assert store.claim_next_job(["render_video"], os.getpid(), capacity=2.0)["job_id"] == third
+
+
+def test_oversized_job_runs_alone_and_blocks_queue(store):
+    big = store.submit_job("render_video", {"resolution": "4k"}, priority=5)
+    small = store.submit_job("render_video", {})
+
+    assert store.claim_next_job(["render_video"], os.getpid(), capacity=2.0)["job_id"] == big
+    assert store.claim_next_job(["render_video"], os.getpid(), capacity=2.0) is None
+    assert store.get_job(small)["status"] == store.QUEUED
+
+
+def test_slot_recovery_only_returns_that_slots_jobs(store):
+    ours = store.submit_job("render_video", {})
+    theirs = store.submit_job("render_video", {})
+    store.claim_next_job(["render_video"], os.getpid(), capacity=4.0, worker_slot="render_worker_2")
+    store.claim_next_job(["render_video"], os.getpid(), capacity=4.0, worker_slot="render_worker")
+
+    assert [j["job_id"] for j in store.find_active_jobs_for_slot("render_worker_2", ["render_video"])] == [ours]
+    owned = store.find_active_jobs_for_slot("render_worker", ["render_video"], include_unassigned=True)
+    assert [j["job_id"] for j in owned] == [theirs]
@@ -0,0 +1,106 @@
+import sqlite3
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+import database as db
+from services import retention_service
+
+
+class RetentionServiceTest(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _local_db(self, local_db):
+        self.db_path = local_db
+
+    def setUp(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript(
+            """
+            CREATE TABLE ai_generation_logs (id INTEGER PRIMARY KEY AUTOINCREMENT, task_type TEXT,
+                worker_email TEXT, provider TEXT, status TEXT,
+                remote_synced_at TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            CREATE TABLE ai_log_rollups (bucket_hour TEXT, day TEXT, worker_email TEXT, task_type TEXT,
+                provider TEXT, status TEXT, call_count INTEGER,
+                PRIMARY KEY (bucket_hour, worker_email, task_type, provider, status));
+            CREATE TABLE project_learning_events (id INTEGER PRIMARY KEY AUTOINCREMENT, event_type TEXT,
+                remote_synced_at TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            CREATE TABLE project_learning_snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, snapshot_type TEXT,
+                remote_synced_at TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            INSERT INTO ai_generation_logs (task_type, remote_synced_at, created_at) VALUES
+                ('old_synced', '2026-01-01T00:00:00', '2026-01-05 10:00:00'),
+                ('old_unsynced', NULL, '2026-01-06 10:00:00'),
+                ('old_synced_feb', '2026-02-01T00:00:00', '2026-02-01 10:00:00'),
+                ('recent_synced', '2026-06-01T00:00:00', '2026-06-25 10:00:00');
+            """
+        )
+        conn.commit()
+        conn.close()
+        self.now = datetime(2026, 7, 1, tzinfo=timezone.utc)
+
+    def _task_types(self):
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            return [r[0] for r in conn.execute("SELECT task_type FROM ai_generation_logs ORDER BY id")]
+        finally:
+            conn.close()
+
+    def test_archives_only_old_synced_rows(self):
+        result = retention_service.archive_table("ai_generation_logs", 30, batch_size=1, now=self.now)
+
+        self.assertEqual((result["archived"], result["deleted"]), (2, 2))
+        self.assertEqual(self._task_types(), ["old_unsynced", "recent_synced"])
+        jan = retention_service.read_archive("ai_generation_logs", "2026-01")
+        feb = retention_service.read_archive("ai_generation_logs", "2026-02")
+        self.assertEqual([r["task_type"] for r in jan], ["old_synced"])
+        self.assertEqual([r["task_type"] for r in feb], ["old_synced_feb"])
+
+    def test_repeated_runs_append_to_archive(self):
+        retention_service.archive_table("ai_generation_logs", 30, now=self.now)
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("UPDATE ai_generation_logs SET remote_synced_at = '2026-06-30' WHERE task_type = 'old_unsynced'")
+        conn.commit()
+        conn.close()
+
+        retention_service.archive_table("ai_generation_logs", 30, now=self.now)
+        jan = retention_service.read_archive("ai_generation_logs", "2026-01")
+        self.assertEqual([r["task_type"] for r in jan], ["old_synced", "old_unsynced"])
+
+    def test_delete_rechecks_sync_state(self):
+        conn = sqlite3.connect(str(self.db_path))
+        unsynced_id = conn.execute("SELECT id FROM ai_generation_logs WHERE task_type = 'old_unsynced'").fetchone()[0]
+        conn.close()
+
+        self.assertEqual(db.delete_retained_rows("ai_generation_logs", [unsynced_id]), 0)
+        self.assertIn("old_unsynced", self._task_types())
+
+    def test_zero_days_disables_policy(self):
+        result = retention_service.archive_table("ai_generation_logs", 0, now=self.now)
+        self.assertEqual(result["archived"], 0)
+        self.assertEqual(len(self._task_types()), 4)
+
+    def test_run_retention_runs_maintenance(self):
+        with patch.object(retention_service, "get_retention_policies",
+                          return_value={"ai_generation_logs": 30, "project_learning_events": 30,
+                                        "project_learning_snapshots": 0}), \
+                patch.object(retention_service, "_cutoff", return_value="2026-06-01 00:00:00"):
+            summary = retention_service.run_retention()
+
+        self.assertEqual(summary["tables"]["ai_generation_logs"]["deleted"], 2)
+        self.assertTrue(summary["maintenance"]["optimized"])
+        self.assertEqual(db.get_retention_table_stats()["ai_generation_logs"], {"total": 2, "unsynced": 1})
+
+    def test_unsynced_ai_logs_are_eligible_once_rolled_up(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute(
+            "INSERT INTO ai_log_rollups VALUES ('2026-01-06 10:00:00', '2026-01-06', 'unknown', 'old_unsynced', '', '', 1)"
+        )
+        conn.commit()
+        conn.close()
+
+        result = retention_service.archive_table("ai_generation_logs", 30, now=self.now)
+
+        self.assertEqual(result["deleted"], 3)
+        self.assertEqual(self._task_types(), ["recent_synced"])
+
@@ -0,0 +1,128 @@
+import sqlite3
+import unittest
+
+import pytest
+
+import database as db
+
+
+class SaveImagePromptsDiffTest(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _local_db(self, local_db):
+        self.db_path = local_db
+
+    def setUp(self):
+        columns = ", ".join(
+            f"{col} BOOLEAN DEFAULT 0" if col == "is_dual" else f"{col} TEXT"
+            for col in db._IMAGE_PROMPT_SAVE_COLUMNS
+        )
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript(
+            f"""
+            CREATE TABLE projects (id INTEGER PRIMARY KEY, sync_dirty INTEGER DEFAULT 0, updated_at TIMESTAMP);
+            CREATE TABLE image_prompts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                project_id INTEGER,
+                scene_number INTEGER,
+                focal_point_y REAL DEFAULT 0.5,
+                scene_text_en TEXT,
+                scene_text_th TEXT,
+                {columns}
+            );
+            INSERT INTO projects (id) VALUES (1);
+            """
+        )
+        conn.commit()
+        conn.close()
+
+    def _rows(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            return [
+                dict(row)
+                for row in conn.execute(
+                    "SELECT * FROM image_prompts WHERE project_id = 1 ORDER BY scene_number"
+                ).fetchall()
+            ]
+        finally:
+            conn.close()
+
+    def _prompts(self, count):
+        return [
+            {"scene_text": f"scene {n}", "prompt_en": f"prompt {n}", "image_url": f"/output/1/{n}.png"}
+            for n in range(1, count + 1)
+        ]
+
+    def test_resave_keeps_row_ids_and_untouched_columns(self):
+        db.save_image_prompts(1, self._prompts(3))
+        first = self._rows()
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("UPDATE image_prompts SET focal_point_y = 0.2, scene_text_en = 'en' WHERE scene_number = 2")
+        conn.commit()
+        conn.close()
+
+        prompts = self._prompts(3)
+        prompts[0]["prompt_en"] = "edited"
+        db.save_image_prompts(1, prompts)
+        second = self._rows()
+
+        self.assertEqual([row["id"] for row in second], [row["id"] for row in first])
+        self.assertEqual(second[0]["prompt_en"], "edited")
+        self.assertEqual(second[1]["focal_point_y"], 0.2)
+        self.assertEqual(second[1]["scene_text_en"], "en")
+
+    def test_changed_scene_text_clears_stale_translations(self):
+        db.save_image_prompts(1, self._prompts(2))
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("UPDATE image_prompts SET scene_text_en = 'en', scene_text_th = 'th'")
+        conn.commit()
+        conn.close()
+
+        prompts = self._prompts(2)
+        prompts[1]["scene_text"] = "rewritten"
+        db.save_image_prompts(1, prompts)
+        rows = self._rows()
+
+        self.assertEqual((rows[0]["scene_text_en"], rows[0]["scene_text_th"]), ("en", "th"))
+        self.assertEqual((rows[1]["scene_text_en"], rows[1]["scene_text_th"]), (None, None))
+
+    def test_inserts_new_scenes_and_deletes_only_removed_ones(self):
+        db.save_image_prompts(1, self._prompts(4))
+        ids = [row["id"] for row in self._rows()]
+
+        db.save_image_prompts(1, self._prompts(2))
+        self.assertEqual([row["id"] for row in self._rows()], ids[:2])
+
+        db.save_image_prompts(1, self._prompts(3))
+        rows = self._rows()
+        self.assertEqual([row["scene_number"] for row in rows], [1, 2, 3])
+        self.assertEqual([row["id"] for row in rows[:2]], ids[:2])
+
+    def test_duplicate_scene_rows_are_collapsed(self):
+        db.save_image_prompts(1, self._prompts(2))
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("INSERT INTO image_prompts (project_id, scene_number, scene_text) VALUES (1, 2, 'dup')")
+        conn.commit()
+        conn.close()
+
+        db.save_image_prompts(1, self._prompts(2))
+        rows = self._rows()
+        self.assertEqual([row["scene_number"] for row in rows], [1, 2])
+        self.assertEqual(rows[1]["scene_text"], "scene 2")
+
+    def test_noop_save_does_not_mark_project_dirty(self):
+        db.save_image_prompts(1, self._prompts(2))
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("UPDATE projects SET sync_dirty = 0")
+        conn.commit()
+        conn.close()
+
+        db.save_image_prompts(1, self._prompts(2))
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            dirty = conn.execute("SELECT sync_dirty FROM projects WHERE id = 1").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(dirty, 0)
+
@@ -1,3 +1,6 @@
+import hashlib
+import json
+import threading
 import unittest
 import zipfile
 from pathlib import Path
@@ -133,6 +136,99 @@ class UpdaterServiceTests(unittest.TestCase):
         self.assertIn("$env:LOCALAPPDATA = 'C:/temp/local'", captured["content"])
         self.assertIn("Start-Process -FilePath $exe -WorkingDirectory $app", captured["content"])
 
+    def test_ranged_download_resumes_missing_parts_and_verifies_sha256(self):
+        payload = bytes(range(256)) * 4096 * 3 + b"tail"  # three 1 MiB parts + 4 bytes
+        requested = []
+        lock = threading.Lock()
+
+        def fake_get(url, headers=None, stream=False, timeout=None):
+            start, end = map(int, headers["Range"].split("=", 1)[1].split("-"))
+            with lock:
+                requested.append(start)
+            return _FakeResponse(206, payload[start:end + 1], {"Content-Range": f"bytes {start}-{end}/{len(payload)}",
+                                                                 "ETag": '"v1"'})
+
+        service = updater_module.UpdaterService()
+        with TemporaryDirectory() as temp_dir, patch.object(
+            updater_module, "RANGE_PART_SIZE", 1024 * 1024
+        ), patch.object(updater_module, "MIN_RANGED_SIZE", 1), patch.object(
+            updater_module.requests, "get", side_effect=fake_get
+        ):
+            service.download_path = Path(temp_dir) / "AIRStudio-update.zip"
+            temporary = Path(temp_dir) / "AIRStudio-update-full.download"
+            # An earlier run finished part 1 before it was interrupted.
+            temporary.write_bytes(b"\0" * 1024 * 1024 + payload[1024 * 1024:2 * 1024 * 1024]
+                                  + b"\0" * (len(payload) - 2 * 1024 * 1024))
+            Path(f"{temporary}.json").write_text(json.dumps(
+                {"url": "https://example.test/full.zip", "size": len(payload), "validator": '"v1"', "done": [1]}
+            ), encoding="utf-8")
+
+            service._fetch("https://example.test/full.zip", hashlib.sha256(payload).hexdigest(), "full")
+
+            self.assertEqual(service.download_path.read_bytes(), payload)
+            self.assertFalse(Path(f"{temporary}.json").exists())
+        self.assertEqual(service.download_progress, 100)
+        self.assertNotIn(1024 * 1024, requested[1:])
+        self.assertEqual(sorted(requested[1:]), [0, 2 * 1024 * 1024, 3 * 1024 * 1024])
+
+    def test_delta_is_preferred_and_falls_back_to_the_full_package(self):
+        service = updater_module.UpdaterService()
+        service.release_info = {
+            "download_url": "https://example.test/full.zip",
+            "delta": {"download_url": "https://example.test/delta.zip", "sha256": "abc"},
+        }
+        fetched = []
+
+        def fake_fetch(url, expected_sha256, kind):
+            fetched.append(kind)
+            if kind == "delta":
+                raise ValueError("Downloaded file did not pass SHA256 verification.")
+            service.download_progress = 100
+
+        with TemporaryDirectory() as temp_dir, patch.object(updater_module.sys, "frozen", True, create=True), \
+                patch.object(updater_module.config, "LOCAL_APP_DATA_DIR", temp_dir), \
+                patch.object(service, "_fetch", side_effect=fake_fetch), \
+                patch.object(updater_module.threading, "Thread") as thread:
+            self.assertTrue(service.start_download("https://example.test/full.zip", "full-sha"))
+            target, args = thread.call_args.kwargs["target"], thread.call_args.kwargs["args"]
+            target(*args)
+
+        self.assertEqual(fetched, ["delta", "full"])
+        self.assertEqual(service.download_kind, "full")
+        self.assertIsNone(service.download_error)
+
+    def test_delta_package_must_match_the_installed_version(self):
+        service = updater_module.UpdaterService()
+
+        with TemporaryDirectory() as temp_dir:
+            package_path = Path(temp_dir) / "AIRStudio-update.zip"
+            with zipfile.ZipFile(package_path, "w") as package:
+                package.writestr("version.json", '{"version":"2.3.42"}')
+                package.writestr("update-delta.json", json.dumps({"from_version": "2.3.40", "removed": []}))
+            service.download_path = package_path
+            service.download_progress = 100
+            with patch.object(updater_module.sys, "frozen", True, create=True), patch.object(
+                updater_module.config, "APP_VERSION", "2.3.41"
+            ):
+                success, error = service.apply_update_and_restart()
+
+        self.assertFalse(success)
+        self.assertIn("different installed version", error)
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body, headers):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers
+
+    def iter_content(self, size):
+        for start in range(0, len(self.body), size):
+            yield self.body[start:start + size]
+
+    def close(self):
+        pass
+
 
 if __name__ == "__main__":
     unittest.main()
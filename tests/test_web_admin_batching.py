@@ -0,0 +1,142 @@
+import json
+
+import pytest
+import requests
+
+from services import learning_sync_service
+from services.web_admin_client import WebAdminClient
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.text = json.dumps(body) if body is not None else ""
+        self.headers = headers or {}
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class FakeSession:
+    def __init__(self, responses=None):
+        self.calls = []
+        self.responses = list(responses or [])
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        if self.responses:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        return FakeResponse(201)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("NEXT_PUBLIC_SUPABASE_URL", "https://db.example")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service-key")
+    instance = WebAdminClient()
+    instance.retry_backoff = 0
+    session = FakeSession()
+    monkeypatch.setattr(instance, "_session", lambda: session)
+    monkeypatch.setattr("services.web_admin_client.time.sleep", lambda seconds: None)
+    return instance, session
+
+
+def test_idempotent_calls_retry_transient_failures_and_inserts_do_not(client):
+    instance, session = client
+    session.responses = [requests.ConnectionError("reset"), FakeResponse(503), FakeResponse(200, [{"id": 1}])]
+    response = instance.supabase_get("profiles", params={"select": "id"})
+    assert response.json() == [{"id": 1}]
+    assert len(session.calls) == 3
+
+    session.calls.clear()
+    session.responses = [FakeResponse(503)]
+    assert instance.supabase_post("render_jobs", {"id": 1}).status_code == 503
+    assert len(session.calls) == 1
+
+    metrics = instance.request_metrics()
+    assert metrics["GET profiles"]["retries"] == 2 and metrics["GET profiles"]["errors"] == 0
+    assert metrics["POST render_jobs"]["errors"] == 1
+
+
+def test_upsert_many_sends_one_request_per_chunk(client):
+    instance, session = client
+    rows = [{"sync_key": f"event:{n}", "value": n} for n in range(1200)]
+    session.responses = [FakeResponse(201), FakeResponse(500, {"message": "boom"}), FakeResponse(201)]
+
+    result = instance.upsert_many("project_learning_events", rows, on_conflict="sync_key")
+
+    assert (result["ok"], result["failed"]) == (700, 500)
+    assert result["failed_statuses"] == [500]
+    assert len(session.calls) == 3
+    method, url, kwargs = session.calls[0]
+    assert (method, url) == ("POST", "https://db.example/rest/v1/project_learning_events")
+    assert kwargs["params"] == {"on_conflict": "sync_key"}
+    assert "merge-duplicates" in kwargs["headers"]["Prefer"]
+    assert len(json.loads(kwargs["data"])) == 500
+
+
+def test_patch_many_groups_rows_with_identical_fields(client):
+    instance, session = client
+    rows = [
+        {"id": "1", "status": "archived"},
+        {"id": "2", "status": "archived"},
+        {"id": "a,b", "status": "archived"},
+        {"id": "3", "status": "pending"},
+    ]
+    result = instance.patch_many("topics_queue", "id", rows, max_workers=1)
+
+    assert result == {"ok": 4, "failed": 0, "errors": []}
+    filters = sorted(kwargs["params"]["id"] for _method, _url, kwargs in session.calls)
+    assert filters == ['in.(1,2,"a,b")', "in.(3)"]
+    assert all(kwargs["headers"]["Prefer"] == "return=minimal" for _m, _u, kwargs in session.calls)
+
+
+def test_learning_sync_pushes_events_in_one_upsert(monkeypatch):
+    events = [{"id": n, "employee_email": "a@b.com", "project_sync_id": "p1"} for n in range(1, 4)]
+    commits = []
+    upserts = []
+
+    class FakeClient:
+        def has_supabase(self):
+            return True
+
+        def resolve_user_id(self, email=""):
+            return "user-1"
+
+        def upsert_many(self, table, rows, on_conflict, timeout=None, idempotency_key=None):
+            upserts.append((table, [row["sync_key"] for row in rows], idempotency_key))
+            return {"ok": len(rows), "failed": 0, "errors": []}
+
+    monkeypatch.setattr(learning_sync_service, "web_admin_client", FakeClient())
+    monkeypatch.setattr(learning_sync_service.db, "get_remote_sync_cursor", lambda stream: 0)
+    monkeypatch.setattr(learning_sync_service.db, "get_unsynced_learning_events",
+                        lambda limit, after_id=None, retry_up_to_id=None: events)
+    monkeypatch.setattr(learning_sync_service.db, "get_unsynced_learning_snapshots",
+                        lambda limit, after_id=None, retry_up_to_id=None: [])
+    monkeypatch.setattr(learning_sync_service.db, "commit_learning_sync_batch",
+                        lambda stream, ids, synced_at, errors=None, cursor_id=None: commits.append((stream, ids, cursor_id)))
+
+    result = learning_sync_service.sync_learning_data(limit=10)
+
+    assert [(table, keys) for table, keys, _key in upserts] == [
+        ("project_learning_events", ["event:p1:1", "event:p1:2", "event:p1:3"])
+    ]
+    assert upserts[0][2].startswith("learning-events-")
+    assert commits == [("events", [1, 2, 3], 3)]
+    assert (result["events_synced"], result["events_failed"]) == (3, 0)
+
+
+def test_upsert_many_sends_compact_json_with_idempotency_key_per_chunk(client):
+    instance, session = client
+    rows = [{"sync_key": f"event:{n}", "value": n} for n in range(3)]
+
+    instance.upsert_many("project_learning_events", rows, on_conflict="sync_key", chunk_size=2,
+                         idempotency_key="batch-1")
+
+    keys = [kwargs["headers"]["Idempotency-Key"] for _m, _u, kwargs in session.calls]
+    assert keys == ["batch-1:0", "batch-1:1"]
+    assert b", " not in session.calls[0][2]["data"]
@@ -0,0 +1,91 @@
+import asyncio
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+import event_bus  # noqa: E402
+import job_wakeup  # noqa: E402
+import manager_rpc  # noqa: E402
+
+
+def test_change_feed_returns_each_changed_job_once_at_its_latest_state(store):
+    first = store.submit_job("render_video", {"title": "a"})
+    second = store.submit_job("render_video", {"title": "b"})
+    seq = store.latest_change_seq()
+    assert [j["job_id"] for j in store.changes_since(0)] == [first, second]
+
+    store.claim_next_job(["render_video"], 1)
+    store.transition(first, store.PREPARING)
+    store.update_progress(first, 40, "rendering")
+    store.flush_progress(first)
+
+    changed = store.changes_since(seq)
+    assert [(j["job_id"], j["status"], j["progress"]) for j in changed] == [(first, store.PREPARING, 40)]
+    assert store.changes_since(changed[-1]["change_seq"]) == []
+
+
+def test_transition_notifies_watchers_not_workers(store):
+    watcher = job_wakeup.WakeupListener("dashboard-events", directory=job_wakeup.watchers_dir()).open()
+    worker = job_wakeup.WakeupListener("render_worker").open()
+    try:
+        job_id = store.submit_job("render_video", {})
+        assert watcher.wait(1.0) and worker.wait(1.0)
+        store.claim_next_job(["render_video"], 1)
+        store.transition(job_id, store.PREPARING)
+        assert watcher.wait(1.0)
+        assert not worker.wait(0.1)
+    finally:
+        watcher.close()
+        worker.close()
+
+
+def test_subscribers_get_snapshot_then_pushed_changes(store, monkeypatch):
+    def no_manager(*args, **kwargs):
+        raise manager_rpc.RpcUnavailable("not running")
+
+    monkeypatch.setattr(manager_rpc, "iter_events", no_manager)
+    monkeypatch.setattr(event_bus, "_SOURCE_IDLE_SECONDS", 0.0)
+    existing = store.submit_job("render_video", {"title": "before", "structure": "x" * 1000})
+    bus = event_bus.EventBus("test", read_status=lambda: {"manager_alive": False, "processes": {}},
+                             decorate_status=lambda snap: dict(snap, decorated=True))
+
+    async def run():
+        stream = bus.subscribe({event_bus.JOB, event_bus.STATUS})
+        snapshot = await asyncio.wait_for(stream.__anext__(), 5)
+        new_id = await asyncio.to_thread(store.submit_job, "script_generate", {"topic": "t"})
+        while True:
+            message = await asyncio.wait_for(stream.__anext__(), 5)
+            if message and message["event"] == event_bus.JOB and message["key"] == new_id:
+                break
+        await stream.aclose()
+        return snapshot, message
+
+    snapshot, pushed = asyncio.run(run())
+    events = {(m["event"], m["key"]): m["data"] for m in snapshot["data"]["events"]}
+    assert events[("status", "")]["decorated"] is True
+    assert events[("job", existing)]["payload"] == {"title": "before"}  # large inputs are not pushed
+    assert pushed["data"]["status"] == store.QUEUED
+    assert bus.subscriber_count == 0
+
+
+def test_slow_subscriber_gets_latest_state_per_key():
+    bus = event_bus.EventBus("test", read_status=dict)
+    bus.ensure_sources = lambda: None  # no jobs.db / Manager behind this bus
+
+    async def run():
+        stream = bus.subscribe()
+        await stream.__anext__()
+        for progress in (10, 20, 30):
+            bus.publish(event_bus.JOB, {"progress": progress}, key="a")
+        bus.publish(event_bus.JOB, {"progress": 5}, key="b")
+        received = [await stream.__anext__(), await stream.__anext__()]
+        await stream.aclose()
+        return received
+
+    received = asyncio.run(run())
+    assert [(m["key"], m["data"]["progress"]) for m in received] == [("a", 30), ("b", 5)]
+    assert event_bus.sse_frame(received[0]).startswith(f"id: {received[0]['id']}\nevent: job\n")
@@ -0,0 +1,74 @@
+import pathlib
+import sqlite3
+import sys
+import threading
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+import job_store  # noqa: E402
+import job_wakeup  # noqa: E402
+
+
+def test_submit_wakes_waiting_listener(store):
+    with job_wakeup.WakeupListener("render_worker") as listener:
+        woke = {}
+
+        def _wait():
+            started = time.perf_counter()
+            woke["result"] = listener.wait(5.0)
+            woke["elapsed"] = time.perf_counter() - started
+
+        waiter = threading.Thread(target=_wait)
+        waiter.start()
+        time.sleep(0.05)
+        store.submit_job("render_video", {"source_path": "x"})
+        waiter.join(5)
+
+    assert woke["result"] is True
+    assert woke["elapsed"] < 1.0
+    assert not list(job_wakeup.WAKEUP_DIR.glob("*.port"))
+
+
+def test_requeue_wakes_listener_and_timeout_returns_false(store):
+    job_id = store.submit_job("render_video", {})
+    store.claim_next_job(["render_video"], 1)
+    store.transition(job_id, store.FAILED, reason="boom")
+    with job_wakeup.WakeupListener("render_worker") as listener:
+        assert listener.wait(0.05) is False
+        store.transition(job_id, store.QUEUED, reason="retry")
+        assert listener.wait(2.0) is True
+
+
+def test_idle_claim_does_not_take_write_lock(store):
+    blocker = sqlite3.connect(str(job_store.JOB_DB_PATH), isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.perf_counter()
+        assert store.claim_next_job(["render_video"], 1) is None
+        assert time.perf_counter() - started < 1.0
+    finally:
+        blocker.execute("ROLLBACK")
+        blocker.close()
+
+
+def test_claim_order_and_index(store):
+    low = store.submit_job("render_video", {}, priority=0)
+    high = store.submit_job("render_video", {}, priority=5)
+    store.submit_job("script_generate", {}, priority=9)
+
+    assert store.claim_next_job(["render_video"], 1)["job_id"] == high
+    assert store.claim_next_job(["render_video"], 1)["job_id"] == low
+
+    plan = " ".join(
+        row[-1]
+        for row in store._conn().execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM jobs WHERE status = ? AND job_type IN (?) "
+            "ORDER BY priority DESC, created_at ASC LIMIT 1",
+            (store.QUEUED, "render_video"),
+        )
+    )
+    assert "idx_jobs_claim" in plan
@@ -0,0 +1,112 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+WORKER = ROOT / "worker"
+if str(WORKER) not in sys.path:
+    sys.path.insert(0, str(WORKER))
+
+import job_store  # noqa: E402
+
+
+def _age(store, job_id, seconds):
+    conn = store._conn()
+    conn.execute("UPDATE jobs SET created_at = created_at - ? WHERE job_id = ?", (seconds, job_id))
+    conn.commit()
+
+
+def _claim(store, policy, job_types=("hermes_topic",)):
+    job = store.claim_next_job(list(job_types), os.getpid(), policy=policy)
+    return job["job_id"] if job else None
+
+
+def test_fair_share_lets_other_sources_past_a_batch(store):
+    policy = job_store.FairSharePolicy(source_weights={}, aging_seconds=0)
+    batch = [store.submit_job("hermes_topic", {}, source="autopilot") for _ in range(5)]
+    assert _claim(store, policy) == batch[0]
+    assert _claim(store, policy) == batch[1]
+
+    manual = store.submit_job("hermes_topic", {}, source="dashboard")
+    assert _claim(store, policy) == manual
+    assert _claim(store, policy) == batch[2]
+
+
+def test_fifo_policy_keeps_strict_priority_order(store):
+    policy = job_store.FifoPolicy(candidates_per_flow=1)
+    batch = [store.submit_job("hermes_topic", {}, source="autopilot") for _ in range(3)]
+    assert _claim(store, policy) == batch[0]
+    manual = store.submit_job("hermes_topic", {}, source="dashboard")
+    assert [_claim(store, policy) for _ in range(3)] == [batch[1], batch[2], manual]
+
+
+def test_aging_overtakes_higher_priority(store):
+    policy = job_store.FairSharePolicy(source_weights={}, aging_seconds=60, max_aging_boost=10, fair_share_penalty=0)
+    old = store.submit_job("hermes_topic", {}, priority=0)
+    fresh = store.submit_job("hermes_topic", {}, priority=2)
+    assert _claim(store, policy) == fresh
+
+    older = store.submit_job("hermes_topic", {}, priority=0)
+    newer = store.submit_job("hermes_topic", {}, priority=2)
+    _age(store, older, 600)
+    assert _claim(store, policy) == older
+    assert {_claim(store, policy), _claim(store, policy)} == {old, newer}
+
+
+def test_type_concurrency_cap_skips_to_other_types(store):
+    policy = job_store.FairSharePolicy(type_concurrency={"hermes_topic": 1}, fair_share_penalty=0)
+    first = store.submit_job("hermes_topic", {}, priority=5)
+    second = store.submit_job("hermes_topic", {}, priority=5)
+    other = store.submit_job("hermes_research", {})
+    types = ("hermes_topic", "hermes_research")
+
+    assert _claim(store, policy, types) == first
+    assert _claim(store, policy, types) == other
+    assert _claim(store, policy, types) is None
+
+    store.transition(first, store.FAILED, reason="test")
+    assert _claim(store, policy, types) == second
+
+
+def test_deep_backlog_does_not_hide_other_flows(store):
+    policy = job_store.FairSharePolicy(source_weights={}, candidates_per_flow=2)
+    for _ in range(20):
+        store.submit_job("hermes_topic", {}, source="autopilot", priority=1)
+    manual = store.submit_job("hermes_topic", {}, source="dashboard")
+    for _ in range(3):
+        _claim(store, policy)
+    assert store.get_job(manual)["status"] == store.CLAIMED
+
+
+def test_malformed_scheduler_env_json_falls_back_to_empty(monkeypatch):
+    import worker_config
+
+    monkeypatch.setenv("AIRWORKER_SCHEDULER_TYPE_WEIGHTS", "{hermes_topic: 1")
+    assert worker_config._env_json_dict("AIRWORKER_SCHEDULER_TYPE_WEIGHTS") == {}
+    monkeypatch.setenv("AIRWORKER_SCHEDULER_TYPE_WEIGHTS", "[1]")
+    assert worker_config._env_json_dict("AIRWORKER_SCHEDULER_TYPE_WEIGHTS") == {}
+    monkeypatch.setenv("AIRWORKER_SCHEDULER_TYPE_WEIGHTS", '{"hermes_topic": 1}')
+    assert worker_config._env_json_dict("AIRWORKER_SCHEDULER_TYPE_WEIGHTS") == {"hermes_topic": 1}
+
+
+def test_bad_scheduler_env_entries_are_skipped_not_fatal(monkeypatch):
+    import worker_config
+
+    monkeypatch.setenv("AIRWORKER_SCHEDULER_TYPE_CONCURRENCY", '{"render_video": "two", "hermes_topic": 1}')
+    caps = worker_config._env_json_dict("AIRWORKER_SCHEDULER_TYPE_CONCURRENCY", int)
+    assert caps == {"hermes_topic": 1}
+    monkeypatch.setenv("AIRWORKER_SCHEDULER_SOURCE_WEIGHTS", '{"autopilot": null, "dashboard": "3"}')
+    assert worker_config._env_json_dict("AIRWORKER_SCHEDULER_SOURCE_WEIGHTS") == {"dashboard": 3.0}
+
+
+def test_job_store_imports_with_a_bad_scheduler_env_value(tmp_path):
+    env = dict(os.environ, AIRWORKER_HOME=str(tmp_path),
+               AIRWORKER_SCHEDULER_TYPE_CONCURRENCY='{"render_video": "two"}',
+               AIRWORKER_SCHEDULER_TYPE_WEIGHTS='{"render_video": [1]}')
+    result = subprocess.run(
+        [sys.executable, "-c", "import job_store; print(job_store.get_scheduling_policy().type_concurrency)"],
+        cwd=str(WORKER), env=env, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "{}"
@@ -0,0 +1,116 @@
+import asyncio
+import datetime
+
+from services import youtube_data_api
+from services import youtube_monitoring_service as monitoring
+
+
+def test_list_by_ids_runs_batches_concurrently_on_rotated_keys(monkeypatch):
+    monkeypatch.setattr(youtube_data_api, "normalized_youtube_keys", lambda: ["k1", "k2", "k3"])
+    calls = []
+
+    async def fake_get(path, params=None, *, timeout=15.0, key_offset=0):
+        ids = params["id"].split(",")
+        calls.append((len(ids), key_offset))
+        if key_offset == 2:
+            return {"error": "YOUTUBE_API_ERROR", "message": "quotaExceeded"}
+        return {"items": [{"id": video_id} for video_id in ids], "_youtube_key_index": key_offset + 1}
+
+    monkeypatch.setattr(youtube_data_api, "async_youtube_get", fake_get)
+    ids = [f"v{n:03d}" for n in range(120)]
+
+    data = asyncio.run(youtube_data_api.async_youtube_list_by_ids("videos", ids, part="statistics", concurrency=3))
+
+    assert sorted(calls) == [(20, 2), (50, 0), (50, 1)]
+    assert len(data["items"]) == 100 and data["batch_count"] == 2
+    assert data["errors"][0]["message"] == "quotaExceeded"
+
+
+def _public_request(n, hours_ago, now, captured=()):
+    return {
+        "id": f"req-{n}",
+        "user_id": "user-1",
+        "video_url": f"https://youtu.be/video{n:06d}",
+        "metadata": {"made_public_at": (now - datetime.timedelta(hours=hours_ago)).isoformat(), "project_id": n,
+                     "youtube_monitoring": {"captured_slots_hours": list(captured)}},
+    }
+
+
+class FakeClient:
+    def __init__(self, failing_table=None):
+        self.failing_table = failing_table
+        self.upserts = []
+        self.patches = []
+
+    def has_supabase(self):
+        return True
+
+    def upsert_many(self, table, rows, *, on_conflict, timeout=None):
+        self.upserts.append((table, [row["sync_key"] for row in rows]))
+        if table == self.failing_table:
+            return {"ok": 0, "failed": len(rows), "errors": ["boom"]}
+        return {"ok": len(rows), "failed": 0, "errors": []}
+
+    def patch_many(self, table, key, rows, timeout=None):
+        self.patches.append((table, [row[key] for row in rows]))
+        return {"ok": len(rows), "failed": 0, "errors": []}
+
+
+def _service(monkeypatch, client, requests_list, returned_ids):
+    service = monitoring.YouTubeMonitoringService()
+    fetched = []
+
+    def fetch(video_ids):
+        fetched.append(list(video_ids))
+        return {video_id: monitoring._metrics_from_item(video_id, {"statistics": {"viewCount": "10"}})
+                for video_id in video_ids if video_id in returned_ids}, 1
+
+    monkeypatch.setattr(monitoring, "web_admin_client", client)
+    monkeypatch.setattr(service, "_youtube_api_key", lambda: "key")
+    monkeypatch.setattr(service, "_fetch_public_requests", lambda: requests_list)
+    monkeypatch.setattr(service, "_fetch_metrics_batch", fetch)
+    return service, fetched
+
+
+def test_due_videos_are_fetched_in_one_batch_and_written_in_bulk(monkeypatch):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    requests_list = [
+        _public_request(1, 30, now, captured=(1, 6)),
+        _public_request(2, 2, now),
+        _public_request(3, 8, now, captured=(1,)),
+    ]
+    client = FakeClient()
+    service, fetched = _service(monkeypatch, client, requests_list, {"video000001", "video000002"})
+
+    result = service.collect_due_public_videos()
+
+    # Grouped by capture slot: 1h (video 2), 6h (video 3), 24h (video 1).
+    assert fetched == [["video000002", "video000003", "video000001"]]
+    assert (result["due"], result["captured"], result["failed"]) == (3, 2, 0)
+    assert [table for table, _keys in client.upserts] == [
+        "youtube_video_metrics", "video_learning_snapshots", "project_learning_events",
+    ]
+    assert client.upserts[0][1] == ["ytmetric:video000002:1", "ytmetric:video000001:24"]
+    assert client.patches == [("publishing_requests", ["req-2", "req-1"])]
+
+
+def test_failed_bulk_write_leaves_slots_uncaptured(monkeypatch):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    client = FakeClient(failing_table="video_learning_snapshots")
+    service, _fetched = _service(monkeypatch, client, [_public_request(1, 2, now)], {"video000001"})
+
+    result = service.collect_due_public_videos()
+
+    assert (result["captured"], result["failed"]) == (0, 1)
+    assert client.patches == []
+
+
+def test_failed_learning_event_write_leaves_slots_uncaptured(monkeypatch):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    client = FakeClient(failing_table="project_learning_events")
+    service, _fetched = _service(monkeypatch, client, [_public_request(1, 2, now)], {"video000001"})
+
+    result = service.collect_due_public_videos()
+
+    assert (result["captured"], result["failed"]) == (0, 1)
+    assert client.patches == []
@@ -0,0 +1,170 @@
+import threading
+
+import pytest
+
+from services.drive_transfer import ResumableSessionStore
+from services.youtube_upload_queue import YouTubeUploadQueue
+from services.youtube_upload_service import UPLOAD_CHUNK_MIN, YouTubeUploadService
+
+
+class GatedUploader:
+    """upload_video blocks until the test releases that title."""
+
+    def __init__(self):
+        self.started = {}
+        self.release = {}
+        self.errors = {}
+        self.lock = threading.Lock()
+
+    def gate(self, table, title):
+        with self.lock:
+            return table.setdefault(title, threading.Event())
+
+    def upload_video(self, title, token_path=None, progress_callback=None, **kwargs):
+        self.gate(self.started, title).set()
+        progress_callback(50, 100)
+        assert self.gate(self.release, title).wait(5)
+        if title in self.errors:
+            raise self.errors[title]
+        progress_callback(100, 100)
+        return {"id": f"vid-{title}"}
+
+
+def test_channels_upload_in_parallel_but_one_at_a_time_per_channel():
+    uploader = GatedUploader()
+    queue = YouTubeUploadQueue(max_workers=3, per_channel=1, daily_limit=0, uploader=uploader)
+    a1 = queue.submit(title="a1", token_path="chan-a", file_path="")
+    a2 = queue.submit(title="a2", token_path="chan-a", file_path="")
+    b1 = queue.submit(title="b1", token_path="chan-b", file_path="")
+
+    assert uploader.gate(uploader.started, "a1").wait(5)
+    assert uploader.gate(uploader.started, "b1").wait(5)
+    assert not uploader.gate(uploader.started, "a2").is_set()
+    status = queue.status()
+    assert (status["uploading"], status["queued"]) == (2, 1)
+    assert status["jobs"][0]["percent"] == 50.0
+
+    uploader.gate(uploader.release, "a1").set()
+    assert queue.wait(a1, 5) == {"id": "vid-a1"}
+    assert uploader.gate(uploader.started, "a2").wait(5)
+    for title in ("a2", "b1"):
+        uploader.gate(uploader.release, title).set()
+    assert queue.wait(a2, 5)["id"] == "vid-a2" and queue.wait(b1, 5)["id"] == "vid-b1"
+    assert queue.status()["channels"]["chan-a"]["uploaded_today"] == 2
+
+
+def test_quota_exhausted_channel_fails_fast_until_reset():
+    uploader = GatedUploader()
+    uploader.errors["a1"] = RuntimeError('<HttpError 403 "quotaExceeded">')
+    queue = YouTubeUploadQueue(max_workers=2, per_channel=1, daily_limit=0, uploader=uploader)
+    a1 = queue.submit(title="a1", token_path="chan-a", file_path="")
+    uploader.gate(uploader.release, "a1").set()
+    with pytest.raises(RuntimeError, match="quotaExceeded"):
+        queue.wait(a1, 5)
+
+    a2 = queue.submit(title="a2", token_path="chan-a", file_path="")
+    with pytest.raises(RuntimeError, match="할당량"):
+        queue.wait(a2, 5)
+    assert not uploader.gate(uploader.started, "a2").is_set()
+    assert queue.status()["channels"]["chan-a"]["blocked_until"]
+
+
+class FakeMedia:
+    def __init__(self, size):
+        self._size = size
+
+    def size(self):
+        return self._size
+
+    def chunksize(self):
+        return UPLOAD_CHUNK_MIN
+
+
+class FakeResponse(dict):
+    def __init__(self, status, **headers):
+        super().__init__(headers)
+        self.status = status
+
+
+class FakeHttp:
+    """Answers the status query (empty PUT) with the bytes the server has acknowledged."""
+
+    def __init__(self, request):
+        self.request_obj = request
+        self.queries = 0
+
+    def request(self, uri, method="GET", headers=None, **kwargs):
+        self.queries += 1
+        offset = self.request_obj.server_offset
+        return FakeResponse(308, range=f"bytes=0-{offset - 1}") if offset else FakeResponse(308), b""
+
+
+class FakeRequest:
+    """Resumable insert: the connection may drop once after the first chunk is acknowledged."""
+
+    def __init__(self, media, drop_after_first=False, server_offset=0):
+        self.media = media
+        self.resumable = media
+        self.http = FakeHttp(self)
+        self.resumable_uri = None
+        self.resumable_progress = 0
+        self.drop_after_first = drop_after_first
+        self.server_offset = server_offset
+        self.chunk_starts = []
+
+    def postproc(self, resp, content):
+        return {"id": "video-1"}
+
+    def next_chunk(self):
+        if self.resumable_uri is None:
+            self.resumable_uri = "https://upload/yt-session"
+        if self.drop_after_first and self.chunk_starts:
+            self.drop_after_first = False
+            # the client believes more was sent than the server acknowledged
+            self.resumable_progress += UPLOAD_CHUNK_MIN // 2
+            raise ConnectionResetError("connection reset")
+        self.chunk_starts.append(self.resumable_progress)
+        self.resumable_progress = min(self.media.size(), self.resumable_progress + self.media.chunksize())
+        self.server_offset = self.resumable_progress
+        if self.resumable_progress == self.media.size():
+            return None, {"id": "video-1"}
+        return object(), None
+
+
+def _service(tmp_path):
+    service = YouTubeUploadService.__new__(YouTubeUploadService)
+    service._session_store = ResumableSessionStore(str(tmp_path / "sessions.json"))
+    service._chunk_sizes = {}
+    return service
+
+
+def test_dropped_connection_resumes_from_last_acknowledged_byte(tmp_path):
+    service = _service(tmp_path)
+    media = FakeMedia(UPLOAD_CHUNK_MIN * 8)
+    request = FakeRequest(media, drop_after_first=True)
+    progress = []
+
+    response = service._execute_resumable(request, media, "video-key", lambda sent, total: progress.append(sent),
+                                          sleep=lambda seconds: None, chunk_key="chan-a")
+
+    assert response == {"id": "video-1"}
+    # The retry asks the server first and restarts at the acknowledged offset.
+    assert request.http.queries == 1
+    assert request.chunk_starts[:2] == [0, UPLOAD_CHUNK_MIN]
+    # Fast chunks grow the chunk size used for this channel's next upload.
+    assert service._chunk_sizes["chan-a"] > UPLOAD_CHUNK_MIN
+    assert progress[-1] == media.size()
+    assert service.session_store.get("video-key") is None
+
+
+def test_saved_session_and_offset_survive_a_restart(tmp_path):
+    store = ResumableSessionStore(str(tmp_path / "sessions.json"))
+    store.put("video-key", "https://upload/yt-session", offset=UPLOAD_CHUNK_MIN * 2)
+
+    service = _service(tmp_path)
+    assert service.session_store.get_entry("video-key")["offset"] == UPLOAD_CHUNK_MIN * 2
+    media = FakeMedia(UPLOAD_CHUNK_MIN * 3)
+    request = FakeRequest(media, server_offset=UPLOAD_CHUNK_MIN * 2)
+
+    assert service._execute_resumable(request, media, "video-key", sleep=lambda seconds: None) == {"id": "video-1"}
+    assert request.chunk_starts == [UPLOAD_CHUNK_MIN * 2]
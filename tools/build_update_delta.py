@@ -0,0 +1,88 @@
+"""Build a delta update package between two AIR Studio release ZIPs.
+
+    python tools/build_update_delta.py release/AIRStudio-2.3.40-win-x64.zip release/AIRStudio-2.3.41-win-x64.zip
+
+Writes release/AIRStudio-<old>-to-<new>-win-x64-delta.zip (plus a .sha256
+sidecar) holding only the files that were added or changed, and an
+update-delta.json manifest with the base version and the files to delete.
+release_github.ps1 uploads any delta built for the release next to the full
+ZIP; UpdaterService prefers it when the installed version matches.
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from services.updater_service import DELTA_ASSET_TEMPLATE, DELTA_MANIFEST_NAME  # noqa: E402
+
+ZIP_VERSION_RE = re.compile(r"AIRStudio-(?P<version>.+)-win-x64\.zip$")
+
+
+def _version_of(path: Path) -> str:
+    match = ZIP_VERSION_RE.search(path.name)
+    if not match:
+        raise SystemExit(f"Not a release ZIP name: {path.name}")
+    return match.group("version")
+
+
+def _file_digests(archive: zipfile.ZipFile) -> dict:
+    digests = {}
+    for info in archive.infolist():
+        if info.is_dir():
+            continue
+        digest = hashlib.sha256()
+        with archive.open(info) as source:
+            for block in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(block)
+        digests[info.filename.replace("\\", "/")] = (info, digest.hexdigest())
+    return digests
+
+
+def build_delta(old_zip: Path, new_zip: Path, output_dir: Path) -> Path:
+    old_version, new_version = _version_of(old_zip), _version_of(new_zip)
+    output = output_dir / DELTA_ASSET_TEMPLATE.format(from_version=old_version, to_version=new_version)
+    with zipfile.ZipFile(old_zip) as old, zipfile.ZipFile(new_zip) as new:
+        old_files, new_files = _file_digests(old), _file_digests(new)
+        changed = [name for name, (_info, digest) in new_files.items()
+                   if name not in old_files or old_files[name][1] != digest]
+        # version.json always changes between releases; keep it even if it did not.
+        if "version.json" in new_files and "version.json" not in changed:
+            changed.append("version.json")
+        removed = sorted(name for name in old_files if name not in new_files)
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as delta:
+            for name in sorted(changed):
+                info = new_files[name][0]
+                with new.open(info) as source, delta.open(zipfile.ZipInfo(name, info.date_time), "w") as target:
+                    for block in iter(lambda: source.read(1024 * 1024), b""):
+                        target.write(block)
+            delta.writestr(DELTA_MANIFEST_NAME, json.dumps({
+                "from_version": old_version,
+                "to_version": new_version,
+                "changed": len(changed),
+                "removed": removed,
+            }, ensure_ascii=False, indent=2))
+
+    digest = hashlib.sha256(output.read_bytes()).hexdigest()
+    Path(f"{output}.sha256").write_text(f"{digest}  {output.name}\n", encoding="ascii")
+    print(f"{output.name}: {len(changed)} changed, {len(removed)} removed, "
+          f"{output.stat().st_size:,} bytes (full {new_zip.stat().st_size:,})")
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old_zip", type=Path)
+    parser.add_argument("new_zip", type=Path)
+    parser.add_argument("--output-dir", type=Path, default=None)
+    args = parser.parse_args()
+    build_delta(args.old_zip, args.new_zip, args.output_dir or args.new_zip.parent)
+
+
+if __name__ == "__main__":
+    main()
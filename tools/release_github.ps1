@@ -165,6 +165,10 @@ if (-not $SkipInstaller) {
     $UploadFiles += $InstallerSha256
 }
 
+# Delta packages from earlier versions (tools/build_update_delta.py), if any were built
+Get-ChildItem -Path $ReleaseDir -Filter "AIRStudio-*-to-$Version-win-x64-delta.zip" -ErrorAction SilentlyContinue |
+    ForEach-Object { $UploadFiles += $_.FullName }
+
 # Release notes
 $Notes = Get-ReleaseNotes -Path $NotesFile
 
@@ -18,8 +18,12 @@ from tempfile import NamedTemporaryFile
 from xml.etree import ElementTree
 
 import job_store
-from fastapi import FastAPI, Header, HTTPException, Response, Body, UploadFile, File
+import log_tail
+import result_index
+from event_bus import EventBus, sse_frame
+from fastapi import FastAPI, Header, HTTPException, Request, Response, Body, UploadFile, File
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from local_api_token import verify_token
 from logging_setup import get_logger
 from render_pipeline_adapter import render_status_display
@@ -252,6 +256,17 @@ def _sync_hermes_process_status(snap: dict, autopilot_status: dict) -> dict:
     return hermes_process
 
 
+def _decorate_status(snap: dict) -> dict:
+    """/api/status와 /api/events의 status 이벤트가 같은 내용을 갖도록 Manager 스냅샷에 덧붙인다."""
+    snap.setdefault("worker_profile", WORKER_PROFILE)
+    _sync_hermes_process_status(snap, autopilot_manager.get_status())
+    snap["render_status"] = render_status_display()
+    return snap
+
+
+event_bus = EventBus("dashboard", read_status=_read_manager_status, decorate_status=_decorate_status)
+
+
 def _job_pipeline_identity(job: dict) -> tuple[str, str, str]:
     payload = job.get("payload") or {}
     queue_id = str(payload.get("topic_queue_id") or payload.get("topic_id") or "").strip()
@@ -322,7 +337,7 @@ def _pipeline_has_active_job(jobs: list[dict]) -> bool:
     return any(str(job.get("status") or "").upper() in HERMES_ACTIVE_STATUSES for job in jobs)
 
 
-def _submit_resume_job_from_pipeline(jobs: list[dict]) -> dict:
+def _submit_resume_job_from_pipeline(jobs: list[dict], pipeline_id: str | None = None) -> dict:
     metadata_job, _metadata_data = _completed_result_for_type(jobs, "publish_metadata_generate")
     if metadata_job:
         return {"success": False, "error": "이미 설명·태그 단계까지 완료된 작업입니다."}
@@ -358,6 +373,8 @@ def _submit_resume_job_from_pipeline(jobs: list[dict]) -> dict:
             priority=100,
             source="autopilot",
             max_retries=0,
+            pipeline_id=pipeline_id,
+            stage="publish_metadata_generate",
         )
         return {"success": True, "job_id": new_job_id, "resumed_stage": "publish_metadata_generate"}
 
@@ -395,6 +412,8 @@ def _submit_resume_job_from_pipeline(jobs: list[dict]) -> dict:
             priority=100,
             source="autopilot",
             max_retries=0,
+            pipeline_id=pipeline_id,
+            stage="script_generate",
         )
         return {"success": True, "job_id": new_job_id, "resumed_stage": "script_generate"}
 
@@ -442,17 +461,19 @@ def _submit_resume_job_from_pipeline(jobs: list[dict]) -> dict:
             priority=100,
             source="autopilot",
             max_retries=0,
+            pipeline_id=pipeline_id,
+            stage="script_plan_generate",
         )
         return {"success": True, "job_id": new_job_id, "resumed_stage": "script_plan_generate"}
 
     return {"success": False, "error": "이어갈 수 있는 완료 단계가 없습니다. 웹조사, 기획 또는 대본 결과가 필요합니다."}
 
 
-AUTOPILOT_RESULTS_DIR = OUTPUT_DIR / "hermes_autopilot_results"
+AUTOPILOT_RESULTS_DIR = result_index.RESULT_DIRS[result_index.PACKAGE]
 AUTOPILOT_STATE_FILE = STATE_DIR / "hermes_autopilot_state.json"
-HERMES_RESULTS_DIR = OUTPUT_DIR / "hermes_results"
+HERMES_RESULTS_DIR = result_index.RESULT_DIRS[result_index.HERMES]
 NOTEBOOKLM_RESULTS_DIR = OUTPUT_DIR / "notebooklm_results"
-GENERATED_RESULT_JOB_TYPES = {"script_generate", "script_plan_generate", "web_research", "publish_metadata_generate"}
+GENERATED_RESULT_JOB_TYPES = result_index.GENERATED_RESULT_JOB_TYPES
 _OFFLINE_HARNESS_CACHE: dict = {"checked_at": 0.0, "report": None}
 _OFFLINE_HARNESS_CACHE_SECONDS = 30.0
 
@@ -618,14 +639,9 @@ def _autopilot_generation_diagnostics() -> dict:
                 state = {}
 
     logs = state.get("logs") if isinstance(state.get("logs"), list) else []
-    hermes_results_dir = OUTPUT_DIR / "hermes_results"
-    partial_count = 0
-    latest_partial_at = None
-    if hermes_results_dir.exists():
-        partial_paths = list(hermes_results_dir.glob("*.json"))
-        partial_count = len(partial_paths)
-        if partial_paths:
-            latest_partial_at = max(path.stat().st_mtime for path in partial_paths)
+    partial_stats = job_store.result_stats(result_index.HERMES)
+    partial_count = partial_stats["count"]
+    latest_partial_at = partial_stats["latest_at"]
 
     stats = state.get("session_stats") if isinstance(state.get("session_stats"), dict) else {}
     return {
@@ -642,44 +658,8 @@ def _autopilot_generation_diagnostics() -> dict:
     }
 
 
-def _result_title(data: dict) -> str:
-    structure = data.get("structure") if isinstance(data.get("structure"), dict) else {}
-    title_generation = data.get("title_generation") if isinstance(data.get("title_generation"), dict) else {}
-    benchmark_analysis = data.get("benchmark_analysis") if isinstance(data.get("benchmark_analysis"), dict) else {}
-    benchmark_title_generation = (
-        benchmark_analysis.get("title_generation")
-        if isinstance(benchmark_analysis.get("title_generation"), dict)
-        else {}
-    )
-    return (
-        data.get("generated_title")
-        or data.get("upload_title")
-        or structure.get("upload_title")
-        or title_generation.get("generated_title")
-        or title_generation.get("final_title")
-        or benchmark_title_generation.get("generated_title")
-        or benchmark_title_generation.get("final_title")
-        or ""
-    )
-
-
-def _result_category(data: dict) -> str:
-    title_generation = data.get("title_generation") if isinstance(data.get("title_generation"), dict) else {}
-    benchmark_analysis = data.get("benchmark_analysis") if isinstance(data.get("benchmark_analysis"), dict) else {}
-    benchmark_title_generation = (
-        benchmark_analysis.get("title_generation")
-        if isinstance(benchmark_analysis.get("title_generation"), dict)
-        else {}
-    )
-    for value in (
-        data.get("category"),
-        title_generation.get("category"),
-        benchmark_title_generation.get("category"),
-    ):
-        category = str(value or "").strip()
-        if category:
-            return category
-    return ""
+_result_title = result_index.result_title
+_result_category = result_index.result_category
 
 
 def _structure_has_image_grid_prompts(structure: dict) -> bool:
@@ -944,38 +924,40 @@ def _topic_generated_result_summary(result_id: str, data: dict) -> dict:
     }
 
 
-def _collect_topic_generated_results(limit: int = 500) -> dict[str, dict]:
-    results: dict[str, dict] = {}
-
-    if HERMES_RESULTS_DIR.exists():
-        paths = sorted(HERMES_RESULTS_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-        for path in paths[:limit]:
-            data = _read_generated_result(path)
-            if not isinstance(data, dict) or data.get("job_type") not in GENERATED_RESULT_JOB_TYPES:
-                continue
-            topic_id = _topic_key(data.get("topic_queue_id"))
-            if not topic_id:
-                continue
-            result_id = f"topic_{topic_id}"
-            target = results.setdefault(result_id, {"id": result_id, "topic_queue_id": data.get("topic_queue_id")})
-            _merge_topic_generated_result(
-                target,
-                data,
-                source="hermes_results",
-                source_id=path.stem,
-                path=path,
-                fallback_ts=path.stat().st_mtime,
-            )
-
+def _autopilot_jobs_by_topic(limit: int = 500) -> dict[str, list[dict]]:
+    grouped: dict[str, list[dict]] = {}
     for job in job_store.list_jobs(limit=limit):
         if job.get("source") != "autopilot" or job.get("job_type") not in GENERATED_RESULT_JOB_TYPES:
             continue
         payload = job.get("payload") if isinstance(job.get("payload"), dict) else {}
         topic_id = _topic_key(payload.get("topic_queue_id"))
-        if not topic_id:
+        if topic_id:
+            grouped.setdefault(topic_id, []).append(job)
+    return grouped
+
+
+def _topic_generated_result(topic_id: str, jobs: list[dict]) -> dict | None:
+    """주제 하나의 Hermes 단계 결과(결과 인덱스)와 autopilot 작업 상태를 합친다.
+    이 주제의 파일만 열기 때문에 결과 파일 총개수와 무관하다."""
+    result_id = f"topic_{topic_id}"
+    target: dict = {"id": result_id, "topic_queue_id": topic_id}
+    rows = job_store.list_results(topic_key=topic_id, kind=result_index.HERMES, job_types=sorted(GENERATED_RESULT_JOB_TYPES))
+    for row in rows:
+        path = Path(row["path"])
+        data = _read_generated_result(path)
+        if not isinstance(data, dict):
             continue
-        result_id = f"topic_{topic_id}"
-        target = results.setdefault(result_id, {"id": result_id, "topic_queue_id": payload.get("topic_queue_id")})
+        _merge_topic_generated_result(
+            target,
+            data,
+            source="hermes_results",
+            source_id=row["result_id"],
+            path=path,
+            fallback_ts=row.get("updated_at"),
+        )
+
+    for job in jobs:
+        payload = job.get("payload") if isinstance(job.get("payload"), dict) else {}
         data = {
             **payload,
             "job_id": job.get("job_id"),
@@ -993,7 +975,52 @@ def _collect_topic_generated_results(limit: int = 500) -> dict[str, dict]:
             fallback_ts=job.get("updated_at") or job.get("completed_at") or job.get("created_at"),
         )
 
-    return results
+    return target if target.get("_sources") else None
+
+
+def _job_only_generated_results(jobs_by_topic: dict[str, list[dict]], category: str | None) -> list[dict]:
+    """결과 인덱스에는 (아직) 보여줄 내용이 없지만 autopilot 작업 payload에 대본/장면이 있는 주제."""
+    listed = job_store.listed_result_topic_keys(jobs_by_topic)
+    summaries = []
+    for topic_id, jobs in jobs_by_topic.items():
+        if topic_id in listed:
+            continue
+        data = _topic_generated_result(topic_id, jobs)
+        if not data:
+            continue
+        summary = _topic_generated_result_summary(data["id"], data)
+        if not (summary.get("has_script") or summary.get("scene_count")):
+            continue
+        if category and summary.get("category") != category:
+            continue
+        summaries.append(summary)
+    return summaries
+
+
+def _list_generated_results(limit: int, offset: int, category: str | None) -> dict:
+    """최종 패키지는 하나씩, 패키지가 없는 주제는 주제당 하나씩 최신순으로 보여준다.
+    total도 같은 단위(보여주는 행)로 센다. 인덱스 항목은 이 페이지 분량만 파일을 연다."""
+    result_index.ensure_backfilled()
+    jobs_by_topic = _autopilot_jobs_by_topic()
+    job_only = _job_only_generated_results(jobs_by_topic, category)
+    # 작업만 있는 주제가 앞쪽에 끼어들 수 있으므로 인덱스는 offset + limit까지 읽어 합친다.
+    entries, indexed_total = job_store.list_result_entries(
+        result_index.PACKAGE, category=category, limit=offset + limit, offset=0
+    )
+    merged = [(entry.get("updated_at") or 0, entry, None) for entry in entries]
+    merged += [(summary.get("completed_at") or summary.get("updated_at") or 0, None, summary) for summary in job_only]
+    merged.sort(key=lambda item: item[0], reverse=True)
+    rows = []
+    for _ts, entry, summary in merged[offset:offset + limit]:
+        if summary is None and entry["entry"] == "package":
+            summary = _generated_result_summary(Path(entry["path"]))
+        elif summary is None:
+            topic_id = entry["topic_key"]
+            data = _topic_generated_result(topic_id, jobs_by_topic.get(topic_id, []))
+            summary = _topic_generated_result_summary(data["id"], data) if data else None
+        if summary:
+            rows.append(summary)
+    return {"results": rows, "total": indexed_total + len(job_only), "offset": offset, "limit": limit}
 
 
 STYLE_PRESET_TYPES = {"image", "script"}
@@ -1062,10 +1089,7 @@ def api_status(
     snap = _read_manager_status()
     if not snap.get("manager_alive"):
         snap["manager_recovery"] = _launch_manager_recovery_if_needed()
-    autopilot_status = autopilot_manager.get_status()
-    _sync_hermes_process_status(snap, autopilot_status)
-    snap["render_status"] = render_status_display()
-    return snap
+    return _decorate_status(snap)
 
 
 @app.get("/api/jobs")
@@ -1254,8 +1278,8 @@ def api_cancel_job(
     cookie: str | None = Header(default=None, alias="Cookie"),
 ):
     require_auth(authorization, cookie)
-    from ipc import submit_command, wait_for_result
-    return wait_for_result(submit_command("cancel_job", {"job_id": job_id}), timeout=15)
+    from ipc import send_command
+    return send_command("cancel_job", {"job_id": job_id}, timeout=15)
 
 
 @app.post("/api/hermes/pipelines/{job_id}/resume")
@@ -1268,16 +1292,24 @@ def api_resume_hermes_pipeline(
     seed_job = _resolve_job_by_id_or_prefix(job_id)
     if not seed_job:
         return {"success": False, "error": "작업을 찾을 수 없습니다."}
-    related_jobs = _related_hermes_pipeline_jobs(seed_job)
+    # 파이프라인 레코드가 있으면(job_store.create_pipeline) 그 단계 기록으로 바로
+    # 이어가고, 이전 작업들만 최근 작업 스캔으로 묶는다.
+    pipeline = job_store.pipeline_for_job(str(seed_job.get("job_id") or ""))
+    pipeline_id = pipeline["pipeline_id"] if pipeline else None
+    related_jobs = job_store.pipeline_jobs(pipeline_id) if pipeline_id else _related_hermes_pipeline_jobs(seed_job)
     if _pipeline_has_active_job(related_jobs):
         return {"success": False, "error": "이미 진행 중인 단계가 있습니다."}
-    resume_result = _submit_resume_job_from_pipeline(related_jobs)
+    resumed = job_store.resume_pipeline(pipeline_id) if pipeline_id else []
+    if resumed:
+        resume_result = {"success": True, "job_id": resumed[0]["job_id"], "resumed_stage": resumed[0]["stage"]}
+    else:
+        resume_result = _submit_resume_job_from_pipeline(related_jobs, pipeline_id=pipeline_id)
     if not resume_result.get("success"):
         return resume_result
 
-    from ipc import submit_command, wait_for_result
+    from ipc import send_command
 
-    worker_result = wait_for_result(submit_command("start_process", {"name": "hermes_worker"}))
+    worker_result = send_command("start_process", {"name": "hermes_worker"})
     return {
         **resume_result,
         "worker_started": bool(worker_result.get("success")),
@@ -1289,16 +1321,85 @@ def api_resume_hermes_pipeline(
 async def api_logs(
     process: str = "manager",
     tail_lines: int = 50,
+    cursor: str | None = None,
     authorization: str | None = Header(default=None),
     cookie: str | None = Header(default=None, alias="Cookie"),
 ):
+    """마지막 tail_lines 줄(파일 끝에서 역방향 탐색) 또는 cursor 이후 새 줄.
+    응답의 cursor를 다음 요청에 넘기면 이어서 읽는다."""
     require_auth(authorization, cookie)
     from worker_config import LOG_FILES
     path = LOG_FILES.get(process)
     if not path or not Path(path).exists():
         return {"error": f"로그를 찾을 수 없습니다: '{process}'", "available": list(LOG_FILES.keys())}
-    lines = Path(path).read_text(encoding="utf-8", errors="replace").splitlines()
-    return {"process": process, "lines": lines[-tail_lines:]}
+    if cursor:
+        chunk = await run_in_threadpool(log_tail.read_since, Path(path), cursor)
+    else:
+        chunk = await run_in_threadpool(log_tail.tail, Path(path), tail_lines)
+    return {"process": process, **chunk}
+
+
+@app.get("/api/logs/stream")
+async def api_logs_stream(
+    request: Request,
+    process: str = "manager",
+    tail_lines: int = 200,
+    cursor: str | None = None,
+    authorization: str | None = Header(default=None),
+    cookie: str | None = Header(default=None, alias="Cookie"),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+):
+    """Server-Sent Events로 로그를 실시간 전달한다. 로테이션(<name>.log.1)을
+    넘어 이어 읽고, 재접속 시 EventSource가 보내는 Last-Event-ID(cursor)부터 재개한다."""
+    require_auth(authorization, cookie)
+    from worker_config import LOG_FILES
+    path = LOG_FILES.get(process)
+    if not path:
+        raise HTTPException(404, f"로그를 찾을 수 없습니다: '{process}'")
+
+    async def events():
+        yield "retry: 3000\n\n"
+        async for batch in log_tail.follow(
+            Path(path), last_event_id or cursor, tail_lines=tail_lines, is_disconnected=request.is_disconnected
+        ):
+            if batch is None:
+                yield ": keepalive\n\n"
+                continue
+            data = json.dumps({"lines": batch["lines"], "rotated": batch["rotated"]}, ensure_ascii=False)
+            yield f"id: {batch['cursor']}\nevent: lines\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/events")
+async def api_events(
+    request: Request,
+    events: str | None = None,
+    authorization: str | None = Header(default=None),
+    cookie: str | None = Header(default=None, alias="Cookie"),
+):
+    """작업 상태·진행률(job)과 Manager 상태(status) 변경을 Server-Sent Events로 푸시한다.
+    접속(재접속) 직후 현재 상태 snapshot을 먼저 보내고, 이후에는 변경분만 보낸다.
+    열린 탭 수와 관계없이 jobs.db·상태 파일은 프로세스당 한 번만 읽는다."""
+    require_auth(authorization, cookie)
+    wanted = {name.strip() for name in (events or "").split(",") if name.strip()}
+
+    async def stream():
+        yield "retry: 3000\n\n"
+        async for message in event_bus.subscribe(wanted):
+            if await request.is_disconnected():
+                return
+            yield sse_frame(message)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/api/style-presets")
@@ -1431,8 +1532,8 @@ def api_hermes_start(
     cookie: str | None = Header(default=None, alias="Cookie"),
 ):
     require_auth(authorization, cookie)
-    from ipc import submit_command, wait_for_result
-    return wait_for_result(submit_command("start_process", {"name": "hermes_worker"}))
+    from ipc import send_command
+    return send_command("start_process", {"name": "hermes_worker"})
 
 
 @app.post("/api/processes/hermes/stop")
@@ -1441,8 +1542,8 @@ def api_hermes_stop(
     cookie: str | None = Header(default=None, alias="Cookie"),
 ):
     require_auth(authorization, cookie)
-    from ipc import submit_command, wait_for_result
-    return wait_for_result(submit_command("stop_process", {"name": "hermes_worker"}))
+    from ipc import send_command
+    return send_command("stop_process", {"name": "hermes_worker"})
 
 
 @app.post("/api/processes/render/start")
@@ -1451,8 +1552,8 @@ def api_render_start(
     cookie: str | None = Header(default=None, alias="Cookie"),
 ):
     require_auth(authorization, cookie)
-    from ipc import submit_command, wait_for_result
-    return wait_for_result(submit_command("start_process", {"name": "render_worker"}))
+    from ipc import send_command
+    return send_command("start_process", {"name": "render_worker"})
 
 
 @app.post("/api/processes/render/stop")
@@ -1461,8 +1562,8 @@ def api_render_stop(
     cookie: str | None = Header(default=None, alias="Cookie"),
 ):
     require_auth(authorization, cookie)
-    from ipc import submit_command, wait_for_result
-    return wait_for_result(submit_command("stop_process", {"name": "render_worker"}))
+    from ipc import send_command
+    return send_command("stop_process", {"name": "render_worker"})
 
 
 @app.post("/api/processes/remote-drive/start")
@@ -1471,8 +1572,8 @@ def api_remote_drive_start(
     cookie: str | None = Header(default=None, alias="Cookie"),
 ):
     require_auth(authorization, cookie)
-    from ipc import submit_command, wait_for_result
-    return wait_for_result(submit_command("start_process", {"name": "remote_drive_worker"}))
+    from ipc import send_command
+    return send_command("start_process", {"name": "remote_drive_worker"})
 
 
 @app.post("/api/processes/remote-drive/stop")
@@ -1481,8 +1582,8 @@ def api_remote_drive_stop(
     cookie: str | None = Header(default=None, alias="Cookie"),
 ):
     require_auth(authorization, cookie)
-    from ipc import submit_command, wait_for_result
-    return wait_for_result(submit_command("stop_process", {"name": "remote_drive_worker"}))
+    from ipc import send_command
+    return send_command("stop_process", {"name": "remote_drive_worker"})
 
 
 # ---------------------------------------------------------------------------
@@ -1771,9 +1872,7 @@ async def api_notebooklm_send_to_hermes(
         "completed_at": now,
     }
 
-    AUTOPILOT_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-    target_path = AUTOPILOT_RESULTS_DIR / f"{hermes_id}.json"
-    target_path.write_text(json.dumps(hermes_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    target_path = result_index.save(result_index.PACKAGE, AUTOPILOT_RESULTS_DIR / f"{hermes_id}.json", hermes_payload)
     return {
         "success": True,
         "id": hermes_id,
@@ -2029,12 +2128,9 @@ async def api_autopilot_start(
             "detail": summary,
             "offline_harness": harness_report,
         }
-    from ipc import submit_command, wait_for_result
+    from ipc import send_command
 
-    worker_result = await run_in_threadpool(
-        wait_for_result,
-        submit_command("start_process", {"name": "hermes_worker"}),
-    )
+    worker_result = await run_in_threadpool(send_command, "start_process", {"name": "hermes_worker"})
     if not worker_result.get("success"):
         return {
             "success": False,
@@ -2065,11 +2161,8 @@ async def api_autopilot_stop(
 ):
     require_auth(authorization, cookie)
     autopilot_result = await autopilot_manager.stop()
-    from ipc import submit_command, wait_for_result
-    worker_result = await run_in_threadpool(
-        wait_for_result,
-        submit_command("stop_process", {"name": "hermes_worker"}),
-    )
+    from ipc import send_command
+    worker_result = await run_in_threadpool(send_command, "stop_process", {"name": "hermes_worker"})
     cancelled_jobs = job_store.cancel_nonterminal_jobs_by_source(
         "autopilot",
         reason="autopilot stopped by administrator",
@@ -2501,34 +2594,17 @@ async def api_voicebox_save_to_supabase(
 @app.get("/api/generated-results")
 async def api_generated_results(
     limit: int = 100,
+    offset: int = 0,
+    category: str | None = None,
     authorization: str | None = Header(default=None),
     cookie: str | None = Header(default=None, alias="Cookie"),
 ):
     require_auth(authorization, cookie)
-    AUTOPILOT_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-    rows = []
-    seen_ids = set()
-    seen_topic_ids = set()
-    for path in sorted(AUTOPILOT_RESULTS_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
-        summary = _generated_result_summary(path)
-        if summary:
-            seen_ids.add(summary["id"])
-            if summary.get("topic_queue_id") is not None:
-                seen_topic_ids.add(_topic_key(summary.get("topic_queue_id")))
-            rows.append(summary)
-    for result_id, data in _collect_topic_generated_results(limit=max(100, min(limit * 10, 1000))).items():
-        if result_id in seen_ids:
-            continue
-        topic_id = _topic_key(data.get("topic_queue_id"))
-        if topic_id and topic_id in seen_topic_ids:
-            continue
-        summary = _topic_generated_result_summary(result_id, data)
-        if summary.get("has_script") or summary.get("scene_count"):
-            rows.append(summary)
-    rows.sort(key=lambda row: row.get("completed_at") or row.get("updated_at") or 0, reverse=True)
-    rows = rows[:max(1, min(limit, 500))]
+    page = await run_in_threadpool(
+        _list_generated_results, max(1, min(limit, 500)), max(0, offset), (category or "").strip() or None
+    )
     return {
-        "results": rows,
+        **page,
         "dir": f"{AUTOPILOT_RESULTS_DIR} + {HERMES_RESULTS_DIR}",
         "diagnostics": _autopilot_generation_diagnostics(),
     }
@@ -2545,8 +2621,9 @@ async def api_generated_result_detail(
     if not safe_id:
         raise HTTPException(400, "Invalid result id")
     if safe_id.startswith("topic_"):
-        topic_results = _collect_topic_generated_results(limit=1000)
-        data = topic_results.get(safe_id)
+        topic_id = safe_id[len("topic_"):]
+        await run_in_threadpool(result_index.ensure_backfilled)
+        data = await run_in_threadpool(_topic_generated_result, topic_id, _autopilot_jobs_by_topic().get(topic_id, []))
         if not isinstance(data, dict):
             raise HTTPException(404, "Generated result not found")
         data["_file"] = {"id": safe_id, "path": "job_store/hermes_results", "updated_at": data.get("updated_at") or data.get("completed_at")}
@@ -3401,6 +3478,9 @@ tr:hover { background: #161b22; }
               </select>
             </div>
             <button class="btn" onclick="loadLogs()">로그 불러오기</button>
+            <label style="display:flex; align-items:center; gap:6px; margin-bottom:8px;">
+              <input type="checkbox" id="log-follow" onchange="loadLogs()"> 실시간 보기
+            </label>
           </div>
         </div>
         <div class="card">
@@ -3790,7 +3870,7 @@ function switchTab(tabId) {
   document.querySelector(`.nav-item[data-tab="${tabId}"]`).classList.add('active');
   document.getElementById('page-title').textContent = tabTitles[tabId] || tabId;
   if (tabId === 'history') loadHistory();
-  if (tabId === 'logs') loadLogs();
+  if (tabId === 'logs') loadLogs(); else stopLogStream();
   if (tabId === 'rendering') loadRenderTab();
   if (tabId === 'settings') loadSettings();
   if (tabId === 'styles') loadStylePresets();
@@ -5023,8 +5103,33 @@ function loadHistory() {
 }
 
 /* ── Logs tab ── */
+const LOG_VIEW_MAX_LINES = 2000;
+let logStream = null;
+
+function stopLogStream() {
+  if (logStream) { logStream.close(); logStream = null; }
+}
+
+function followLogs(proc) {
+  const out = document.getElementById('log-output');
+  let lines = [];
+  out.textContent = '';
+  logStream = new EventSource(`/api/logs/stream?process=${proc}&tail_lines=200`);
+  logStream.addEventListener('lines', ev => {
+    const data = JSON.parse(ev.data);
+    if (data.rotated) lines.push('── 로그 파일 교체됨 ──');
+    lines = lines.concat(data.lines || []);
+    if (lines.length > LOG_VIEW_MAX_LINES) lines = lines.slice(-LOG_VIEW_MAX_LINES);
+    const atBottom = out.scrollTop + out.clientHeight >= out.scrollHeight - 20;
+    out.textContent = lines.join('\n') || '(로그 없음)';
+    if (atBottom) out.scrollTop = out.scrollHeight;
+  });
+}
+
 function loadLogs() {
   const proc = document.getElementById('log-process').value;
+  stopLogStream();
+  if (document.getElementById('log-follow')?.checked) { followLogs(proc); return; }
   api('GET', `/api/logs?process=${proc}&tail_lines=200`).then(data => {
     if (!data || data.error) {
       document.getElementById('log-output').textContent = data?.error || '로그를 불러올 수 없습니다';
@@ -5642,7 +5747,7 @@ async function refreshAll() {
     return;
   }
   refreshAllInFlight = true;
-  countdown = 3;
+  countdown = liveConnected ? LIVE_REFRESH_SECONDS : 3;
   try {
     const [jobs, status, renderJobsData] = await Promise.all([
       api('GET', '/api/jobs?limit=50'),
@@ -5655,6 +5760,7 @@ async function refreshAll() {
     if (!status) return;
     window.latestWorkerStatus = status;
     const recentJobs = jobs?.jobs || [];
+    autopilotJobRow = recentJobs.find(j => j.job_id === 'hermes-autopilot-current') || null;
     renderProcessCards(status, recentJobs);
     renderRecentJobs(recentJobs);
 
@@ -5672,10 +5778,71 @@ async function refreshAll() {
 /* ── Auto-refresh countdown ── */
 setInterval(() => {
   countdown--;
-  if (countdown <= 0) { countdown = 3; refreshAll(); }
-  document.getElementById('refresh-timer').textContent = `${countdown}s 후 새로고침`;
+  if (countdown <= 0) { countdown = liveConnected ? LIVE_REFRESH_SECONDS : 3; refreshAll(); }
+  document.getElementById('refresh-timer').textContent = liveConnected ? '실시간 연결됨' : `${countdown}s 후 새로고침`;
 }, 1000);
 
+/* ── Live events (/api/events) ──
+   작업 상태·진행률과 Manager 상태는 서버가 푸시한다. 연결되어 있는 동안 전체 새로고침은
+   푸시 대상이 아닌 데이터(원격 렌더 큐, Autopilot)를 위해 LIVE_REFRESH_SECONDS마다만 한다.
+   연결이 끊기면 EventSource가 알아서 재접속하고, 그 사이에는 3초 폴링으로 돌아간다. */
+const LIVE_REFRESH_SECONDS = 30;
+const liveJobs = new Map();
+let liveConnected = false;
+let liveRenderTimer = null;
+let liveRenderTabDirty = false;
+let autopilotJobRow = null;
+
+function liveRecentJobs() {
+  const jobs = Array.from(liveJobs.values())
+    .sort((a, b) => (b.created_at || 0) - (a.created_at || 0))
+    .slice(0, 50);
+  if (autopilotJobRow) jobs.unshift(autopilotJobRow);
+  return jobs.slice(0, 50);
+}
+
+function scheduleLiveRender() {
+  if (liveRenderTimer) return;
+  liveRenderTimer = setTimeout(() => {
+    liveRenderTimer = null;
+    const jobs = liveRecentJobs();
+    if (window.latestWorkerStatus) renderProcessCards(window.latestWorkerStatus, jobs);
+    renderRecentJobs(jobs);
+    const activeTab = document.querySelector('.nav-item.active')?.dataset.tab;
+    if (liveRenderTabDirty && activeTab === 'rendering') loadRenderTab();
+    liveRenderTabDirty = false;
+  }, 250);
+}
+
+function applyLiveEvent(event, key, data) {
+  if (event === 'status') {
+    window.latestWorkerStatus = data;
+  } else if (event === 'job') {
+    liveJobs.set(key, data);
+    if (data.job_type === 'render_video') liveRenderTabDirty = true;
+  }
+}
+
+function connectLiveEvents() {
+  if (!window.EventSource) return;
+  const source = new EventSource('/api/events');
+  source.addEventListener('snapshot', ev => {
+    liveJobs.clear();
+    for (const m of JSON.parse(ev.data).events || []) applyLiveEvent(m.event, m.key, m.data);
+    liveConnected = true;
+    liveRenderTabDirty = true;
+    scheduleLiveRender();
+  });
+  for (const name of ['status', 'job']) {
+    source.addEventListener(name, ev => {
+      const m = JSON.parse(ev.data);
+      applyLiveEvent(name, m.key, m.data);
+      scheduleLiveRender();
+    });
+  }
+  source.onerror = () => { liveConnected = false; countdown = Math.min(countdown, 3); };
+}
+
 /* ── Logout ── */
 async function doLogout() {
   await fetch('/auth/logout', { method: 'POST' });
@@ -7011,6 +7178,7 @@ function showRestartModal() {
 
 /* ── Init ── */
 refreshAll();
+connectLiveEvents();
 
 // 3초마다 렌더링 상황 배지 실시간 동기화
 setInterval(() => {
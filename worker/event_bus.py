@@ -0,0 +1,242 @@
+"""
+Push channel for the dashboard and Local API.
+
+The dashboard polled /api/status, /api/jobs and /api/rendering-jobs every
+few seconds per open tab, and each poll re-read manager_status.json and
+jobs.db. EventBus is one per API process: it follows the two sources once,
+however many clients are connected, and fans the changes out to every
+subscriber.
+
+  - "job": a jobs row changed (submit, claim, transition, progress). Every
+    job_store write stamps a change_seq and sends a job_wakeup watcher
+    datagram; the bus wakes on it and reads job_store.changes_since().
+  - "status": the Manager's status snapshot, pushed over manager_rpc's
+    subscribe stream (falls back to re-reading MANAGER_STATUS_FILE once per
+    tick while the Manager is not reachable over RPC).
+
+The latest message per (event, key) is retained, so a client that connects
+(or reconnects) first gets a "snapshot" of the current state and then only
+changes. Subscribers are latest-wins per key as well: a slow client gets
+the newest state of each job, never a backlog. Sources only run while at
+least one client is connected.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import AsyncIterator, Callable, Optional
+
+import job_store
+import job_wakeup
+import manager_rpc
+from worker_config import (
+    EVENT_BUS_HEARTBEAT_SECONDS,
+    EVENT_BUS_JOB_FALLBACK_SECONDS,
+    EVENT_BUS_RETAINED_JOBS,
+    MANAGER_TICK_SECONDS,
+    ensure_project_root_on_path,
+)
+
+# Subscriber queues and SSE framing are shared with the AIR Studio app's bus.
+ensure_project_root_on_path()
+from services.event_bus import SNAPSHOT, Subscriber, sse_frame  # noqa: E402  (re-exported for the apps)
+
+logger = logging.getLogger("event_bus")
+
+JOB = "job"
+STATUS = "status"
+_SOURCE_IDLE_SECONDS = 30.0          # sources stop this long after the last client left
+_RPC_RETRY_SECONDS = 5.0
+_PAYLOAD_VALUE_MAX_CHARS = 300
+_CHANGE_BATCH = 200
+
+
+def job_summary(job: dict) -> dict:
+    """A jobs row as pushed to clients: the payload keeps only short scalar
+    values (category, topic, titles, ids) - enough for the job list, not the
+    multi-KB research/script inputs."""
+    summary = {k: v for k, v in job.items() if k != "payload"}
+    payload = job.get("payload") or {}
+    summary["payload"] = {
+        k: v for k, v in payload.items()
+        if isinstance(v, (int, float, bool)) or (isinstance(v, str) and len(v) <= _PAYLOAD_VALUE_MAX_CHARS)
+    }
+    return summary
+
+
+class EventBus:
+    """`read_status()` returns the Manager status as the process's own
+    status endpoint would (used until/unless the RPC stream is up), and
+    `decorate_status(snapshot)` adds whatever that endpoint adds on top."""
+
+    def __init__(self, name: str, *, read_status: Callable[[], dict],
+                 decorate_status: Optional[Callable[[dict], dict]] = None):
+        self.name = name
+        self.read_status = read_status
+        self.decorate_status = decorate_status
+        self._lock = threading.Lock()
+        self._subscribers: set[Subscriber] = set()
+        self._retained: dict = {}        # (event, key) -> message
+        self._seq = 0
+        self._job_seq = 0
+        self._sources: list[threading.Thread] = []
+        self._sources_lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._wanted = threading.Event()  # set while sources should run
+        self._idle_since: Optional[float] = None
+
+    # ---- publishing ----------------------------------------------------------
+
+    def publish(self, event: str, data: dict, *, key=None) -> dict:
+        """Thread-safe. Retains the message and offers it to every subscriber."""
+        with self._lock:
+            self._seq += 1
+            message = {"id": self._seq, "event": event, "key": "" if key is None else str(key), "data": data}
+            self._retained[(event, message["key"])] = message
+            if event == JOB:
+                self._trim_retained_jobs()
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.offer(message)
+        return message
+
+    def _trim_retained_jobs(self):
+        jobs = [slot for slot in self._retained if slot[0] == JOB]
+        excess = len(jobs) - EVENT_BUS_RETAINED_JOBS
+        if excess > 0:
+            for slot in sorted(jobs, key=lambda s: self._retained[s]["id"])[:excess]:
+                del self._retained[slot]
+
+    def retained(self, events: Optional[set] = None) -> list[dict]:
+        with self._lock:
+            messages = sorted(self._retained.values(), key=lambda m: m["id"])
+        return [m for m in messages if not events or m["event"] in events]
+
+    # ---- subscribing ---------------------------------------------------------
+
+    async def subscribe(self, events=None, *, match: Optional[Callable[[dict], bool]] = None,
+                        heartbeat: float = EVENT_BUS_HEARTBEAT_SECONDS) -> AsyncIterator[Optional[dict]]:
+        """Yield a "snapshot" message (the retained state this subscriber
+        wants), then each change as it is published. None is a heartbeat -
+        nothing happened for `heartbeat` seconds."""
+        await asyncio.to_thread(self.ensure_sources)
+        subscriber = Subscriber(asyncio.get_running_loop(), set(events or ()), match)
+        with self._lock:
+            # Registered under the same lock the snapshot is taken with, so
+            # nothing published in between is lost (at worst seen twice).
+            self._subscribers.add(subscriber)
+            snapshot = [m for m in sorted(self._retained.values(), key=lambda m: m["id"]) if subscriber.wants(m)]
+            self._idle_since = None
+        try:
+            yield {"id": snapshot[-1]["id"] if snapshot else 0, "event": SNAPSHOT, "key": "",
+                   "data": {"events": snapshot}}
+            while True:
+                batch = await subscriber.next_batch(heartbeat)
+                if not batch:
+                    yield None
+                for message in batch:
+                    yield message
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+                if not self._subscribers:
+                    self._idle_since = time.monotonic()
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    # ---- sources -------------------------------------------------------------
+
+    def ensure_sources(self):
+        """Make sure the retained state is current and the sources are
+        running. Blocking (reads jobs.db) - call off the event loop."""
+        with self._sources_lock:
+            if not self._sources:
+                self._job_seq = job_store.latest_change_seq()
+                for job in reversed(job_store.list_jobs(limit=EVENT_BUS_RETAINED_JOBS)):
+                    self.publish(JOB, job_summary(job), key=job["job_id"])
+                self._sources = [
+                    threading.Thread(target=self._watch_jobs, name=f"{self.name}-job-events", daemon=True),
+                    threading.Thread(target=self._watch_status, name=f"{self.name}-status-events", daemon=True),
+                ]
+                for thread in self._sources:
+                    thread.start()
+            elif not self._wanted.is_set():
+                self.drain_job_changes()   # catch up on what changed while paused
+            else:
+                return
+            self._publish_status(None)
+            with self._lock:
+                self._idle_since = None
+            self._wanted.set()
+
+    def _paused(self) -> bool:
+        """True once nobody has been subscribed for _SOURCE_IDLE_SECONDS;
+        the source then parks on _wanted instead of exiting, so
+        a returning client never races a thread that is shutting down."""
+        with self._lock:
+            if self._idle_since is not None and time.monotonic() - self._idle_since >= _SOURCE_IDLE_SECONDS:
+                self._wanted.clear()
+        return not self._wanted.is_set()
+
+    def drain_job_changes(self) -> int:
+        published = 0
+        with self._drain_lock:
+            while True:
+                rows = job_store.changes_since(self._job_seq, _CHANGE_BATCH)
+                for job in rows:
+                    self._job_seq = max(self._job_seq, int(job.get("change_seq") or 0))
+                    self.publish(JOB, job_summary(job), key=job["job_id"])
+                published += len(rows)
+                if len(rows) < _CHANGE_BATCH:
+                    return published
+
+    def _watch_jobs(self):
+        listener = job_wakeup.WakeupListener(f"{self.name}-events", directory=job_wakeup.watchers_dir())
+        try:
+            listener.open()
+        except OSError as e:
+            logger.warning(f"job watcher could not listen for wakeups ({e}); re-checking every "
+                           f"{EVENT_BUS_JOB_FALLBACK_SECONDS}s")
+        while True:
+            if self._paused():
+                self._wanted.wait()
+            listener.wait(EVENT_BUS_JOB_FALLBACK_SECONDS)
+            try:
+                self.drain_job_changes()
+            except Exception as e:
+                logger.warning(f"job change feed read failed: {e}")
+
+    def _publish_status(self, pushed: Optional[dict]):
+        if pushed is not None:
+            snapshot = dict(pushed, manager_alive=True)
+        else:
+            snapshot = self.read_status()
+        if self.decorate_status is not None:
+            snapshot = self.decorate_status(snapshot)
+        self.publish(STATUS, snapshot)
+
+    def _watch_status(self):
+        while True:
+            if self._paused():
+                self._wanted.wait()
+            try:
+                for event in manager_rpc.iter_events((STATUS,)):
+                    self._publish_status(event["data"] or {})
+                    if self._paused():
+                        break
+                continue                 # paused, or the Manager closed the stream - reconnect
+            except manager_rpc.RpcUnavailable:
+                pass
+            except Exception as e:
+                logger.warning(f"Manager status stream failed: {e}")
+            # Manager not reachable over RPC: follow the status file until it is.
+            retry_at = time.monotonic() + _RPC_RETRY_SECONDS
+            while not self._paused() and time.monotonic() < retry_at:
+                try:
+                    self._publish_status(None)
+                except Exception as e:
+                    logger.warning(f"Manager status read failed: {e}")
+                time.sleep(MANAGER_TICK_SECONDS)
@@ -20,6 +20,7 @@ from datetime import datetime, timezone
 from difflib import SequenceMatcher
 
 import job_store
+import result_index
 from worker_config import STATE_DIR, OUTPUT_DIR, PROJECT_ROOT
 import logging
 from services import ai_router
@@ -45,6 +46,22 @@ HERMES_PIPELINE_JOB_TYPES = {
 }
 HERMES_ACTIVE_STATUSES = {"CLAIMED", "PREPARING", "RENDERING", "UPLOADING"}
 HERMES_RESUMABLE_JOB_TYPES = {"web_research", "script_plan_generate", "script_generate"}
+# 신규 주제 파이프라인 DAG (job_store.create_pipeline). 단계 사이에 제목 생성·
+# Supabase 등록·제목 검증이 필요한 단계는 오토파일럿이 직접 제출하고,
+# script_generate는 기획 완료 즉시 job_store가 구조(structure)를 참조로 넘겨 자동 제출한다.
+HERMES_TOPIC_PIPELINE_STAGES = [
+    {"stage": "topic_benchmark_analyze", "job_type": "topic_benchmark_analyze"},
+    {"stage": "web_research", "job_type": "web_research", "depends_on": ["topic_benchmark_analyze"]},
+    {"stage": "script_plan_generate", "job_type": "script_plan_generate", "depends_on": ["web_research"]},
+    {
+        "stage": "script_generate",
+        "job_type": "script_generate",
+        "depends_on": ["script_plan_generate"],
+        "inputs": {"structure": "script_plan_generate.structure"},
+        "max_retries": 0,
+    },
+    {"stage": "publish_metadata_generate", "job_type": "publish_metadata_generate", "depends_on": ["script_generate"]},
+]
 TOPICS_QUEUE_OPTIONAL_MATERIAL_COLUMNS = {
     "benchmark_status",
     "title_status",
@@ -2608,6 +2625,9 @@ Return ONLY a JSON array of strings.
                 f"⚠️ {category} 벤치마크 채널 풀을 확보하지 못했습니다. "
                 "YouTube 검색 쿼터/키 상태를 확인해야 합니다."
             )
+        pipeline_id = job_store.create_pipeline(
+            HERMES_TOPIC_PIPELINE_STAGES, name=category, source="autopilot", priority=100
+        )
         benchmark_job_id = job_store.submit_job(
             job_type="topic_benchmark_analyze",
             payload={
@@ -2622,7 +2642,9 @@ Return ONLY a JSON array of strings.
                 "topic_queue_id": topic_queue_id
             },
             priority=100,
-            source="autopilot"
+            source="autopilot",
+            pipeline_id=pipeline_id,
+            stage="topic_benchmark_analyze",
         )
         self.add_log(f"-> topic_benchmark_analyze 작업 제출 완료 (Job ID: {benchmark_job_id})")
         
@@ -2705,6 +2727,8 @@ Return ONLY a JSON array of strings.
             },
             priority=100,
             source="autopilot",
+            pipeline_id=pipeline_id,
+            stage="web_research",
         )
         await self._wait_for_job(research_job_id)
         research_result = self._read_result_file(research_job_id) or {}
@@ -2835,9 +2859,35 @@ Return ONLY a JSON array of strings.
                 "quality_feedback": getattr(self, "_quality_feedback", []),
             },
             priority=100,
-            source="autopilot"
+            source="autopilot",
+            pipeline_id=pipeline_id,
+            stage="script_plan_generate",
         )
         self.add_log(f"-> script_plan_generate 작업 제출 완료 (Job ID: {plan_job_id})")
+        # 대본 집필은 기획 결과의 structure만 기다리므로, 기획이 끝나는 즉시
+        # job_store가 자동 제출하도록 나머지 payload를 미리 등록한다.
+        job_store.set_stage_payload(
+            pipeline_id,
+            "script_generate",
+            {
+                "topic_queue_id": topic_queue_id,
+                "category": category,
+                "category_name": category,
+                "category_id": category_id,
+                "topic": generated_title,
+                "target_duration_seconds": target_duration_seconds,
+                "script_style": category_script_style,
+                "image_style": assigned_image_style,
+                "image_style_selection": image_style_plan,
+                "language": "ko",
+                "narration_mode": "dramatic_single",
+                "upload_title": generated_title,
+                "title_generation": title_plan,
+                "learning_profile": learning_profile,
+                "defer_ready_until_quality_gate": True,
+                "quality_feedback": getattr(self, "_quality_feedback", []),
+            },
+        )
         
         await self._wait_for_job(plan_job_id)
         
@@ -2871,32 +2921,10 @@ Return ONLY a JSON array of strings.
         self.current_step = "나레이션 대본 집필"
         self.add_log(f"씬 구조를 바탕으로 나레이션 본문 생성 중...")
         
-        script_job_id = job_store.submit_job(
-            job_type="script_generate",
-            payload={
-                "topic_queue_id": topic_queue_id,
-                "category": category,
-                "category_name": category,
-                "category_id": category_id,
-                "topic": generated_title,
-                "structure": structure,
-                "target_duration_seconds": target_duration_seconds,
-                "script_style": category_script_style,
-                "image_style": assigned_image_style,
-                "image_style_selection": image_style_plan,
-                "language": "ko",
-                "narration_mode": "dramatic_single",
-                "upload_title": generated_title,
-                "title_generation": title_plan,
-                "learning_profile": learning_profile,
-                "defer_ready_until_quality_gate": True,
-                "quality_feedback": getattr(self, "_quality_feedback", []),
-            },
-            priority=100,
-            source="autopilot",
-            max_retries=0,
-        )
-        self.add_log(f"-> script_generate 작업 제출 완료 (Job ID: {script_job_id})")
+        script_job_id = job_store.get_pipeline(pipeline_id)["stages"]["script_generate"]["job_id"]
+        if not script_job_id:
+            raise RuntimeError("대본 기획 완료 후 script_generate 작업이 자동 제출되지 않았습니다.")
+        self.add_log(f"-> script_generate 작업 자동 제출됨 (Job ID: {script_job_id})")
         
         await self._wait_for_job(script_job_id)
         
@@ -2943,6 +2971,8 @@ Return ONLY a JSON array of strings.
             },
             priority=100,
             source="autopilot",
+            pipeline_id=pipeline_id,
+            stage="publish_metadata_generate",
         )
         self.add_log(f"-> publish_metadata_generate 작업 제출 완료 (Job ID: {metadata_job_id})")
         await self._wait_for_job(metadata_job_id)
@@ -3114,12 +3144,8 @@ Return ONLY a JSON array of strings.
         self.current_step = "로컬 저장 완료"
         self.add_log("종합 데이터를 로컬 결과 디렉토리에 백업 중...")
         
-        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-        local_result_path = RESULTS_DIR / f"{topic_queue_id}.json"
-        
-        local_result_path.write_text(
-            json.dumps(summary_payload, ensure_ascii=False, indent=2),
-            encoding="utf-8"
+        local_result_path = result_index.save(
+            result_index.PACKAGE, RESULTS_DIR / f"{topic_queue_id}.json", summary_payload
         )
         self.session_stats["generated_count"] += 1
         self._quality_feedback = []
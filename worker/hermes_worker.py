@@ -84,11 +84,24 @@ from dotenv import load_dotenv
 
 import central_client
 import job_store
+import job_wakeup
+import result_index
 from logging_setup import get_job_logger, get_logger
+from progress_coalescer import StateFileWriter
 from shutdown_flag import clear_shutdown_flag, is_shutdown_requested
-from worker_config import OUTPUT_DIR, PROJECT_ROOT, STATE_DIR, WORKER_ID, WORKER_INSTANCE_ID, ensure_project_root_on_path
+from worker_config import (
+    IDLE_REMOTE_POLL_SECONDS,
+    IDLE_WAKEUP_FALLBACK_SECONDS,
+    OUTPUT_DIR,
+    PROJECT_ROOT,
+    STATE_DIR,
+    WORKER_ID,
+    WORKER_INSTANCE_ID,
+    ensure_project_root_on_path,
+)
 
 STATE_FILE = STATE_DIR / "hermes_worker.json"
+_state_writer = StateFileWriter(name="hermes-state-flush")
 PAUSE_FLAG_FILE = STATE_DIR / "hermes_worker.pause"
 RESULTS_DIR = OUTPUT_DIR / "hermes_results"
 AUDIT_DIR = OUTPUT_DIR / "hermes_audit"
@@ -231,27 +244,22 @@ def _state_job_summary(current_job: dict | None) -> dict | None:
 
 def write_state(status: str, current_job: dict | None, progress: int, job_id: str | None = None,
                  last_success_at: float | None = None, last_error: str | None = None):
-    prev = {}
-    if STATE_FILE.exists():
-        try:
-            prev = json.loads(STATE_FILE.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            prev = {}
-    STATE_FILE.write_text(
-        json.dumps(
-            {
-                "pid": os.getpid(),
-                "status": status,
-                "current_job": _state_job_summary(current_job),
-                "current_job_id": job_id,
-                "progress": progress,
-                "heartbeat_at": time.time(),
-                "last_success_at": last_success_at if last_success_at is not None else prev.get("last_success_at"),
-                "last_error": last_error if last_error is not None else prev.get("last_error", ""),
-            },
-            ensure_ascii=False,
-        ),
-        encoding="utf-8",
+    # Coalesced + atomic (progress_coalescer.StateFileWriter): progress-only
+    # updates within a job are written at most once per interval.
+    prev = _state_writer.latest(STATE_FILE) or {}
+    _state_writer.write(
+        STATE_FILE,
+        {
+            "pid": os.getpid(),
+            "status": status,
+            "current_job": _state_job_summary(current_job),
+            "current_job_id": job_id,
+            "progress": progress,
+            "heartbeat_at": time.time(),
+            "last_success_at": last_success_at if last_success_at is not None else prev.get("last_success_at"),
+            "last_error": last_error if last_error is not None else prev.get("last_error", ""),
+        },
+        force=last_success_at is not None or last_error is not None,
     )
 
 
@@ -1491,7 +1499,7 @@ def _process_topic_research(job: dict, job_id: str, job_log) -> tuple[str, dict]
         "error": None,
         "_payload_data": job.get("payload", {}),
     }
-    result_path.write_text(json.dumps(result_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    result_index.save(result_index.HERMES, result_path, result_payload)
 
     job_store.transition(job_id, job_store.COMPLETED, reason="topic research complete", output_path=str(result_path))
     job_log.info(f"-> COMPLETED, result at {result_path}")
@@ -1785,7 +1793,7 @@ def _process_topic_benchmark_analyze(job: dict, job_id: str, job_log) -> tuple[s
         "completed_at": completed_at,
         "error": None,
     }
-    result_path.write_text(json.dumps(result_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    result_index.save(result_index.HERMES, result_path, result_payload)
 
     job_store.transition(job_id, job_store.COMPLETED, reason="benchmark analysis complete", output_path=str(result_path))
     job_log.info(f"-> COMPLETED, result at {result_path}; audit at {audit_path}")
@@ -1864,7 +1872,7 @@ Return JSON only:
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
     result_path = RESULTS_DIR / f"{job_id}.json"
     result_payload = {"job_id": job_id, "job_type": "web_research", "status": "COMPLETED", "research_bundle": bundle}
-    result_path.write_text(json.dumps(result_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    result_index.save(result_index.HERMES, result_path, result_payload)
     job_store.transition(job_id, job_store.UPLOADING, reason="saving web research result")
     job_store.transition(job_id, job_store.COMPLETED, reason="Gemini web research complete", output_path=str(result_path))
     job_log.info("WEB_RESEARCH complete: %d sources; queries=%r", len(bundle["sources"]), bundle["search_queries"])
@@ -5890,7 +5898,7 @@ Scene planning guard:
         "completed_at": completed_at,
         "error": None,
     }
-    result_path.write_text(json.dumps(result_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    result_index.save(result_index.HERMES, result_path, result_payload)
 
     job_store.transition(job_id, job_store.COMPLETED, reason="script plan complete", output_path=str(result_path))
     job_log.info(f"-> COMPLETED, result at {result_path}")
@@ -7926,7 +7934,7 @@ Hard retry rules:
         "completed_at": completed_at,
         "error": None,
     }
-    result_path.write_text(json.dumps(result_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    result_index.save(result_index.HERMES, result_path, result_payload)
 
     job_store.transition(job_id, job_store.COMPLETED, reason="script generation complete", output_path=str(result_path))
     job_log.info(f"-> COMPLETED, result at {result_path}")
@@ -8032,7 +8040,7 @@ def _process_publish_metadata_generate(job: dict, job_id: str, job_log) -> tuple
         "completed_at": completed_at,
         "error": None,
     }
-    result_path.write_text(json.dumps(result_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    result_index.save(result_index.HERMES, result_path, result_payload)
 
     job_store.transition(job_id, job_store.COMPLETED, reason="publish metadata complete", output_path=str(result_path))
     job_log.info(f"-> COMPLETED, result at {result_path}")
@@ -8285,6 +8293,28 @@ def _save_result_to_supabase(job_type: str, result_payload: dict, job_log) -> No
         job_log.warning(f"Supabase save failed (non-fatal): {e}")
 
 
+def _resolve_pipeline_inputs(job: dict, job_log) -> None:
+    """Pipeline stages get upstream results by reference
+    (job_store.create_pipeline inputs -> payload["pipeline_inputs"]); load
+    the referenced result files into the payload keys the stage handlers
+    already read. A value the submitter put in the payload itself wins."""
+    payload = job.get("payload") or {}
+    for key, ref in (payload.get("pipeline_inputs") or {}).items():
+        if payload.get(key) not in (None, "", [], {}):
+            continue
+        result_path = Path(ref.get("result_ref") or RESULTS_DIR / f"{ref.get('job_id')}.json")
+        try:
+            result = json.loads(result_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise RuntimeError(f"pipeline input {key!r} from stage {ref.get('stage')} is unreadable: {result_path} ({exc})")
+        field = ref.get("field")
+        if field and field not in result:
+            raise RuntimeError(f"pipeline input {key!r}: {result_path} has no {field!r}")
+        payload[key] = result[field] if field else result
+        job_log.info(f"Pipeline input {key} <- {ref.get('stage')} ({str(ref.get('job_id') or '')[:8]})")
+    job["payload"] = payload
+
+
 def process_one_job(job: dict) -> None:
     job_id = job["job_id"]
     job_type = job.get("job_type") or "topic_research"
@@ -8312,6 +8342,7 @@ def process_one_job(job: dict) -> None:
         if invalid_models:
             raise RuntimeError(f"Invalid generation model settings: {', '.join(invalid_models)}")
 
+        _resolve_pipeline_inputs(job, job_log)
         if job_type == "topic_benchmark_analyze":
             output_ref, result_payload = _process_topic_benchmark_analyze(job, job_id, job_log)
         elif job_type == "web_research":
@@ -8357,6 +8388,8 @@ def run_forever():
     # previous process's failure as if it were a current error.
     write_state("idle", None, 0, last_error="")
     next_remote_heartbeat_at = 0.0
+    idle_wait = IDLE_REMOTE_POLL_SECONDS if REMOTE_ENABLED else IDLE_WAKEUP_FALLBACK_SECONDS
+    wakeup = job_wakeup.WakeupListener("hermes_worker").open()
 
     try:
         if REMOTE_ENABLED:
@@ -8395,7 +8428,9 @@ def run_forever():
                     job = job_store.claim_next_job(SUPPORTED_JOB_TYPES, os.getpid())
                 if not job:
                     write_state("idle", None, 0)
-                    time.sleep(1.0)
+                    # Woken immediately by job_store submit/re-queue and
+                    # request_shutdown(); the timeout is only a fallback.
+                    wakeup.wait(idle_wait)
                     continue
                 process_one_job(job)
             except Exception as e:
@@ -8403,6 +8438,8 @@ def run_forever():
                 write_state("idle", None, 0, last_error=str(e))
                 time.sleep(1.0)
     finally:
+        wakeup.close()
+        job_store.flush_progress()
         write_state("stopped", None, 0)
         logger.info("Hermes Worker stopped")
 
@@ -14,6 +14,10 @@ This uses the same file-polling IPC pattern already established between the
 Manager and Render/Hermes Worker (heartbeat state files) rather than adding
 a second network protocol - the Manager's existing 1s supervisor tick just
 gains one more thing to check per loop.
+
+[RPC] Callers now go through send_command(), which uses manager_rpc's
+loopback socket channel first (immediate dispatch, no files) and only
+falls back to the file channel below when the Manager is not listening.
 """
 import json
 import time
@@ -49,6 +53,16 @@ def wait_for_result(command_id: str, timeout: float = COMMAND_RESULT_TIMEOUT_SEC
     return {"success": False, "error": f"Manager did not respond to command within {timeout}s (is it running?)"}
 
 
+def send_command(command: str, params: Optional[dict] = None, timeout: float = COMMAND_RESULT_TIMEOUT_SECONDS) -> dict:
+    """Run a Manager command and return its result dict."""
+    import manager_rpc
+
+    try:
+        return manager_rpc.call(command, params, timeout=timeout)
+    except manager_rpc.RpcUnavailable:
+        return wait_for_result(submit_command(command, params), timeout=timeout)
+
+
 def pending_commands() -> list[Path]:
     return sorted(COMMAND_DIR.glob("*.json"))
 
@@ -22,7 +22,21 @@ import uuid
 from pathlib import Path
 from typing import Optional
 
-from worker_config import JOB_DB_PATH
+import job_wakeup
+from progress_coalescer import Coalescer
+from render_capacity import estimate_job_cost
+from worker_config import (
+    JOB_DB_PATH,
+    JOB_SCHEDULER_POLICY,
+    SCHEDULER_AGING_SECONDS,
+    SCHEDULER_CANDIDATES_PER_FLOW,
+    SCHEDULER_FAIR_SHARE_PENALTY,
+    SCHEDULER_FAIR_SHARE_WINDOW_SECONDS,
+    SCHEDULER_MAX_AGING_BOOST,
+    SCHEDULER_SOURCE_WEIGHTS,
+    SCHEDULER_TYPE_CONCURRENCY,
+    SCHEDULER_TYPE_WEIGHTS,
+)
 
 # Status enum exactly as specified by the AIR-0227B instruction (Stage 6).
 QUEUED = "QUEUED"
@@ -62,12 +76,18 @@ _local = threading.local()
 
 def _conn() -> sqlite3.Connection:
     conn = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "path", None) != str(JOB_DB_PATH):
+        # Long-lived threads (the progress flusher) outlive a JOB_DB_PATH
+        # change in tests/tools - never keep writing to the old file.
+        conn.close()
+        conn = None
     if conn is None:
         conn = sqlite3.connect(str(JOB_DB_PATH), timeout=30)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA busy_timeout=30000")
         _local.conn = conn
+        _local.path = str(JOB_DB_PATH)
     return conn
 
 
@@ -98,7 +118,12 @@ def init_db():
             lease_expires_at REAL,
             attempt_number INTEGER NOT NULL DEFAULT 1,
             remote_job_id TEXT,
-            remote_ack_status TEXT
+            remote_ack_status TEXT,
+            cost REAL NOT NULL DEFAULT 1.0,
+            worker_slot TEXT,
+            pipeline_id TEXT,
+            pipeline_stage TEXT,
+            change_seq INTEGER NOT NULL DEFAULT 0
         )
         """
     )
@@ -114,6 +139,16 @@ def init_db():
         ("attempt_number", "ALTER TABLE jobs ADD COLUMN attempt_number INTEGER NOT NULL DEFAULT 1"),
         ("remote_job_id", "ALTER TABLE jobs ADD COLUMN remote_job_id TEXT"),
         ("remote_ack_status", "ALTER TABLE jobs ADD COLUMN remote_ack_status TEXT"),
+        # Multi-slot rendering: admission cost (render_capacity.estimate_job_cost)
+        # and which render slot process owns an active job, so one slot's
+        # crash only recovers that slot's job.
+        ("cost", "ALTER TABLE jobs ADD COLUMN cost REAL NOT NULL DEFAULT 1.0"),
+        ("worker_slot", "ALTER TABLE jobs ADD COLUMN worker_slot TEXT"),
+        # Multi-stage (Hermes) pipelines - see create_pipeline().
+        ("pipeline_id", "ALTER TABLE jobs ADD COLUMN pipeline_id TEXT"),
+        ("pipeline_stage", "ALTER TABLE jobs ADD COLUMN pipeline_stage TEXT"),
+        # Change feed for API-side watchers - see changes_since().
+        ("change_seq", "ALTER TABLE jobs ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0"),
     ]:
         if col not in existing_cols:
             conn.execute(ddl)
@@ -129,6 +164,92 @@ def init_db():
         )
         """
     )
+    # One row per multi-stage pipeline and one per stage (DAG node). A
+    # stage's `status` mirrors the status of its current job (WAITING until
+    # one exists); `depends_on` holds the DAG edges, `payload` an optional
+    # template enqueued automatically once every dependency is COMPLETED,
+    # and `result_ref` the completed job's output_path - downstream stages
+    # receive that reference, never a copy of the result.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pipelines (
+            pipeline_id TEXT PRIMARY KEY,
+            name TEXT,
+            source TEXT NOT NULL DEFAULT 'local_fixture',
+            priority INTEGER NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pipeline_stages (
+            pipeline_id TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            job_type TEXT NOT NULL,
+            depends_on TEXT NOT NULL DEFAULT '[]',
+            inputs TEXT NOT NULL DEFAULT '{}',
+            payload TEXT,
+            max_retries INTEGER NOT NULL DEFAULT 3,
+            job_id TEXT,
+            status TEXT NOT NULL,
+            result_ref TEXT,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (pipeline_id, stage)
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_pipeline ON jobs(pipeline_id)")
+    # Index of Hermes result files (result_index.py): one row per file, plus
+    # one row per topic aggregated on write, so the dashboard pages results
+    # with an index range scan instead of stat()ing and parsing every file.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS hermes_results (
+            kind TEXT NOT NULL,
+            result_id TEXT NOT NULL,
+            topic_key TEXT NOT NULL DEFAULT '',
+            topic_queue_id TEXT,
+            job_type TEXT,
+            status TEXT,
+            title TEXT,
+            category TEXT,
+            scene_count INTEGER NOT NULL DEFAULT 0,
+            script_chars INTEGER NOT NULL DEFAULT 0,
+            path TEXT NOT NULL,
+            created_at REAL,
+            updated_at REAL,
+            PRIMARY KEY (kind, result_id)
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_hermes_results_topic ON hermes_results(topic_key, updated_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_hermes_results_type ON hermes_results(job_type, updated_at)")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS hermes_result_topics (
+            topic_key TEXT PRIMARY KEY,
+            topic_queue_id TEXT,
+            title TEXT,
+            category TEXT,
+            updated_at REAL,
+            has_package INTEGER NOT NULL DEFAULT 0,
+            has_content INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_hermes_result_topics_updated ON hermes_result_topics(updated_at)")
+    conn.execute("CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)")
+    # claim_next_job()'s lookup - status/job_type equality then the exact
+    # ORDER BY, so the claim query is an index range scan instead of a full
+    # table scan + sort once jobs.db has accumulated history.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs(status, job_type, priority DESC, created_at)"
+    )
+    # FairSharePolicy's "recently served" lookup (_flow_usage).
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_started ON jobs(job_type, started_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_change_seq ON jobs(change_seq)")
     # Older workers recorded the last in-flight checkpoint (for example,
     # script revision at 84%) when a job became COMPLETED. A terminal success
     # must always be represented as 100%, both for the dashboard and API users.
@@ -136,54 +257,109 @@ def init_db():
     conn.commit()
 
 
+# Every write to a jobs row stamps it with the next change_seq. Writers are
+# serialized by SQLite, so the sequence is strictly increasing across
+# processes and changes_since() is one index range scan.
+_NEXT_CHANGE_SEQ = "(SELECT COALESCE(MAX(change_seq), 0) + 1 FROM jobs)"
+
+
 def _row_to_dict(row: sqlite3.Row) -> dict:
     d = dict(row)
     d["payload"] = json.loads(d["payload"]) if d["payload"] else {}
     return d
 
 
+def _insert_job(conn, job_id: str, job_type: str, payload: dict, priority: int, source: str, max_retries: int,
+                pipeline_id: Optional[str] = None, stage: Optional[str] = None, reason: str = "submitted"):
+    conn.execute(
+        f"""INSERT INTO jobs (job_id, job_type, source, priority, payload, status,
+                               created_at, retry_count, max_retries, cost, pipeline_id, pipeline_stage, change_seq)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?, {_NEXT_CHANGE_SEQ})""",
+        (job_id, job_type, source, priority, json.dumps(payload, ensure_ascii=False), QUEUED, time.time(),
+         max_retries, estimate_job_cost(job_type, payload), pipeline_id, stage),
+    )
+    _log_transition(conn, job_id, None, QUEUED, reason)
+
+
 def submit_job(job_type: str, payload: dict, priority: int = 0, source: str = "local_fixture",
-               max_retries: int = 3, job_id: Optional[str] = None) -> str:
+               max_retries: int = 3, job_id: Optional[str] = None, *,
+               pipeline_id: Optional[str] = None, stage: Optional[str] = None) -> str:
+    """Queue a job. With `pipeline_id`/`stage` the job becomes that
+    pipeline stage's current job (see create_pipeline) and its payload gets
+    the stage's upstream result references as `pipeline_inputs`."""
     job_id = job_id or str(uuid.uuid4())
-    now = time.time()
     conn = _conn()
-    conn.execute(
-        """INSERT INTO jobs (job_id, job_type, source, priority, payload, status,
-                              created_at, retry_count, max_retries)
-           VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?)""",
-        (job_id, job_type, source, priority, json.dumps(payload, ensure_ascii=False), QUEUED, now, max_retries),
-    )
-    _log_transition(conn, job_id, None, QUEUED, "submitted")
+    if pipeline_id:
+        payload = _attach_stage_job(conn, pipeline_id, stage, job_id, payload)
+    _insert_job(conn, job_id, job_type, payload, priority, source, max_retries, pipeline_id, stage if pipeline_id else None)
     conn.commit()
+    job_wakeup.notify("submitted")
+    job_wakeup.notify_watchers("submitted")
     return job_id
 
 
 def create_from_remote_claim(remote_job_id: str, job_type: str, payload: dict, priority: int,
-                              lease_id: str, worker_instance_id: str, lease_expires_at: float) -> str:
+                              lease_id: str, worker_instance_id: str, lease_expires_at: float,
+                              worker_slot: Optional[str] = None, prefetched: bool = False) -> str:
     """[AIR-0227C Stage 5] Mirrors a job just claimed from the central
     server into the local store as CLAIMED (skipping QUEUED entirely - it
     was already claimed server-side before render_worker.py ever saw it).
     From here on it flows through the exact same PREPARING/RENDERING/
     UPLOADING state machine as a local_fixture job; only the lease_id/
     worker_instance_id/remote_job_id columns and the central_client calls
-    render_worker.py makes alongside each local transition are different."""
+    render_worker.py makes alongside each local transition are different.
+
+    A `prefetched` job (claimed while the slot is still rendering its
+    current one) is mirrored with cost 0: it holds no render capacity
+    until admit_prefetched_job() charges it when the slot is free."""
     local_job_id = str(uuid.uuid4())
     now = time.time()
     conn = _conn()
     conn.execute(
-        """INSERT INTO jobs (job_id, job_type, source, priority, payload, status, worker_pid,
-                              created_at, started_at, retry_count, max_retries,
-                              lease_id, worker_instance_id, lease_expires_at, remote_job_id)
-           VALUES (?, ?, 'central_server', ?, ?, ?, NULL, ?, ?, 0, 0, ?, ?, ?, ?)""",
+        f"""INSERT INTO jobs (job_id, job_type, source, priority, payload, status, worker_pid,
+                               created_at, started_at, retry_count, max_retries,
+                               lease_id, worker_instance_id, lease_expires_at, remote_job_id,
+                               cost, worker_slot, change_seq)
+            VALUES (?, ?, 'central_server', ?, ?, ?, NULL, ?, ?, 0, 0, ?, ?, ?, ?, ?, ?, {_NEXT_CHANGE_SEQ})""",
         (local_job_id, job_type, priority, json.dumps(payload, ensure_ascii=False), CLAIMED,
-         now, now, lease_id, worker_instance_id, lease_expires_at, remote_job_id),
+         now, now, lease_id, worker_instance_id, lease_expires_at, remote_job_id,
+         0.0 if prefetched else estimate_job_cost(job_type, payload), worker_slot),
     )
     _log_transition(conn, local_job_id, None, QUEUED, "mirrored from central server claim")
-    _log_transition(conn, local_job_id, QUEUED, CLAIMED, f"claimed via central server, lease_id={lease_id}")
+    _log_transition(conn, local_job_id, QUEUED, CLAIMED, f"claimed via central server, lease_id={lease_id}" +
+                    (" (prefetched)" if prefetched else ""))
     conn.commit()
+    job_wakeup.notify_watchers("claimed")
     return local_job_id
 
 
+def admit_prefetched_job(job_id: str, job_types: list[str], capacity: Optional[float]) -> bool:
+    """Start-time admission for a job mirrored with prefetched=True: charges
+    its cost if it fits next to the jobs of these types in flight - the same
+    rule claim_next_job applies, inside the same kind of write transaction.
+    False if it does not fit yet, or is no longer CLAIMED (cancelled while
+    it waited)."""
+    conn = _conn()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT job_type, payload, status FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None or row["status"] != CLAIMED:
+            conn.execute("COMMIT")
+            return False
+        cost = estimate_job_cost(row["job_type"], json.loads(row["payload"]))
+        if capacity is not None:
+            in_flight = active_cost(job_types, conn)
+            if in_flight > 0 and in_flight + cost > capacity:
+                conn.execute("COMMIT")
+                return False
+        conn.execute("UPDATE jobs SET cost = ? WHERE job_id = ?", (cost, job_id))
+        conn.execute("COMMIT")
+        return True
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
 def update_lease(job_id: str, lease_expires_at: float):
     conn = _conn()
     conn.execute("UPDATE jobs SET lease_expires_at = ? WHERE job_id = ?", (lease_expires_at, job_id))
@@ -296,7 +472,16 @@ def transition(job_id: str, to_status: str, *, reason: str = "", worker_pid: Opt
     if to_status not in allowed:
         raise InvalidTransitionError(f"{job_id}: {current} -> {to_status} is not a valid transition (allowed: {sorted(allowed)})")
 
-    fields = ["status = ?"]
+    # Fold any coalesced progress into this transition's own commit, so a
+    # stage change always carries the latest progress and an older pending
+    # value can never be written after it.
+    pending = _progress.take(job_id, forget=to_status not in ACTIVE_STATUSES)
+    if pending is not None and progress is None:
+        progress = pending[0]
+        if progress_message is None:
+            progress_message = pending[1]
+
+    fields = ["status = ?", f"change_seq = {_NEXT_CHANGE_SEQ}"]
     params = [to_status]
 
     if to_status == CLAIMED:
@@ -339,48 +524,653 @@ def transition(job_id: str, to_status: str, *, reason: str = "", worker_pid: Opt
     params.append(job_id)
     conn.execute(f"UPDATE jobs SET {', '.join(fields)} WHERE job_id = ?", params)
     _log_transition(conn, job_id, current, to_status, reason)
+    if row["pipeline_id"]:
+        _sync_stage(conn, row["pipeline_id"], row["pipeline_stage"], job_id, to_status,
+                    (output_path or row["output_path"]) if to_status == COMPLETED else None)
+        if to_status == COMPLETED:
+            # Same transaction: a stage is never seen COMPLETED without
+            # its ready downstream stages already queued.
+            _advance_pipeline(row["pipeline_id"])
     conn.commit()
+    if to_status == QUEUED:
+        job_wakeup.notify("requeued")
+    elif current in ACTIVE_STATUSES and to_status not in ACTIVE_STATUSES:
+        # Render capacity was just released - an idle slot may now admit
+        # a job that did not fit a moment ago.
+        job_wakeup.notify("capacity released")
+    job_wakeup.notify_watchers(to_status)
     return get_job(job_id)
 
 
-def update_progress(job_id: str, progress: int, message: str = ""):
+# ---------------------------------------------------------------------------
+# Multi-stage pipelines (Hermes topic -> plan -> script -> metadata)
+# ---------------------------------------------------------------------------
+
+STAGE_WAITING = "WAITING"  # pipeline stage with no job yet
+
+
+def create_pipeline(stages: list[dict], *, name: str = "", source: str = "local_fixture", priority: int = 0,
+                    pipeline_id: Optional[str] = None) -> str:
+    """Record a pipeline DAG and enqueue its ready stages.
+
+    Each stage is a dict:
+      stage       unique name (defaults to job_type)
+      job_type    job type of the stage's jobs
+      depends_on  names of earlier stages that must be COMPLETED first
+      inputs      {payload_key: "stage" or "stage.field"} - upstream results
+                  handed to the job by reference (payload["pipeline_inputs"])
+      payload     optional template; when present the stage is enqueued
+                  automatically as soon as its dependencies complete.
+                  Without one the orchestrator submits the stage itself
+                  (submit_job(..., pipeline_id=, stage=)), e.g. because its
+                  payload needs work done between stages.
+      max_retries defaults to 3
+
+    Dependencies may only name earlier stages, so the graph is acyclic by
+    construction. Stages whose dependencies are satisfied together are
+    enqueued together and run in parallel where worker capacity allows."""
+    pipeline_id = pipeline_id or str(uuid.uuid4())
+    now = time.time()
+    conn = _conn()
+    seen: set = set()
+    rows = []
+    for position, spec in enumerate(stages):
+        stage = spec.get("stage") or spec["job_type"]
+        depends_on = list(spec.get("depends_on") or [])
+        inputs = dict(spec.get("inputs") or {})
+        if stage in seen:
+            raise ValueError(f"duplicate pipeline stage: {stage}")
+        unknown = [dep for dep in depends_on + [ref.split(".", 1)[0] for ref in inputs.values()] if dep not in seen]
+        if unknown:
+            raise ValueError(f"stage {stage} depends on unknown or later stage(s): {unknown}")
+        seen.add(stage)
+        payload = spec.get("payload")
+        rows.append((pipeline_id, stage, position, spec["job_type"], json.dumps(depends_on), json.dumps(inputs),
+                     json.dumps(payload, ensure_ascii=False) if payload is not None else None,
+                     int(spec.get("max_retries", 3)), STAGE_WAITING, now))
+    conn.execute(
+        "INSERT INTO pipelines (pipeline_id, name, source, priority, created_at) VALUES (?, ?, ?, ?, ?)",
+        (pipeline_id, name, source, priority, now),
+    )
+    conn.executemany(
+        """INSERT INTO pipeline_stages (pipeline_id, stage, position, job_type, depends_on, inputs, payload,
+                                        max_retries, status, updated_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        rows,
+    )
+    conn.commit()
+    _advance_pipeline(pipeline_id)
+    return pipeline_id
+
+
+def _stage_rows(conn, pipeline_id: str) -> list[dict]:
+    rows = conn.execute(
+        "SELECT * FROM pipeline_stages WHERE pipeline_id = ? ORDER BY position", (pipeline_id,)
+    ).fetchall()
+    stages = []
+    for row in rows:
+        stage = dict(row)
+        stage["depends_on"] = json.loads(stage["depends_on"] or "[]")
+        stage["inputs"] = json.loads(stage["inputs"] or "{}")
+        stage["payload"] = json.loads(stage["payload"]) if stage["payload"] else None
+        stages.append(stage)
+    return stages
+
+
+def _stage_inputs(stage: dict, by_name: dict) -> dict:
+    """payload["pipeline_inputs"]: {payload_key: {stage, job_id, result_ref,
+    field}} for the consuming worker to load - a reference to the upstream
+    result file, not its content."""
+    refs = {}
+    for key, ref in stage["inputs"].items():
+        source_stage, _, field = ref.partition(".")
+        upstream = by_name[source_stage]
+        refs[key] = {
+            "stage": source_stage,
+            "job_id": upstream["job_id"],
+            "result_ref": upstream["result_ref"],
+            "field": field or None,
+        }
+    return refs
+
+
+def _attach_stage_job(conn, pipeline_id: str, stage: Optional[str], job_id: str, payload: dict) -> dict:
+    by_name = {row["stage"]: row for row in _stage_rows(conn, pipeline_id)}
+    if stage not in by_name:
+        raise KeyError(f"Unknown stage {stage!r} in pipeline {pipeline_id}")
+    conn.execute(
+        "UPDATE pipeline_stages SET job_id = ?, status = ?, result_ref = NULL, updated_at = ? "
+        "WHERE pipeline_id = ? AND stage = ?",
+        (job_id, QUEUED, time.time(), pipeline_id, stage),
+    )
+    inputs = _stage_inputs(by_name[stage], by_name)
+    return {**payload, "pipeline_inputs": inputs} if inputs else payload
+
+
+def _sync_stage(conn, pipeline_id: str, stage: str, job_id: str, status: str, result_ref: Optional[str]):
+    # Keyed on job_id too: a superseded job of a resumed stage must not
+    # overwrite the status of the job that replaced it.
+    conn.execute(
+        "UPDATE pipeline_stages SET status = ?, result_ref = COALESCE(?, result_ref), updated_at = ? "
+        "WHERE pipeline_id = ? AND stage = ? AND job_id = ?",
+        (status, result_ref, time.time(), pipeline_id, stage, job_id),
+    )
+
+
+def _advance_pipeline(pipeline_id: str) -> list[str]:
+    """Enqueue every WAITING stage that has a payload template and whose
+    dependencies are all COMPLETED. The WAITING -> QUEUED flip is a
+    conditional UPDATE, so two processes completing sibling dependencies at
+    the same moment cannot enqueue the same stage twice."""
+    conn = _conn()
+    pipeline = conn.execute("SELECT * FROM pipelines WHERE pipeline_id = ?", (pipeline_id,)).fetchone()
+    if not pipeline:
+        return []
+    stages = _stage_rows(conn, pipeline_id)
+    by_name = {row["stage"]: row for row in stages}
+    enqueued = []
+    for stage in stages:
+        if stage["status"] != STAGE_WAITING or stage["payload"] is None:
+            continue
+        if any(by_name[dep]["status"] != COMPLETED for dep in stage["depends_on"]):
+            continue
+        job_id = str(uuid.uuid4())
+        claimed = conn.execute(
+            "UPDATE pipeline_stages SET job_id = ?, status = ?, updated_at = ? "
+            "WHERE pipeline_id = ? AND stage = ? AND status = ?",
+            (job_id, QUEUED, time.time(), pipeline_id, stage["stage"], STAGE_WAITING),
+        ).rowcount
+        if not claimed:
+            continue
+        inputs = _stage_inputs(stage, by_name)
+        payload = {**stage["payload"], "pipeline_inputs": inputs} if inputs else stage["payload"]
+        _insert_job(conn, job_id, stage["job_type"], payload, pipeline["priority"], pipeline["source"],
+                    stage["max_retries"], pipeline_id, stage["stage"],
+                    reason=f"pipeline {pipeline_id[:8]}: dependencies of {stage['stage']} completed")
+        enqueued.append(job_id)
+    conn.commit()
+    if enqueued:
+        job_wakeup.notify("submitted")
+        job_wakeup.notify_watchers("submitted")
+    return enqueued
+
+
+def set_stage_payload(pipeline_id: str, stage: str, payload: dict) -> list[str]:
+    """Give a still-WAITING stage its payload template, so it is enqueued
+    as soon as its dependencies complete (immediately if they already
+    have). Returns the job ids enqueued by this call."""
+    conn = _conn()
+    conn.execute(
+        "UPDATE pipeline_stages SET payload = ?, updated_at = ? WHERE pipeline_id = ? AND stage = ? AND status = ?",
+        (json.dumps(payload, ensure_ascii=False), time.time(), pipeline_id, stage, STAGE_WAITING),
+    )
+    conn.commit()
+    return _advance_pipeline(pipeline_id)
+
+
+def _pipeline_status(stages: list[dict]) -> str:
+    statuses = {stage["status"] for stage in stages}
+    if statuses == {COMPLETED}:
+        return COMPLETED
+    if statuses & (ACTIVE_STATUSES | {QUEUED, ABANDONED}):
+        return "RUNNING"
+    if statuses & {FAILED, CANCELED}:
+        return FAILED
+    return STAGE_WAITING
+
+
+def get_pipeline(pipeline_id: str) -> Optional[dict]:
+    conn = _conn()
+    row = conn.execute("SELECT * FROM pipelines WHERE pipeline_id = ?", (pipeline_id,)).fetchone()
+    if not row:
+        return None
+    stages = _stage_rows(conn, pipeline_id)
+    return {**dict(row), "status": _pipeline_status(stages), "stages": {stage["stage"]: stage for stage in stages}}
+
+
+def pipeline_for_job(job_id: str) -> Optional[dict]:
+    row = _conn().execute("SELECT pipeline_id FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+    if not row or not row["pipeline_id"]:
+        return None
+    return get_pipeline(row["pipeline_id"])
+
+
+def pipeline_jobs(pipeline_id: str) -> list[dict]:
+    """Every job ever run for the pipeline (including superseded attempts),
+    oldest first - an indexed lookup instead of scanning recent jobs."""
+    rows = _conn().execute(
+        "SELECT * FROM jobs WHERE pipeline_id = ? ORDER BY created_at ASC", (pipeline_id,)
+    ).fetchall()
+    return [_row_to_dict(r) for r in rows]
+
+
+def resume_pipeline(pipeline_id: str) -> list[dict]:
+    """Restart a pipeline from its failed stage(s): each FAILED/CANCELED
+    stage none of whose dependents has started yet gets a new job with the
+    failed job's payload (upstream references re-resolved). Completed
+    stages are kept. Downstream stages with a template follow automatically;
+    the caller handles stages it normally submits itself.
+    Returns [{stage, job_type, job_id}] for the jobs submitted."""
+    pipeline = get_pipeline(pipeline_id)
+    if not pipeline:
+        raise KeyError(f"Unknown pipeline_id: {pipeline_id}")
+    stages = pipeline["stages"]
+    resumed = []
+    for name, stage in stages.items():
+        if stage["status"] not in (FAILED, CANCELED) or not stage["job_id"]:
+            continue
+        if any(name in other["depends_on"] and other["status"] != STAGE_WAITING for other in stages.values()):
+            continue  # the pipeline already moved on past this stage
+        failed_job = get_job(stage["job_id"])
+        payload = {key: value for key, value in (failed_job or {}).get("payload", {}).items() if key != "pipeline_inputs"}
+        payload["resume_from_job_id"] = stage["job_id"]
+        job_id = submit_job(stage["job_type"], payload, priority=pipeline["priority"], source=pipeline["source"],
+                            max_retries=stage["max_retries"], pipeline_id=pipeline_id, stage=name)
+        resumed.append({"stage": name, "job_type": stage["job_type"], "job_id": job_id})
+    return resumed
+
+
+# ---------------------------------------------------------------------------
+# Hermes result index (rows built by result_index.describe)
+# ---------------------------------------------------------------------------
+
+_RESULT_COLUMNS = ("kind", "result_id", "topic_key", "topic_queue_id", "job_type", "status", "title", "category",
+                   "scene_count", "script_chars", "path", "created_at", "updated_at")
+
+
+def record_results(rows: list[dict]):
+    """Upsert result rows and fold each into its topic row, in one commit.
+    A row may carry `listed` (counts as displayable content for its topic)
+    and `package` (a final topic package rather than a per-job result)."""
+    if not rows:
+        return
+    conn = _conn()
+    placeholders = ", ".join("?" for _ in _RESULT_COLUMNS)
+    updates = ", ".join(f"{col} = excluded.{col}" for col in _RESULT_COLUMNS[2:])
+    conn.executemany(
+        f"INSERT INTO hermes_results ({', '.join(_RESULT_COLUMNS)}) VALUES ({placeholders}) "
+        f"ON CONFLICT(kind, result_id) DO UPDATE SET {updates}",
+        [tuple(row.get(col) for col in _RESULT_COLUMNS) for row in rows],
+    )
+    conn.executemany(
+        """INSERT INTO hermes_result_topics (topic_key, topic_queue_id, title, category, updated_at,
+                                             has_package, has_content)
+           VALUES (?, ?, ?, ?, ?, ?, ?)
+           ON CONFLICT(topic_key) DO UPDATE SET
+               topic_queue_id = COALESCE(excluded.topic_queue_id, topic_queue_id),
+               title = COALESCE(NULLIF(excluded.title, ''), title),
+               category = COALESCE(NULLIF(excluded.category, ''), category),
+               updated_at = MAX(COALESCE(updated_at, 0), COALESCE(excluded.updated_at, 0)),
+               has_package = MAX(has_package, excluded.has_package),
+               has_content = MAX(has_content, excluded.has_content)""",
+        [
+            (row["topic_key"], row.get("topic_queue_id"), row.get("title") or "", row.get("category") or "",
+             row.get("updated_at"), int(bool(row.get("package"))), int(bool(row.get("listed"))))
+            for row in rows if row.get("topic_key")
+        ],
+    )
+    conn.commit()
+
+
+def list_result_topics(*, category: Optional[str] = None, limit: int = 100, offset: int = 0) -> tuple[list[dict], int]:
+    """One page of displayable result topics, newest first, and the total."""
+    where = "(has_package = 1 OR has_content = 1)"
+    params: list = []
+    if category:
+        where += " AND category = ?"
+        params.append(category)
+    conn = _conn()
+    rows = conn.execute(
+        f"SELECT * FROM hermes_result_topics WHERE {where} ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+        (*params, limit, offset),
+    ).fetchall()
+    total = conn.execute(f"SELECT COUNT(*) FROM hermes_result_topics WHERE {where}", params).fetchone()[0]
+    return [dict(r) for r in rows], total
+
+
+def list_result_entries(package_kind: str, *, category: Optional[str] = None, limit: int = 100,
+                         offset: int = 0) -> tuple[list[dict], int]:
+    """One page of generated-results entries, newest first, and the total -
+    the unit the dashboard lists: every `package_kind` result on its own,
+    plus one entry per topic with displayable content but no package."""
+    package_where, topic_where = "kind = ?", "has_package = 0 AND has_content = 1"
+    package_params: list = [package_kind]
+    topic_params: list = []
+    if category:
+        package_where += " AND category = ?"
+        topic_where += " AND category = ?"
+        package_params.append(category)
+        topic_params.append(category)
+    union = (
+        f"SELECT 'package' AS entry, result_id, path, topic_key, updated_at FROM hermes_results WHERE {package_where} "
+        f"UNION ALL SELECT 'topic' AS entry, NULL, NULL, topic_key, updated_at FROM hermes_result_topics WHERE {topic_where}"
+    )
+    conn = _conn()
+    rows = conn.execute(
+        f"{union} ORDER BY updated_at DESC LIMIT ? OFFSET ?", (*package_params, *topic_params, limit, offset)
+    ).fetchall()
+    total = conn.execute(f"SELECT COUNT(*) FROM ({union})", (*package_params, *topic_params)).fetchone()[0]
+    return [dict(r) for r in rows], total
+
+
+def listed_result_topic_keys(topic_keys) -> set[str]:
+    """The subset of `topic_keys` the index already lists (a package or displayable content)."""
+    keys = list(topic_keys)
+    if not keys:
+        return set()
+    rows = _conn().execute(
+        f"SELECT topic_key FROM hermes_result_topics WHERE (has_package = 1 OR has_content = 1) "
+        f"AND topic_key IN ({','.join('?' for _ in keys)})",
+        keys,
+    ).fetchall()
+    return {r["topic_key"] for r in rows}
+
+
+def list_results(*, topic_key: Optional[str] = None, kind: Optional[str] = None,
+                 job_types: Optional[list[str]] = None, limit: int = 500) -> list[dict]:
+    """Result rows, newest first."""
+    clauses, params = [], []
+    if topic_key is not None:
+        clauses.append("topic_key = ?")
+        params.append(topic_key)
+    if kind:
+        clauses.append("kind = ?")
+        params.append(kind)
+    if job_types:
+        clauses.append(f"job_type IN ({','.join('?' for _ in job_types)})")
+        params.extend(job_types)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = _conn().execute(
+        f"SELECT * FROM hermes_results {where} ORDER BY updated_at DESC LIMIT ?", (*params, limit)
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def result_stats(kind: str) -> dict:
+    row = _conn().execute(
+        "SELECT COUNT(*) AS count, MAX(updated_at) AS latest_at FROM hermes_results WHERE kind = ?", (kind,)
+    ).fetchone()
+    return {"count": row["count"], "latest_at": row["latest_at"]}
+
+
+def get_meta(key: str) -> Optional[str]:
+    row = _conn().execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+    return row["value"] if row else None
+
+
+def set_meta(key: str, value: str):
     conn = _conn()
     conn.execute(
-        "UPDATE jobs SET progress = ?, progress_message = ? WHERE job_id = ?",
+        "INSERT INTO store_meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, value),
+    )
+    conn.commit()
+
+
+def _write_progress(job_id: str, value: tuple):
+    progress, message = value
+    conn = _conn()
+    conn.execute(
+        f"UPDATE jobs SET progress = ?, progress_message = ?, change_seq = {_NEXT_CHANGE_SEQ} WHERE job_id = ?",
         (progress, message, job_id),
     )
     conn.commit()
+    job_wakeup.notify_watchers("progress")
+
+
+_progress = Coalescer(_write_progress, name="job-progress-flush")
+
+
+def update_progress(job_id: str, progress: int, message: str = ""):
+    """Coalesced: at most one jobs.db commit per job per
+    PROGRESS_FLUSH_INTERVAL_SECONDS (progress_coalescer.py). The latest
+    value is always written - by a trailing flush, or folded into the
+    job's next transition()."""
+    _progress.submit(job_id, (progress, message))
+
+
+def flush_progress(job_id: Optional[str] = None):
+    """Write coalesced progress now (one job, or all)."""
+    _progress.drain(job_id)
+
+
+def active_cost(job_types: list[str], conn: Optional[sqlite3.Connection] = None) -> float:
+    """Summed admission cost of the jobs of these types currently in flight."""
+    conn = conn or _conn()
+    types_ph = ",".join("?" for _ in job_types)
+    active_ph = ",".join("?" for _ in ACTIVE_STATUSES)
+    row = conn.execute(
+        f"SELECT COALESCE(SUM(cost), 0) FROM jobs WHERE status IN ({active_ph}) AND job_type IN ({types_ph})",
+        (*ACTIVE_STATUSES, *job_types),
+    ).fetchone()
+    return float(row[0] or 0)
+
+
+# ---- claim scheduling policy ------------------------------------------------
+#
+# Strict `priority DESC, created_at ASC` let one source (a large autopilot
+# batch) starve dashboard/local_api/fixture jobs indefinitely. The policy
+# decides which QUEUED candidate claim_next_job() takes; it runs inside the
+# claim's BEGIN IMMEDIATE transaction, so its decision is atomic with the
+# claim even with several workers/slots claiming concurrently.
 
 
-def claim_next_job(job_types: list[str], worker_pid: int) -> Optional[dict]:
-    """Atomically claim the highest-priority QUEUED job of an allowed type,
-    oldest-first within the same priority (docs/AIR_WORKER_RESOURCE_POLICY.md
-    §1, matching remote_render_queue's existing FIFO convention)."""
+class SchedulingPolicy:
+    """Base policy. `candidates` are QUEUED job dicts (the top few per
+    (source, job_type) flow by priority and by age); `usage` maps
+    (source, job_type) -> {"started": jobs started within the fair-share
+    window, "active": jobs currently in ACTIVE_STATUSES}."""
+
+    name = "base"
+
+    def __init__(self, *, type_concurrency: Optional[dict] = None,
+                 candidates_per_flow: int = SCHEDULER_CANDIDATES_PER_FLOW,
+                 window_seconds: float = SCHEDULER_FAIR_SHARE_WINDOW_SECONDS):
+        self.type_concurrency = {k: int(v) for k, v in (type_concurrency or {}).items()}
+        self.candidates_per_flow = max(1, int(candidates_per_flow))
+        self.window_seconds = float(window_seconds)
+
+    def eligible(self, candidates: list[dict], usage: dict) -> list[dict]:
+        """Drop candidates whose job_type is at its concurrency cap. A capped
+        type does not block other types - the claimer takes the next best."""
+        if not self.type_concurrency:
+            return candidates
+        active_by_type: dict = {}
+        for (_, job_type), counts in usage.items():
+            active_by_type[job_type] = active_by_type.get(job_type, 0) + counts["active"]
+        return [
+            job for job in candidates
+            if job["job_type"] not in self.type_concurrency
+            or active_by_type.get(job["job_type"], 0) < self.type_concurrency[job["job_type"]]
+        ]
+
+    def score(self, job: dict, usage: dict, now: float) -> float:
+        raise NotImplementedError
+
+    def choose(self, candidates: list[dict], usage: dict, now: float) -> Optional[dict]:
+        eligible = self.eligible(candidates, usage)
+        if not eligible:
+            return None
+        # Highest score wins; ties go to the oldest job (FIFO).
+        return max(eligible, key=lambda job: (self.score(job, usage, now), -job["created_at"]))
+
+
+class FifoPolicy(SchedulingPolicy):
+    """The original order: priority DESC, created_at ASC."""
+
+    name = "fifo"
+
+    def score(self, job: dict, usage: dict, now: float) -> float:
+        return float(job["priority"])
+
+
+class FairSharePolicy(SchedulingPolicy):
+    """Effective priority = priority + aging - fair-share penalty.
+
+    - aging: +1 per `aging_seconds` waited, capped at `max_aging_boost`, so
+      a long-waiting low-priority job eventually overtakes fresh ones;
+    - fair share: every job a source (and a job_type) started within the
+      window costs `fair_share_penalty` points divided by that source's
+      (type's) weight. A flow that has just been served a lot yields to
+      flows that have not; with equal usage the order is plain priority/FIFO.
+    Unknown sources/types weigh 1.0."""
+
+    name = "fair"
+
+    def __init__(self, *, source_weights: Optional[dict] = None, type_weights: Optional[dict] = None,
+                 aging_seconds: float = SCHEDULER_AGING_SECONDS, max_aging_boost: float = SCHEDULER_MAX_AGING_BOOST,
+                 fair_share_penalty: float = SCHEDULER_FAIR_SHARE_PENALTY, **kwargs):
+        super().__init__(**kwargs)
+        self.source_weights = dict(SCHEDULER_SOURCE_WEIGHTS if source_weights is None else source_weights)
+        self.type_weights = dict(SCHEDULER_TYPE_WEIGHTS if type_weights is None else type_weights)
+        self.aging_seconds = float(aging_seconds)
+        self.max_aging_boost = float(max_aging_boost)
+        self.fair_share_penalty = float(fair_share_penalty)
+
+    @staticmethod
+    def _weight(weights: dict, key: str) -> float:
+        try:
+            return max(float(weights.get(key, 1.0)), 0.01)
+        except (TypeError, ValueError):
+            return 1.0
+
+    def score(self, job: dict, usage: dict, now: float) -> float:
+        aging = 0.0
+        if self.aging_seconds > 0:
+            aging = min(self.max_aging_boost, max(0.0, now - job["created_at"]) / self.aging_seconds)
+        source, job_type = job["source"], job["job_type"]
+        served_source = sum(c["started"] for (s, _), c in usage.items() if s == source)
+        served_type = sum(c["started"] for (_, t), c in usage.items() if t == job_type)
+        share = (served_source / self._weight(self.source_weights, source)
+                 + served_type / self._weight(self.type_weights, job_type))
+        return job["priority"] + aging - self.fair_share_penalty * share
+
+
+def build_scheduling_policy(name: str) -> SchedulingPolicy:
+    if (name or "").strip().lower() == "fifo":
+        return FifoPolicy(type_concurrency=SCHEDULER_TYPE_CONCURRENCY, candidates_per_flow=1)
+    return FairSharePolicy(type_concurrency=SCHEDULER_TYPE_CONCURRENCY)
+
+
+_policy: SchedulingPolicy = build_scheduling_policy(JOB_SCHEDULER_POLICY)
+
+
+def get_scheduling_policy() -> SchedulingPolicy:
+    return _policy
+
+
+def set_scheduling_policy(policy: SchedulingPolicy) -> SchedulingPolicy:
+    """Swap the process-wide policy (tests, benchmarks). Returns the old one."""
+    global _policy
+    previous, _policy = _policy, policy
+    return previous
+
+
+def _scheduling_candidates(conn: sqlite3.Connection, job_types: list[str], per_flow: int) -> list[dict]:
+    """Top `per_flow` jobs of every (source, job_type) flow by priority,
+    plus its `per_flow` oldest - the only rows any policy could pick, no
+    matter how deep a single flow's backlog is."""
+    placeholders = ",".join("?" for _ in job_types)
+    rows = conn.execute(
+        f"""SELECT * FROM (
+                SELECT *,
+                       ROW_NUMBER() OVER (PARTITION BY source, job_type ORDER BY priority DESC, created_at ASC) AS rank_priority,
+                       ROW_NUMBER() OVER (PARTITION BY source, job_type ORDER BY created_at ASC) AS rank_age
+                FROM jobs WHERE status = ? AND job_type IN ({placeholders})
+            ) WHERE rank_priority <= ? OR rank_age <= ?""",
+        (QUEUED, *job_types, per_flow, per_flow),
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def _flow_usage(conn: sqlite3.Connection, job_types: list[str], since: float) -> dict:
+    types_ph = ",".join("?" for _ in job_types)
+    active_ph = ",".join("?" for _ in ACTIVE_STATUSES)
+    rows = conn.execute(
+        f"""SELECT source, job_type,
+                   SUM(CASE WHEN started_at >= ? THEN 1 ELSE 0 END) AS started,
+                   SUM(CASE WHEN status IN ({active_ph}) THEN 1 ELSE 0 END) AS active
+            FROM jobs
+            WHERE job_type IN ({types_ph}) AND (started_at >= ? OR status IN ({active_ph}))
+            GROUP BY source, job_type""",
+        (since, *ACTIVE_STATUSES, *job_types, since, *ACTIVE_STATUSES),
+    ).fetchall()
+    return {(r["source"], r["job_type"]): {"started": r["started"] or 0, "active": r["active"] or 0} for r in rows}
+
+
+def claim_next_job(job_types: list[str], worker_pid: int, *, capacity: Optional[float] = None,
+                   worker_slot: Optional[str] = None, policy: Optional[SchedulingPolicy] = None) -> Optional[dict]:
+    """Atomically claim the QUEUED job of an allowed type that the
+    scheduling policy ranks first (FairSharePolicy by default,
+    AIRWORKER_JOB_SCHEDULER=fifo for the original highest-priority,
+    oldest-first order of docs/AIR_WORKER_RESOURCE_POLICY.md §1).
+
+    An idle queue is answered by a plain indexed read - the BEGIN IMMEDIATE
+    write lock is only taken once there is something to claim, so idle
+    workers never hold jobs.db's write lock (or grow its WAL) while waiting.
+
+    The policy runs inside the claim transaction (see SchedulingPolicy),
+    including its per-type concurrency caps.
+
+    With `capacity` (render slots, render_capacity.read_capacity()), the
+    chosen job is only admitted if it fits next to the jobs of these types
+    already in flight - checked inside the same write transaction, so
+    parallel slots cannot over-commit. An oversized job is still admitted
+    when nothing else is running, and a job that does not fit blocks the
+    ones behind it (no bypass), so large renders are never starved by a
+    stream of small ones."""
     conn = _conn()
+    placeholders = ",".join("?" for _ in job_types)
+    if conn.execute(
+        f"SELECT 1 FROM jobs WHERE status = ? AND job_type IN ({placeholders}) LIMIT 1",
+        (QUEUED, *job_types),
+    ).fetchone() is None:
+        return None
+    policy = policy or _policy
     conn.execute("BEGIN IMMEDIATE")
     try:
-        placeholders = ",".join("?" for _ in job_types)
-        row = conn.execute(
-            f"""SELECT * FROM jobs WHERE status = ? AND job_type IN ({placeholders})
-                ORDER BY priority DESC, created_at ASC LIMIT 1""",
-            (QUEUED, *job_types),
-        ).fetchone()
+        now = time.time()
+        candidates = _scheduling_candidates(conn, job_types, policy.candidates_per_flow)
+        usage = _flow_usage(conn, job_types, now - policy.window_seconds) if candidates else {}
+        row = policy.choose(candidates, usage, now)
         if not row:
             conn.execute("COMMIT")
             return None
+        if capacity is not None:
+            in_flight = active_cost(job_types, conn)
+            if in_flight > 0 and in_flight + float(row["cost"] or 0) > capacity:
+                conn.execute("COMMIT")
+                return None
         job_id = row["job_id"]
         conn.execute(
-            "UPDATE jobs SET status = ?, worker_pid = ?, started_at = ? WHERE job_id = ?",
-            (CLAIMED, worker_pid, time.time(), job_id),
+            f"UPDATE jobs SET status = ?, worker_pid = ?, started_at = ?, worker_slot = ?, "
+            f"change_seq = {_NEXT_CHANGE_SEQ} WHERE job_id = ?",
+            (CLAIMED, worker_pid, now, worker_slot, job_id),
         )
         _log_transition(conn, job_id, QUEUED, CLAIMED, f"claimed by pid={worker_pid}")
         conn.commit()
+        job_wakeup.notify_watchers(CLAIMED)
         return get_job(job_id)
     except Exception:
         conn.execute("ROLLBACK")
         raise
 
 
+def latest_change_seq() -> int:
+    row = _conn().execute("SELECT MAX(change_seq) FROM jobs").fetchone()
+    return int(row[0] or 0)
+
+
+def changes_since(change_seq: int, limit: int = 200) -> list[dict]:
+    """Jobs written after `change_seq`, oldest change first. Each row is the
+    job's current state (with its own change_seq), so a caller that falls
+    behind sees every changed job once, at its latest value."""
+    rows = _conn().execute(
+        "SELECT * FROM jobs WHERE change_seq > ? ORDER BY change_seq LIMIT ?", (change_seq, limit)
+    ).fetchall()
+    return [_row_to_dict(r) for r in rows]
+
+
 def transition_history(job_id: str) -> list[dict]:
     rows = _conn().execute(
         "SELECT from_status, to_status, at, reason FROM job_transitions WHERE job_id = ? ORDER BY id ASC",
@@ -408,6 +1198,21 @@ def find_stale_active_jobs(alive_pid: Optional[int]) -> list[dict]:
     return [_row_to_dict(r) for r in rows]
 
 
+def find_active_jobs_for_slot(worker_slot: str, job_types: list[str], *, include_unassigned: bool = False) -> list[dict]:
+    """Active jobs owned by one render slot process. `include_unassigned`
+    also returns active jobs of these types with no recorded slot (claimed
+    before multi-slot rendering existed) - the primary slot owns those."""
+    conn = _conn()
+    active_ph = ",".join("?" for _ in ACTIVE_STATUSES)
+    types_ph = ",".join("?" for _ in job_types)
+    owner_sql = "(worker_slot = ? OR worker_slot IS NULL)" if include_unassigned else "worker_slot = ?"
+    rows = conn.execute(
+        f"SELECT * FROM jobs WHERE status IN ({active_ph}) AND job_type IN ({types_ph}) AND {owner_sql}",
+        (*ACTIVE_STATUSES, *job_types, worker_slot),
+    ).fetchall()
+    return [_row_to_dict(r) for r in rows]
+
+
 def mark_abandoned_and_recover(job: dict) -> dict:
     """[AIR-0227B Stage 7] ABANDONED -> retry (QUEUED, retry_count+=1) if
     under max_retries, else quarantine as FAILED with a distinct error_code
@@ -421,7 +1226,7 @@ def mark_abandoned_and_recover(job: dict) -> dict:
     if current not in ACTIVE_STATUSES:
         return get_job(job_id)  # already resolved by the time we got here
 
-    conn.execute("UPDATE jobs SET status = ? WHERE job_id = ?", (ABANDONED, job_id))
+    conn.execute(f"UPDATE jobs SET status = ?, change_seq = {_NEXT_CHANGE_SEQ} WHERE job_id = ?", (ABANDONED, job_id))
     _log_transition(conn, job_id, current, ABANDONED, "owning process not alive (crash/force-kill detected)")
     conn.commit()
 
@@ -0,0 +1,131 @@
+"""
+Event-driven wakeup channel for job claiming.
+
+Render/Hermes Workers used to poll job_store.claim_next_job() once per
+second while idle - a BEGIN IMMEDIATE write transaction on jobs.db every
+tick, and up to a second of claim latency after a job was submitted.
+
+Each idle worker now binds a UDP socket on 127.0.0.1 (ephemeral port) and
+advertises it as STATE_DIR/wakeup/<name>-<pid>.port. job_store.submit_job()
+and any transition back to QUEUED call notify(), which sends one tiny
+datagram to every advertised port; the worker's wait() returns immediately
+and claims. Loopback UDP was chosen over named pipes / Unix sockets because
+it behaves the same on Windows (the production target) and POSIX, needs no
+extra dependency, and a datagram to a dead listener is silently dropped -
+notify() never blocks the submitter.
+
+Wakeups are a latency optimisation only: workers still wake on a fallback
+timeout (well under HEARTBEAT_STALE_SECONDS) and re-check the queue, so a
+lost datagram or a stale .port file can never strand a job.
+
+The same mechanism tells API processes that a job row changed: their
+event_bus.py listeners advertise themselves under WAKEUP_DIR/watchers, so
+notify_watchers() never wakes a worker into a pointless claim attempt and
+notify() never pays for watchers.
+"""
+import os
+import select
+import socket
+from pathlib import Path
+from typing import Optional
+
+from worker_config import STATE_DIR
+
+WAKEUP_DIR = STATE_DIR / "wakeup"
+_LOOPBACK = "127.0.0.1"
+_MESSAGE = b"wake"
+
+
+def watchers_dir() -> Path:
+    return WAKEUP_DIR / "watchers"
+
+
+def _port_files(directory: Path) -> list[Path]:
+    try:
+        return sorted(directory.glob("*.port"))
+    except OSError:
+        return []
+
+
+def notify(reason: str = "", *, directory: Optional[Path] = None) -> int:
+    """Wake every listening worker. Returns how many listeners were signalled.
+    Best-effort by design - never raises into the caller's job_store write."""
+    sent = 0
+    sock = None
+    try:
+        for path in _port_files(directory or WAKEUP_DIR):
+            try:
+                port = int(path.read_text(encoding="utf-8").strip())
+            except (OSError, ValueError):
+                continue
+            if sock is None:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.sendto(_MESSAGE, (_LOOPBACK, port))
+                sent += 1
+            except OSError:
+                pass
+    finally:
+        if sock is not None:
+            sock.close()
+    return sent
+
+
+def notify_watchers(reason: str = "") -> int:
+    """Tell API processes (event_bus.py) that a jobs row changed."""
+    return notify(reason, directory=watchers_dir())
+
+
+class WakeupListener:
+    """One per worker process. Use as a context manager around run_forever()'s loop."""
+
+    def __init__(self, name: str, *, directory: Optional[Path] = None):
+        self.name = name
+        self._sock: Optional[socket.socket] = None
+        self._dir = directory or WAKEUP_DIR
+        self._path = self._dir / f"{name}-{os.getpid()}.port"
+
+    def open(self) -> "WakeupListener":
+        self._dir.mkdir(parents=True, exist_ok=True)
+        # Only one instance of each named worker runs under the Manager, so
+        # any leftover file for this name belongs to a previous (dead) instance.
+        for stale in self._dir.glob(f"{self.name}-*.port"):
+            stale.unlink(missing_ok=True)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind((_LOOPBACK, 0))
+        sock.setblocking(False)
+        self._sock = sock
+        tmp = self._path.with_suffix(".port.tmp")
+        tmp.write_text(str(sock.getsockname()[1]), encoding="utf-8")
+        os.replace(tmp, self._path)  # atomic - notify() never reads a half-written port
+        return self
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a wakeup arrives or `timeout` elapses. Returns True if
+        woken. Coalesces every datagram already queued into one wakeup."""
+        if self._sock is None:
+            return False
+        try:
+            ready, _, _ = select.select([self._sock], [], [], max(0.0, timeout))
+        except (OSError, ValueError):
+            return False
+        if not ready:
+            return False
+        while True:
+            try:
+                self._sock.recv(64)
+            except (BlockingIOError, OSError):
+                break
+        return True
+
+    def close(self):
+        self._path.unlink(missing_ok=True)
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self) -> "WakeupListener":
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
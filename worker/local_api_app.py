@@ -17,8 +17,11 @@ import time
 from pathlib import Path
 
 import job_store
-from fastapi import FastAPI, Header, HTTPException
-from ipc import submit_command, wait_for_result
+import log_tail
+from event_bus import EventBus, sse_frame
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from ipc import send_command
 from local_api_token import verify_token
 from logging_setup import get_logger
 from render_pipeline_adapter import render_status_display
@@ -59,6 +62,14 @@ def _read_manager_status() -> dict:
         return {"processes": {}, "hermes_paused": False, "worker_id": WORKER_ID, "manager_alive": False}
 
 
+def _decorate_status(snap: dict) -> dict:
+    snap["render_status"] = render_status_display()
+    return snap
+
+
+event_bus = EventBus("local_api", read_status=_read_manager_status, decorate_status=_decorate_status)
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "time": time.time()}
@@ -67,9 +78,7 @@ async def health():
 @app.get("/status")
 async def status(authorization: str | None = Header(default=None)):
     require_auth(authorization)
-    snap = _read_manager_status()
-    snap["render_status"] = render_status_display()
-    return snap
+    return _decorate_status(_read_manager_status())
 
 
 @app.get("/processes")
@@ -82,42 +91,42 @@ async def processes(authorization: str | None = Header(default=None)):
 async def render_start(authorization: str | None = Header(default=None)):
     require_auth(authorization)
     audit("processes/render/start")
-    return wait_for_result(submit_command("start_process", {"name": "render_worker"}))
+    return send_command("start_process", {"name": "render_worker"})
 
 
 @app.post("/processes/render/stop")
 async def render_stop(authorization: str | None = Header(default=None)):
     require_auth(authorization)
     audit("processes/render/stop")
-    return wait_for_result(submit_command("stop_process", {"name": "render_worker"}))
+    return send_command("stop_process", {"name": "render_worker"})
 
 
 @app.post("/processes/remote-drive/start")
 async def remote_drive_start(authorization: str | None = Header(default=None)):
     require_auth(authorization)
     audit("processes/remote-drive/start")
-    return wait_for_result(submit_command("start_process", {"name": "remote_drive_worker"}))
+    return send_command("start_process", {"name": "remote_drive_worker"})
 
 
 @app.post("/processes/remote-drive/stop")
 async def remote_drive_stop(authorization: str | None = Header(default=None)):
     require_auth(authorization)
     audit("processes/remote-drive/stop")
-    return wait_for_result(submit_command("stop_process", {"name": "remote_drive_worker"}))
+    return send_command("stop_process", {"name": "remote_drive_worker"})
 
 
 @app.post("/processes/hermes/start")
 async def hermes_start(authorization: str | None = Header(default=None)):
     require_auth(authorization)
     audit("processes/hermes/start")
-    return wait_for_result(submit_command("start_process", {"name": "hermes_worker"}))
+    return send_command("start_process", {"name": "hermes_worker"})
 
 
 @app.post("/processes/hermes/stop")
 async def hermes_stop(authorization: str | None = Header(default=None)):
     require_auth(authorization)
     audit("processes/hermes/stop")
-    return wait_for_result(submit_command("stop_process", {"name": "hermes_worker"}))
+    return send_command("stop_process", {"name": "hermes_worker"})
 
 
 @app.get("/jobs")
@@ -159,17 +168,39 @@ async def cancel_job(job_id: str, authorization: str | None = Header(default=Non
     decide + execute which path applies (it knows the live process pid)."""
     require_auth(authorization)
     audit("jobs/cancel", f"job_id={job_id}")
-    return wait_for_result(submit_command("cancel_job", {"job_id": job_id}), timeout=15)
+    return send_command("cancel_job", {"job_id": job_id}, timeout=15)
 
 
 @app.get("/logs")
-async def logs(process: str = "manager", tail_lines: int = 50, authorization: str | None = Header(default=None)):
+def logs(process: str = "manager", tail_lines: int = 50, cursor: str | None = None,
+         authorization: str | None = Header(default=None)):
+    """Last `tail_lines` lines, or the lines appended after `cursor` (the
+    `cursor` of a previous response) - see log_tail.py."""
     require_auth(authorization)
     path = LOG_FILES.get(process)
     if not path or not Path(path).exists():
         return {"error": f"Unknown or empty log for process '{process}'", "available": list(LOG_FILES.keys())}
-    lines = Path(path).read_text(encoding="utf-8", errors="replace").splitlines()
-    return {"process": process, "lines": lines[-tail_lines:]}
+    chunk = log_tail.read_since(Path(path), cursor) if cursor else log_tail.tail(Path(path), tail_lines)
+    return {"process": process, **chunk}
+
+
+@app.get("/events")
+async def events(request: Request, events: str | None = None, authorization: str | None = Header(default=None)):
+    """Server-Sent Events push of job changes ("job") and Manager status
+    ("status"), instead of polling /status and /jobs - see event_bus.py.
+    The first event is a "snapshot" of the current state. `events` is an
+    optional comma-separated filter."""
+    require_auth(authorization)
+    wanted = {name.strip() for name in (events or "").split(",") if name.strip()}
+
+    async def stream():
+        yield "retry: 3000\n\n"
+        async for message in event_bus.subscribe(wanted):
+            if await request.is_disconnected():
+                return
+            yield sse_frame(message)
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-store"})
 
 
 @app.post("/_test/crash-local-api")
@@ -193,4 +224,4 @@ async def test_crash_local_api(authorization: str | None = Header(default=None))
 async def shutdown(authorization: str | None = Header(default=None)):
     require_auth(authorization)
     audit("shutdown")
-    return wait_for_result(submit_command("shutdown_all"), timeout=20)
+    return send_command("shutdown_all", timeout=20)
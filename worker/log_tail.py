@@ -0,0 +1,164 @@
+"""
+Log tailing and following for the dashboard / Local API log endpoints.
+
+/api/logs used to read_text() + splitlines() a whole process log to return
+its last 50-200 lines; after weeks of uptime that is hundreds of MB per
+request. tail() instead seeks backwards from the end of the file in
+TAIL_BLOCK_BYTES blocks until it has enough lines, and read_since()
+continues from a cursor, so memory and I/O are bounded by what is returned,
+not by the size of the file.
+
+A cursor is "<file id>:<byte offset>" (the file id is st_ino, the Windows
+file index on NTFS). logging_setup.py rotates <name>.log to <name>.log.1
+by renaming, which keeps the file id, so a cursor into a file that was
+just rotated away finishes reading <name>.log.1 before continuing at the
+start of the new <name>.log. follow() turns that into a polling stream
+that opens the file only for the duration of each read - holding it open
+would block the rename on Windows.
+"""
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+TAIL_BLOCK_BYTES = 64 * 1024
+MAX_TAIL_BYTES = 4 * 1024 * 1024     # a tail never buffers more than this, however long the lines
+MAX_READ_BYTES = 512 * 1024          # per read_since() call / streamed event
+MAX_TAIL_LINES = 5000
+FOLLOW_POLL_SECONDS = 0.5
+FOLLOW_HEARTBEAT_SECONDS = 15.0
+
+
+def _file_id(st: os.stat_result) -> str:
+    return str(st.st_ino or "")
+
+
+def make_cursor(file_id: str, offset: int) -> str:
+    return f"{file_id}:{offset}"
+
+
+def parse_cursor(cursor) -> tuple[str, int]:
+    """'<file id>:<offset>', or a bare byte offset (file id unknown)."""
+    text = str(cursor or "").strip()
+    file_id, _, offset = text.rpartition(":")
+    try:
+        return file_id, max(0, int(offset))
+    except ValueError:
+        return "", 0
+
+
+def _decode(raw_lines: list[bytes]) -> list[str]:
+    return [line.rstrip(b"\r").decode("utf-8", errors="replace") for line in raw_lines]
+
+
+def tail(path: Path, lines: int = 50) -> dict:
+    """The last `lines` complete lines and a cursor just past them."""
+    lines = max(1, min(int(lines), MAX_TAIL_LINES))
+    with open(path, "rb") as fh:
+        st = os.fstat(fh.fileno())
+        end = st.st_size
+        pos = end
+        data = b""
+        while pos > 0 and data.count(b"\n") <= lines and len(data) < MAX_TAIL_BYTES:
+            step = min(TAIL_BLOCK_BYTES, pos)
+            pos -= step
+            fh.seek(pos)
+            data = fh.read(step) + data
+    parts = data.split(b"\n")
+    partial = parts.pop()            # bytes after the last newline (a line still being written)
+    if pos > 0 and parts:
+        parts.pop(0)                 # the first block started mid-line
+    return {"lines": _decode(parts[-lines:]), "cursor": make_cursor(_file_id(st), end - len(partial))}
+
+
+def _read_lines(path: Path, offset: int, max_bytes: int) -> tuple[list[bytes], int, bool]:
+    """Complete lines from `offset`, at most ~max_bytes. Returns (lines,
+    next offset, more pending)."""
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        fh.seek(offset)
+        data = fh.read(max_bytes)
+    cut = data.rfind(b"\n") + 1
+    if cut == 0 and len(data) == max_bytes:
+        cut = len(data)              # a single line longer than max_bytes - never stall on it
+    consumed = data[:cut]
+    parts = consumed.split(b"\n")
+    if parts and parts[-1] == b"":
+        parts.pop()
+    return parts, offset + cut, offset + cut < size
+
+
+def read_since(path: Path, cursor, max_bytes: int = MAX_READ_BYTES) -> dict:
+    """Lines appended after `cursor`, following a rotation in between.
+    Returns {lines, cursor, rotated, more}."""
+    path = Path(path)
+    file_id, offset = parse_cursor(cursor)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {"lines": [], "cursor": make_cursor(file_id, offset), "rotated": False, "more": False}
+
+    rotated = False
+    if file_id and file_id != _file_id(st):
+        rotated = True
+        backup = path.with_name(path.name + ".1")
+        try:
+            backup_st = os.stat(backup)
+        except FileNotFoundError:
+            backup_st = None
+        if backup_st is not None and _file_id(backup_st) == file_id and offset < backup_st.st_size:
+            parts, next_offset, more = _read_lines(backup, offset, max_bytes)
+            if more:
+                return {"lines": _decode(parts), "cursor": make_cursor(file_id, next_offset), "rotated": True, "more": True}
+            head = parts
+        else:
+            head = []                # rotated more than once since the cursor - resume at the new file
+        offset = 0
+    elif offset > st.st_size:
+        rotated, head, offset = True, [], 0  # truncated in place
+    else:
+        head = []
+
+    parts, next_offset, more = _read_lines(path, offset, max(1, max_bytes - sum(len(p) + 1 for p in head)))
+    return {
+        "lines": _decode(head + parts),
+        "cursor": make_cursor(_file_id(st), next_offset),
+        "rotated": rotated,
+        "more": more,
+    }
+
+
+async def follow(path: Path, cursor=None, *, tail_lines: int = 200,
+                 is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+                 poll_interval: float = FOLLOW_POLL_SECONDS,
+                 heartbeat: float = FOLLOW_HEARTBEAT_SECONDS) -> AsyncIterator[Optional[dict]]:
+    """Yield read_since() batches as the log grows (None = heartbeat, so a
+    caller can keep an idle connection alive). Starts with the last
+    `tail_lines` lines when no cursor is given. Each batch is bounded by
+    MAX_READ_BYTES and the next read only happens once the caller has
+    consumed the previous one, so a slow client never buffers the log."""
+    path = Path(path)
+    if cursor is None:
+        if path.exists():
+            first = await asyncio.to_thread(tail, path, tail_lines)
+            first.update(rotated=False, more=False)
+            cursor = first["cursor"]
+            yield first
+        else:
+            cursor = make_cursor("", 0)
+    last_sent = time.monotonic()
+    while True:
+        if is_disconnected is not None and await is_disconnected():
+            return
+        batch = await asyncio.to_thread(read_since, path, cursor)
+        cursor = batch["cursor"]
+        if batch["lines"] or batch["rotated"]:
+            last_sent = time.monotonic()
+            yield batch
+            if batch["more"]:
+                continue
+        elif time.monotonic() - last_sent >= heartbeat:
+            last_sent = time.monotonic()
+            yield None
+        await asyncio.sleep(poll_interval)
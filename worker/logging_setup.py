@@ -13,12 +13,17 @@ log file - no shared-file write contention between processes.
     log file even if a caller accidentally includes one in a message
     (docs/AIR_WORKER_SECURITY.md §4 "실 Worker Token 커밋 금지" extended to
     "실 시크릿 로그 금지").
+
+Process logs rotate at LOG_MAX_BYTES (<name>.log -> <name>.log.1 ...), so a
+worker left running for weeks no longer grows one multi-hundred-MB file;
+log_tail.py reads/streams them across the rotation.
 """
 import logging
+import logging.handlers
 import re
 import sys
 
-from worker_config import JOB_LOG_DIR, LOG_FILES
+from worker_config import JOB_LOG_DIR, LOG_BACKUP_COUNT, LOG_FILES, LOG_MAX_BYTES
 
 # Patterns for values that must never appear in a log line. Conservative on
 # purpose - false positives (over-redacting) are acceptable, a leaked
@@ -51,6 +56,18 @@ class _RedactingFilter(logging.Filter):
         return True
 
 
+class _RotatingFileHandler(logging.handlers.RotatingFileHandler):
+    def doRollover(self):
+        try:
+            super().doRollover()
+        except OSError:
+            # Windows refuses to rename a file another process has open at
+            # this instant (a dashboard/Local API log read) - keep appending
+            # and retry the rollover on a later record instead of losing it.
+            if self.stream is None:
+                self.stream = self._open()
+
+
 def get_logger(process_name: str) -> logging.Logger:
     if process_name not in LOG_FILES:
         raise ValueError(f"Unknown process_name '{process_name}' - not in worker_config.LOG_FILES")
@@ -63,7 +80,9 @@ def get_logger(process_name: str) -> logging.Logger:
     fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
     redact_filter = _RedactingFilter()
 
-    file_handler = logging.FileHandler(LOG_FILES[process_name], encoding="utf-8")
+    file_handler = _RotatingFileHandler(
+        LOG_FILES[process_name], maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+    )
     file_handler.setFormatter(fmt)
     file_handler.addFilter(redact_filter)
     logger.addHandler(file_handler)
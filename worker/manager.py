@@ -11,6 +11,9 @@ Changes from the AIR-0227A skeleton (worker/manager.py history):
   - A file-based command channel (worker/ipc.py) lets the now-separate
     Local API process ask the Manager to start/stop children, cancel a
     job, or shut everything down - polled once per supervisor tick.
+    manager_rpc.py's loopback socket now carries the same commands without
+    waiting for a tick (and pushes status events); the file channel stays
+    as the fallback.
   - graceful_shutdown() implements the full timed/logged 11-step shutdown
     protocol (docs/AIR_WORKER_SHUTDOWN_PROTOCOL.md) and REPLACES the
     os._exit(0) workaround entirely - normal process exit is now expected
@@ -21,14 +24,18 @@ Changes from the AIR-0227A skeleton (worker/manager.py history):
 """
 import json
 import os
+import queue
 import subprocess
 import sys
 import threading
 import time
 import uuid
+from dataclasses import asdict
 from pathlib import Path
 
 import job_store
+import manager_rpc
+import render_capacity
 from ipc import consume_command, pending_commands, read_command, write_result
 from logging_setup import get_logger
 from process_registry import ProcessRegistry
@@ -36,9 +43,11 @@ from shutdown_flag import clear_shutdown_flag, request_shutdown
 from worker_config import (
     CANCEL_FLAG_DIR,
     COMMAND_DIR,
+    COMMAND_RESULT_TIMEOUT_SECONDS,
     HEARTBEAT_STALE_SECONDS,
     MANAGER_STATUS_FILE,
     MANAGER_TICK_SECONDS,
+    RENDER_SLOT_NAMES,
     RESTART_BACKOFF_SECONDS,
     SHUTDOWN_GRACE_SECONDS,
     SHUTDOWN_JOB_ABORT_GRACE_SECONDS,
@@ -66,15 +75,33 @@ CHILD_SCRIPTS = ("render_worker", "remote_drive_worker", "hermes_worker", "local
 # Hermes is part of the core generation path, so a full server restart brings
 # it back with the other worker services.
 ALWAYS_ON_CHILD_SCRIPTS = tuple(ALLOWED_CHILD_SCRIPTS)
+# Extra render slots (render_worker_2..N) are the same render_worker role,
+# started/stopped by _apply_render_slot_policy() - never on their own.
+EXTRA_RENDER_SLOTS = tuple(RENDER_SLOT_NAMES[1:])
+MANAGED_CHILDREN = CHILD_SCRIPTS + EXTRA_RENDER_SLOTS
+# Mirrors render_worker.SUPPORTED_JOB_TYPES (not imported: render_worker
+# pulls in the whole render pipeline, which the Manager never loads).
+RENDER_JOB_TYPES = ["render_video"]
 STATE_FILES = {
     "render_worker": STATE_DIR / "render_worker.json",
     "remote_drive_worker": STATE_DIR / "remote_drive_worker.json",
     "hermes_worker": STATE_DIR / "hermes_worker.json",
     "local_api": STATE_DIR / "local_api.json",
+    **{name: STATE_DIR / f"{name}.json" for name in EXTRA_RENDER_SLOTS},
 }
 PAUSE_FLAG_FILE = STATE_DIR / "hermes_worker.pause"
 
 
+def _role_for(name: str) -> str:
+    return "render_worker" if name in RENDER_SLOT_NAMES else name
+
+
+def _is_allowed(name: str) -> bool:
+    if name in EXTRA_RENDER_SLOTS:
+        return "render_worker" in ALWAYS_ON_CHILD_SCRIPTS
+    return name in ALWAYS_ON_CHILD_SCRIPTS
+
+
 def _child_command(role: str) -> list[str]:
     """[AIR-0227E] Build the Popen argv for child process `role`.
 
@@ -108,12 +135,19 @@ class WorkerManager:
         # previous Manager lifetime can never look like the current one).
         self.worker_instance_id = uuid.uuid4().hex
         logger.info(f"Worker instance id for this Manager run: {self.worker_instance_id}")
-        for name in CHILD_SCRIPTS:
+        for name in MANAGED_CHILDREN:
             rec = self.registry.register(name)
-            if name not in ALWAYS_ON_CHILD_SCRIPTS:
+            if not _is_allowed(name):
                 rec.status = "disabled"
                 rec.disabled_reason = f"disabled by AIRWORKER_PROFILE={WORKER_PROFILE}"
         self.registry.register("updater")
+        self.render_capacity: render_capacity.RenderCapacity | None = None
+        self._published_capacity: tuple | None = None
+        # RPC commands are queued for the supervisor thread, so every
+        # command - file or socket - is still handled on one thread.
+        self.rpc_server: manager_rpc.RpcServer | None = None
+        self._rpc_commands: queue.Queue = queue.Queue()
+        self._wake = threading.Event()
 
     # ---- process lifecycle -------------------------------------------------
 
@@ -123,7 +157,7 @@ class WorkerManager:
             if rec is None:
                 logger.warning(f"Refusing to start unknown process '{name}'")
                 return False
-            if name not in ALWAYS_ON_CHILD_SCRIPTS:
+            if not _is_allowed(name):
                 rec.status = "disabled"
                 rec.pid = None
                 rec.disabled_reason = f"disabled by AIRWORKER_PROFILE={WORKER_PROFILE}"
@@ -137,7 +171,7 @@ class WorkerManager:
                 return True
 
             clear_shutdown_flag(name)  # a leftover flag from a previous stop would make the new instance exit immediately
-            cmd = _child_command(name)
+            cmd = _child_command(_role_for(name))
             logger.info(f"Starting '{name}' ({' '.join(cmd)})")
             # [AIR-0227B Stage 4 finding, not a regression introduced here]
             # services/video_service.py prints emoji/non-ASCII to stdout.
@@ -148,6 +182,8 @@ class WorkerManager:
             # standard fix and doesn't require touching the existing
             # rendering pipeline's print statements.
             child_env = dict(os.environ, PYTHONIOENCODING="utf-8", AIRWORKER_INSTANCE_ID=self.worker_instance_id)
+            if name in RENDER_SLOT_NAMES:
+                child_env["AIRWORKER_RENDER_SLOT"] = str(RENDER_SLOT_NAMES.index(name) + 1)
             popen = subprocess.Popen(cmd, cwd=str(HERE), env=child_env)
             self.popens[name] = popen
             rec.pid = popen.pid
@@ -262,6 +298,10 @@ class WorkerManager:
                 ok = self.start_process(params["name"])
                 return {"success": ok}
             if command == "stop_process":
+                if params["name"] == "render_worker":
+                    # Extra render slots only exist alongside the primary one.
+                    for name in EXTRA_RENDER_SLOTS:
+                        self.stop_process(name)
                 ok = self.stop_process(params["name"])
                 return {"success": ok}
             if command == "cancel_job":
@@ -294,7 +334,44 @@ class WorkerManager:
             logger.error(f"Command '{command}' failed: {e}")
             return {"success": False, "error": str(e)}
 
+    def start_rpc_server(self):
+        try:
+            server = manager_rpc.RpcServer(self._enqueue_rpc_command)
+            port = server.start()
+        except OSError as e:
+            logger.warning(f"Manager RPC unavailable, Local API will use file IPC only: {e}")
+            return
+        self.rpc_server = server
+        logger.info(f"Manager RPC listening on 127.0.0.1:{port}")
+
+    def _enqueue_rpc_command(self, cmd: dict) -> dict:
+        """Called on an RPC connection thread; blocks until the supervisor
+        thread has run the command (see run_supervisor_loop)."""
+        done = threading.Event()
+        slot: dict = {}
+        self._rpc_commands.put((cmd, slot, done))
+        self._wake.set()
+        if not done.wait(COMMAND_RESULT_TIMEOUT_SECONDS * 3):
+            return {"success": False, "error": "Manager supervisor loop did not pick up the command"}
+        return slot["result"]
+
+    def _drain_rpc_commands(self) -> int:
+        handled = 0
+        while True:
+            try:
+                cmd, slot, done = self._rpc_commands.get_nowait()
+            except queue.Empty:
+                return handled
+            logger.info(f"Command received (rpc): {cmd['command']} {cmd.get('params')}")
+            try:
+                slot["result"] = self._handle_command(cmd)
+            except Exception as e:
+                slot["result"] = {"success": False, "error": str(e)}
+            done.set()
+            handled += 1
+
     def poll_commands(self):
+        self._drain_rpc_commands()
         for path in pending_commands():
             cmd = read_command(path)
             consume_command(path)
@@ -337,14 +414,18 @@ class WorkerManager:
                 return {"success": False, "error": f"job left in unexpected status {status} during soft-cancel"}
 
         if status in (job_store.RENDERING, job_store.UPLOADING):
-            popen = self.popens.get("render_worker")
+            # Only the slot that owns this job is killed; other slots keep rendering.
+            slot = job_store.get_job(job_id).get("worker_slot") or "render_worker"
+            if slot not in RENDER_SLOT_NAMES:
+                slot = "render_worker"
+            popen = self.popens.get(slot)
             if popen and popen.poll() is None:
-                logger.warning(f"Hard-cancelling job {job_id}: killing render_worker process tree (pid={popen.pid})")
+                logger.warning(f"Hard-cancelling job {job_id}: killing {slot} process tree (pid={popen.pid})")
                 self._kill_process_tree(popen.pid)
             job_store.transition(job_id, job_store.CANCELED, reason="render worker process tree killed to cancel active render")
-            self.registry.get("render_worker").status = "stopped"
-            self.registry.get("render_worker").pid = None
-            self.start_process("render_worker")
+            self.registry.get(slot).status = "stopped"
+            self.registry.get(slot).pid = None
+            self.start_process(slot)
             return {"success": True, "result": "cancelled_hard_kill"}
 
         return {"success": False, "error": f"job already in terminal status {status}, nothing to cancel"}
@@ -367,7 +448,7 @@ class WorkerManager:
         publish a status snapshot for Local API to read."""
         self.poll_commands()
 
-        for name in list(CHILD_SCRIPTS):
+        for name in list(MANAGED_CHILDREN):
             rec = self.registry.get(name)
             if rec.status == "disabled":
                 continue
@@ -380,8 +461,8 @@ class WorkerManager:
                 if self._stopping or rec.status == "stopped":
                     continue
                 logger.error(f"'{name}' exited unexpectedly (code={exit_code})")
-                if name == "render_worker":
-                    self._recover_jobs_owned_by(popen.pid)
+                if name in RENDER_SLOT_NAMES:
+                    self._recover_jobs_owned_by(popen.pid, slot=name)
                 can_restart = rec.record_crash(error=f"exit_code={exit_code}")
                 if can_restart:
                     logger.info(f"Auto-restarting '{name}' (crash {len(rec.crash_timestamps)} in window)")
@@ -398,10 +479,11 @@ class WorkerManager:
                 if rec.last_heartbeat_at and (time.time() - rec.last_heartbeat_at) > HEARTBEAT_STALE_SECONDS:
                     logger.warning(f"'{name}' heartbeat stale ({time.time() - rec.last_heartbeat_at:.1f}s)")
 
+        self._apply_render_slot_policy()
         self._apply_resource_policy()
         self._publish_status()
 
-    def _recover_jobs_owned_by(self, dead_pid: int):
+    def _recover_jobs_owned_by(self, dead_pid: int, slot: str = "render_worker"):
         """[Stage 7] Called the moment we notice the Render Worker died
         unexpectedly - immediately resolve whatever job it was holding
         instead of waiting for the next Manager restart.
@@ -415,17 +497,61 @@ class WorkerManager:
         equality check silently matched nothing and jobs stayed stuck in
         RENDERING forever after a real crash, discovered only by actually
         force-killing a render worker mid-job and watching it fail to
-        recover. Fix: since the Manager only ever runs one Render Worker
-        Process at a time, at the exact moment we're handling its crash
-        there is by definition no live process that could legitimately own
-        any job still in an ACTIVE status - so every such job found here
-        IS orphaned, regardless of which literal pid it recorded. This
-        mirrors run_startup_recovery()'s alive_pid=None semantics, applied
-        immediately instead of only at the next Manager start."""
-        stale = job_store.find_stale_active_jobs(alive_pid=None)
+        recover.
+
+        [Multi-slot] Ownership is matched by render slot name instead
+        (jobs.worker_slot, written at claim time by the slot process itself
+        - a name, so the launcher pid mismatch above cannot affect it).
+        Other slots are still alive and rendering their own jobs, so only
+        the dead slot's active render jobs are orphaned. Active render jobs
+        with no recorded slot predate multi-slot rendering and belong to the
+        primary slot."""
+        stale = job_store.find_active_jobs_for_slot(slot, RENDER_JOB_TYPES, include_unassigned=(slot == "render_worker"))
         for job in stale:
             recovered = job_store.mark_abandoned_and_recover(job)
-            logger.warning(f"[RECOVERY] job {job['job_id']} (owning Render Worker pid={dead_pid} crashed): {job['status']} -> {recovered['status']}")
+            logger.warning(f"[RECOVERY] job {job['job_id']} (owning {slot} pid={dead_pid} crashed): {job['status']} -> {recovered['status']}")
+
+    def _slot_busy(self, name: str) -> bool:
+        state = self._read_state_file(name)
+        return bool(state and state.get("current_job"))
+
+    def _apply_render_slot_policy(self):
+        """Size the render slot pool from measured CPU/RAM/encoder
+        (render_capacity.plan_render_slots) and publish the admission
+        capacity the slots claim against. Extra slots only run alongside a
+        live primary render_worker (stopping render from the Local API /
+        dashboard stops the whole pool), and shrinking - e.g. under memory
+        pressure - only ever stops *idle* slots; a render in flight is
+        never interrupted by this policy."""
+        if "render_worker" not in ALWAYS_ON_CHILD_SCRIPTS:
+            return
+        primary = self.popens.get("render_worker")
+        primary_up = bool(primary and primary.poll() is None)
+        busy = [name for name in RENDER_SLOT_NAMES if self._slot_busy(name)]
+        plan = render_capacity.plan_render_slots(render_capacity.measure_host(), busy_slots=len(busy))
+        previous = self.render_capacity
+        self.render_capacity = plan
+
+        published = (plan.slots, plan.capacity, plan.memory_pressure)
+        if published != self._published_capacity:
+            render_capacity.write_capacity(plan)
+            self._published_capacity = published
+            if previous is not None:
+                logger.info(
+                    f"Render slots -> {plan.slots} (capacity={plan.capacity}, limited_by={plan.limited_by}, "
+                    f"memory_pressure={plan.memory_pressure}, busy={busy})"
+                )
+
+        for index, name in enumerate(EXTRA_RENDER_SLOTS, start=2):
+            rec = self.registry.get(name)
+            popen = self.popens.get(name)
+            running = bool(popen and popen.poll() is None)
+            wanted = primary_up and index <= plan.slots
+            if wanted and not running and rec.status == "stopped":
+                self.start_process(name)
+            elif not wanted and running and name not in busy:
+                logger.info(f"Retiring idle render slot '{name}' (target slots={plan.slots if primary_up else 1})")
+                self.stop_process(name)
 
     def _apply_resource_policy(self):
         """docs/AIR_WORKER_RESOURCE_POLICY.md §2/§3: if the render worker
@@ -436,8 +562,7 @@ class WorkerManager:
                 logger.info("Render worker disabled by profile -> clearing Hermes pause flag")
                 PAUSE_FLAG_FILE.unlink(missing_ok=True)
             return
-        render_state = self._read_state_file("render_worker")
-        render_busy = bool(render_state and render_state.get("current_job"))
+        render_busy = any(self._slot_busy(name) for name in RENDER_SLOT_NAMES)
         if render_busy and not PAUSE_FLAG_FILE.exists():
             logger.info("Render job active -> pausing Hermes new-job intake")
             PAUSE_FLAG_FILE.write_text("paused", encoding="utf-8")
@@ -449,21 +574,35 @@ class WorkerManager:
         snapshot = self.status_snapshot()
         snapshot["written_at"] = time.time()
         MANAGER_STATUS_FILE.write_text(json.dumps(snapshot, ensure_ascii=False), encoding="utf-8")
+        if self.rpc_server is not None:
+            self.rpc_server.publish("status", snapshot)
 
     def run_supervisor_loop(self):
+        """One supervise_once() per MANAGER_TICK_SECONDS, but an RPC command
+        wakes the loop immediately and is handled between ticks."""
         logger.info("Health Monitor loop starting")
+        next_tick = 0.0
         while not self._stopping:
-            try:
-                self.supervise_once()
-            except Exception as e:
-                logger.error(f"Supervisor tick error (non-fatal, continuing): {e}")
-            time.sleep(MANAGER_TICK_SECONDS)
+            if time.monotonic() >= next_tick:
+                try:
+                    self.supervise_once()
+                except Exception as e:
+                    logger.error(f"Supervisor tick error (non-fatal, continuing): {e}")
+                next_tick = time.monotonic() + MANAGER_TICK_SECONDS
+            else:
+                try:
+                    if self._drain_rpc_commands():
+                        self._publish_status()
+                except Exception as e:
+                    logger.error(f"RPC command error (non-fatal, continuing): {e}")
+            self._wake.wait(max(0.0, next_tick - time.monotonic()))
+            self._wake.clear()
 
     # ---- status snapshot for Local API ---------------------------------------
 
     def status_snapshot(self) -> dict:
         processes = self.registry.to_dict()
-        for name in CHILD_SCRIPTS:
+        for name in MANAGED_CHILDREN:
             state = self._read_state_file(name)
             if state:
                 processes[name]["current_job"] = state.get("current_job")
@@ -480,6 +619,19 @@ class WorkerManager:
             "worker_instance_id": self.worker_instance_id,
             "processes": processes,
             "hermes_paused": PAUSE_FLAG_FILE.exists(),
+            "render_slots": [
+                {
+                    "name": name,
+                    "slot": index,
+                    "status": processes.get(name, {}).get("status"),
+                    "pid": processes.get(name, {}).get("pid"),
+                    "current_job": processes.get(name, {}).get("current_job"),
+                    "progress": processes.get(name, {}).get("progress"),
+                }
+                for index, name in enumerate(RENDER_SLOT_NAMES, start=1)
+                if name == "render_worker" or processes.get(name, {}).get("status") not in (None, "stopped", "disabled")
+            ],
+            "render_capacity": asdict(self.render_capacity) if self.render_capacity else None,
         }
 
     # ---- graceful shutdown (Stage 3) -----------------------------------------
@@ -514,19 +666,27 @@ class WorkerManager:
         log_step("Stopping Remote Drive Worker (Drive API queue intake)")
         self.stop_process("remote_drive_worker", timeout=SHUTDOWN_GRACE_SECONDS, force_tree_kill=True)
 
-        render_state = self._read_state_file("render_worker")
-        job_active = bool(render_state and render_state.get("current_job"))
-        log_step(f"Render Worker job_active={job_active}")
+        busy_slots = [name for name in RENDER_SLOT_NAMES if self._slot_busy(name)]
+        job_active = bool(busy_slots)
+        log_step(f"Render Worker job_active={job_active} busy_slots={busy_slots}")
 
         render_timeout = SHUTDOWN_GRACE_SECONDS + (SHUTDOWN_JOB_ABORT_GRACE_SECONDS if job_active else 0)
-        log_step(f"Signalling Render Worker to stop, granting up to {render_timeout}s "
+        log_step(f"Signalling Render Worker slot(s) to stop, granting up to {render_timeout}s "
                   f"({'honors PREPARING checkpoint only, cannot abort a live encode' if job_active else 'no active job'})")
-        popen = self.popens.get("render_worker")
-        pid_before = popen.pid if popen else None
-        self.stop_process("render_worker", timeout=render_timeout, force_tree_kill=True)
-
-        if job_active and pid_before:
-            self._recover_jobs_owned_by(pid_before)
+        pids_before = {}
+        for name in RENDER_SLOT_NAMES:
+            popen = self.popens.get(name)
+            if popen and popen.poll() is None:
+                pids_before[name] = popen.pid
+                # Flag every slot up front so they wind down in parallel
+                # while stop_process() below waits on each in turn.
+                request_shutdown(name)
+        for name in pids_before:
+            self.stop_process(name, timeout=render_timeout, force_tree_kill=True)
+
+        for name in busy_slots:
+            if pids_before.get(name):
+                self._recover_jobs_owned_by(pids_before[name], slot=name)
         log_step("Render Worker stop resolved (any interrupted job handed to recovery)")
 
         log_step("Stopping Local API process last (serves this very shutdown response)")
@@ -546,7 +706,10 @@ class WorkerManager:
             cleaned += 1
         if PAUSE_FLAG_FILE.exists():
             PAUSE_FLAG_FILE.unlink()
-        log_step(f"Cleaned up {cleaned} stale command file(s) and the Hermes pause flag")
+        if self.rpc_server is not None:
+            self.rpc_server.close()
+            self.rpc_server = None
+        log_step(f"Cleaned up {cleaned} stale command file(s), the Hermes pause flag and the RPC socket")
 
         log_step(f"SHUTDOWN_COMPLETE total_elapsed={time.time() - t0:.2f}s leftover_pids={len(leftover)}")
 
@@ -573,6 +736,7 @@ def main():
         logger.warning(f"웹어드민 API 키 로드 실패 (무시): {e}")
 
     manager = WorkerManager()
+    manager.start_rpc_server()
     manager.run_startup_recovery()
     cancelled_autopilot_jobs = job_store.cancel_nonterminal_jobs_by_source(
         "autopilot",
@@ -0,0 +1,282 @@
+"""
+Socket RPC between the Local API / dashboard and the Worker Manager.
+
+ipc.py's file channel costs up to one full Manager tick (1s) for the
+Manager to notice a command, plus up to 100ms of result polling, and
+leaves a .json/.tmp pair on disk per start/stop/cancel. The Manager now
+also listens on a loopback TCP socket (127.0.0.1, ephemeral port advertised
+in STATE_DIR/manager_rpc.port). Loopback TCP rather than a Unix socket or
+named pipe for the same reason as job_wakeup.py: one code path on Windows
+(the production target) and POSIX, no extra dependency.
+
+Framing: every message is a 4-byte big-endian length followed by that many
+bytes of UTF-8 JSON.
+
+    client -> {"type": "hello", "token": <Local API token>}
+    server -> {"type": "hello", "ok": true}
+    client -> {"type": "call", "id": 1, "command": "stop_process", "params": {...}}
+    server -> {"type": "result", "id": 1, "result": {...}}
+    client -> {"type": "subscribe", "events": ["status"]}
+    server -> {"type": "event", "event": "status", "data": {...}}   (until closed)
+
+The hello token is the same one Local API HTTP callers must present
+(local_api_token.verify_token), so a local process that cannot call the
+Local API cannot drive the Manager over this socket either.
+
+ipc.send_command() tries this channel first and falls back to the file
+channel only when the Manager is not listening (RpcUnavailable: no port
+file, connection refused, handshake rejected). Once a call has been sent
+it never falls back - the command may already be running.
+"""
+import json
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+from typing import Callable, Iterator, Optional
+
+from local_api_token import get_or_create_token, verify_token
+from worker_config import COMMAND_RESULT_TIMEOUT_SECONDS, STATE_DIR
+
+RPC_PORT_FILE = STATE_DIR / "manager_rpc.port"
+_LOOPBACK = "127.0.0.1"
+_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+CONNECT_TIMEOUT_SECONDS = 0.5
+HANDSHAKE_TIMEOUT_SECONDS = 5.0
+EVENT_KEEPALIVE_SECONDS = 15.0
+_SUBSCRIBER_QUEUE_SIZE = 32
+
+
+class RpcUnavailable(ConnectionError):
+    """The Manager is not reachable over RPC - fall back to ipc.py's file channel."""
+
+
+def send_frame(sock: socket.socket, message: dict):
+    body = json.dumps(message, ensure_ascii=False, default=str).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(body)) + body)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError("connection closed by peer")
+        buf += chunk
+    return bytes(buf)
+
+
+def recv_frame(sock: socket.socket) -> dict:
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if size > MAX_FRAME_BYTES:
+        raise ConnectionError(f"frame too large ({size} bytes)")
+    return json.loads(_recv_exact(sock, size).decode("utf-8"))
+
+
+def _no_delay(sock: socket.socket):
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        pass
+
+
+# ---- server (runs inside the Manager process) --------------------------------
+
+
+class _Subscriber:
+    def __init__(self, events: set):
+        self.events = events
+        self.queue: queue.Queue = queue.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+
+    def offer(self, message: Optional[dict]):
+        # Status events are latest-wins: a slow reader loses old snapshots,
+        # never blocks the Manager's tick.
+        while True:
+            try:
+                self.queue.put_nowait(message)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        rpc: "RpcServer" = self.server.rpc
+        sock = self.request
+        _no_delay(sock)
+        try:
+            sock.settimeout(HANDSHAKE_TIMEOUT_SECONDS)
+            hello = recv_frame(sock)
+            if hello.get("type") != "hello" or not verify_token(hello.get("token")):
+                send_frame(sock, {"type": "hello", "ok": False, "error": "unauthorized"})
+                return
+            send_frame(sock, {"type": "hello", "ok": True})
+            sock.settimeout(None)
+            while True:
+                message = recv_frame(sock)
+                kind = message.get("type")
+                if kind == "call":
+                    result = rpc.dispatch({
+                        "command_id": f"rpc-{threading.get_ident()}-{message.get('id')}",
+                        "command": message.get("command"),
+                        "params": message.get("params") or {},
+                    })
+                    send_frame(sock, {"type": "result", "id": message.get("id"), "result": result})
+                elif kind == "subscribe":
+                    rpc.stream(sock, set(message.get("events") or ["status"]))
+                    return
+                else:
+                    send_frame(sock, {"type": "error", "error": f"unknown message type {kind!r}"})
+        except (ConnectionError, OSError, ValueError):
+            return
+
+
+class _TcpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = False
+
+
+class RpcServer:
+    """`on_command(cmd)` gets the same dict shape ipc.read_command() returns
+    ({"command_id", "command", "params"}) and must return the result dict."""
+
+    def __init__(self, on_command: Callable[[dict], dict]):
+        self.on_command = on_command
+        self._server: Optional[_TcpServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._subscribers: list[_Subscriber] = []
+        self._subscribers_lock = threading.Lock()
+        self.port: Optional[int] = None
+
+    def start(self) -> int:
+        server = _TcpServer((_LOOPBACK, 0), _RequestHandler)
+        server.rpc = self
+        self._server = server
+        self.port = server.server_address[1]
+        self._thread = threading.Thread(target=server.serve_forever, name="manager-rpc", daemon=True)
+        self._thread.start()
+        tmp = RPC_PORT_FILE.with_suffix(".port.tmp")
+        tmp.write_text(str(self.port), encoding="utf-8")
+        os.replace(tmp, RPC_PORT_FILE)  # atomic - clients never read a half-written port
+        return self.port
+
+    def dispatch(self, cmd: dict) -> dict:
+        try:
+            return self.on_command(cmd)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def publish(self, event: str, data: dict):
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if event in subscriber.events:
+                subscriber.offer({"type": "event", "event": event, "data": data})
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._subscribers_lock:
+            return len(self._subscribers)
+
+    def stream(self, sock: socket.socket, events: set):
+        subscriber = _Subscriber(events)
+        with self._subscribers_lock:
+            self._subscribers.append(subscriber)
+        try:
+            send_frame(sock, {"type": "subscribed", "events": sorted(events)})
+            while True:
+                try:
+                    message = subscriber.queue.get(timeout=EVENT_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    message = {"type": "ping"}
+                if message is None:
+                    return
+                send_frame(sock, message)
+        finally:
+            with self._subscribers_lock:
+                self._subscribers.remove(subscriber)
+
+    def close(self):
+        try:
+            if RPC_PORT_FILE.read_text(encoding="utf-8").strip() == str(self.port):
+                RPC_PORT_FILE.unlink(missing_ok=True)
+        except OSError:
+            pass
+        with self._subscribers_lock:
+            for subscriber in self._subscribers:
+                subscriber.offer(None)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# ---- client (Local API / dashboard) -------------------------------------------
+
+
+def _connect(timeout: float) -> socket.socket:
+    try:
+        port = int(RPC_PORT_FILE.read_text(encoding="utf-8").strip())
+    except (OSError, ValueError) as e:
+        raise RpcUnavailable(f"Manager RPC port not advertised: {e}") from e
+    try:
+        sock = socket.create_connection((_LOOPBACK, port), timeout=CONNECT_TIMEOUT_SECONDS)
+    except OSError as e:
+        raise RpcUnavailable(f"Manager RPC not listening on {port}: {e}") from e
+    _no_delay(sock)
+    try:
+        sock.settimeout(min(timeout, HANDSHAKE_TIMEOUT_SECONDS))
+        send_frame(sock, {"type": "hello", "token": get_or_create_token()})
+        reply = recv_frame(sock)
+    except (OSError, ValueError) as e:
+        sock.close()
+        raise RpcUnavailable(f"Manager RPC handshake failed: {e}") from e
+    if not reply.get("ok"):
+        sock.close()
+        raise RpcUnavailable(f"Manager RPC handshake rejected: {reply.get('error')}")
+    return sock
+
+
+def call(command: str, params: Optional[dict] = None, timeout: float = COMMAND_RESULT_TIMEOUT_SECONDS) -> dict:
+    """One request/response round trip. Raises RpcUnavailable only before
+    the command was sent; after that, failures come back as the same
+    {"success": False, "error": ...} shape ipc.wait_for_result() uses."""
+    sock = _connect(timeout)
+    try:
+        sock.settimeout(timeout)
+        send_frame(sock, {"type": "call", "id": 1, "command": command, "params": params or {}})
+        reply = recv_frame(sock)
+    except socket.timeout:
+        return {"success": False, "error": f"Manager did not respond to command within {timeout}s (is it running?)"}
+    except (OSError, ValueError) as e:
+        return {"success": False, "error": f"Manager RPC connection lost: {e}"}
+    finally:
+        sock.close()
+    if reply.get("type") != "result":
+        return {"success": False, "error": reply.get("error") or f"unexpected Manager RPC reply: {reply.get('type')}"}
+    return reply.get("result") or {}
+
+
+def iter_events(events: tuple = ("status",), timeout: float = EVENT_KEEPALIVE_SECONDS * 2) -> Iterator[dict]:
+    """Yield {"event", "data"} pushed by the Manager until the connection
+    closes. `timeout` bounds the silence between frames (keepalive pings
+    arrive every EVENT_KEEPALIVE_SECONDS)."""
+    sock = _connect(timeout)
+    try:
+        sock.settimeout(timeout)
+        send_frame(sock, {"type": "subscribe", "events": list(events)})
+        while True:
+            try:
+                message = recv_frame(sock)
+            except (OSError, ValueError):
+                return
+            if message.get("type") == "event":
+                yield {"event": message.get("event"), "data": message.get("data")}
+    finally:
+        sock.close()
@@ -0,0 +1,156 @@
+"""
+Coalesced progress reporting for job_store and worker state files.
+
+Render progress callbacks (MoviePy/ffmpeg) and Hermes chunk loops fire many
+times a second, and each one used to commit a jobs.db write transaction
+(job_store.update_progress) *and* rewrite the worker's JSON state file -
+several fsyncs per second that nobody can see, since the dashboard, tray
+and Manager all poll at ~1s.
+
+Coalescer keeps only the latest value per key and writes it at most once
+per PROGRESS_FLUSH_INTERVAL_SECONDS. A trailing value is written by one
+background flusher thread once its interval has elapsed, so the last
+update is never lost. Stage changes bypass the interval (submit(force=True))
+or fold the pending value into their own write (take()). Every write for a
+key happens under one lock, so an older coalesced value can never land
+after a newer forced one.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional
+
+from worker_config import PROGRESS_FLUSH_INTERVAL_SECONDS
+
+
+class Coalescer:
+    def __init__(self, flush: Callable[[Hashable, Any], None], interval: float = PROGRESS_FLUSH_INTERVAL_SECONDS,
+                 name: str = "progress-flush"):
+        self._flush = flush
+        self.interval = float(interval)
+        self.name = name
+        self._cond = threading.Condition(threading.RLock())
+        self._pending: dict = {}       # key -> (value, due_at)
+        self._last_flush: dict = {}    # key -> monotonic time of the last write
+        self._thread: Optional[threading.Thread] = None
+        self.submitted = 0
+        self.flushed = 0
+
+    def submit(self, key: Hashable, value: Any, *, force: bool = False) -> bool:
+        """Record `value` for `key`. Returns True if it was written now,
+        False if it is pending (coalesced) for the flusher thread."""
+        with self._cond:
+            self.submitted += 1
+            now = time.monotonic()
+            due = self._last_flush.get(key, float("-inf")) + self.interval
+            if force or now >= due:
+                self._pending.pop(key, None)
+                self._write(key, value, now)
+                return True
+            first = key not in self._pending
+            self._pending[key] = (value, due)
+            if first:
+                self._ensure_thread()
+                self._cond.notify()
+            return False
+
+    def take(self, key: Hashable, *, forget: bool = False) -> Any:
+        """Remove and return the pending value for `key` (None if nothing is
+        pending) - for a caller that is about to write it itself, e.g. a
+        state transition carrying the latest progress in the same commit.
+        `forget` also drops the key's rate-limit history (job finished)."""
+        with self._cond:
+            entry = self._pending.pop(key, None)
+            if forget:
+                self._last_flush.pop(key, None)
+            else:
+                self._last_flush[key] = time.monotonic()
+            return entry[0] if entry else None
+
+    def drain(self, key: Optional[Hashable] = None):
+        """Write pending values now (one key, or all)."""
+        with self._cond:
+            keys = [key] if key is not None else list(self._pending)
+            for k in keys:
+                entry = self._pending.pop(k, None)
+                if entry is not None:
+                    self._write(k, entry[0], time.monotonic())
+
+    def pending(self, key: Hashable) -> Any:
+        with self._cond:
+            entry = self._pending.get(key)
+            return entry[0] if entry else None
+
+    def _write(self, key, value, now: float):
+        self._last_flush[key] = now
+        self.flushed += 1
+        self._flush(key, value)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        with self._cond:
+            while True:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                key, (value, due) = min(self._pending.items(), key=lambda item: item[1][1])
+                now = time.monotonic()
+                if due > now:
+                    self._cond.wait(due - now)
+                    continue
+                del self._pending[key]
+                try:
+                    self._write(key, value, now)
+                except Exception:
+                    # Progress is advisory: a failed trailing write (e.g.
+                    # jobs.db busy past its timeout) is superseded by the
+                    # next update or the next stage transition.
+                    pass
+
+
+def _write_json_atomic(path: Path, data: dict):
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    try:
+        os.replace(tmp, path)  # readers never parse a half-written file
+    except PermissionError:
+        # Windows refuses to replace a file another process has open at
+        # this instant (Manager/tray reading it) - fall back to the old
+        # in-place write rather than dropping the update.
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        tmp.unlink(missing_ok=True)
+
+
+class StateFileWriter:
+    """Coalesced, atomic writer for a worker's STATE_FILE. A change of
+    status or current job is written immediately; progress/heartbeat-only
+    updates with the same status and job are coalesced."""
+
+    def __init__(self, interval: float = PROGRESS_FLUSH_INTERVAL_SECONDS, name: str = "state-flush"):
+        self._last_key: dict = {}
+        self._coalescer = Coalescer(_write_json_atomic, interval, name=name)
+
+    def write(self, path: Path, state: dict, *, force: bool = False):
+        key = (state.get("status"), state.get("current_job_id"))
+        force = force or key != self._last_key.get(path)
+        self._last_key[path] = key
+        self._coalescer.submit(path, state, force=force)
+
+    def latest(self, path: Path) -> Optional[dict]:
+        """The newest state this process has reported, flushed or not."""
+        pending = self._coalescer.pending(path)
+        if pending is not None:
+            return pending
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def flush(self):
+        self._coalescer.drain()
@@ -17,7 +17,13 @@ STATE_FILE = STATE_DIR / "remote_drive_worker.json"
 logger = get_logger("remote_drive_worker")
 
 
-def write_state(status: str, current_job: dict | None = None, progress: int = 0, last_error: str | None = None):
+def write_state(
+    status: str,
+    current_job: dict | None = None,
+    progress: int = 0,
+    last_error: str | None = None,
+    in_flight: list | None = None,
+):
     prev = {}
     if STATE_FILE.exists():
         try:
@@ -36,6 +42,7 @@ def write_state(status: str, current_job: dict | None = None, progress: int = 0,
                 "heartbeat_at": time.time(),
                 "last_success_at": prev.get("last_success_at"),
                 "last_error": last_error if last_error is not None else prev.get("last_error"),
+                "in_flight": in_flight or [],
             },
             ensure_ascii=False,
         ),
@@ -43,6 +50,13 @@ def write_state(status: str, current_job: dict | None = None, progress: int = 0,
     )
 
 
+def _mark_success():
+    state = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    state["last_success_at"] = time.time()
+    state["last_error"] = None
+    STATE_FILE.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+
+
 def _job_summary(job: dict) -> dict:
     return {
         "id": job.get("id"),
@@ -67,56 +81,74 @@ def main():
         raise
 
     write_state("idle")
-    while not is_shutdown_requested("remote_drive_worker"):
-        try:
-            job = worker.fetch_next_job()
-            if not job:
-                write_state("idle")
-                time.sleep(worker.poll_interval)
-                continue
-
-            claimed = worker.claim_job(job)
-            if not claimed:
-                write_state("idle")
-                continue
-
-            summary = _job_summary(claimed)
-            logger.info("Processing Drive API render job %s", claimed.get("id"))
-            write_state("running", summary, int(claimed.get("progress") or 1))
-            heartbeat_stop = threading.Event()
-
-            def refresh_heartbeat():
-                while not heartbeat_stop.wait(10):
-                    try:
-                        write_state("running", summary, int(claimed.get("progress") or 1))
-                    except Exception:
-                        logger.exception("Failed to refresh Remote Drive Worker heartbeat")
-
-            heartbeat_thread = threading.Thread(
-                target=refresh_heartbeat,
-                name="remote-drive-heartbeat",
-                daemon=True,
-            )
-            heartbeat_thread.start()
+    # The pipeline calls back from its stage threads; serialise state-file writes
+    # and keep the last snapshot so the heartbeat can rewrite it.
+    state_lock = threading.Lock()
+    pipeline = {"jobs": {}, "stages": {}}
+
+    def publish_state(last_error=None):
+        stages = pipeline["stages"]
+        if not stages:
+            write_state("idle", last_error=last_error)
+            return
+        # Report the job furthest along as the current one; the rest are listed as in-flight.
+        order = ("publishing", "rendered", "rendering", "queued", "fetching")
+        job_ids = sorted(stages, key=lambda job_id: order.index(stages[job_id]) if stages[job_id] in order else len(order))
+        current = pipeline["jobs"].get(job_ids[0]) or {}
+        write_state(
+            "running",
+            _job_summary(current),
+            int(current.get("progress") or 1),
+            last_error=last_error,
+            in_flight=[dict(_job_summary(pipeline["jobs"].get(job_id) or {"id": job_id}), stage=stages[job_id])
+                       for job_id in job_ids],
+        )
+
+    def on_change(event, job, stages):
+        with state_lock:
+            pipeline["stages"] = stages
+            pipeline["jobs"][job.get("id")] = job
+            for job_id in list(pipeline["jobs"]):
+                if job_id not in stages:
+                    pipeline["jobs"].pop(job_id, None)
+            if event == "completed":
+                logger.info("Drive API render job %s completed", job.get("id"))
+                publish_state(last_error=None)
+                _mark_success()
+            elif event == "failed":
+                logger.warning("Drive API render job %s failed", job.get("id"))
+                publish_state(last_error=f"job {job.get('id')} failed")
+            else:
+                logger.info("Drive API render job %s: %s", job.get("id"), event)
+                publish_state()
+
+    heartbeat_stop = threading.Event()
+
+    def refresh_heartbeat():
+        while not heartbeat_stop.wait(10):
+            try:
+                with state_lock:
+                    publish_state()
+            except Exception:
+                logger.exception("Failed to refresh Remote Drive Worker heartbeat")
+
+    heartbeat_thread = threading.Thread(target=refresh_heartbeat, name="remote-drive-heartbeat", daemon=True)
+    heartbeat_thread.start()
+    try:
+        while not is_shutdown_requested("remote_drive_worker"):
             try:
-                worker.process_job(claimed)
-            finally:
-                heartbeat_stop.set()
-                heartbeat_thread.join(timeout=2)
-
-            state = json.loads(STATE_FILE.read_text(encoding="utf-8"))
-            state["status"] = "idle"
-            state["current_job"] = None
-            state["current_job_id"] = None
-            state["progress"] = 0
-            state["heartbeat_at"] = time.time()
-            state["last_success_at"] = time.time()
-            state["last_error"] = None
-            STATE_FILE.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
-        except Exception as exc:
-            logger.exception("Remote Drive Worker tick failed")
-            write_state("idle", last_error=str(exc))
-            time.sleep(getattr(worker, "poll_interval", 10))
+                worker.run_pipeline(
+                    should_stop=lambda: is_shutdown_requested("remote_drive_worker"),
+                    on_change=on_change,
+                )
+            except Exception as exc:
+                logger.exception("Remote Drive Worker pipeline failed")
+                with state_lock:
+                    write_state("idle", last_error=str(exc))
+                time.sleep(getattr(worker, "poll_interval", 10))
+    finally:
+        heartbeat_stop.set()
+        heartbeat_thread.join(timeout=2)
 
     write_state("stopped")
     logger.info("Remote Drive Worker process stopped")
@@ -0,0 +1,242 @@
+"""
+Resource-aware render slot sizing + per-job cost estimate.
+
+The Manager used to supervise exactly one Render Worker, so a strong render
+PC processed one project at a time, and _apply_resource_policy() only ever
+reacted after a render had started. This module decides *up front*:
+
+  - how many render slots this machine can run (plan_render_slots), from
+    logical CPU cores, total/available RAM and the encoder actually in use
+    (worker_config.RENDER_ENCODER / GPU_RENDERING_ACTIVE - a CPU libx264
+    encode is core-bound, a hardware encoder is session-bound);
+  - how much of that capacity a job will use (estimate_job_cost), in
+    "standard render" units: 1.0 == one 1080p, 10-minute render with the
+    default effect set. Slot count == capacity in the same units, so a 4K
+    or hour-long job occupies several slots' worth and is admitted alone.
+
+The Manager publishes the plan to RENDER_CAPACITY_FILE every tick;
+job_store.claim_next_job(capacity=...) enforces admission atomically
+inside its claim transaction, so concurrent slots can never over-commit.
+
+No hard dependency on psutil: it is used when importable, otherwise RAM is
+read via GlobalMemoryStatusEx (Windows, the production target) or
+/proc/meminfo (Linux dev boxes). Unknown RAM never blocks rendering - it
+just stops limiting the plan.
+"""
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from worker_config import (
+    GPU_RENDERING_ACTIVE,
+    RENDER_CAPACITY_FILE,
+    RENDER_CPU_CORES_PER_SLOT,
+    RENDER_ENCODER,
+    RENDER_GPU_ENCODER_SESSIONS,
+    RENDER_MAX_SLOTS,
+    RENDER_MEMORY_PRESSURE_MB,
+    RENDER_RAM_MB_PER_SLOT,
+)
+
+# ffmpeg encoder names that run on dedicated hardware rather than CPU cores.
+_HARDWARE_ENCODER_MARKERS = ("nvenc", "qsv", "amf", "videotoolbox", "vaapi")
+
+_STANDARD_PIXELS = 1920 * 1080
+_STANDARD_SECONDS = 600.0
+_EFFECT_WEIGHT = 0.15          # each extra effect layer (subtitles, motion, overlays, sfx...)
+_MIN_JOB_COST = 0.25
+_RESOLUTION_ALIASES = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "1440p": (2560, 1440),
+    "2k": (2560, 1440),
+    "2160p": (3840, 2160),
+    "4k": (3840, 2160),
+}
+# Boolean payload flags that add a render pass/layer when truthy.
+_EFFECT_FLAGS = ("subtitles", "burn_subtitles", "motion", "ken_burns", "overlays", "sfx", "bgm", "transitions", "intro", "outro")
+
+
+@dataclass
+class HostResources:
+    cpu_cores: int
+    total_ram_mb: Optional[int] = None
+    available_ram_mb: Optional[int] = None
+
+
+@dataclass
+class RenderCapacity:
+    slots: int
+    capacity: float
+    encoder: str
+    hardware_encoder: bool
+    memory_pressure: bool
+    limited_by: str
+    host: dict
+    measured_at: float
+
+
+def _memory_mb() -> tuple[Optional[int], Optional[int]]:
+    try:
+        import psutil  # optional
+
+        vm = psutil.virtual_memory()
+        return int(vm.total / 1048576), int(vm.available / 1048576)
+    except Exception:
+        pass
+    if sys.platform == "win32":
+        try:
+            import ctypes
+
+            class _MemoryStatusEx(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = _MemoryStatusEx()
+            status.dwLength = ctypes.sizeof(_MemoryStatusEx)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return int(status.ullTotalPhys / 1048576), int(status.ullAvailPhys / 1048576)
+        except Exception:
+            pass
+        return None, None
+    try:
+        info = {}
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                info[key] = int(rest.split()[0])  # kB
+        return info["MemTotal"] // 1024, info.get("MemAvailable", info.get("MemFree", 0)) // 1024
+    except Exception:
+        return None, None
+
+
+def measure_host() -> HostResources:
+    total, available = _memory_mb()
+    return HostResources(cpu_cores=os.cpu_count() or 1, total_ram_mb=total, available_ram_mb=available)
+
+
+def is_hardware_encoder(encoder: str, gpu_active: bool) -> bool:
+    name = (encoder or "").lower()
+    return bool(gpu_active) and any(marker in name for marker in _HARDWARE_ENCODER_MARKERS)
+
+
+def plan_render_slots(host: HostResources, *, busy_slots: int = 0, encoder: str = RENDER_ENCODER,
+                      gpu_active: bool = GPU_RENDERING_ACTIVE, max_slots: int = RENDER_MAX_SLOTS) -> RenderCapacity:
+    """How many render slots to run right now. Never below 1, and never
+    below `busy_slots` - shrinking only ever retires *idle* slots; a render
+    already in flight is not something this policy may interrupt."""
+    hardware = is_hardware_encoder(encoder, gpu_active)
+    limits = {"max_slots": max(1, int(max_slots))}
+    if hardware:
+        # Hardware encoders are capped by concurrent sessions; CPU still
+        # decodes/composites, so keep a looser core bound as well.
+        limits["encoder_sessions"] = max(1, int(RENDER_GPU_ENCODER_SESSIONS))
+        limits["cpu"] = max(1, host.cpu_cores // 2)
+    else:
+        limits["cpu"] = max(1, host.cpu_cores // max(1, RENDER_CPU_CORES_PER_SLOT))
+    if host.total_ram_mb:
+        limits["ram"] = max(1, host.total_ram_mb // max(1, RENDER_RAM_MB_PER_SLOT))
+
+    limited_by = min(limits, key=lambda k: limits[k])
+    slots = limits[limited_by]
+
+    memory_pressure = host.available_ram_mb is not None and host.available_ram_mb < RENDER_MEMORY_PRESSURE_MB
+    if memory_pressure:
+        slots = 1
+        limited_by = "memory_pressure"
+    slots = min(max(1, slots, int(busy_slots)), max(1, int(max_slots)))
+
+    return RenderCapacity(
+        slots=slots,
+        # Under memory pressure no new job is admitted while anything is
+        # still rendering (capacity 1.0 with >=1.0 already active).
+        capacity=1.0 if memory_pressure else float(slots),
+        encoder=encoder,
+        hardware_encoder=hardware,
+        memory_pressure=memory_pressure,
+        limited_by=limited_by,
+        host=asdict(host),
+        measured_at=time.time(),
+    )
+
+
+def _parse_resolution(payload: dict) -> tuple[int, int]:
+    width, height = payload.get("width"), payload.get("height")
+    try:
+        if width and height:
+            return int(width), int(height)
+    except (TypeError, ValueError):
+        pass
+    raw = str(payload.get("resolution") or payload.get("video_resolution") or "").strip().lower()
+    if raw in _RESOLUTION_ALIASES:
+        return _RESOLUTION_ALIASES[raw]
+    match = re.match(r"^(\d{3,5})\s*[x*]\s*(\d{3,5})$", raw)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    return 1920, 1080
+
+
+def _duration_seconds(payload: dict) -> float:
+    for key in ("duration_seconds", "duration", "target_duration_seconds"):
+        try:
+            value = float(payload.get(key) or 0)
+        except (TypeError, ValueError):
+            continue
+        if value > 0:
+            return value
+    return _STANDARD_SECONDS
+
+
+def _effect_count(payload: dict) -> int:
+    effects = payload.get("effects")
+    if isinstance(effects, (list, tuple, set)):
+        count = len(effects)
+    else:
+        try:
+            count = int(effects or 0)
+        except (TypeError, ValueError):
+            count = 0
+    return count + sum(1 for flag in _EFFECT_FLAGS if payload.get(flag))
+
+
+def estimate_job_cost(job_type: str, payload: Optional[dict]) -> float:
+    """resolution x duration x effects, in standard-render units. Non-render
+    jobs and payloads without any hints cost exactly one slot (1.0), which
+    reproduces the old one-job-per-slot behaviour."""
+    if not str(job_type or "").startswith("render_") or not isinstance(payload, dict):
+        return 1.0
+    width, height = _parse_resolution(payload)
+    pixels = max(1, width * height) / _STANDARD_PIXELS
+    duration = _duration_seconds(payload) / _STANDARD_SECONDS
+    effects = 1.0 + _EFFECT_WEIGHT * _effect_count(payload)
+    return round(max(_MIN_JOB_COST, pixels * duration * effects), 3)
+
+
+def write_capacity(capacity: RenderCapacity):
+    tmp = RENDER_CAPACITY_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(asdict(capacity), ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, RENDER_CAPACITY_FILE)
+
+
+def read_capacity(default: float = 1.0) -> float:
+    """Capacity published by the Manager. A standalone Render Worker (no
+    Manager, or the file is missing/corrupt) behaves exactly as before:
+    one job at a time."""
+    try:
+        data = json.loads(RENDER_CAPACITY_FILE.read_text(encoding="utf-8"))
+        return max(float(default if data.get("capacity") is None else data["capacity"]), 0.0) or default
+    except (OSError, ValueError, TypeError, AttributeError):
+        return default
@@ -36,6 +36,12 @@ at the top of every subsequent loop iteration until the server
 acknowledges it - the local terminal status (COMPLETED/FAILED) is set
 immediately regardless, so a network outage never causes a re-render of
 already-finished work.
+
+Prefetch (RENDER_PREFETCH_ENABLED, remote only): once the current render
+reaches RENDER_PREFETCH_START_PERCENT, _Prefetcher claims the next remote job and downloads/unpacks its inputs in
+the background, so back-to-back renders do not leave the CPU idle for the
+whole transfer. Its lease is renewed from the moment it is claimed; see
+_Prefetcher for how it is admitted and when it is released instead.
 """
 import os
 import signal
@@ -47,15 +53,37 @@ from pathlib import Path
 
 import central_client
 import job_store
+import job_wakeup
+import render_capacity
 import upload_adapter
 from logging_setup import get_job_logger, get_logger
+from progress_coalescer import StateFileWriter
 from render_pipeline_adapter import RenderPipelineError, cleanup_temp_dir, prepare_temp_dir, run_render
 from shutdown_flag import is_shutdown_requested
-from worker_config import CANCEL_FLAG_DIR, OUTPUT_DIR, STATE_DIR, WORKER_ID, WORKER_INSTANCE_ID
-
-STATE_FILE = STATE_DIR / "render_worker.json"
+from worker_config import (
+    CANCEL_FLAG_DIR,
+    IDLE_REMOTE_POLL_SECONDS,
+    IDLE_WAKEUP_FALLBACK_SECONDS,
+    OUTPUT_DIR,
+    RENDER_PREFETCH_ENABLED,
+    RENDER_PREFETCH_MAX_HOLD_SECONDS,
+    RENDER_PREFETCH_START_PERCENT,
+    RENDER_SLOT_NAMES,
+    STATE_DIR,
+    WORKER_ID,
+    WORKER_INSTANCE_ID,
+)
+
+# Multi-slot rendering: the Manager spawns one process per render slot and
+# tells each which one it is. Slot 1 keeps the historical "render_worker"
+# name for its state file, shutdown flag and log; render_worker_2..N get
+# their own (docs/AIR_WORKER_PROCESS_MODEL.md §4 - no shared files).
+RENDER_SLOT = min(max(1, int(os.environ.get("AIRWORKER_RENDER_SLOT", "1") or 1)), len(RENDER_SLOT_NAMES))
+PROCESS_NAME = RENDER_SLOT_NAMES[RENDER_SLOT - 1]
+STATE_FILE = STATE_DIR / f"{PROCESS_NAME}.json"
+_state_writer = StateFileWriter(name=f"{PROCESS_NAME}-state-flush")
 DELIVERED_DIR = OUTPUT_DIR / "delivered"  # [P2-VALIDATION] moved out of state/ into the canonical output/ subpath
-logger = get_logger("render_worker")
+logger = get_logger(PROCESS_NAME)
 
 _shutdown_requested = False
 SUPPORTED_JOB_TYPES = ["render_video"]
@@ -76,7 +104,7 @@ def _handle_signal(signum, frame):
 
 
 def _should_stop() -> bool:
-    return _shutdown_requested or is_shutdown_requested("render_worker")
+    return _shutdown_requested or is_shutdown_requested(PROCESS_NAME)
 
 
 def _state_job_summary(current_job: dict | None) -> dict | None:
@@ -102,33 +130,28 @@ def _state_job_summary(current_job: dict | None) -> dict | None:
 
 def write_state(status: str, current_job: dict | None, progress: int, job_id: str | None = None,
                  last_success_at: float | None = None, last_error: str | None = None):
-    import json
-    prev = {}
-    if STATE_FILE.exists():
-        try:
-            prev = json.loads(STATE_FILE.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            prev = {}
-    STATE_FILE.write_text(
-        json.dumps(
-            {
-                "pid": None,  # filled in by the Manager from Popen, not self-reported
-                "status": status,
-                "current_job": _state_job_summary(current_job),
-                "current_job_id": job_id,
-                "progress": progress,
-                "worker_instance_id": WORKER_INSTANCE_ID,
-                "heartbeat_at": time.time(),
-                # [AIR-0227E-P3 item 11] mirrors hermes_worker.py's state
-                # shape so Local API /status can show both workers'
-                # last-success/last-error uniformly - additive fields only,
-                # existing consumers of this file ignore unknown keys.
-                "last_success_at": last_success_at if last_success_at is not None else prev.get("last_success_at"),
-                "last_error": last_error if last_error is not None else prev.get("last_error"),
-            },
-            ensure_ascii=False,
-        ),
-        encoding="utf-8",
+    # Coalesced + atomic (progress_coalescer.StateFileWriter): progress-only
+    # updates during a render are written at most once per interval.
+    prev = _state_writer.latest(STATE_FILE) or {}
+    _state_writer.write(
+        STATE_FILE,
+        {
+            "pid": None,  # filled in by the Manager from Popen, not self-reported
+            "status": status,
+            "current_job": _state_job_summary(current_job),
+            "current_job_id": job_id,
+            "progress": progress,
+            "render_slot": RENDER_SLOT,
+            "worker_instance_id": WORKER_INSTANCE_ID,
+            "heartbeat_at": time.time(),
+            # [AIR-0227E-P3 item 11] mirrors hermes_worker.py's state
+            # shape so Local API /status can show both workers'
+            # last-success/last-error uniformly - additive fields only,
+            # existing consumers of this file ignore unknown keys.
+            "last_success_at": last_success_at if last_success_at is not None else prev.get("last_success_at"),
+            "last_error": last_error if last_error is not None else prev.get("last_error"),
+        },
+        force=last_success_at is not None or last_error is not None,
     )
 
 
@@ -166,13 +189,18 @@ def _is_remote(job: dict) -> bool:
     return job.get("source") == "central_server" and job.get("remote_job_id")
 
 
-def _start_lease_renewal(job: dict, job_log) -> tuple[threading.Thread, threading.Event] | tuple[None, None]:
+def _start_lease_renewal(job: dict, job_log, renew_while=None) -> tuple[threading.Thread, threading.Event] | tuple[None, None]:
+    """`renew_while()`, if given, is checked before every renewal; once it
+    returns False the loop stops and the lease is left to lapse."""
     if not _is_remote(job):
         return None, None
     stop_event = threading.Event()
 
     def _loop():
         while not stop_event.wait(LEASE_RENEW_INTERVAL_SECONDS):
+            if renew_while is not None and not renew_while():
+                job_log.info("Lease renewal stopped (prefetch hold limit reached), leaving the lease to lapse")
+                return
             try:
                 result = central_client.renew_lease(job["remote_job_id"], job["lease_id"], WORKER_INSTANCE_ID)
                 job_store.update_lease(job["job_id"], result["lease_expires_at"])
@@ -269,14 +297,21 @@ def _flush_pending_remote_acks():
             _report_remote_outcome(job, job_log, success=False, error_code=job.get("error_code") or "", error_message=job.get("error_message") or "")
 
 
-def process_one_job(job: dict, adapter: "upload_adapter.UploadAdapter") -> None:
+def process_one_job(job: dict, adapter: "upload_adapter.UploadAdapter", prefetched: dict | None = None) -> None:
+    """`prefetched` is what _Prefetcher.take() handed over for this job: its
+    lease renewal is already running and its temp_dir may already be
+    prepared (None if that failed - it is then prepared here as usual)."""
     job_id = job["job_id"]
     job_log = get_job_logger(job_id)
     job_log.info(f"Claimed (source={job['source']}, remote_job_id={job.get('remote_job_id')}), payload={job['payload']}")
-    logger.info(f"Claimed job {job_id}")
+    logger.info(f"Claimed job {job_id}" + (" (prefetched)" if prefetched else ""))
 
-    renew_thread, renew_stop = _start_lease_renewal(job, job_log)
-    temp_dir = None
+    if prefetched:
+        renew_thread, renew_stop = prefetched["renewal"]
+        temp_dir = prefetched["temp_dir"]
+    else:
+        renew_thread, renew_stop = _start_lease_renewal(job, job_log)
+        temp_dir = None
     _last_success_at = None
     _last_error = None
     try:
@@ -290,8 +325,11 @@ def process_one_job(job: dict, adapter: "upload_adapter.UploadAdapter") -> None:
         source_path = job["payload"].get("source_path")
         if not source_path:
             raise RenderPipelineError("payload.source_path is required for render_video")
-        temp_dir = prepare_temp_dir(source_path)
-        job_log.info(f"Prepared temp_dir={temp_dir}")
+        if temp_dir is None:
+            temp_dir = prepare_temp_dir(source_path)
+            job_log.info(f"Prepared temp_dir={temp_dir}")
+        else:
+            job_log.info(f"Using prefetched temp_dir={temp_dir}")
 
         if _is_soft_cancel_requested(job_id):
             job_store.transition(job_id, job_store.CANCELED, reason="cancelled at PREPARING checkpoint (soft-cancel, no process kill needed)")
@@ -301,17 +339,22 @@ def process_one_job(job: dict, adapter: "upload_adapter.UploadAdapter") -> None:
 
         job_store.transition(job_id, job_store.RENDERING, reason="starting real render pipeline")
         write_state("rendering", job, 0, job_id)
+        prefetch = REMOTE_ENABLED and RENDER_PREFETCH_ENABLED
 
         def _on_progress(pct, msg):
             job_store.update_progress(job_id, pct, msg)
             write_state("rendering", job, pct, job_id)
             job_log.info(f"progress={pct} message={msg}")
             _remote_progress(job, job_log, "RENDERING", pct, msg)
+            if prefetch and pct >= RENDER_PREFETCH_START_PERCENT:
+                _prefetcher.start()
 
         _remote_progress(job, job_log, "RENDERING", 20, "Rendering video on remote worker.")
         job_log.info("-> RENDERING (calling services.remote_render_service.remote_render_executor_func)")
         output_path = run_render(job_id, temp_dir, _on_progress)
         job_log.info(f"Render complete: {output_path}")
+        if prefetch:
+            _prefetcher.start()   # the upload still overlaps the next transfer
 
         job_store.transition(job_id, job_store.UPLOADING, reason="render complete, delivering output")
         write_state("uploading", job, 100, job_id)
@@ -337,6 +380,7 @@ def process_one_job(job: dict, adapter: "upload_adapter.UploadAdapter") -> None:
         _report_remote_outcome(job, job_log, success=False, error_code="RENDER_EXCEPTION", error_message=error_detail)
         _last_error = error_detail
     finally:
+        _prefetcher.current_finished()
         if renew_stop:
             renew_stop.set()
         if temp_dir:
@@ -344,7 +388,7 @@ def process_one_job(job: dict, adapter: "upload_adapter.UploadAdapter") -> None:
         write_state("idle", None, 0, last_success_at=_last_success_at, last_error=_last_error)
 
 
-def _try_remote_claim() -> dict | None:
+def _try_remote_claim(prefetch: bool = False) -> dict | None:
     global _next_remote_claim_at
     now = time.time()
     if now < _next_remote_claim_at:
@@ -371,29 +415,192 @@ def _try_remote_claim() -> dict | None:
     local_job_id = job_store.create_from_remote_claim(
         remote_job_id=claimed["job_id"], job_type=claimed["job_type"], payload=claimed["payload"],
         priority=claimed["priority"], lease_id=claimed["lease_id"], worker_instance_id=WORKER_INSTANCE_ID,
-        lease_expires_at=claimed["lease_expires_at"],
+        lease_expires_at=claimed["lease_expires_at"], worker_slot=PROCESS_NAME, prefetched=prefetch,
     )
     return job_store.get_job(local_job_id)
 
 
+class _Prefetcher:
+    """Claims and prepares the next remote job while the current one renders.
+
+    Without it a slot finished a render, then claimed, then downloaded and
+    unpacked the next package (prepare_temp_dir) with the CPU idle the
+    whole time. start() runs once the current render reaches
+    RENDER_PREFETCH_START_PERCENT (or completes); take() hands the prepared
+    job to the main loop when the slot is free again.
+
+    Lease semantics: renewal starts as soon as the job is claimed (the
+    server's lease TTL stays short, so a worker that dies mid-prefetch
+    still loses the job within one TTL) and carries over into
+    process_one_job. The mirrored row holds no render capacity until
+    job_store.admit_prefetched_job() charges it at start. The lease is kept
+    for as long as the current job runs, however long that render is; the
+    hold limit only counts once current_finished() was called. A job that
+    was cancelled while waiting, whose lease lapsed, or that could not start
+    within RENDER_PREFETCH_MAX_HOLD_SECONDS of the slot finishing its
+    current job (e.g. other work took the capacity) is released instead: CANCELED
+    locally and never reported, so the central server re-queues it for any
+    worker once the lease expires."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._held: dict | None = None   # {"job", "temp_dir", "renewal", "claimed_at", "started"}
+        self._current_running = False
+        self._current_finished_at = 0.0
+
+    def start(self):
+        with self._lock:
+            self._current_running = True
+            if self._thread is not None or self._held is not None:
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True, name=f"{PROCESS_NAME}-prefetch")
+            self._thread.start()
+
+    def _run(self):
+        try:
+            job = _try_remote_claim(prefetch=True)
+        except Exception as e:
+            logger.warning(f"Prefetch claim failed (non-fatal, next job is claimed as usual): {e}")
+            return
+        if not job:
+            return
+        job_log = get_job_logger(job["job_id"])
+        job_log.info(f"Prefetched while the current render runs (remote_job_id={job.get('remote_job_id')})")
+        held = {"job": job, "temp_dir": None, "claimed_at": time.time(), "started": False}
+        held["renewal"] = _start_lease_renewal(job, job_log, renew_while=lambda: self._keep_lease(held))
+        try:
+            source_path = (job.get("payload") or {}).get("source_path")
+            if job["job_type"] == "render_video" and source_path:
+                held["temp_dir"] = prepare_temp_dir(source_path)
+                job_log.info(f"Prefetched temp_dir={held['temp_dir']}")
+        except Exception as e:
+            job_log.warning(f"Prefetching render inputs failed, preparing them again when the job starts: {e}")
+        with self._lock:
+            self._held = held
+
+    def current_finished(self):
+        """The slot's current job is done: the hold limit starts counting."""
+        with self._lock:
+            self._current_running = False
+            self._current_finished_at = time.time()
+
+    def _keep_lease(self, held: dict) -> bool:
+        if held["started"] or self._current_running:
+            return True
+        hold_from = max(held["claimed_at"], self._current_finished_at)
+        return time.time() - hold_from < RENDER_PREFETCH_MAX_HOLD_SECONDS
+
+    def take(self, capacity: float) -> dict | None:
+        """The prefetched job if it may start now (admitted against
+        `capacity`), else None. A prefetch still in flight is waited for -
+        the slot is free, so that transfer is what it would wait on anyway."""
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            self._thread = None
+            held = self._held
+        if held is None:
+            return None
+        job_id = held["job"]["job_id"]
+        current = job_store.get_job(job_id)
+        if current is None or current["status"] != job_store.CLAIMED:
+            self._release(held, None)
+            return None
+        if not self._keep_lease(held):
+            self._release(held, f"not started within {RENDER_PREFETCH_MAX_HOLD_SECONDS:.0f}s of the slot freeing up")
+            return None
+        if (current.get("lease_expires_at") or 0) <= time.time():
+            self._release(held, "lease lapsed before the job could start")
+            return None
+        if not job_store.admit_prefetched_job(job_id, SUPPORTED_JOB_TYPES, capacity):
+            return None                  # no room yet - keep holding (and renewing)
+        held["started"] = True
+        with self._lock:
+            self._held = None
+        held["job"] = job_store.get_job(job_id)
+        renew_thread, _renew_stop = held["renewal"]
+        if renew_thread is not None and not renew_thread.is_alive():
+            # Hit the hold limit between the check above and `started`.
+            held["renewal"] = _start_lease_renewal(held["job"], get_job_logger(job_id))
+        return held
+
+    @property
+    def holding(self) -> bool:
+        with self._lock:
+            return self._held is not None
+
+    def release(self, reason: str):
+        """Give up whatever is prefetched (worker stopping)."""
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            self._thread = None
+            held = self._held
+        if held is not None:
+            self._release(held, reason)
+
+    def _release(self, held: dict, reason: str | None):
+        _renew_thread, renew_stop = held["renewal"]
+        if renew_stop:
+            renew_stop.set()
+        if held["temp_dir"]:
+            cleanup_temp_dir(held["temp_dir"])
+        with self._lock:
+            self._held = None
+        job_id = held["job"]["job_id"]
+        if reason is None:
+            logger.info(f"Prefetched job {job_id} was moved externally before it started, dropped")
+            return
+        try:
+            job_store.transition(job_id, job_store.CANCELED,
+                                 reason=f"prefetched job released: {reason} (central server re-queues it once the lease expires)")
+        except job_store.InvalidTransitionError:
+            pass
+        get_job_logger(job_id).info(f"-> CANCELED (prefetch released: {reason})")
+        logger.info(f"Released prefetched job {job_id}: {reason}")
+
+
+_prefetcher = _Prefetcher()
+
+
 def run_forever():
     from shutdown_flag import clear_shutdown_flag
-    clear_shutdown_flag("render_worker")  # discard any stale flag from a previous instance of this process
-    logger.info(f"Render Worker (real pipeline) starting, pid={os.getpid()}, worker_instance_id={WORKER_INSTANCE_ID}, remote_enabled={REMOTE_ENABLED}")
+    clear_shutdown_flag(PROCESS_NAME)  # discard any stale flag from a previous instance of this process
+    logger.info(f"Render Worker (real pipeline) starting, slot={RENDER_SLOT} ({PROCESS_NAME}), pid={os.getpid()}, worker_instance_id={WORKER_INSTANCE_ID}, remote_enabled={REMOTE_ENABLED}")
     write_state("idle", None, 0)
     adapter = upload_adapter.LocalCopyUploadAdapter(DELIVERED_DIR)
+    idle_wait = IDLE_REMOTE_POLL_SECONDS if REMOTE_ENABLED else IDLE_WAKEUP_FALLBACK_SECONDS
+    wakeup = job_wakeup.WakeupListener(PROCESS_NAME).open()
 
     try:
         while not _should_stop():
             try:
                 _flush_pending_remote_acks()
 
-                job = job_store.claim_next_job(SUPPORTED_JOB_TYPES, os.getpid())
-                if not job and REMOTE_ENABLED:
-                    job = _try_remote_claim()
+                # Admission against the Manager-published slot capacity is
+                # enforced inside claim_next_job's transaction. A remote
+                # claim's cost is unknown until claimed, so only ask the
+                # central server while at least one standard slot is free.
+                capacity = render_capacity.read_capacity()
+                prefetched = _prefetcher.take(capacity)
+                if prefetched:
+                    process_one_job(prefetched["job"], adapter, prefetched)
+                    continue
+                job = None
+                if not _prefetcher.holding:  # a held prefetch that does not fit yet goes first once it does
+                    job = job_store.claim_next_job(SUPPORTED_JOB_TYPES, os.getpid(), capacity=capacity, worker_slot=PROCESS_NAME)
+                    if not job and REMOTE_ENABLED and job_store.active_cost(SUPPORTED_JOB_TYPES) + 1.0 <= capacity:
+                        job = _try_remote_claim()
                 if not job:
                     write_state("idle", None, 0)
-                    time.sleep(1.0)
+                    # job_store.submit_job()/re-queue and request_shutdown()
+                    # wake this immediately; the timeout is only a fallback.
+                    wakeup.wait(idle_wait)
                     continue
                 process_one_job(job, adapter)
             except Exception as e:
@@ -410,6 +617,9 @@ def run_forever():
                 write_state("idle", None, 0)
                 time.sleep(1.0)
     finally:
+        _prefetcher.release("worker stopping")
+        wakeup.close()
+        job_store.flush_progress()
         write_state("stopped", None, 0)
         logger.info("Render Worker stopped")
 
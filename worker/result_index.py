@@ -0,0 +1,166 @@
+"""
+Indexed store for Hermes result files.
+
+Hermes writes one JSON file per finished job to OUTPUT_DIR/hermes_results
+and one final topic package per autopilot run (or NotebookLM import) to
+OUTPUT_DIR/hermes_autopilot_results. The dashboard used to list them by
+sorting every file by mtime and parsing hundreds of them per request, so
+/api/generated-results got slower with every result ever produced.
+
+Now every writer goes through save(): the file is replaced atomically and
+its summary row (job_store.record_results) is upserted right after, so the
+dashboard pages over the jobs.db index and only opens the files of the
+topics it actually returns. ensure_backfilled() imports files written
+before the index existed, once per jobs.db.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import job_store
+from worker_config import OUTPUT_DIR
+
+HERMES = "hermes"    # per-job result (hermes_worker)
+PACKAGE = "package"  # final topic package (autopilot / NotebookLM import)
+RESULT_DIRS = {
+    HERMES: OUTPUT_DIR / "hermes_results",
+    PACKAGE: OUTPUT_DIR / "hermes_autopilot_results",
+}
+# Per-job results that contribute to a topic's generated-results entry.
+GENERATED_RESULT_JOB_TYPES = {"script_generate", "script_plan_generate", "web_research", "publish_metadata_generate"}
+BACKFILL_META_KEY = "hermes_results_backfilled_at"
+
+_backfill_lock = threading.Lock()
+
+
+def result_title(data: dict) -> str:
+    structure = data.get("structure") if isinstance(data.get("structure"), dict) else {}
+    title_generation = data.get("title_generation") if isinstance(data.get("title_generation"), dict) else {}
+    benchmark_analysis = data.get("benchmark_analysis") if isinstance(data.get("benchmark_analysis"), dict) else {}
+    benchmark_title_generation = (
+        benchmark_analysis.get("title_generation")
+        if isinstance(benchmark_analysis.get("title_generation"), dict)
+        else {}
+    )
+    return (
+        data.get("generated_title")
+        or data.get("upload_title")
+        or structure.get("upload_title")
+        or title_generation.get("generated_title")
+        or title_generation.get("final_title")
+        or benchmark_title_generation.get("generated_title")
+        or benchmark_title_generation.get("final_title")
+        or ""
+    )
+
+
+def result_category(data: dict) -> str:
+    title_generation = data.get("title_generation") if isinstance(data.get("title_generation"), dict) else {}
+    benchmark_analysis = data.get("benchmark_analysis") if isinstance(data.get("benchmark_analysis"), dict) else {}
+    benchmark_title_generation = (
+        benchmark_analysis.get("title_generation")
+        if isinstance(benchmark_analysis.get("title_generation"), dict)
+        else {}
+    )
+    for value in (
+        data.get("category"),
+        title_generation.get("category"),
+        benchmark_title_generation.get("category"),
+    ):
+        category = str(value or "").strip()
+        if category:
+            return category
+    return ""
+
+
+def _timestamp(data: dict, key_order: tuple, fallback: Optional[float]) -> Optional[float]:
+    for key in key_order:
+        value = data.get(key)
+        if isinstance(value, (int, float)):
+            return float(value)
+    return fallback
+
+
+def describe(kind: str, path: Path, data: dict, *, mtime: Optional[float] = None) -> dict:
+    """The index row for one result file."""
+    structure = data.get("structure") if isinstance(data.get("structure"), dict) else {}
+    scenes = structure.get("scenes") if isinstance(structure.get("scenes"), list) else []
+    script = data.get("script") if isinstance(data.get("script"), str) else ""
+    topic_queue_id = str(data.get("topic_queue_id") or "").strip()
+    if kind == PACKAGE:
+        # Packages are listed on their own, keyed like the dashboard always did.
+        topic_queue_id = topic_queue_id or path.stem
+    job_type = data.get("job_type") or (kind if kind == PACKAGE else "")
+    return {
+        "kind": kind,
+        "result_id": path.stem,
+        "topic_key": topic_queue_id,
+        "topic_queue_id": topic_queue_id or None,
+        "job_type": job_type,
+        "status": data.get("status") or "",
+        "title": result_title(data),
+        "category": result_category(data),
+        "scene_count": len(scenes),
+        "script_chars": len(script.strip()),
+        "path": str(path),
+        "created_at": _timestamp(data, ("created_at", "started_at"), mtime),
+        "updated_at": _timestamp(data, ("completed_at", "updated_at", "created_at", "started_at"), mtime),
+        "package": kind == PACKAGE,
+        "listed": kind == PACKAGE or (job_type in GENERATED_RESULT_JOB_TYPES and bool(scenes or script.strip())),
+    }
+
+
+def write_json_atomic(path: Path, data: dict):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    try:
+        os.replace(tmp, path)
+    except PermissionError:
+        # Windows: a reader (dashboard) has the file open right now.
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.unlink(missing_ok=True)
+
+
+def save(kind: str, path: Path, data: dict) -> Path:
+    """Write a result file atomically and index it."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json_atomic(path, data)
+    job_store.record_results([describe(kind, path, data, mtime=time.time())])
+    return path
+
+
+def read(path) -> Optional[dict]:
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def ensure_backfilled(force: bool = False) -> int:
+    """Index result files written before the index existed. Runs once per
+    jobs.db (recorded in store_meta); returns the number of files indexed."""
+    with _backfill_lock:
+        if not force and job_store.get_meta(BACKFILL_META_KEY):
+            return 0
+        rows = []
+        for kind, directory in RESULT_DIRS.items():
+            if not directory.exists():
+                continue
+            for path in directory.glob("*.json"):
+                data = read(path)
+                if data is None:
+                    continue
+                try:
+                    mtime = path.stat().st_mtime
+                except OSError:
+                    continue
+                rows.append(describe(kind, path, data, mtime=mtime))
+        for start in range(0, len(rows), 500):
+            job_store.record_results(rows[start:start + 500])
+        job_store.set_meta(BACKFILL_META_KEY, str(time.time()))
+        return len(rows)
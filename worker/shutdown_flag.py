@@ -21,11 +21,15 @@ escalate to an actual terminate()/kill() (which on Windows IS an
 unconditional TerminateProcess - fine as the escalation path, just not
 acceptable as the *only* path).
 """
+import job_wakeup
 from worker_config import SHUTDOWN_FLAG_DIR
 
 
 def request_shutdown(name: str):
     (SHUTDOWN_FLAG_DIR / f"{name}.flag").write_text("shutdown", encoding="utf-8")
+    # Idle workers block on job_wakeup between claims - wake them so the
+    # flag is seen now rather than at the end of their fallback timeout.
+    job_wakeup.notify("shutdown")
 
 
 def is_shutdown_requested(name: str) -> bool:
@@ -11,6 +11,8 @@ every real-pipeline import. Renaming this module is the fix (AIR-0227A's
 worker/config.py caused no problem only because nothing under worker/ ever
 imported the real pipeline yet - AIR-0227B is the first Task that does).
 """
+import json
+import logging
 import os
 import sys
 from pathlib import Path
@@ -86,6 +88,36 @@ LOG_FILES = {
     "dashboard": LOG_DIR / "dashboard.log",
 }
 
+# logging_setup.py rotates each process log at this size, keeping
+# LOG_BACKUP_COUNT old files (<name>.log.1 ... .N); log_tail.py follows a
+# streamed log across that rotation.
+LOG_MAX_BYTES = int(float(os.environ.get("AIRWORKER_LOG_MAX_MB", "50")) * 1024 * 1024)
+LOG_BACKUP_COUNT = 5
+
+# Multi-slot rendering (render_capacity.py, manager.py::_apply_render_slot_policy).
+# Slot 1 keeps the historical "render_worker" name (state file, shutdown flag,
+# log) so every existing consumer of that name is unchanged; extra slots are
+# the same render_worker role spawned as render_worker_2..N, each with its
+# own state file and log per docs/AIR_WORKER_PROCESS_MODEL.md §4.
+RENDER_MAX_SLOTS = max(1, int(os.environ.get("AIRWORKER_RENDER_MAX_SLOTS", "4")))
+RENDER_SLOT_NAMES = ("render_worker",) + tuple(f"render_worker_{i}" for i in range(2, RENDER_MAX_SLOTS + 1))
+for _slot_name in RENDER_SLOT_NAMES[1:]:
+    LOG_FILES[_slot_name] = LOG_DIR / f"{_slot_name}.log"
+RENDER_CPU_CORES_PER_SLOT = 4       # logical cores one CPU (libx264) render keeps busy
+RENDER_RAM_MB_PER_SLOT = 3072       # peak working set of one 1080p MoviePy/ffmpeg render
+RENDER_GPU_ENCODER_SESSIONS = 2     # concurrent hardware-encoder sessions to allow per GPU
+RENDER_MEMORY_PRESSURE_MB = 1536    # below this much available RAM, shrink to the busy slots only
+RENDER_CAPACITY_FILE = STATE_DIR / "render_capacity.json"
+# render_worker.py - with a central server configured, a slot claims its
+# next remote job once the current render reaches RENDER_PREFETCH_START_PERCENT
+# and prepares its inputs in the background. Its lease is renewed for as long
+# as the current job runs; one that has not started within the hold limit
+# AFTER the current job finished is released (renewal stops, the server
+# re-queues it on lease expiry).
+RENDER_PREFETCH_ENABLED = os.environ.get("AIRWORKER_RENDER_PREFETCH", "1") != "0"
+RENDER_PREFETCH_START_PERCENT = float(os.environ.get("AIRWORKER_RENDER_PREFETCH_START_PERCENT", "70"))
+RENDER_PREFETCH_MAX_HOLD_SECONDS = float(os.environ.get("AIRWORKER_RENDER_PREFETCH_MAX_HOLD_SECONDS", "300"))
+
 # docs/AIR_WORKER_PROCESS_MODEL.md §3 - bounded auto-restart.
 CRASH_WINDOW_SECONDS = 600          # 10 minutes
 MAX_CRASHES_IN_WINDOW = 3           # disable the module after this many crashes in the window
@@ -98,6 +130,69 @@ LOCAL_API_PORT = int(os.environ.get("AIRWORKER_LOCAL_API_PORT", "8765"))
 
 HEARTBEAT_STALE_SECONDS = 15        # a process is considered unresponsive if its heartbeat file is older than this
 MANAGER_TICK_SECONDS = 1.0          # how often the manager's supervisor loop runs
+# job_wakeup.py - idle workers block on a wakeup instead of polling jobs.db.
+# The fallback re-check (and heartbeat refresh) must stay well under
+# HEARTBEAT_STALE_SECONDS; with a central server configured workers still
+# poll it at REMOTE_POLL, since remote claims have no local wakeup.
+IDLE_WAKEUP_FALLBACK_SECONDS = 5.0
+IDLE_REMOTE_POLL_SECONDS = 1.0
+# progress_coalescer.py - job progress (jobs.db) and worker state-file
+# progress/heartbeat writes are coalesced to at most one per interval;
+# status changes and job transitions are always written immediately.
+PROGRESS_FLUSH_INTERVAL_SECONDS = float(os.environ.get("AIRWORKER_PROGRESS_FLUSH_MS", "1000")) / 1000.0
+# event_bus.py - the dashboard / Local API push job and Manager status
+# changes to connected clients. Job changes arrive via a job_wakeup watcher
+# datagram; the fallback re-check only covers a lost datagram.
+EVENT_BUS_JOB_FALLBACK_SECONDS = 2.0
+EVENT_BUS_HEARTBEAT_SECONDS = 15.0
+EVENT_BUS_RETAINED_JOBS = 200       # latest job states replayed to a client on connect
+
+# job_store.py claim scheduling (docs/AIR_WORKER_RESOURCE_POLICY.md §1).
+# "fair" = weighted fair share across source/job_type + priority aging +
+# per-type concurrency caps; "fifo" = the original strict priority DESC,
+# created_at ASC order. Weights/caps accept a JSON object override, e.g.
+# AIRWORKER_SCHEDULER_TYPE_CONCURRENCY='{"hermes_topic": 1}'.
+JOB_SCHEDULER_POLICY = os.environ.get("AIRWORKER_JOB_SCHEDULER", "fair").strip().lower()
+SCHEDULER_AGING_SECONDS = 300.0             # a queued job gains +1 effective priority per this many seconds waited
+SCHEDULER_MAX_AGING_BOOST = 3.0             # ...capped, so aging cannot outrank an explicit urgent priority forever
+SCHEDULER_FAIR_SHARE_WINDOW_SECONDS = 600.0  # how far back "recently served" looks
+SCHEDULER_FAIR_SHARE_PENALTY = 2.0          # effective priority a flow loses per job it started in the window (/ weight)
+SCHEDULER_CANDIDATES_PER_FLOW = 4           # top-priority + oldest jobs considered per (source, job_type)
+
+
+def _env_json_dict(name: str, value_type=float) -> dict:
+    """A JSON object from env var `name` with every value coerced to
+    `value_type`; a typo in it (bad JSON, or one bad entry, which is skipped)
+    must not stop every worker process from importing."""
+    raw = os.environ.get(name)
+    if not raw:
+        return {}
+    log = logging.getLogger("worker_config")
+    try:
+        value = json.loads(raw)
+    except ValueError as e:
+        log.warning("ignoring %s: invalid JSON (%s)", name, e)
+        return {}
+    if not isinstance(value, dict):
+        log.warning("ignoring %s: expected a JSON object", name)
+        return {}
+    coerced = {}
+    for key, item in value.items():
+        try:
+            coerced[key] = value_type(item)
+        except (TypeError, ValueError):
+            log.warning("ignoring %s[%r]: expected a number, got %r", name, key, item)
+    return coerced
+
+
+SCHEDULER_SOURCE_WEIGHTS = {
+    "dashboard": 2.0,   # a person clicked "submit" and is waiting on it
+    "local_api": 2.0,
+    "autopilot": 1.0,
+    **_env_json_dict("AIRWORKER_SCHEDULER_SOURCE_WEIGHTS"),
+}
+SCHEDULER_TYPE_WEIGHTS = _env_json_dict("AIRWORKER_SCHEDULER_TYPE_WEIGHTS")
+SCHEDULER_TYPE_CONCURRENCY = _env_json_dict("AIRWORKER_SCHEDULER_TYPE_CONCURRENCY", int)
 
 # [AIR-0227B Stage 3] graceful shutdown protocol timings (docs/AIR_WORKER_SHUTDOWN_PROTOCOL.md).
 SHUTDOWN_GRACE_SECONDS = 8.0        # time given to a child process to exit cleanly after SIGTERM/terminate()
@@ -151,8 +246,10 @@ WORKER_INSTANCE_ID = os.environ.get("AIRWORKER_INSTANCE_ID") or __import__("uuid
 # Supabase/service_role dependency - services/remote_render_service.py's
 # remote_render_executor_func() takes no credentials at all, and
 # database.py (imported transitively) is pure local SQLite (verified
-# Stage 1). Only the Render Worker Process needs this; Manager/Hermes/Local
-# API never import project-root modules.
+# Stage 1). The Render Worker Process needs this for the pipeline; the
+# dashboard and Local API only import services/event_bus.py (stdlib only)
+# through worker/event_bus.py. Manager/Hermes never import project-root
+# modules.
 PROJECT_ROOT = Path(os.environ.get("AIRWORKER_PROJECT_ROOT", Path(__file__).resolve().parent.parent))
 
 